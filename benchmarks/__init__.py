@@ -0,0 +1,11 @@
+"""
+Performance benchmarks. These are not part of the installed package.
+
+Run from the repository root, e.g.:
+
+    $ python -m benchmarks.bench_threads
+
+benchmarks.suite times every pipeline stage over a grid of sizes and writes JSON for comparing runs:
+
+    $ python -m benchmarks.suite --json results.json
+"""
@@ -0,0 +1,118 @@
+"""
+Allocation counts per pipeline stage.
+
+For each stage this reports:
+  - inits: calls to __init__ of paragraph_generator classes (Tags, words, Sentence, Paragraph, ...)
+  - blocks: memory blocks allocated by the interpreter, net of frees (sys.getallocatedblocks)
+  - peak KB: tracemalloc peak above the starting point
+
+    $ python -m benchmarks.bench_allocations --size 15
+"""
+import argparse
+import gc
+import json
+import random
+import sys
+import tracemalloc
+from collections import Counter
+
+from benchmarks.vocabulary import load_word_lists
+from paragraph_generator.answer_checker import AnswerChecker
+from paragraph_generator.backend.error_maker import ErrorMaker
+from paragraph_generator.backend.grammarizer import Grammarizer
+from paragraph_generator.backend.random_assignments.assign_random_negatives import assign_random_negatives
+from paragraph_generator.backend.random_assignments.plurals_assignement import PluralsAssignment
+from paragraph_generator.backend.random_assignments.random_paragraph import RandomParagraph
+from paragraph_generator.serializer import Serializer
+
+PACKAGE = 'paragraph_generator'
+
+
+def count_inits(func):
+    counts = Counter()
+
+    def profiler(frame, event, _):
+        code = frame.f_code
+        if event == 'call' and code.co_name == '__init__' and PACKAGE in code.co_filename:
+            counts[type(frame.f_locals.get('self')).__name__] += 1
+
+    sys.setprofile(profiler)
+    try:
+        func()
+    finally:
+        sys.setprofile(None)
+    return counts
+
+
+def measure_memory(func):
+    gc.collect()
+    gc.disable()
+    try:
+        blocks = sys.getallocatedblocks()
+        tracemalloc.start()
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        blocks = sys.getallocatedblocks() - blocks
+    finally:
+        gc.enable()
+    return blocks, peak
+
+
+def get_stages(size, seed):
+    word_lists = load_word_lists()
+    verbs, nouns = word_lists.verbs, word_lists.nouns
+    rng = random.Random(seed)
+
+    raw = RandomParagraph(0.3, verbs, nouns, rng).create_chain_paragraph(size)
+    with_plurals = PluralsAssignment(raw, rng).assign_random_plurals(0.3)
+    with_negatives = assign_random_negatives(with_plurals, 0.3, rng)
+    answer = Grammarizer(with_negatives).grammarize_to_present_tense()
+    error = ErrorMaker(answer, rng).noun_errors(0.3).verb_errors(0.3).get_paragraph()
+    as_json = Serializer.to_json(answer)
+    submission = str(error)
+
+    def stage(func):
+        return lambda: func(random.Random(seed))
+
+    return [
+        ('random_paragraph', stage(lambda r: RandomParagraph(0.3, verbs, nouns, r).create_chain_paragraph(size))),
+        ('plurals', stage(lambda r: PluralsAssignment(raw, r).assign_random_plurals(0.3))),
+        ('negatives', stage(lambda r: assign_random_negatives(with_plurals, 0.3, r))),
+        ('grammarizer', lambda: Grammarizer(with_negatives).grammarize_to_present_tense()),
+        ('noun_errors', stage(lambda r: ErrorMaker(answer, r).noun_errors(0.3))),
+        ('pronoun_errors', stage(lambda r: ErrorMaker(answer, r).pronoun_errors(0.3))),
+        ('verb_errors', stage(lambda r: ErrorMaker(answer, r).verb_errors(0.3))),
+        ('is_do_errors', stage(lambda r: ErrorMaker(answer, r).is_do_errors(0.3))),
+        ('preposition_errors', stage(lambda r: ErrorMaker(answer, r).preposition_errors(0.3))),
+        ('punctuation_errors', stage(lambda r: ErrorMaker(answer, r).punctuation_errors(0.3))),
+        ('serializer_round_trip', lambda: Serializer.from_json(as_json)),
+        ('answer_checker', lambda: AnswerChecker(submission, answer).get_word_hints()),
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=15, help='sentences per paragraph')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help='also write the results to this file')
+    args = parser.parse_args(argv)
+
+    results = {}
+    print('{:>22} {:>8} {:>8} {:>9}  top inits'.format('stage', 'inits', 'blocks', 'peak KB'))
+    for name, func in get_stages(args.size, args.seed):
+        func()  # warm up lazily built caches
+        inits = count_inits(func)
+        blocks, peak = measure_memory(func)
+        results[name] = {'inits': sum(inits.values()), 'inits_by_class': dict(inits), 'blocks': blocks,
+                         'peak_bytes': peak}
+        top = ', '.join('{}={}'.format(cls, count) for cls, count in inits.most_common(3))
+        print('{:>22} {:>8} {:>8} {:>9.1f}  {}'.format(name, sum(inits.values()), blocks, peak / 1024, top))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
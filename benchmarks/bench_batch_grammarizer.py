@@ -0,0 +1,65 @@
+"""
+Grammarizer on one paragraph at a time against BatchGrammarizer on the whole batch.
+
+    $ python -m benchmarks.bench_batch_grammarizer --paragraphs 10000
+"""
+import argparse
+import random
+import time
+
+from benchmarks.vocabulary import load_word_lists
+from paragraph_generator.backend.batch_grammarizer import BatchGrammarizer
+from paragraph_generator.backend.grammarizer import Grammarizer
+from paragraph_generator.backend.random_assignments.assign_random_negatives import assign_random_negatives
+from paragraph_generator.backend.random_assignments.plurals_assignement import PluralsAssignment
+from paragraph_generator.backend.random_assignments.random_paragraph import RandomParagraph
+from paragraph_generator.word_groups.columnar import ParagraphBatch, Vocabulary
+
+
+def make_raw_paragraphs(count, paragraph_size, seed=0):
+    word_lists = load_word_lists()
+    rng = random.Random(seed)
+    verbs, nouns = word_lists.verbs, word_lists.nouns
+    paragraphs = []
+    for _ in range(count):
+        raw = RandomParagraph(0.3, verbs, nouns, rng).create_chain_paragraph(paragraph_size)
+        with_plurals = PluralsAssignment(raw, rng).assign_random_plurals(0.3)
+        paragraphs.append(assign_random_negatives(with_plurals, 0.3, rng))
+    return paragraphs
+
+
+def timed(func):
+    start = time.perf_counter()
+    answer = func()
+    return answer, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--paragraphs', type=int, default=10000)
+    parser.add_argument('--size', type=int, default=15, help='sentences per paragraph')
+    args = parser.parse_args(argv)
+
+    paragraphs = make_raw_paragraphs(args.paragraphs, args.size)
+
+    expected, per_paragraph = timed(lambda: [Grammarizer(p).grammarize_to_present_tense() for p in paragraphs])
+
+    vocabulary = Vocabulary()
+    batch, encode = timed(lambda: ParagraphBatch.from_paragraphs(paragraphs, vocabulary))
+    grammarized, cold = timed(lambda: BatchGrammarizer(batch).grammarize_to_present_tense())
+    grammarized, warm = timed(lambda: BatchGrammarizer(batch).grammarize_to_present_tense())
+    answer, decode = timed(grammarized.to_paragraphs)
+    assert answer == expected, 'batch output differs from Grammarizer'
+
+    print('{} paragraphs of {} sentences, {} distinct words'.format(len(paragraphs), args.size, len(vocabulary)))
+    print('{:>28}: {:8.3f} s'.format('Grammarizer per paragraph', per_paragraph))
+    print('{:>28}: {:8.3f} s'.format('encode to ParagraphBatch', encode))
+    print('{:>28}: {:8.3f} s'.format('BatchGrammarizer (cold)', cold))
+    print('{:>28}: {:8.3f} s'.format('BatchGrammarizer (warm)', warm))
+    print('{:>28}: {:8.3f} s'.format('decode to Paragraphs', decode))
+    print('{:>28}: {:8.2f}x'.format('speedup, arrays only', per_paragraph / warm))
+    print('{:>28}: {:8.2f}x'.format('speedup, with conversions', per_paragraph / (encode + cold + decode)))
+
+
+if __name__ == '__main__':
+    main()
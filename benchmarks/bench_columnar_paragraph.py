@@ -0,0 +1,59 @@
+"""
+Memory per paragraph, and the time of indexed_all_words and find, for Paragraph and ColumnarParagraph.
+
+    $ python -m benchmarks.bench_columnar_paragraph --paragraphs 1000
+"""
+import argparse
+import random
+import timeit
+import tracemalloc
+
+from benchmarks.vocabulary import load_word_lists
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+from paragraph_generator.serializer import Serializer
+from paragraph_generator.word_groups.columnar import ColumnarParagraph, Vocabulary
+
+
+def allocated_by(func):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    answer = func()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return answer, after - before
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--paragraphs', type=int, default=1000)
+    parser.add_argument('--size', type=int, default=15, help='sentences per paragraph')
+    parser.add_argument('--number', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    generator = ParagraphsGenerator({'paragraph_size': args.size}, load_word_lists())
+    rng = random.Random(0)
+    dicts = [Serializer.to_dict(generator.generate_paragraphs(rng)[0]) for _ in range(args.paragraphs)]
+
+    paragraphs, object_bytes = allocated_by(lambda: [Serializer.to_obj(d) for d in dicts])
+    vocabulary = Vocabulary()
+    columnar, columnar_bytes = allocated_by(
+        lambda: [ColumnarParagraph.from_paragraph(p, vocabulary) for p in paragraphs])
+
+    print('{} paragraphs of {} sentences, {} distinct words'.format(args.paragraphs, args.size, len(vocabulary)))
+    print('{:>18} {:>14} {:>22} {:>14}'.format('', 'bytes/para', 'indexed_all_words us', 'find us'))
+    for name, group, size in (('Paragraph', paragraphs, object_bytes), ('ColumnarParagraph', columnar,
+                                                                        columnar_bytes)):
+        sample = group[:100]
+        targets = [next(p.all_words()) for p in sample]
+        iterate = min(timeit.repeat(lambda: [list(p.indexed_all_words()) for p in sample],
+                                    number=args.number, repeat=3))
+        find = min(timeit.repeat(lambda: [p.find(t) for p, t in zip(sample, targets)],
+                                 number=args.number, repeat=3))
+        per_call = args.number * len(sample)
+        print('{:>18} {:>14.0f} {:>22.2f} {:>14.2f}'.format(
+            name, size / len(group), iterate / per_call * 1e6, find / per_call * 1e6))
+    print('columnar bytes include the shared vocabulary')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Loading a large vocabulary: WordLists from one dict per word, against ColumnarWordLists from parallel lists and from
+csv text. Times are for building the lists object and reading verbs and nouns once. Memory is the tracemalloc peak
+while loading, and what is still allocated once the lists object is loaded.
+
+    $ python -m benchmarks.bench_columnar_word_lists --words 100000
+"""
+import argparse
+import csv
+import gc
+import io
+import time
+import tracemalloc
+
+from paragraph_generator.word_lists import ColumnarWordLists, WordLists
+
+PREPOSITIONS = ['', 'with', 'to', 'for', 'about']
+PARTICLES = ['', 'away', 'up', 'out']
+
+
+def make_columns(words):
+    verbs = {'verb': ['verb{}'.format(index) for index in range(words)],
+             'irregular_past': ['past{}'.format(index) if index % 7 == 0 else '' for index in range(words)],
+             'preposition': [PREPOSITIONS[index % len(PREPOSITIONS)] for index in range(words)],
+             'particle': [PARTICLES[index % len(PARTICLES)] for index in range(words)],
+             'objects': [index % 3 for index in range(words)]}
+    countable = {'noun': ['noun{}'.format(index) for index in range(words)],
+                 'irregular_plural': ['nouns{}x'.format(index) if index % 11 == 0 else '' for index in range(words)]}
+    return verbs, countable
+
+
+def to_csv(columns):
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(list(columns))
+    writer.writerows(zip(*columns.values()))
+    return out.getvalue()
+
+
+def load_all(load):
+    lists = load()
+    lists.verbs
+    lists.nouns
+    return lists
+
+
+def measure(load):
+    """:return: seconds, then peak and held bytes from a second run under tracemalloc, which is much slower"""
+    gc.collect()
+    start = time.perf_counter()
+    load_all(load)
+    seconds = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    lists = load_all(load)
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del lists
+    return seconds, peak, held
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--words', type=int, default=100000, help='verbs, and also countable nouns')
+    args = parser.parse_args(argv)
+
+    verb_columns, noun_columns = make_columns(args.words)
+    verb_csv, noun_csv = to_csv(verb_columns), to_csv(noun_columns)
+
+    def from_dicts():
+        verbs = [dict(zip(verb_columns, values)) for values in zip(*verb_columns.values())]
+        countable = [dict(zip(noun_columns, values)) for values in zip(*noun_columns.values())]
+        return WordLists(verbs=verbs, countable=countable)
+
+    loaders = [
+        ('WordLists (dicts)', from_dicts),
+        ('Columnar (lists)', lambda: ColumnarWordLists(verb_columns, noun_columns)),
+        ('Columnar (csv)', lambda: ColumnarWordLists.from_csv(io.StringIO(verb_csv), io.StringIO(noun_csv))),
+    ]
+    print('{} verbs and {} countable nouns'.format(args.words, args.words))
+    print('{:>20} {:>10} {:>12} {:>12}'.format('', 'seconds', 'peak MB', 'held MB'))
+    for name, load in loaders:
+        seconds, peak, held = measure(load)
+        print('{:>20} {:>10.2f} {:>12.1f} {:>12.1f}'.format(name, seconds, peak / 1e6, held / 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Grading many submissions of one worksheet: AnswerChecker from the original Paragraph against AnswerChecker from one
+compile_checker(original).
+
+    $ python -m benchmarks.bench_compiled_checker --size 15 --submissions 200
+"""
+import argparse
+import random
+import timeit
+
+from benchmarks.vocabulary import load_word_lists
+from paragraph_generator.answer_checker import AnswerChecker
+from paragraph_generator.compiled_checker import compile_checker
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+
+
+def grade(submissions, original):
+    for submission in submissions:
+        checker = AnswerChecker(submission, original)
+        checker.get_sentence_hints()
+        checker.get_word_hints()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=15)
+    parser.add_argument('--submissions', type=int, default=200)
+    parser.add_argument('--number', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    generator = ParagraphsGenerator({'paragraph_size': args.size}, load_word_lists())
+    rng = random.Random(1)
+    answer, _ = generator.generate_paragraphs(rng)
+    submissions = [str(generator._create_errors(answer, rng).get_paragraph()) for _ in range(args.submissions)]
+
+    compile_seconds = min(timeit.repeat(lambda: compile_checker(answer), number=args.number, repeat=3)) / args.number
+    timings = {
+        'paragraph': lambda: grade(submissions, answer),
+        'compiled': lambda: grade(submissions, compile_checker(answer)),
+    }
+    print('sentences: {}  submissions: {}  compile: {:.2f} ms'.format(len(answer), len(submissions),
+                                                                       compile_seconds * 1e3))
+    per_submission = {}
+    for name, func in timings.items():
+        per_submission[name] = min(timeit.repeat(func, number=args.number, repeat=3)) / (args.number * len(submissions))
+        print('{:>10}: {:.1f} us per submission'.format(name, per_submission[name] * 1e6))
+    print('{:>10}: {:.2f}x'.format('speedup', per_submission['paragraph'] / per_submission['compiled']))
+
+
+if __name__ == '__main__':
+    main()
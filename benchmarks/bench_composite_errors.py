@@ -0,0 +1,50 @@
+"""
+Error creation on grammatical paragraphs: the six chained ErrorMaker methods against one composite_errors pass.
+
+    $ python -m benchmarks.bench_composite_errors --size 15 --p-error 0.2
+"""
+import argparse
+import random
+import timeit
+
+from benchmarks.vocabulary import load_word_lists
+from paragraph_generator.backend.error_maker import ERROR_ORDER, ErrorMaker
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+
+
+def chained(paragraph, p_error, rng):
+    return (ErrorMaker(paragraph, rng).noun_errors(p_error).pronoun_errors(p_error).verb_errors(p_error)
+            .is_do_errors(p_error).punctuation_errors(p_error).preposition_errors(p_error).get_paragraph())
+
+
+def composite(paragraph, p_error, rng):
+    return ErrorMaker(paragraph, rng).composite_errors({tag: p_error for tag in ERROR_ORDER}).get_paragraph()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=15)
+    parser.add_argument('--paragraphs', type=int, default=50)
+    parser.add_argument('--p-error', type=float, default=0.2)
+    parser.add_argument('--number', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    generator = ParagraphsGenerator({'paragraph_size': args.size, 'error_probability': 0.0}, load_word_lists())
+    rng = random.Random(1)
+    answers = [generator.generate_paragraphs(rng)[0] for _ in range(args.paragraphs)]
+
+    per_paragraph = {}
+    for name, func in (('chained', chained), ('composite', composite)):
+        def run():
+            for answer in answers:
+                func(answer, args.p_error, rng)
+        per_paragraph[name] = min(timeit.repeat(run, number=args.number, repeat=5)) / (args.number * len(answers))
+
+    print('paragraphs: {}  sentences each: {}  p_error: {}'.format(len(answers), args.size, args.p_error))
+    for name, seconds in per_paragraph.items():
+        print('{:>10}: {:.1f} us per paragraph'.format(name, seconds * 1e6))
+    print('{:>10}: {:.2f}x'.format('speedup', per_paragraph['chained'] / per_paragraph['composite']))
+
+
+if __name__ == '__main__':
+    main()
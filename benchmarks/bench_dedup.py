@@ -0,0 +1,68 @@
+"""
+Dedup indexes: memory per million fingerprints, and batch generation with and without a dedup index.
+
+    $ python -m benchmarks.bench_dedup --fingerprints 1000000 --batch 200
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from benchmarks.vocabulary import load_word_lists
+from paragraph_generator.backend.dedup import BloomFilter, FingerprintSet
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+
+
+def random_fingerprints(count, seed=0):
+    rng = random.Random(seed)
+    return [rng.getrandbits(64).to_bytes(8, 'little') for _ in range(count)]
+
+
+def measure_memory(make_index, fingerprints):
+    """bytes allocated by an index holding fingerprints, not counting the fingerprints already alive in the list"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    index = make_index()
+    for fingerprint in fingerprints:
+        index.add(fingerprint)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return index, used
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--fingerprints', type=int, default=1000000)
+    parser.add_argument('--batch', type=int, default=200)
+    parser.add_argument('--size', type=int, default=15)
+    args = parser.parse_args(argv)
+
+    fingerprints = random_fingerprints(args.fingerprints)
+    per_million = 1e6 / args.fingerprints
+    print('fingerprints: {}  (8 bytes each)'.format(args.fingerprints))
+    indexes = (
+        ('FingerprintSet', FingerprintSet, 8),
+        ('Bloom 1%', lambda: BloomFilter(args.fingerprints, 0.01), None),
+        ('Bloom 0.1%', lambda: BloomFilter(args.fingerprints, 0.001), None),
+    )
+    for name, make_index, on_disk_per_item in indexes:
+        index, used = measure_memory(make_index, fingerprints)
+        if on_disk_per_item is None:
+            on_disk = index.num_bits / 8
+        else:
+            on_disk = on_disk_per_item * len(index)
+        print('{:>15}: {:7.1f} MB in memory  {:7.1f} MB on disk  per million fingerprints'.format(
+            name, used * per_million / 1e6, on_disk * per_million / 1e6))
+        del index
+
+    generator = ParagraphsGenerator({'paragraph_size': args.size}, load_word_lists())
+    for name, index in (('no index', None), ('FingerprintSet', FingerprintSet()),
+                        ('Bloom 1%', BloomFilter(args.batch))):
+        start = time.perf_counter()
+        generator.generate_batch(args.batch, index, random.Random(1))
+        seconds = time.perf_counter() - start
+        print('{:>15}: {:.2f} ms per paragraph in a batch of {}'.format(name, seconds * 1e3 / args.batch, args.batch))
+
+
+if __name__ == '__main__':
+    main()
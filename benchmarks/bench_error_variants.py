@@ -0,0 +1,61 @@
+"""
+Noun and verb errors at error_probability=1.0 on one long paragraph: building the error variants on every call against
+the cached variant tables.
+
+    $ python -m benchmarks.bench_error_variants --size 1000
+"""
+import argparse
+import random
+import timeit
+
+from benchmarks.vocabulary import load_word_lists
+from paragraph_generator.backend import error_maker
+from paragraph_generator.backend.error_maker import ErrorMaker
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+from paragraph_generator.words.noun import Noun
+from paragraph_generator.words.verb import Verb
+
+
+def uncached(func):
+    """runs func as if there were no cache: every lookup builds its variants again."""
+    noun_cache = error_maker._NOUN_ERROR_CHOICES
+    verb_cache = error_maker._VERB_ERROR_CHOICES
+    old_max = error_maker.MAX_CACHED_ERROR_CHOICES
+    error_maker.MAX_CACHED_ERROR_CHOICES = 0
+    try:
+        func()
+    finally:
+        error_maker.MAX_CACHED_ERROR_CHOICES = old_max
+        noun_cache.clear()
+        verb_cache.clear()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=1000)
+    parser.add_argument('--number', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    generator = ParagraphsGenerator({'paragraph_size': args.size, 'error_probability': 0.0}, load_word_lists())
+    rng = random.Random(1)
+    answer = generator.generate_paragraphs(rng)[0]
+    nouns_and_verbs = sum(1 for word in answer.all_words() if isinstance(word, (Noun, Verb)))
+
+    def make_errors():
+        ErrorMaker(answer, rng).noun_errors(1.0).verb_errors(1.0)
+
+    timings = {
+        'rebuilt': min(timeit.repeat(lambda: uncached(make_errors), number=args.number, repeat=3)) / args.number,
+    }
+    make_errors()
+    timings['cached'] = min(timeit.repeat(make_errors, number=args.number, repeat=3)) / args.number
+
+    print('sentences: {}  nouns and verbs: {}  error_probability: 1.0'.format(len(answer), nouns_and_verbs))
+    for name, seconds in timings.items():
+        print('{:>8}: {:.2f} ms per paragraph  {:.2f} us per error'.format(
+            name, seconds * 1e3, seconds * 1e6 / nouns_and_verbs))
+    print('{:>8}: {:.2f}x'.format('speedup', timings['rebuilt'] / timings['cached']))
+
+
+if __name__ == '__main__':
+    main()
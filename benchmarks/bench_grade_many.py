@@ -0,0 +1,57 @@
+"""
+Grading a class set against one worksheet: a loop of AnswerCheckers against grade_many in one process and in several.
+
+    $ python -m benchmarks.bench_grade_many --size 15 --students 300 --processes 4
+"""
+import argparse
+import random
+import time
+
+from benchmarks.vocabulary import load_word_lists
+from paragraph_generator.answer_checker import AnswerChecker
+from paragraph_generator.grading import grade_many
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+
+
+def naive_loop(original, submissions):
+    results = []
+    for submission in submissions:
+        checker = AnswerChecker(submission, original)
+        results.append((checker.get_sentence_hints(), checker.get_word_hints()))
+    return results
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=15)
+    parser.add_argument('--students', type=int, default=300)
+    parser.add_argument('--processes', type=int, default=4)
+    args = parser.parse_args(argv)
+
+    generator = ParagraphsGenerator({'paragraph_size': args.size}, load_word_lists())
+    rng = random.Random(1)
+    answer, _ = generator.generate_paragraphs(rng)
+    submissions = [str(generator._create_errors(answer, rng).get_paragraph()) for _ in range(args.students)]
+
+    timings = {
+        'naive loop': timed(lambda: naive_loop(answer, submissions)),
+        'grade_many, 1 process': timed(lambda: grade_many(answer, submissions, processes=1)),
+        'grade_many, {} processes'.format(args.processes): timed(
+            lambda: grade_many(answer, submissions, processes=args.processes)),
+    }
+    print('sentences: {}  students: {}'.format(len(answer), args.students))
+    for name, seconds in timings.items():
+        print('{:>24}: {:7.1f} ms  {:.2f}x'.format(name, seconds * 1e3, timings['naive loop'] / seconds))
+    top = grade_many(answer, submissions, processes=1, most_missed=3)['most_missed_words']
+    print('most missed: {}'.format(', '.join('{word!r} in sentence {sentence_index} ({count})'.format(**word)
+                                          for word in top)))
+
+
+if __name__ == '__main__':
+    main()
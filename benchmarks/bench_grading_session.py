@@ -0,0 +1,83 @@
+"""
+Live feedback while typing a 30 sentence paragraph: a new AnswerChecker on the whole text after every keystroke
+against one GradingSession updated with edit. Both get sentence and word hints after each keystroke.
+
+    $ python -m benchmarks.bench_grading_session --size 30
+"""
+import argparse
+import random
+import time
+
+from benchmarks.vocabulary import load_word_lists
+from paragraph_generator.answer_checker import AnswerChecker
+from paragraph_generator.compiled_checker import compile_checker
+from paragraph_generator.grading import GradingSession
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+
+
+def keystrokes(target, rng, typos):
+    """(start, end, replacement) edits that type target left to right, with some typos fixed by backspace"""
+    edits = []
+    for index, char in enumerate(target):
+        if rng.random() < typos:
+            edits.append((index, index, 'x'))
+            edits.append((index, index + 1, ''))
+        edits.append((index, index, char))
+    return edits
+
+
+def middle_edits(target, rng, count):
+    """replaces one character somewhere in the finished text, then puts it back"""
+    edits = []
+    for _ in range(count):
+        index = rng.randrange(len(target))
+        edits.append((index, index + 1, 'x'))
+        edits.append((index, index + 1, target[index]))
+    return edits
+
+
+def per_keystroke(edits, grade):
+    start = time.perf_counter()
+    for edit in edits:
+        grade(edit)
+    return (time.perf_counter() - start) / len(edits)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=30)
+    parser.add_argument('--typos', type=float, default=0.05)
+    args = parser.parse_args(argv)
+
+    generator = ParagraphsGenerator({'paragraph_size': args.size}, load_word_lists())
+    rng = random.Random(1)
+    answer, _ = generator.generate_paragraphs(rng)
+    target = str(answer)
+    print('sentences: {}  characters: {}'.format(len(answer), len(target)))
+
+    for name, edits in (('typing', keystrokes(target, rng, args.typos)),
+                        ('editing', [(0, 0, target)] + middle_edits(target, rng, 200))):
+        text = ['']
+
+        def full(edit):
+            start, end, replacement = edit
+            text[0] = text[0][:start] + replacement + text[0][end:]
+            checker = AnswerChecker(text[0], answer)
+            checker.get_sentence_hints()
+            checker.get_word_hints()
+
+        session = GradingSession(compile_checker(answer))
+
+        def incremental(edit):
+            session.edit(*edit)
+            session.get_sentence_hints()
+            session.get_word_hints()
+
+        full_seconds = per_keystroke(edits, full)
+        session_seconds = per_keystroke(edits, incremental)
+        print('{:>8} ({} keystrokes): AnswerChecker {:.0f} us  GradingSession {:.0f} us  per keystroke  {:.1f}x'.format(
+            name, len(edits), full_seconds * 1e6, session_seconds * 1e6, full_seconds / session_seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Import time of the package and of the modules that tools usually need, from python -X importtime in a fresh
+interpreter. The time is the median over several runs, of the cumulative microseconds reported for the module.
+
+    $ python -m benchmarks.bench_import
+    $ python -m benchmarks.bench_import --statements "import paragraph_generator" --max-us 5000
+
+With --max-us, the exit code is 1 if any median is slower, so it can guard against import time regressions.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    'import paragraph_generator',
+    'from paragraph_generator import Paragraph',
+    'from paragraph_generator import ParagraphsGenerator',
+    'from paragraph_generator import AnswerChecker',
+    'from paragraph_generator import Serializer',
+]
+
+
+def import_microseconds(statement: str) -> int:
+    """the total import time of the modules that statement imports, not counting those python imports at start up"""
+    already_imported = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'pass'],
+                                      stderr=subprocess.PIPE, universal_newlines=True, check=True).stderr
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    skip = set(_top_level_times(already_imported))
+    return sum(cumulative for name, cumulative in _top_level_times(result.stderr).items() if name not in skip)
+
+
+def _top_level_times(importtime_output: str) -> dict:
+    """{module imported at the top level: cumulative microseconds}"""
+    times = {}
+    for line in importtime_output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if not name.startswith('  '):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--statements', nargs='+', default=STATEMENTS)
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--max-us', type=int, help='exit with 1 if a median is more than this')
+    args = parser.parse_args(argv)
+
+    slower = []
+    for statement in args.statements:
+        median = statistics.median(import_microseconds(statement) for _ in range(args.repeat))
+        print('{:>10.0f} us  {}'.format(median, statement))
+        if args.max_us is not None and median > args.max_us:
+            slower.append(statement)
+    for statement in slower:
+        print('SLOWER than {} us: {}'.format(args.max_us, statement))
+    if slower:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+The cost of instrumentation on ParagraphsGenerator.generate_paragraphs: without an Instrumentation, with one, and with
+one that does not track allocated memory blocks. What the instrumented runs recorded is logged at the end.
+
+    $ python -m benchmarks.bench_instrumentation --paragraphs 2000
+"""
+import argparse
+import logging
+import random
+import timeit
+
+from benchmarks.vocabulary import load_word_lists
+from paragraph_generator.instrumentation import Instrumentation, LoggingSink
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+
+CONFIG = {'error_probability': 0.2, 'is_do_errors': True, 'preposition_transpose_errors': True}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--paragraphs', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    word_lists = load_word_lists()
+    warm_up = ParagraphsGenerator(CONFIG, word_lists)
+    for seed in range(args.paragraphs):
+        warm_up.generate_paragraphs(random.Random(seed))
+    instrumentations = [
+        ('none', None),
+        ('instrumented', Instrumentation()),
+        ('no allocations', Instrumentation(track_allocations=False)),
+    ]
+    baseline = None
+    for name, instrumentation in instrumentations:
+        generator = ParagraphsGenerator(CONFIG, word_lists, instrumentation)
+
+        def run():
+            rng = random.Random(0)
+            for _ in range(args.paragraphs):
+                generator.generate_paragraphs(rng)
+
+        seconds = min(timeit.repeat(run, number=1, repeat=args.repeat)) / args.paragraphs
+        baseline = baseline or seconds
+        print('{:>16} {:>9.1f} us/paragraph {:>7.1%} overhead'.format(name, seconds * 1e6, seconds / baseline - 1))
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    LoggingSink().emit(instrumentations[1][1].snapshot())
+
+
+if __name__ == '__main__':
+    main()
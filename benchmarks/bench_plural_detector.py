@@ -0,0 +1,61 @@
+"""
+Plural detection in create_answer_paragraph: the old per-noun search (get_countable_nouns, then noun.plural() and a
+substring search for each noun) against the cached PluralDetector, and PluralDetector.find against the one pass scan
+for a growing number of plurals.
+
+    $ python -m benchmarks.bench_plural_detector --size 200
+"""
+import argparse
+import random
+import string
+import timeit
+
+from benchmarks.vocabulary import load_word_lists
+from paragraph_generator.backend.create_answer_paragraph import get_plural_detector
+from paragraph_generator.backend.plural_detector import MIN_PATTERNS_TO_SCAN, PluralDetector
+from paragraph_generator.backend.random_assignments.plurals_assignement import get_countable_nouns
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+
+
+def per_noun(paragraph, submission):
+    countable_nouns = get_countable_nouns(paragraph)
+    return [noun for noun in countable_nouns if noun.plural().value.lower() in submission.lower()]
+
+
+def cached(paragraph, submission):
+    countable_nouns, detector = get_plural_detector(paragraph)
+    return [countable_nouns[index] for index in detector.find(submission.lower())]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=200)
+    parser.add_argument('--number', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    generator = ParagraphsGenerator({'paragraph_size': args.size}, load_word_lists())
+    rng = random.Random(1)
+    answer, error = generator.generate_paragraphs(rng)
+    submission = str(error)
+    assert per_noun(answer, submission) == cached(answer, submission)
+
+    print('sentences: {}  countable nouns: {}  submission: {} chars'.format(
+        len(answer), len(get_countable_nouns(answer)), len(submission)))
+    for name, func in (('per noun', per_noun), ('cached', cached)):
+        seconds = min(timeit.repeat(lambda: func(answer, submission), number=args.number, repeat=3)) / args.number
+        print('{:>10}: {:.1f} us per submission'.format(name, seconds * 1e6))
+
+    words = [''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 8))) + 's' for _ in range(4096)]
+    text = ' '.join(rng.choice(words) for _ in range(1000))
+    print('\nrandom plurals, {} char text (find checks each pattern below {} patterns)'.format(
+        len(text), MIN_PATTERNS_TO_SCAN))
+    for count in (32, 128, 512, 2048):
+        detector = PluralDetector(words[:count])
+        detector.scan('')
+        each = min(timeit.repeat(lambda: [word in text for word in words[:count]], number=5, repeat=3)) / 5
+        scan = min(timeit.repeat(lambda: detector.scan(text), number=5, repeat=3)) / 5
+        print('{:>6} plurals: {:8.1f} us checking each  {:8.1f} us one pass'.format(count, each * 1e6, scan * 1e6))
+
+
+if __name__ == '__main__':
+    main()
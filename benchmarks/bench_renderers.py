@@ -0,0 +1,74 @@
+"""
+HTML word hints for a class set: rendering the <bold></bold> hint paragraph and converting it with a regex, against
+rendering HTML straight from the hint words, and against writing it to a stream. The rendering is timed on its own, on
+hint words that were already compared, and then with the comparison.
+
+    $ python -m benchmarks.bench_renderers --size 15 --students 300
+"""
+import argparse
+import html
+import io
+import random
+import re
+import timeit
+
+from benchmarks.vocabulary import load_word_lists
+from paragraph_generator.compiled_checker import compile_checker
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+from paragraph_generator.rendering import HTML
+
+BOLD_RE = re.compile(r'<bold>(.*?)</bold>')
+
+
+def regex_post_pass(hint_paragraph):
+    return BOLD_RE.sub(r'<strong>\1</strong>', html.escape(hint_paragraph, quote=False).replace(
+        '&lt;bold&gt;', '<bold>').replace('&lt;/bold&gt;', '</bold>'))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=15)
+    parser.add_argument('--students', type=int, default=300)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    generator = ParagraphsGenerator({'paragraph_size': args.size}, load_word_lists())
+    rng = random.Random(1)
+    answer, _ = generator.generate_paragraphs(rng)
+    submissions = [str(generator._create_errors(answer, rng).get_paragraph()) for _ in range(args.students)]
+    checker = compile_checker(answer)
+    comparisons = [checker.comparison(submission) for submission in submissions]
+
+    hints = [[hint.words for hint in comparison.compare_by_words_structured()['hints']] for comparison in comparisons]
+
+    def write_hints():
+        stream = io.StringIO()
+        for hint_sentences in hints:
+            HTML.write_paragraph(stream, hint_sentences)
+            stream.write('\n')
+
+    def write_all():
+        stream = io.StringIO()
+        for comparison in comparisons:
+            comparison.write_word_hints(stream, HTML)
+            stream.write('\n')
+
+    cases = [
+        ('render: regex', lambda: [regex_post_pass(' '.join([str(sentence) for sentence in hint_sentences]))
+                                   for hint_sentences in hints]),
+        ('render: HTML', lambda: [HTML.render_paragraph(hint_sentences) for hint_sentences in hints]),
+        ('render: HTML stream', write_hints),
+        ('<bold> hints', lambda: [comparison.compare_by_words() for comparison in comparisons]),
+        ('<bold> hints + regex', lambda: [regex_post_pass(comparison.compare_by_words()['hint_paragraph'])
+                                          for comparison in comparisons]),
+        ('HTML renderer', lambda: [comparison.compare_by_words(HTML) for comparison in comparisons]),
+        ('HTML write_word_hints', write_all),
+    ]
+    print('sentences: {}  students: {}'.format(len(answer), args.students))
+    for name, func in cases:
+        seconds = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print('{:>24} {:>9.1f} ms'.format(name, seconds * 1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Renders the answer paragraphs of a worksheet: joining the words of each sentence, str() of sentences that were
+already rendered, get_expected_sentences and writing whole paragraphs to a stream. concatenated is the old
+Sentence.__str__, for comparison.
+
+    $ python -m benchmarks.bench_rendering --paragraphs 500
+"""
+import argparse
+import io
+import random
+import timeit
+
+from benchmarks.vocabulary import load_word_lists
+from paragraph_generator.backend.paragraph_comparison import get_expected_sentences
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+from paragraph_generator.word_groups.paragraph import Paragraph
+from paragraph_generator.word_groups.sentence import _render
+from paragraph_generator.words.punctuation import Punctuation
+
+CONFIG = {'paragraph_size': 15}
+
+
+def concatenated(sentence):
+    answer = ''
+    for word in sentence:
+        if not answer or isinstance(word, Punctuation):
+            answer += word.value
+        else:
+            answer += ' {}'.format(word.value)
+    return answer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--paragraphs', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=7)
+    args = parser.parse_args(argv)
+
+    generator = ParagraphsGenerator(CONFIG, load_word_lists())
+    rng = random.Random(0)
+    paragraphs = [generator.generate_paragraphs(rng)[0] for _ in range(args.paragraphs)]
+    sentences = [sentence for paragraph in paragraphs for sentence in paragraph]
+
+    def write_worksheet():
+        stream = io.StringIO()
+        for paragraph in paragraphs:
+            Paragraph(paragraph).write(stream)
+            stream.write('\n')
+
+    cases = [
+        ('concatenated', lambda: [concatenated(sentence) for sentence in sentences]),
+        ('joined, first time', lambda: [_render(sentence) for sentence in sentences]),
+        ('joined, cached', lambda: [str(sentence) for sentence in sentences]),
+        ('get_expected_sentences', lambda: [get_expected_sentences(paragraph) for paragraph in paragraphs]),
+        ('Paragraph.write', write_worksheet),
+    ]
+    print('{} paragraphs, {} sentences'.format(len(paragraphs), len(sentences)))
+    for name, func in cases:
+        seconds = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print('{:>24} {:>9.3f} ms'.format(name, seconds * 1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Predicate construction over the verbs in verbs.csv: assign_objects against the precomputed SentenceTemplates.
+
+    $ python -m benchmarks.bench_sentence_templates
+"""
+import argparse
+import random
+import timeit
+
+from benchmarks.vocabulary import load_word_lists
+from paragraph_generator.backend.random_assignments.sentence_templates import (SentenceTemplates, assign_objects,
+                                                                                fill_template)
+from paragraph_generator.words.pronoun import Pronoun
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=200)
+    args = parser.parse_args(argv)
+
+    word_lists = load_word_lists()
+    verb_groups = word_lists.verbs
+    nouns = word_lists.nouns
+
+    build_time = timeit.timeit(lambda: SentenceTemplates(verb_groups), number=args.number) / args.number
+    templates = SentenceTemplates(verb_groups)
+    entries = templates.pair_with(verb_groups)
+
+    rng = random.Random(1)
+    cases = []
+    for verb_group, table in entries:
+        for _ in range(10):
+            objects = [rng.choice(list(Pronoun)).object() if rng.random() < 0.3 else rng.choice(nouns)
+                       for _ in range(verb_group.objects)]
+            cases.append((verb_group, table, objects))
+
+    def run_assign_objects():
+        for verb_group, _, objects in cases:
+            assign_objects(verb_group, objects[:])
+
+    def run_templates():
+        for verb_group, table, objects in cases:
+            fill_template(table, verb_group, objects)
+
+    per_call = {}
+    for name, func in (('assign_objects', run_assign_objects), ('fill_template', run_templates)):
+        per_call[name] = min(timeit.repeat(func, number=args.number, repeat=5)) / (args.number * len(cases))
+
+    print('verb groups: {}  shapes: {}  template build: {:.1f} us'.format(
+        len(verb_groups), len({id(table) for _, table in entries}), build_time * 1e6))
+    for name, seconds in per_call.items():
+        print('{:>16}: {:.3f} us per predicate'.format(name, seconds * 1e6))
+    print('{:>16}: {:.2f}x'.format('speedup', per_call['assign_objects'] / per_call['fill_template']))
+
+
+if __name__ == '__main__':
+    main()
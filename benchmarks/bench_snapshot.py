@@ -0,0 +1,75 @@
+"""
+Cold start of a worker, in a fresh interpreter: the time from the first import to the first generated paragraph, when
+the generator is built from the bundled csv files and when it is loaded from a snapshot. The build includes reading
+the csv files. The snapshot was made after --warm-up paragraphs, and its error choice caches are restored.
+
+    $ python -m benchmarks.bench_snapshot --vocabularies 1 10 50
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.vocabulary import load_word_lists
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+
+CONFIG = {'error_probability': 0.2, 'is_do_errors': True, 'preposition_transpose_errors': True}
+
+BUILD = '''
+import time
+start = time.perf_counter()
+from benchmarks.vocabulary import load_word_lists
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+generator = ParagraphsGenerator({config!r}, load_word_lists({copies}))
+generator.prepare()
+generator.generate_paragraphs()
+print(time.perf_counter() - start)
+'''
+
+LOAD = '''
+import time
+start = time.perf_counter()
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+generator = ParagraphsGenerator.load_snapshot({path!r}, restore_error_caches=True)
+generator.generate_paragraphs()
+print(time.perf_counter() - start)
+'''
+
+
+def cold_start_seconds(code, repeat):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', code], cwd=root, stdout=subprocess.PIPE,
+                                universal_newlines=True, check=True).stdout
+        times.append(float(output))
+    return statistics.median(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--vocabularies', type=int, nargs='+', default=[1, 10, 50],
+                        help='copies of the bundled vocabulary')
+    parser.add_argument('--warm-up', type=int, default=0, help='paragraphs generated before the snapshot is saved')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print('{:>10} {:>10} {:>12} {:>14} {:>8}'.format('vocabulary', 'build ms', 'snapshot ms', 'snapshot size',
+                                                     'speedup'))
+    with tempfile.TemporaryDirectory() as directory:
+        for copies in args.vocabularies:
+            path = os.path.join(directory, 'generator_{}.snapshot'.format(copies))
+            generator = ParagraphsGenerator(CONFIG, load_word_lists(copies))
+            generator.prepare(args.warm_up)
+            generator.save_snapshot(path)
+
+            build = cold_start_seconds(BUILD.format(config=CONFIG, copies=copies), args.repeat)
+            load = cold_start_seconds(LOAD.format(path=path), args.repeat)
+            print('{:>9}x {:>10.1f} {:>12.1f} {:>12.0f}kB {:>7.2f}x'.format(
+                copies, build * 1e3, load * 1e3, os.path.getsize(path) / 1e3, build / load))
+
+
+if __name__ == '__main__':
+    main()
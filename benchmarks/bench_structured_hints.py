@@ -0,0 +1,55 @@
+"""
+Word hints for a UI that highlights errors: rendering the <bold></bold> hint paragraph and finding the bold spans in
+it with a regex, against compare_by_words_structured, which gives the error tokens and only renders the hint strings
+if they are asked for.
+
+    $ python -m benchmarks.bench_structured_hints --size 15 --students 300
+"""
+import argparse
+import random
+import re
+import timeit
+
+from benchmarks.vocabulary import load_word_lists
+from paragraph_generator.compiled_checker import compile_checker
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+
+BOLD_RE = re.compile(r'<bold>(.*?)</bold>')
+
+
+def render_then_parse(comparison):
+    hint_paragraph = comparison.compare_by_words()['hint_paragraph']
+    return [(match.span(), match.group(1)) for match in BOLD_RE.finditer(hint_paragraph)]
+
+
+def structured(comparison):
+    hints = comparison.compare_by_words_structured()['hints']
+    return [(s_index, token) for s_index, hint in enumerate(hints) for token in hint.errors()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=15)
+    parser.add_argument('--students', type=int, default=300)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    generator = ParagraphsGenerator({'paragraph_size': args.size}, load_word_lists())
+    rng = random.Random(1)
+    answer, _ = generator.generate_paragraphs(rng)
+    submissions = [str(generator._create_errors(answer, rng).get_paragraph()) for _ in range(args.students)]
+    checker = compile_checker(answer)
+    comparisons = [checker.comparison(submission) for submission in submissions]
+
+    cases = [
+        ('render then parse', lambda: [render_then_parse(comparison) for comparison in comparisons]),
+        ('structured', lambda: [structured(comparison) for comparison in comparisons]),
+    ]
+    print('sentences: {}  students: {}'.format(len(answer), args.students))
+    for name, func in cases:
+        seconds = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print('{:>20} {:>9.1f} ms'.format(name, seconds * 1e3))
+
+
+if __name__ == '__main__':
+    main()
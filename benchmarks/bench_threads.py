@@ -0,0 +1,56 @@
+"""
+Throughput of ParagraphsGenerator.generate_paragraphs against thread count, with every thread sharing one
+generator and one WordLists. On a free-threaded (GIL-less) build throughput should scale with threads.
+
+    $ python -m benchmarks.bench_threads --paragraphs 2000 --threads 1 2 4 8
+"""
+import argparse
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.vocabulary import load_word_lists
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+
+CONFIG = {'error_probability': 0.2, 'is_do_errors': True, 'preposition_transpose_errors': True}
+
+
+def gil_enabled():
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def run(generator, paragraphs, threads):
+    per_thread = paragraphs // threads
+
+    def work(seed):
+        rng = random.Random(seed)
+        for _ in range(per_thread):
+            generator.generate_paragraphs(rng)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(work, range(threads)))
+    elapsed = time.perf_counter() - start
+    return per_thread * threads / elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--paragraphs', type=int, default=2000)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args(argv)
+
+    generator = ParagraphsGenerator(CONFIG, load_word_lists())
+    print('python {} gil_enabled={}'.format(sys.version.split()[0], gil_enabled()))
+    print('{:>8} {:>16} {:>9}'.format('threads', 'paragraphs/sec', 'scaling'))
+    baseline = None
+    for threads in args.threads:
+        throughput = run(generator, args.paragraphs, threads)
+        baseline = baseline or throughput
+        print('{:>8} {:>16.1f} {:>8.2f}x'.format(threads, throughput, throughput / baseline))
+
+
+if __name__ == '__main__':
+    main()
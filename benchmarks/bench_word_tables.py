@@ -0,0 +1,61 @@
+"""
+The pronoun and BeVerb lookups that run for many words in every paragraph, on their own and inside
+error_maker.get_be_verb and grammarizer._needs_third_person over the sentences of generated paragraphs.
+
+    $ python -m benchmarks.bench_word_tables --paragraphs 200
+"""
+import argparse
+import random
+import timeit
+
+from benchmarks.vocabulary import load_word_lists
+from paragraph_generator.backend.error_maker import get_be_verb
+from paragraph_generator.backend.grammarizer import _needs_third_person
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+from paragraph_generator.tags.wordtag import WordTag
+from paragraph_generator.words.be_verb import BeVerb
+from paragraph_generator.words.pronoun import CapitalPronoun, Pronoun
+
+CONFIG = {'probability_pronoun': 0.5, 'probability_plural_noun': 0.3, 'probability_negative_verb': 0.3}
+
+
+def time_per_call(func, calls, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat)) / calls
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--paragraphs', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=7)
+    args = parser.parse_args(argv)
+
+    generator = ParagraphsGenerator(CONFIG, load_word_lists())
+    rng = random.Random(0)
+    sentences = [sentence for _ in range(args.paragraphs)
+                 for sentence in generator.generate_paragraphs(rng)[0]]
+    pronouns = list(Pronoun) + list(CapitalPronoun)
+    be_verbs = list(BeVerb)
+
+    def each(method, words):
+        return lambda: [method(word) for word in words]
+
+    cases = [
+        ('AbstractPronoun.object', each(lambda word: word.object(), pronouns), len(pronouns)),
+        ('AbstractPronoun.subject', each(lambda word: word.subject(), pronouns), len(pronouns)),
+        ('capitalize', each(lambda word: word.capitalize(), pronouns), len(pronouns)),
+        ('de_capitalize', each(lambda word: word.de_capitalize(), pronouns), len(pronouns)),
+        ('AbstractPronoun.has_tags', each(lambda word: word.has_tags(WordTag.PLURAL), pronouns), len(pronouns)),
+        ('BeVerb.tags', each(lambda word: word.tags, be_verbs), len(be_verbs)),
+        ('BeVerb.has_tags', each(lambda word: word.has_tags(WordTag.NEGATIVE), be_verbs), len(be_verbs)),
+        ('BeVerb.negative', each(lambda word: word.negative(), be_verbs), len(be_verbs)),
+        ('BeVerb.past_tense', each(lambda word: word.past_tense(), be_verbs), len(be_verbs)),
+        ('get_be_verb', each(get_be_verb, sentences), len(sentences)),
+        ('_needs_third_person', each(_needs_third_person, sentences), len(sentences)),
+    ]
+    print('{} sentences'.format(len(sentences)))
+    for name, func, calls in cases:
+        print('{:>26} {:>9.3f} us/call'.format(name, time_per_call(func, calls, args.repeat) * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Profiles a batch of generations and a batch of gradings, prints the time in each pipeline stage and writes
+flamegraph collapsed stacks.
+
+    $ python -m benchmarks.profile_pipeline --paragraphs 500 --submissions 200 --out profile
+    $ flamegraph.pl profile.generate.folded > generate.svg
+    $ python -m benchmarks.profile_pipeline --sampling --interval 0.0005
+"""
+import argparse
+import random
+
+from benchmarks.vocabulary import load_word_lists
+from paragraph_generator.backend.error_maker import ERROR_ORDER, ErrorMaker
+from paragraph_generator.grading import grade_many
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+from paragraph_generator.profiling import profile
+
+CONFIG = {'error_probability': 0.2, 'is_do_errors': True, 'preposition_transpose_errors': True}
+
+
+def report(name, result, out):
+    stages = result.stage_seconds()
+    total = sum(stages.values()) or 1.0
+    print(name)
+    for stage, seconds in sorted(stages.items(), key=lambda item: -item[1]):
+        print('{:>20} {:>9.3f} s {:>6.1%}'.format(stage, seconds, seconds / total))
+    if out:
+        path = '{}.{}.folded'.format(out, name)
+        with open(path, 'w') as f:
+            result.write_collapsed(f)
+        print('{:>20} {}'.format('wrote', path))
+        if result.stats is not None:
+            result.dump_stats('{}.{}.prof'.format(out, name))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--paragraphs', type=int, default=500)
+    parser.add_argument('--submissions', type=int, default=200)
+    parser.add_argument('--sampling', action='store_true', help='sample stacks instead of running cProfile')
+    parser.add_argument('--interval', type=float, default=0.001, help='seconds between samples')
+    parser.add_argument('--out', help='write OUT.generate.folded and OUT.grade.folded, and .prof files for cProfile')
+    args = parser.parse_args(argv)
+
+    generator = ParagraphsGenerator(CONFIG, load_word_lists())
+    rng = random.Random(0)
+    with profile(args.sampling, args.interval) as result:
+        pairs = [generator.generate_paragraphs(rng) for _ in range(args.paragraphs)]
+    report('generate', result, args.out)
+
+    answer = pairs[0][0]
+    submissions = [str(ErrorMaker(answer, rng).composite_errors({tag: 0.2 for tag in ERROR_ORDER}).get_paragraph())
+                   for _ in range(args.submissions)]
+    with profile(args.sampling, args.interval) as result:
+        grade_many(answer, submissions, processes=1)
+    report('grade', result, args.out)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,177 @@
+"""
+Timings for every pipeline stage, on fixed seeds, over a grid of vocabulary and paragraph sizes.
+
+Each stage is timed on its own, with its input made ahead of time by the stages before it. The numbers are the best
+and median time per call over several repeats. Results can be written as JSON and compared against an earlier run to
+catch regressions.
+
+    $ python -m benchmarks.suite --json before.json
+    $ python -m benchmarks.suite --json after.json --compare before.json --tolerance 0.25
+    $ python -m benchmarks.suite --stages grammarizer_present compare_by_words --sizes 15 --vocabularies 1
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import timeit
+
+from benchmarks.vocabulary import load_json_lists
+from paragraph_generator.backend.create_answer_paragraph import create_answer_paragraph
+from paragraph_generator.backend.error_maker import ERROR_ORDER, ErrorMaker
+from paragraph_generator.backend.grammarizer import Grammarizer
+from paragraph_generator.backend.paragraph_comparison import ParagraphComparison
+from paragraph_generator.backend.random_assignments.assign_random_negatives import assign_random_negatives
+from paragraph_generator.backend.random_assignments.plurals_assignement import PluralsAssignment
+from paragraph_generator.backend.random_assignments.random_paragraph import RandomParagraph
+from paragraph_generator.serializer import Serializer
+from paragraph_generator.word_lists import WordLists
+
+SCHEMA_VERSION = 1
+P = 0.3
+
+
+def get_stages(copies, size, seed):
+    """
+
+    :return: [(name, func), ...] func takes no arguments and runs the stage once
+    """
+    verb_list, countable, uncountable, static = load_json_lists(copies)
+    word_lists = WordLists(verb_list, countable, uncountable, static)
+    verbs, nouns = word_lists.verbs, word_lists.nouns
+
+    rng = random.Random(seed)
+    raw = RandomParagraph(P, verbs, nouns, rng).create_chain_paragraph(size)
+    with_plurals = PluralsAssignment(raw, rng).assign_random_plurals(P)
+    with_negatives = assign_random_negatives(with_plurals, P, rng)
+    answer = Grammarizer(with_negatives).grammarize_to_present_tense()
+    submission = str(ErrorMaker(answer, rng).composite_errors({tag: P for tag in ERROR_ORDER}).get_paragraph())
+    checked_answer = create_answer_paragraph(submission, answer)
+
+    def seeded(func):
+        return lambda: func(random.Random(seed))
+
+    def materialize():
+        fresh = WordLists(verb_list, countable, uncountable, static)
+        return fresh.verbs, fresh.nouns
+
+    stages = [
+        ('word_lists', materialize),
+        ('chain_paragraph', seeded(lambda r: RandomParagraph(P, verbs, nouns, r).create_chain_paragraph(size))),
+        ('pool_paragraph', seeded(lambda r: RandomParagraph(P, verbs, nouns, r).create_pool_paragraph(5, size))),
+        ('plurals', seeded(lambda r: PluralsAssignment(raw, r).assign_random_plurals(P))),
+        ('negatives', seeded(lambda r: assign_random_negatives(with_plurals, P, r))),
+        ('grammarizer_present', lambda: Grammarizer(with_negatives).grammarize_to_present_tense()),
+        ('grammarizer_past', lambda: Grammarizer(with_negatives).grammarize_to_past_tense()),
+    ]
+    error_methods = ('noun_errors', 'pronoun_errors', 'verb_errors', 'is_do_errors', 'preposition_errors',
+                     'punctuation_errors')
+    for method in error_methods:
+        stages.append((method, seeded(lambda r, method=method: getattr(ErrorMaker(answer, r), method)(P))))
+    stages += [
+        ('composite_errors', seeded(lambda r: ErrorMaker(answer, r).composite_errors({tag: P for tag in ERROR_ORDER}))),
+        ('serializer_round_trip', lambda: Serializer.from_json(Serializer.to_json(answer))),
+        ('create_answer_paragraph', lambda: create_answer_paragraph(submission, answer)),
+        ('compare_by_sentences', lambda: ParagraphComparison(checked_answer, submission).compare_by_sentences()),
+        ('compare_by_words', lambda: ParagraphComparison(checked_answer, submission).compare_by_words()),
+    ]
+    return stages
+
+
+STAGE_NAMES = [
+    'word_lists', 'chain_paragraph', 'pool_paragraph', 'plurals', 'negatives',
+    'grammarizer_present', 'grammarizer_past',
+    'noun_errors', 'pronoun_errors', 'verb_errors', 'is_do_errors', 'preposition_errors', 'punctuation_errors',
+    'composite_errors', 'serializer_round_trip', 'create_answer_paragraph', 'compare_by_sentences', 'compare_by_words',
+]
+
+
+def time_stage(func, repeat, min_seconds):
+    """
+
+    :return: best and median seconds per call, calls per repeat
+    """
+    func()
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_seconds:
+        number *= 2
+    per_call = [seconds / number for seconds in timer.repeat(repeat, number)]
+    return min(per_call), statistics.median(per_call), number
+
+
+def run(vocabularies, sizes, seed, stage_names, repeat, min_seconds, out=sys.stdout):
+    results = []
+    for copies in vocabularies:
+        for size in sizes:
+            for name, func in get_stages(copies, size, seed):
+                if name not in stage_names:
+                    continue
+                best, median, number = time_stage(func, repeat, min_seconds)
+                results.append({'stage': name, 'vocabulary': copies, 'paragraph_size': size, 'seed': seed,
+                                'best_us': best * 1e6, 'median_us': median * 1e6, 'number': number,
+                                'repeat': repeat})
+                print('{:>24}  vocabulary x{:<3} size {:<4} {:>11.1f} us  (median {:.1f})'.format(
+                    name, copies, size, best * 1e6, median * 1e6), file=out)
+    return results
+
+
+def result_key(result):
+    return result['stage'], result['vocabulary'], result['paragraph_size'], result['seed']
+
+
+def compare(results, baseline, tolerance):
+    """
+
+    :return: [(key, baseline best_us, best_us), ...] for results more than tolerance slower than baseline
+    """
+    before = {result_key(result): result for result in baseline['results']}
+    slower = []
+    for result in results:
+        old = before.get(result_key(result))
+        if old is not None and result['best_us'] > old['best_us'] * (1 + tolerance):
+            slower.append((result_key(result), old['best_us'], result['best_us']))
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--vocabularies', type=int, nargs='+', default=[1, 10],
+                        help='copies of the bundled vocabulary')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[5, 15, 50], help='sentences per paragraph')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--stages', nargs='+', default=STAGE_NAMES, choices=STAGE_NAMES, metavar='STAGE')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-seconds', type=float, default=0.02, help='minimum time for one repeat')
+    parser.add_argument('--json', help='write the results to this file')
+    parser.add_argument('--compare', help='a json file from an earlier run')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='report stages more than this fraction slower than in --compare')
+    args = parser.parse_args(argv)
+
+    results = run(args.vocabularies, args.sizes, args.seed, set(args.stages), args.repeat, args.min_seconds)
+    report = {
+        'schema_version': SCHEMA_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        slower = compare(results, baseline, args.tolerance)
+        for (stage, copies, size, _), old, new in slower:
+            print('SLOWER {} vocabulary x{} size {}: {:.1f} us -> {:.1f} us'.format(stage, copies, size, old, new))
+        if slower:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
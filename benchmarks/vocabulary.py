@@ -0,0 +1,71 @@
+"""
+Loads the csv files bundled in paragraph_generator/data into the json-like lists that WordLists expects.
+"""
+import csv
+import os
+
+from paragraph_generator.word_lists import WordLists
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'paragraph_generator', 'data')
+
+
+def read_rows(file_name):
+    with open(os.path.join(DATA_DIR, file_name), newline='') as f:
+        lines = [line for line in f if line.strip() and not line.lstrip().startswith('#')]
+    return [[field.strip() for field in row] for row in csv.reader(lines, skipinitialspace=True)]
+
+
+def _field(row, index, default=''):
+    if index < len(row) and row[index] not in ('', 'null'):
+        return row[index]
+    return default
+
+
+def load_verbs():
+    verbs = []
+    for row in read_rows('verbs.csv'):
+        infinitive, _, particle = _field(row, 0).partition(' ')
+        irregular_past = _field(row, 1).partition(' ')[0]
+        verbs.append({'verb': infinitive, 'irregular_past': irregular_past, 'particle': particle,
+                      'preposition': _field(row, 2), 'objects': int(_field(row, 3, '1'))})
+    return verbs
+
+
+def load_countable():
+    return [{'noun': _field(row, 0), 'irregular_plural': _field(row, 1)} for row in read_rows('nouns.csv')]
+
+
+def load_uncountable():
+    return [{'noun': _field(row, 0), 'definite': False} for row in read_rows('uncountable.csv')]
+
+
+def load_static():
+    return [{'noun': _field(row, 0), 'is_plural': _field(row, 1) == 'p'} for row in read_rows('proper.csv')]
+
+
+def load_word_lists(copies=1):
+    """
+
+    :param copies: repeat every entry this many times (with a numbered suffix) to simulate larger vocabularies.
+    """
+    verbs, countable, uncountable, static = load_json_lists(copies)
+    return WordLists(verbs=verbs, countable=countable, uncountable=uncountable, static=static)
+
+
+def load_json_lists(copies=1):
+    """
+
+    :return: the verbs, countable, uncountable and static lists that WordLists takes
+    """
+    lists = [load_verbs(), load_countable(), load_uncountable(), load_static()]
+    if copies > 1:
+        lists = [_multiply(json_list, copies) for json_list in lists]
+    return lists
+
+
+def _multiply(json_list, copies):
+    key = 'verb' if json_list and 'verb' in json_list[0] else 'noun'
+    out = list(json_list)
+    for number in range(1, copies):
+        out += [dict(json_dict, **{key: '{}{}'.format(json_dict[key], number)}) for json_dict in json_list]
+    return out
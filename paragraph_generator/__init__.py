@@ -1,17 +1,50 @@
-from paragraph_generator.answer_checker import AnswerChecker
-from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
-from paragraph_generator.serializer import Serializer
-
-from paragraph_generator.word_groups.paragraph import Paragraph
-from paragraph_generator.word_groups.sentence import Sentence
-from paragraph_generator.word_groups.verb_group import VerbGroup
-
-from paragraph_generator.word_lists import WordLists, AbstractWordLists
-
-from paragraph_generator.words.basicword import BasicWord
-from paragraph_generator.words.be_verb import BeVerb
-from paragraph_generator.words.noun import Noun
-from paragraph_generator.words.pronoun import AbstractPronoun, Pronoun, CapitalPronoun
-from paragraph_generator.words.punctuation import Punctuation
-from paragraph_generator.words.verb import Verb
-from paragraph_generator.words.wordtools.abstractword import AbstractWord
+"""
+The names below are imported from their modules the first time they are used, so `import paragraph_generator` only
+loads the modules that are needed.
+"""
+import importlib
+
+_LAZY_NAMES = {
+    'AnswerChecker': 'paragraph_generator.answer_checker',
+    'CompiledChecker': 'paragraph_generator.compiled_checker',
+    'compile_checker': 'paragraph_generator.compiled_checker',
+    'ParagraphsGenerator': 'paragraph_generator.paragraphsgenerator',
+    'Serializer': 'paragraph_generator.serializer',
+    'Renderer': 'paragraph_generator.rendering',
+    'get_renderer': 'paragraph_generator.rendering',
+
+    'Paragraph': 'paragraph_generator.word_groups.paragraph',
+    'Sentence': 'paragraph_generator.word_groups.sentence',
+    'VerbGroup': 'paragraph_generator.word_groups.verb_group',
+
+    'WordLists': 'paragraph_generator.word_lists',
+    'ColumnarWordLists': 'paragraph_generator.word_lists',
+    'AbstractWordLists': 'paragraph_generator.word_lists',
+
+    'BasicWord': 'paragraph_generator.words.basicword',
+    'BeVerb': 'paragraph_generator.words.be_verb',
+    'Noun': 'paragraph_generator.words.noun',
+    'AbstractPronoun': 'paragraph_generator.words.pronoun',
+    'Pronoun': 'paragraph_generator.words.pronoun',
+    'CapitalPronoun': 'paragraph_generator.words.pronoun',
+    'Punctuation': 'paragraph_generator.words.punctuation',
+    'Verb': 'paragraph_generator.words.verb',
+    'AbstractWord': 'paragraph_generator.words.wordtools.abstractword',
+}
+"""{name: the module it is imported from}"""
+
+__all__ = list(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_NAMES.get(name)
+    if module_name is None:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
+
@@ -8,14 +8,31 @@ return requested json including answer paragraph according to kind of comparison
 
 """
 
+from typing import TextIO, Union
+
 from paragraph_generator.backend.create_answer_paragraph import create_answer_paragraph
 from paragraph_generator.backend.paragraph_comparison import ParagraphComparison
+from paragraph_generator.compiled_checker import CompiledChecker
+from paragraph_generator.instrumentation import Instrumentation, activate, stage
+from paragraph_generator.rendering import Renderer
 from paragraph_generator.word_groups.paragraph import Paragraph
 
 
 class AnswerChecker(object):
-    def __init__(self, submission: str, original: Paragraph):
+    def __init__(self, submission: str, original: Union[Paragraph, CompiledChecker],
+                 instrumentation: Instrumentation = None):
+        """
+
+        :param original: the answer paragraph, or compile_checker(answer paragraph) to reuse the work that does not
+            depend on the submission
+        :param instrumentation: records stage times and cache hits while checking
+        """
         self._submission = submission
+        self._instrumentation = instrumentation
+        self._compiled = None
+        if isinstance(original, CompiledChecker):
+            self._compiled = original
+            original = original.original
         self._original = original
 
     @property
@@ -35,21 +52,64 @@ class AnswerChecker(object):
     def count_word_errors(self) -> int:
         return self.get_word_hints()['error_count']
 
-    def get_sentence_hints(self):
+    def get_sentence_hints(self, renderer: Renderer = None):
         """
 
+        :param renderer: writes 'hint_paragraph', such as rendering.HTML. Without one, errors are in <bold></bold>.
         :return: {'error_count': int, 'hint_paragraph': str, 'missing_sentences': int}
         """
-        return self._get_comparitor().compare_by_sentences()
+        with activate(self._instrumentation):
+            comparitor = self._get_comparitor()
+            with stage(self._instrumentation, 'compare_by_sentences'):
+                return comparitor.compare_by_sentences(renderer)
 
-    def get_word_hints(self):
+    def get_word_hints(self, renderer: Renderer = None):
         """
 
+        :param renderer: writes 'hint_paragraph', such as rendering.HTML. Without one, errors are in <bold></bold>.
         :return: {'error_count': int, 'hint_paragraph': str, 'missing_sentences': int}
         """
-        return self._get_comparitor().compare_by_words()
+        with activate(self._instrumentation):
+            comparitor = self._get_comparitor()
+            with stage(self._instrumentation, 'compare_by_words'):
+                return comparitor.compare_by_words(renderer)
+
+    def get_structured_word_hints(self):
+        """
+
+        :return: {'error_count': int, 'hints': [SentenceHint, ...], 'missing_sentences': int}. Each SentenceHint has
+            the token spans, error kinds and expected and actual text of one sentence, and only renders its hint string
+            when it is asked for.
+        """
+        with activate(self._instrumentation):
+            comparitor = self._get_comparitor()
+            with stage(self._instrumentation, 'compare_by_words'):
+                return comparitor.compare_by_words_structured()
+
+    def write_sentence_hints(self, stream: TextIO, renderer: Renderer):
+        """
+
+        :return: {'error_count': int, 'missing_sentences': int}. The hint paragraph is written to stream.
+        """
+        with activate(self._instrumentation):
+            comparitor = self._get_comparitor()
+            with stage(self._instrumentation, 'compare_by_sentences'):
+                return comparitor.write_sentence_hints(stream, renderer)
+
+    def write_word_hints(self, stream: TextIO, renderer: Renderer):
+        """
+
+        :return: {'error_count': int, 'missing_sentences': int}. The hint paragraph is written to stream.
+        """
+        with activate(self._instrumentation):
+            comparitor = self._get_comparitor()
+            with stage(self._instrumentation, 'compare_by_words'):
+                return comparitor.write_word_hints(stream, renderer)
 
     def _get_comparitor(self):
-        answer_paragraph = create_answer_paragraph(self._submission, self._original)
-        comparison = ParagraphComparison(answer_paragraph, self._submission)
-        return comparison
+        with stage(self._instrumentation, 'answer_paragraph'):
+            if self._compiled is not None:
+                return self._compiled.comparison(self._submission)
+            answer_paragraph = create_answer_paragraph(self._submission, self._original)
+            comparison = ParagraphComparison(answer_paragraph, self._submission)
+            return comparison
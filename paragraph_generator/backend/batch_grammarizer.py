@@ -0,0 +1,106 @@
+from array import array
+from typing import List
+
+from paragraph_generator.tags.status_tag import StatusTag
+from paragraph_generator.tags.wordtag import WordTag
+from paragraph_generator.word_groups.columnar import (ParagraphBatch, Vocabulary, tag_bit, KIND_NOUN, KIND_VERB,
+                                                      KIND_BE_VERB, KIND_PRONOUN, KIND_FIRST_PERSON, ID_TYPECODE)
+from paragraph_generator.word_groups.paragraph import Paragraph
+
+_PROPER_OR_UNCOUNTABLE = tag_bit(WordTag.PROPER) | tag_bit(WordTag.UNCOUNTABLE)
+_PLURAL = tag_bit(WordTag.PLURAL)
+_ANY_VERB = KIND_VERB | KIND_BE_VERB
+_SUBJECT = KIND_NOUN | KIND_PRONOUN
+
+
+class BatchGrammarizer(object):
+    def __init__(self, raw_batch: ParagraphBatch):
+        """
+        Grammarizer for a whole ParagraphBatch at once. Each rule is applied as a pass over the flat word id and
+        bitmask arrays, and every word transformation is looked up once per distinct word in the vocabulary.
+        The answer is identical to running Grammarizer on each paragraph.
+        """
+        self._raw = raw_batch
+
+    @classmethod
+    def from_paragraphs(cls, raw_paragraphs: List[Paragraph], vocabulary: Vocabulary = None) -> 'BatchGrammarizer':
+        return cls(ParagraphBatch.from_paragraphs(raw_paragraphs, vocabulary))
+
+    @property
+    def raw(self) -> ParagraphBatch:
+        return self._raw
+
+    def grammarize_to_present_tense(self) -> ParagraphBatch:
+        word_ids = self._assign_noun_articles()
+        self._assign_present_tense_verbs(word_ids)
+        self._capitalize_first_letter_of_sentences(word_ids)
+        return self._to_batch(word_ids, StatusTag.SIMPLE_PRESENT)
+
+    def grammarize_to_past_tense(self) -> ParagraphBatch:
+        word_ids = self._assign_noun_articles()
+        self._assign_past_tense_verbs(word_ids)
+        self._capitalize_first_letter_of_sentences(word_ids)
+        return self._to_batch(word_ids, StatusTag.SIMPLE_PAST)
+
+    def _assign_noun_articles(self) -> array:
+        vocabulary = self._raw.vocabulary
+        masks = vocabulary.masks
+        word_ids = array(ID_TYPECODE, self._raw.word_ids)
+        sentence_offsets = self._raw.sentence_offsets
+        paragraph_offsets = self._raw.paragraph_offsets
+
+        for paragraph_start, paragraph_end in zip(paragraph_offsets, paragraph_offsets[1:]):
+            assign_definite = set()
+            for index in range(sentence_offsets[paragraph_start], sentence_offsets[paragraph_end]):
+                word_id = word_ids[index]
+                mask = masks[word_id]
+                if not mask & KIND_NOUN or mask & _PROPER_OR_UNCOUNTABLE:
+                    continue
+                if word_id in assign_definite:
+                    word_ids[index] = vocabulary.transform(word_id, 'definite')
+                else:
+                    if not mask & _PLURAL:
+                        word_ids[index] = vocabulary.transform(word_id, 'indefinite')
+                    assign_definite.add(word_id)
+        return word_ids
+
+    def _assign_present_tense_verbs(self, word_ids: array):
+        vocabulary = self._raw.vocabulary
+        masks = vocabulary.masks
+        for start, verb_index in self._verb_indices(word_ids):
+            if verb_index == start:
+                continue
+            subject_mask = masks[word_ids[verb_index - 1]]
+            if subject_mask & _SUBJECT and not subject_mask & (KIND_FIRST_PERSON | _PLURAL):
+                word_ids[verb_index] = vocabulary.transform(word_ids[verb_index], 'third_person')
+
+    def _assign_past_tense_verbs(self, word_ids: array):
+        vocabulary = self._raw.vocabulary
+        for _, verb_index in self._verb_indices(word_ids):
+            word_ids[verb_index] = vocabulary.transform(word_ids[verb_index], 'past_tense')
+
+    def _verb_indices(self, word_ids: array):
+        """
+
+        :return: Generator[(sentence_start, verb_index)] for every sentence that has a verb
+        """
+        masks = self._raw.vocabulary.masks
+        sentence_offsets = self._raw.sentence_offsets
+        for start, end in zip(sentence_offsets, sentence_offsets[1:]):
+            for index in range(start, end):
+                if masks[word_ids[index]] & _ANY_VERB:
+                    yield start, index
+                    break
+
+    def _capitalize_first_letter_of_sentences(self, word_ids: array):
+        vocabulary = self._raw.vocabulary
+        sentence_offsets = self._raw.sentence_offsets
+        for start, end in zip(sentence_offsets, sentence_offsets[1:]):
+            if start == end:
+                raise IndexError('sentence index out of range')
+            word_ids[start] = vocabulary.transform(word_ids[start], 'capitalize')
+
+    def _to_batch(self, word_ids: array, tense_tag: StatusTag) -> ParagraphBatch:
+        tags = [tags.remove(StatusTag.RAW).add(tense_tag) for tags in self._raw.tags]
+        return ParagraphBatch(self._raw.vocabulary, word_ids, self._raw.sentence_offsets,
+                              self._raw.paragraph_offsets, tags)
@@ -4,18 +4,32 @@ When I went back to look on this. I couldn't figure out what it was for. That's
 This takes an original Paragraph and a submitted answer string. It then generates a new paragraph
 with properly assigned plural nouns. You can then plug that into ParagraphComparison to get a new thing.
 """
+import weakref
+from typing import Dict, List, Tuple
+
 from paragraph_generator.backend.grammarizer import Grammarizer
+from paragraph_generator.backend.plural_detector import PluralDetector
 from paragraph_generator.backend.random_assignments.plurals_assignement import get_countable_nouns, PluralsAssignment
+from paragraph_generator.instrumentation import record_cache
 from paragraph_generator.tags.status_tag import StatusTag
 from paragraph_generator.tags.wordtag import WordTag
 from paragraph_generator.word_groups.paragraph import Paragraph
+from paragraph_generator.words.noun import Noun
 from paragraph_generator.words.verb import Verb
 
+MAX_CACHED_PLURAL_DETECTORS = 256
+_PLURAL_DETECTORS = {}  # type: Dict[int, Tuple[weakref.ref, List[Noun], PluralDetector]]
+
 
 def create_answer_paragraph(paragraph_str: str, base_paragraph: Paragraph) -> Paragraph:
     plurals_assigned_with_no_articles = _get_plurals_paragraph(base_paragraph, paragraph_str)
-    verbs_have_negatives_but_no_grammar = _revert_verbs(plurals_assigned_with_no_articles)
-    grammarizer = Grammarizer(verbs_have_negatives_but_no_grammar)
+    verbs_have_negatives_but_no_grammar = revert_verbs(plurals_assigned_with_no_articles)
+    return grammarize_like(verbs_have_negatives_but_no_grammar, base_paragraph)
+
+
+def grammarize_like(paragraph: Paragraph, base_paragraph: Paragraph) -> Paragraph:
+    """grammarizes paragraph in the tense of base_paragraph"""
+    grammarizer = Grammarizer(paragraph)
     if base_paragraph.tags.has(StatusTag.SIMPLE_PAST):
         answer = grammarizer.grammarize_to_past_tense()
     else:
@@ -23,14 +37,34 @@ def create_answer_paragraph(paragraph_str: str, base_paragraph: Paragraph) -> Pa
     return answer
 
 
-def _get_plurals_paragraph(base_paragraph, paragraph_str) -> Paragraph:
+def get_plural_detector(base_paragraph: Paragraph) -> Tuple[List[Noun], PluralDetector]:
+    """
+    the countable nouns of base_paragraph and a detector for their lower case plurals. They are made on the first call
+    for each paragraph and cached.
+    """
+    key = id(base_paragraph)
+    cached = _PLURAL_DETECTORS.get(key)
+    is_hit = cached is not None and cached[0]() is base_paragraph
+    record_cache('plural_detectors', is_hit)
+    if is_hit:
+        return cached[1], cached[2]
+
     countable_nouns = get_countable_nouns(base_paragraph)
-    plurals = [noun for noun in countable_nouns if noun.plural().value.lower() in paragraph_str.lower()]
+    detector = PluralDetector(noun.plural().value.lower() for noun in countable_nouns)
+    if len(_PLURAL_DETECTORS) >= MAX_CACHED_PLURAL_DETECTORS:
+        _PLURAL_DETECTORS.clear()
+    _PLURAL_DETECTORS[key] = (weakref.ref(base_paragraph), countable_nouns, detector)
+    return countable_nouns, detector
+
+
+def _get_plurals_paragraph(base_paragraph, paragraph_str) -> Paragraph:
+    countable_nouns, detector = get_plural_detector(base_paragraph)
+    plurals = [countable_nouns[index] for index in detector.find(paragraph_str.lower())]
     new_base = PluralsAssignment(base_paragraph).assign_plural(plurals)
     return new_base
 
 
-def _revert_verbs(paragraph) -> Paragraph:
+def revert_verbs(paragraph) -> Paragraph:
     answer = paragraph
     for s_index, w_index, word in paragraph.indexed_all_words():
         if isinstance(word, Verb):
@@ -0,0 +1,178 @@
+"""
+Fingerprints for spotting generated paragraphs that are near-duplicates of ones already made, and two indexes to keep
+them in.
+
+A sentence fingerprint hashes the sentence's skeleton. The skeleton is each word reduced to its base form: the noun
+without article or plural, the verb's infinitive, the pronoun's subject form. Punctuation is left out. Sentences that
+differ only in inflection or punctuation get the same fingerprint. A paragraph fingerprint hashes the sorted
+fingerprints of its sentences, so the same sentences in a different order count as a duplicate. Fingerprints come
+from blake2b, so they are stable across processes and can be saved.
+
+Both indexes share one interface, `add(fingerprint) -> bool`, `in` and `len`. FingerprintSet is exact. BloomFilter
+uses a fixed, much smaller amount of memory. It may report a paragraph it has not seen as a duplicate, at
+`error_rate`. It never misses one it has seen.
+"""
+import math
+import threading
+from hashlib import blake2b
+from typing import Iterable
+
+from paragraph_generator.word_groups.paragraph import Paragraph
+from paragraph_generator.word_groups.sentence import Sentence
+from paragraph_generator.words.be_verb import BeVerb
+from paragraph_generator.words.noun import Noun
+from paragraph_generator.words.pronoun import AbstractPronoun
+from paragraph_generator.words.punctuation import Punctuation
+from paragraph_generator.words.verb import Verb
+from paragraph_generator.words.wordtools.abstractword import AbstractWord
+
+FINGERPRINT_SIZE = 8
+
+_SET_MAGIC = b'PGFPSET1'
+_BLOOM_MAGIC = b'PGBLOOM1'
+_BLOOM_HEADER_SIZE = len(_BLOOM_MAGIC) + 3 * 8
+
+
+def word_skeleton(word: AbstractWord) -> str:
+    """
+
+    :return: '' for punctuation
+    """
+    if isinstance(word, Noun):
+        return 'n:' + word.base_noun.lower()
+    if isinstance(word, Verb):
+        return 'v:' + word.infinitive.lower()
+    if isinstance(word, BeVerb):
+        return 'v:be'
+    if isinstance(word, AbstractPronoun):
+        return 'p:' + word.subject().value.lower()
+    if isinstance(word, Punctuation):
+        return ''
+    return 'w:' + word.value.lower()
+
+
+def sentence_fingerprint(sentence: Sentence) -> bytes:
+    skeleton = ' '.join(token for token in map(word_skeleton, sentence) if token)
+    return blake2b(skeleton.encode('utf-8'), digest_size=FINGERPRINT_SIZE).digest()
+
+
+def paragraph_fingerprint(paragraph: Paragraph) -> bytes:
+    fingerprints = sorted(sentence_fingerprint(sentence) for sentence in paragraph)
+    return blake2b(b''.join(fingerprints), digest_size=FINGERPRINT_SIZE).digest()
+
+
+class FingerprintSet(object):
+    def __init__(self, fingerprints: Iterable[bytes] = ()):
+        """Exact index. Memory grows with every fingerprint added."""
+        self._fingerprints = set(fingerprints)
+        self._lock = threading.Lock()
+
+    def add(self, fingerprint: bytes) -> bool:
+        """
+
+        :return: True if fingerprint was not already in the set
+        """
+        with self._lock:
+            if fingerprint in self._fingerprints:
+                return False
+            self._fingerprints.add(fingerprint)
+            return True
+
+    def __contains__(self, fingerprint: bytes):
+        return fingerprint in self._fingerprints
+
+    def __len__(self):
+        return len(self._fingerprints)
+
+    def save(self, path: str):
+        with open(path, 'wb') as f:
+            f.write(_SET_MAGIC)
+            f.write(b''.join(sorted(self._fingerprints)))
+
+    @classmethod
+    def load(cls, path: str) -> 'FingerprintSet':
+        with open(path, 'rb') as f:
+            data = f.read()
+        if not data.startswith(_SET_MAGIC) or (len(data) - len(_SET_MAGIC)) % FINGERPRINT_SIZE:
+            raise ValueError('not a fingerprint set file: {}'.format(path))
+        starts = range(len(_SET_MAGIC), len(data), FINGERPRINT_SIZE)
+        return cls(data[start: start + FINGERPRINT_SIZE] for start in starts)
+
+
+class BloomFilter(object):
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """
+        Sized so that after capacity fingerprints, a new fingerprint is reported as seen with probability error_rate.
+        """
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError('capacity must be > 0 and 0 < error_rate < 1')
+        num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        num_hashes = max(1, int(round(num_bits / capacity * math.log(2))))
+        self._init(num_bits, num_hashes, 0, bytearray((num_bits + 7) // 8))
+
+    def _init(self, num_bits: int, num_hashes: int, count: int, bits: bytearray):
+        self._num_bits = num_bits
+        self._num_hashes = num_hashes
+        self._count = count
+        self._bits = bits
+        self._lock = threading.Lock()
+
+    @property
+    def num_bits(self) -> int:
+        return self._num_bits
+
+    @property
+    def num_hashes(self) -> int:
+        return self._num_hashes
+
+    def _positions(self, fingerprint: bytes):
+        first = int.from_bytes(fingerprint[:4], 'little')
+        step = int.from_bytes(fingerprint[4:8], 'little') | 1
+        return ((first + index * step) % self._num_bits for index in range(self._num_hashes))
+
+    def add(self, fingerprint: bytes) -> bool:
+        """
+
+        :return: True if fingerprint was not already in the filter. A false positive returns False.
+        """
+        is_new = False
+        bits = self._bits
+        with self._lock:
+            for position in self._positions(fingerprint):
+                byte, mask = position >> 3, 1 << (position & 7)
+                if not bits[byte] & mask:
+                    bits[byte] |= mask
+                    is_new = True
+            if is_new:
+                self._count += 1
+        return is_new
+
+    def __contains__(self, fingerprint: bytes):
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(fingerprint))
+
+    def __len__(self):
+        """the number of fingerprints added that were new"""
+        return self._count
+
+    def save(self, path: str):
+        with open(path, 'wb') as f:
+            f.write(_BLOOM_MAGIC)
+            for number in (self._num_bits, self._num_hashes, self._count):
+                f.write(number.to_bytes(8, 'little'))
+            f.write(self._bits)
+
+    @classmethod
+    def load(cls, path: str) -> 'BloomFilter':
+        with open(path, 'rb') as f:
+            data = f.read()
+        if not data.startswith(_BLOOM_MAGIC) or len(data) < _BLOOM_HEADER_SIZE:
+            raise ValueError('not a bloom filter file: {}'.format(path))
+        num_bits, num_hashes, count = (int.from_bytes(data[start: start + 8], 'little')
+                                       for start in range(len(_BLOOM_MAGIC), _BLOOM_HEADER_SIZE, 8))
+        bits = bytearray(data[_BLOOM_HEADER_SIZE:])
+        if len(bits) != (num_bits + 7) // 8:
+            raise ValueError('bloom filter file is truncated: {}'.format(path))
+        answer = cls.__new__(cls)
+        answer._init(num_bits, num_hashes, count, bits)
+        return answer
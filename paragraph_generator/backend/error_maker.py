@@ -1,102 +1,253 @@
+import itertools
 import random
-from typing import Optional
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple, Union
 
+from paragraph_generator.instrumentation import record_cache
 from paragraph_generator.tags.status_tag import StatusTag
 from paragraph_generator.tags.wordtag import WordTag
 from paragraph_generator.word_groups.paragraph import Paragraph
+from paragraph_generator.word_groups.sentence import Sentence
 from paragraph_generator.words.be_verb import BeVerb
 from paragraph_generator.words.noun import Noun
-from paragraph_generator.words.pronoun import Pronoun, CapitalPronoun, AbstractPronoun
+from paragraph_generator.words.pronoun import FIRST_PERSON_SINGULAR, Pronoun, CapitalPronoun, AbstractPronoun
 from paragraph_generator.words.punctuation import Punctuation
 from paragraph_generator.words.verb import Verb
 from paragraph_generator.words.wordtools.common_functions import add_s
 
 
+# the order ParagraphsGenerator chains the error methods in. composite_errors applies them in the same order.
+ERROR_ORDER = (StatusTag.NOUN_ERRORS, StatusTag.PRONOUN_ERRORS, StatusTag.VERB_ERRORS, StatusTag.IS_DO_ERRORS,
+               StatusTag.PUNCTUATION_ERRORS, StatusTag.PREPOSITION_ERRORS)
+
+# called once for each place an error could go, in order. True means make the error there.
+Decide = Callable[[], bool]
+
+_EXCLUDED_PRONOUNS = (Pronoun.YOU, Pronoun.IT, CapitalPronoun.YOU, CapitalPronoun.IT)
+
+# nouns and verbs are immutable, so their error variants can be shared. each cache starts over when it gets this big.
+MAX_CACHED_ERROR_CHOICES = 20000
+_NOUN_ERROR_CHOICES = {}  # type: Dict[tuple, Tuple[Noun, ...]]
+_VERB_ERROR_CHOICES = {}  # type: Dict[tuple, Tuple[Verb, ...]]
+
+
 class ErrorMaker(object):
-    def __init__(self, paragraph: Paragraph):
+    def __init__(self, paragraph: Paragraph, rng: random.Random = None):
         self._paragraph = paragraph
         self._error_paragraph = None  # type: Optional[Paragraph]
+        self._rng = random if rng is None else rng
 
     def get_paragraph(self) -> Paragraph:
         return self._paragraph
 
     def noun_errors(self, p_error) -> 'ErrorMaker':
-        self._error_paragraph = self._paragraph
-        self._set_error_tag(StatusTag.NOUN_ERRORS)
-
-        for s_index, w_index, word in self._error_paragraph.indexed_all_words():
-            if isinstance(word, Noun) and random.random() < p_error:
-                new_noun = make_noun_error(word)
-                self._error_paragraph = self._error_paragraph.set(s_index, w_index, new_noun)
-        self._recapitalize_first_word_if_original_capitalized()
-        return ErrorMaker(self._error_paragraph)
+        self._apply_to_each_sentence(StatusTag.NOUN_ERRORS, p_error)
+        return ErrorMaker(self._error_paragraph, self._rng)
 
     def pronoun_errors(self, p_error) -> 'ErrorMaker':
-        self._error_paragraph = self._paragraph
-        self._set_error_tag(StatusTag.PRONOUN_ERRORS)
-
-        excluded = [Pronoun.YOU, Pronoun.IT, CapitalPronoun.YOU, CapitalPronoun.IT]
-        for s_index, w_index, word in self._error_paragraph.indexed_all_words():
-            if isinstance(word, AbstractPronoun) and word not in excluded:
-                if random.random() < p_error:
-                    new_word = word.subject()
-                    if new_word == word:
-                        new_word = word.object()
-                    self._error_paragraph = self._error_paragraph.set(s_index, w_index, new_word)
-
-        return ErrorMaker(self._error_paragraph)
+        self._apply_to_each_sentence(StatusTag.PRONOUN_ERRORS, p_error)
+        return ErrorMaker(self._error_paragraph, self._rng)
 
     def verb_errors(self, p_error) -> 'ErrorMaker':
-        self._error_paragraph = self._paragraph
-        self._set_error_tag(StatusTag.VERB_ERRORS)
-
-        for s_index, w_index, word in self._error_paragraph.indexed_all_words():
-            if isinstance(word, Verb) and random.random() < p_error:
-                new_verb = make_verb_error(word)
-                self._error_paragraph = self._error_paragraph.set(s_index, w_index, new_verb)
-
-        self._recapitalize_first_word_if_original_capitalized()
-        return ErrorMaker(self._error_paragraph)
+        self._apply_to_each_sentence(StatusTag.VERB_ERRORS, p_error)
+        return ErrorMaker(self._error_paragraph, self._rng)
 
     def is_do_errors(self, p_error) -> 'ErrorMaker':
-        self._error_paragraph = self._paragraph
-        self._set_error_tag(StatusTag.IS_DO_ERRORS)
-        for s_index, sentence in enumerate(self._error_paragraph):
-            be_verb = get_be_verb(sentence)
-            v_index = sentence.get_verb()
-            if v_index != -1 and random.random() < p_error:
-                verb = sentence.get(v_index)
-                if isinstance(verb, BeVerb):
-                    continue
-
-                new_sentence = sentence.set(v_index, verb.to_basic_verb())
-                new_sentence = new_sentence.insert(v_index, be_verb)
-                self._error_paragraph = self._error_paragraph.set_sentence(s_index, new_sentence)
-        return ErrorMaker(self._error_paragraph)
+        self._apply_to_each_sentence(StatusTag.IS_DO_ERRORS, p_error)
+        return ErrorMaker(self._error_paragraph, self._rng)
 
     def preposition_errors(self, p_error) -> 'ErrorMaker':
-        self._error_paragraph = self._paragraph
-        self._set_error_tag(StatusTag.PREPOSITION_ERRORS)
-        for s_index, w_index, word in self._error_paragraph.indexed_all_words():
-            if word.has_tags(WordTag.PREPOSITION) and random.random() < p_error:
-                sentence = self._error_paragraph.get_sentence(s_index)
-                obj = sentence.get(w_index + 1)
-                sentence = sentence.delete(w_index).delete(w_index)
-                v_index = sentence.get_verb()
-                sentence = sentence.insert(v_index, obj).insert(v_index, word)
-                self._error_paragraph = self._error_paragraph.set_sentence(s_index, sentence)
-
-        return ErrorMaker(self._error_paragraph)
+        self._apply_to_each_sentence(StatusTag.PREPOSITION_ERRORS, p_error)
+        return ErrorMaker(self._error_paragraph, self._rng)
 
     def punctuation_errors(self, p_error) -> 'ErrorMaker':
-        self._error_paragraph = self._paragraph
-        self._set_error_tag(StatusTag.PUNCTUATION_ERRORS)
-        for s_index, sentence in enumerate(self._error_paragraph):
-            if random.random() < p_error:
-                new_sentence = sentence.set(-1, Punctuation.COMMA)
-                self._error_paragraph = self._error_paragraph.set_sentence(s_index, new_sentence)
+        self._apply_to_each_sentence(StatusTag.PUNCTUATION_ERRORS, p_error)
         self._decapitalize_at_commas()
-        return ErrorMaker(self._error_paragraph)
+        return ErrorMaker(self._error_paragraph, self._rng)
+
+    def composite_errors(self, p_errors: Dict[StatusTag, float]) -> 'ErrorMaker':
+        """
+        Applies every error type in p_errors in a single pass, finishing each sentence before moving on to the next.
+        Noun, pronoun and verb errors change different kinds of words, so they share one walk over the words. Each
+        word or sentence gets the same independent draws as the chained methods, so the answer has the same
+        distribution as chaining them in ERROR_ORDER. The random sequence is different, so a seeded run gives a
+        different answer.
+
+        :param p_errors: {StatusTag.NOUN_ERRORS: p_error, ...}
+        """
+        _raise_for_unknown_error_types(p_errors)
+        deciders = {tag: self._draw(p_error) for tag, p_error in p_errors.items()}
+        return self._errors_in_one_pass(lambda tag, s_index: deciders.get(tag))
+
+    def exact_errors(self, error_types: Iterable[StatusTag], count: Union[int, Tuple[int, int]]) -> 'ErrorMaker':
+        """
+        Makes exactly count errors of the given types, spread at random over every place where one of them can go.
+        Each set of places is equally likely. The errors are made in a single pass, like composite_errors.
+
+        :param count: int or (low, high) inclusive. for a range, the number of errors is picked uniformly from low to
+                      high, and high is lowered to the number of places if there are fewer.
+        :raises ValueError: if count is more than the number of places an error can go
+        """
+        error_types = set(error_types)
+        _raise_for_unknown_error_types(error_types)
+        low, high = (count, count) if isinstance(count, int) else count
+        if low < 0 or low > high:
+            raise ValueError('count must be 0 <= count or 0 <= low <= high. got: {!r}'.format(count))
+
+        candidates = list(self._error_candidates(error_types))
+        if low > len(candidates):
+            raise ValueError('cannot make {} errors. there are only {} places for errors of types {}'.format(
+                low, len(candidates), sorted(error_types)))
+        total = self._rng.randint(low, min(high, len(candidates)))
+
+        chosen = {}  # type: Dict[Tuple[StatusTag, int], Set[int]]
+        for tag, s_index, ordinal in self._rng.sample(candidates, total):
+            chosen.setdefault((tag, s_index), set()).add(ordinal)
+
+        def decider(tag, s_index):
+            if tag not in error_types:
+                return None
+            return _choose_by_ordinal(chosen.get((tag, s_index), ()))
+
+        return self._errors_in_one_pass(decider)
+
+    def _error_candidates(self, error_types: Set[StatusTag]):
+        """
+
+        :return: Generator[(error_tag, s_index, ordinal)] every place an error can change the paragraph. ordinal counts
+                 the places for that error type in that sentence.
+        """
+        for s_index, sentence in enumerate(self._paragraph):
+            ordinals = dict.fromkeys(error_types, 0)
+            for word in sentence:
+                if isinstance(word, Noun):
+                    tag = StatusTag.NOUN_ERRORS
+                elif isinstance(word, Verb):
+                    tag = StatusTag.VERB_ERRORS
+                elif isinstance(word, AbstractPronoun) and word not in _EXCLUDED_PRONOUNS:
+                    tag = StatusTag.PRONOUN_ERRORS
+                elif word.has_tags(WordTag.PREPOSITION):
+                    tag = StatusTag.PREPOSITION_ERRORS
+                else:
+                    continue
+                if tag in ordinals:
+                    yield tag, s_index, ordinals[tag]
+                    ordinals[tag] += 1
+
+            v_index = sentence.get_verb()
+            if StatusTag.IS_DO_ERRORS in ordinals and v_index != -1 and not isinstance(sentence.get(v_index), BeVerb):
+                yield StatusTag.IS_DO_ERRORS, s_index, 0
+            if StatusTag.PUNCTUATION_ERRORS in ordinals and sentence.get(-1) != Punctuation.COMMA:
+                yield StatusTag.PUNCTUATION_ERRORS, s_index, 0
+
+    def _errors_in_one_pass(self, get_decider: Callable[[StatusTag, int], Optional[Decide]]) -> 'ErrorMaker':
+        """
+
+        :param get_decider: (error_tag, s_index) -> the Decide for that error type in that sentence, or None if that
+                            error type is not in use.
+        """
+        tags = self._paragraph.tags
+        for tag in ERROR_ORDER:
+            if get_decider(tag, 0) is not None:
+                tags = tags.add(tag)
+
+        previous_ends_in_comma = False
+        new_sentences = []
+        for s_index, sentence in enumerate(self._paragraph):
+            word_deciders = [get_decider(tag, s_index) for tag in ERROR_ORDER[:3]]
+            if any(decide is not None for decide in word_deciders):
+                sentence = self._word_errors_in_sentence(sentence, *word_deciders)
+            decide = get_decider(StatusTag.IS_DO_ERRORS, s_index)
+            if decide is not None:
+                sentence = self._is_do_error(sentence, decide)
+            decide = get_decider(StatusTag.PUNCTUATION_ERRORS, s_index)
+            if decide is not None:
+                sentence = self._punctuation_error(sentence, decide)
+                if previous_ends_in_comma:
+                    sentence = sentence.set(0, sentence.get(0).de_capitalize())
+                previous_ends_in_comma = sentence.get(-1) == Punctuation.COMMA
+            decide = get_decider(StatusTag.PREPOSITION_ERRORS, s_index)
+            if decide is not None:
+                sentence = self._preposition_errors_in_sentence(sentence, decide)
+            new_sentences.append(sentence)
+
+        return ErrorMaker(Paragraph(new_sentences, tags), self._rng)
+
+    def _draw(self, p_error) -> Decide:
+        return lambda: self._rng.random() < p_error
+
+    def _sentence_methods(self):
+        return {
+            StatusTag.NOUN_ERRORS: self._noun_errors_in_sentence,
+            StatusTag.PRONOUN_ERRORS: self._pronoun_errors_in_sentence,
+            StatusTag.VERB_ERRORS: self._verb_errors_in_sentence,
+            StatusTag.IS_DO_ERRORS: self._is_do_error,
+            StatusTag.PUNCTUATION_ERRORS: self._punctuation_error,
+            StatusTag.PREPOSITION_ERRORS: self._preposition_errors_in_sentence,
+        }
+
+    def _apply_to_each_sentence(self, error_tag, p_error):
+        sentence_method = self._sentence_methods()[error_tag]
+        decide = self._draw(p_error)
+        new_sentences = [sentence_method(sentence, decide) for sentence in self._paragraph]
+        self._error_paragraph = Paragraph(new_sentences, self._paragraph.tags.add(error_tag))
+
+    def _noun_errors_in_sentence(self, sentence: Sentence, decide: Decide) -> Sentence:
+        return self._word_errors_in_sentence(sentence, decide, None, None)
+
+    def _pronoun_errors_in_sentence(self, sentence: Sentence, decide: Decide) -> Sentence:
+        return self._word_errors_in_sentence(sentence, None, decide, None)
+
+    def _verb_errors_in_sentence(self, sentence: Sentence, decide: Decide) -> Sentence:
+        return self._word_errors_in_sentence(sentence, None, None, decide)
+
+    def _word_errors_in_sentence(self, sentence: Sentence, noun: Optional[Decide], pronoun: Optional[Decide],
+                                 verb: Optional[Decide]) -> Sentence:
+        """None means no errors of that kind"""
+        new_words = None
+        for w_index, word in enumerate(sentence):
+            if isinstance(word, Noun):
+                decide, make_error = noun, make_noun_error
+            elif isinstance(word, Verb):
+                decide, make_error = verb, make_verb_error
+            elif isinstance(word, AbstractPronoun) and word not in _EXCLUDED_PRONOUNS:
+                decide, make_error = pronoun, _make_pronoun_error
+            else:
+                continue
+            if decide is not None and decide():
+                if new_words is None:
+                    new_words = sentence.word_list()
+                new_words[w_index] = make_error(word, self._rng)
+
+        if new_words is None:
+            return sentence
+        first_word = sentence.get(0)
+        if new_words[0] is not first_word and not isinstance(first_word, AbstractPronoun):
+            new_words[0] = _recapitalize_if_original_capitalized(first_word, new_words[0])
+        return Sentence(new_words)
+
+    def _is_do_error(self, sentence: Sentence, decide: Decide) -> Sentence:
+        v_index = sentence.get_verb()
+        if v_index != -1 and decide():
+            verb = sentence.get(v_index)
+            if not isinstance(verb, BeVerb):
+                be_verb = get_be_verb(sentence)
+                return sentence.set(v_index, verb.to_basic_verb()).insert(v_index, be_verb)
+        return sentence
+
+    def _punctuation_error(self, sentence: Sentence, decide: Decide) -> Sentence:
+        if decide():
+            return sentence.set(-1, Punctuation.COMMA)
+        return sentence
+
+    def _preposition_errors_in_sentence(self, sentence: Sentence, decide: Decide) -> Sentence:
+        new_sentence = sentence
+        for w_index, word in enumerate(sentence):
+            if word.has_tags(WordTag.PREPOSITION) and decide():
+                obj = new_sentence.get(w_index + 1)
+                new_sentence = new_sentence.delete(w_index).delete(w_index)
+                v_index = new_sentence.get_verb()
+                new_sentence = new_sentence.insert(v_index, obj).insert(v_index, word)
+        return new_sentence
 
     def _decapitalize_at_commas(self):
         for index, sentence in enumerate(self._error_paragraph.sentence_list()[:-1]):
@@ -107,23 +258,89 @@ class ErrorMaker(object):
                 next_sentence = next_sentence.set(0, first_word.de_capitalize())
                 self._error_paragraph = self._error_paragraph.set_sentence(next_index, next_sentence)
 
-    def _set_error_tag(self, new_tag):
-        new_tags = self._error_paragraph.tags.add(new_tag)
-        self._error_paragraph = self._error_paragraph.set_tags(new_tags)
 
-    def _recapitalize_first_word_if_original_capitalized(self):
-        for s_index, sentence in enumerate(self._error_paragraph):
-            test_word = self._paragraph.get_sentence(s_index).get(0)
-            new_word = sentence.get(0)
+def _raise_for_unknown_error_types(error_types):
+    unknown = set(error_types).difference(ERROR_ORDER)
+    if unknown:
+        raise ValueError('not an error type: {}'.format(sorted(unknown)))
+
+
+def _choose_by_ordinal(chosen_ordinals) -> Decide:
+    ordinals = itertools.count()
+    return lambda: next(ordinals) in chosen_ordinals
+
+
+def _recapitalize_if_original_capitalized(original_word, new_word):
+    if original_word.capitalize() == original_word:
+        return new_word.capitalize()
+    return new_word
+
+
+def _make_pronoun_error(pronoun, _=None):
+    new_pronoun = pronoun.subject()
+    if new_pronoun == pronoun:
+        new_pronoun = pronoun.object()
+    return new_pronoun
+
+
+def make_noun_error(noun, rng: random.Random = None):
+    if rng is None:
+        rng = random
+    return rng.choice(get_noun_error_choices(noun))
+
+
+def make_verb_error(verb, rng: random.Random = None):
+    if rng is None:
+        rng = random
+    return rng.choice(get_verb_error_choices(verb))
+
+
+def get_noun_error_choices(noun) -> Tuple[Noun, ...]:
+    """
+    the variants make_noun_error picks from, with repeats for the more likely ones. They are built on the first call
+    for each noun and cached.
+    """
+    key = (type(noun), noun.value, noun.irregular_plural, noun.base_noun, noun.tags)
+    choices = _NOUN_ERROR_CHOICES.get(key)
+    record_cache('noun_error_choices', choices is not None)
+    if choices is None:
+        choices = _cache(_NOUN_ERROR_CHOICES, key, _build_noun_error_choices(noun))
+    return choices
+
+
+def get_verb_error_choices(verb) -> Tuple[Verb, ...]:
+    """
+    the variants make_verb_error picks from, with repeats for the more likely ones. They are built on the first call
+    for each verb and cached.
+    """
+    key = (type(verb), verb.value, verb.irregular_past, verb.infinitive, verb.tags)
+    choices = _VERB_ERROR_CHOICES.get(key)
+    record_cache('verb_error_choices', choices is not None)
+    if choices is None:
+        choices = _cache(_VERB_ERROR_CHOICES, key, _build_verb_error_choices(verb))
+    return choices
+
+
+def get_cached_error_choices() -> dict:
+    """:return: {'nouns': {key: choices}, 'verbs': {key: choices}}, a copy of what is cached now"""
+    return {'nouns': dict(_NOUN_ERROR_CHOICES), 'verbs': dict(_VERB_ERROR_CHOICES)}
+
+
+def add_cached_error_choices(cached: dict):
+    """:param cached: from get_cached_error_choices, possibly in another process"""
+    for cache, saved in ((_NOUN_ERROR_CHOICES, cached['nouns']), (_VERB_ERROR_CHOICES, cached['verbs'])):
+        for key, choices in saved.items():
+            _cache(cache, key, choices)
 
-            if test_word.capitalize() == test_word:
-                new_word = new_word.capitalize()
 
-            new_sentence = sentence.set(0, new_word)
-            self._error_paragraph = self._error_paragraph.set_sentence(s_index, new_sentence)
+def _cache(cache: dict, key, choices: tuple) -> tuple:
+    if len(cache) >= MAX_CACHED_ERROR_CHOICES:
+        cache.clear()
+    cache[key] = choices
+    return choices
 
 
-def make_noun_error(noun):
+def _build_noun_error_choices(noun) -> Tuple[Noun, ...]:
     basic = noun.to_basic_noun()
 
     if noun.has_tags(WordTag.PROPER):
@@ -137,10 +354,10 @@ def make_noun_error(noun):
     else:
         choices = [basic] * 3 + [basic.indefinite(), basic.plural(), basic.plural().indefinite()]
 
-    return random.choice(choices)
+    return tuple(choices)
 
 
-def make_verb_error(verb):
+def _build_verb_error_choices(verb) -> Tuple[Verb, ...]:
     basic = verb.to_basic_verb()
     if verb.has_tags(WordTag.NEGATIVE):
         basic = basic.negative()
@@ -153,7 +370,7 @@ def make_verb_error(verb):
     else:
         choices = [basic.third_person()] * 3 + [basic.past_tense()]
 
-    return random.choice(choices)
+    return tuple(choices)
 
 
 def _add_s_to_verb(verb: Verb):
@@ -171,7 +388,7 @@ def get_be_verb(sentence):
     if isinstance(verb, BeVerb):
         return verb
 
-    if subj in (Pronoun.I, Pronoun.ME, CapitalPronoun.I, CapitalPronoun.ME):
+    if isinstance(subj, AbstractPronoun) and subj in FIRST_PERSON_SINGULAR:
         be_verb = BeVerb.AM
     elif not subj.has_tags(WordTag.PLURAL):
         be_verb = BeVerb.IS
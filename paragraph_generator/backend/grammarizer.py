@@ -5,7 +5,7 @@ from paragraph_generator.tags.wordtag import WordTag
 from paragraph_generator.word_groups.paragraph import Paragraph
 from paragraph_generator.word_groups.sentence import Sentence
 from paragraph_generator.words.noun import Noun
-from paragraph_generator.words.pronoun import Pronoun, CapitalPronoun, AbstractPronoun
+from paragraph_generator.words.pronoun import FIRST_PERSON_SINGULAR, AbstractPronoun
 
 
 class Grammarizer(object):
@@ -84,7 +84,8 @@ def _needs_third_person(sentence: Sentence):
 
     subject = sentence.get(subject_index)
 
-    first_person = (Pronoun.I, Pronoun.ME, CapitalPronoun.I, CapitalPronoun.ME)
-    if isinstance(subject, (Noun, AbstractPronoun)) and subject not in first_person:
+    if isinstance(subject, AbstractPronoun):
+        return subject not in FIRST_PERSON_SINGULAR and not subject.has_tags(WordTag.PLURAL)
+    if isinstance(subject, Noun):
         return not subject.has_tags(WordTag.PLURAL)
     return False
@@ -1,8 +1,9 @@
 import re
 from collections import namedtuple
 from itertools import zip_longest
-from typing import List, Tuple, Optional, Union
+from typing import Dict, List, Optional, Pattern, Sequence, TextIO, Tuple, Union
 
+from paragraph_generator.rendering import Renderer
 from paragraph_generator.word_groups.paragraph import Paragraph
 from paragraph_generator.word_groups.sentence import Sentence
 from paragraph_generator.words.basicword import BasicWord
@@ -13,58 +14,174 @@ from paragraph_generator.words.verb import Verb
 from paragraph_generator.words.wordtools.abstractword import AbstractWord
 
 
+ExpectedSentences = Sequence[Tuple[str, str]]
+Matchers = Dict[str, Pattern]
+
+SENTENCE_RE = re.compile(r"[^.,!?]+[.,!?]?")
+
+
 class ParagraphComparison(object):
-    def __init__(self, answer_paragraph: Paragraph, submission_str):
+    def __init__(self, answer_paragraph: Paragraph, submission_str, expected_sentences: ExpectedSentences = None,
+                 matchers: Matchers = None):
+        """
+
+        :param expected_sentences: from get_expected_sentences(answer_paragraph), if it is already made
+        :param matchers: {matcher_key(word): word_matcher(word)} for words in answer_paragraph. Words that are not
+            in it are matched as usual.
+        """
         self.answer = answer_paragraph
         self.submission = submission_str
+        self._expected_sentences = expected_sentences
+        self._matchers = matchers
+
+    def compare_by_sentences(self, renderer: Renderer = None):
+        """
+
+        :param renderer: writes 'hint_paragraph'. Without one, errors are in <bold></bold>.
+        """
+        hints, error_count, missing_sentences = self._sentence_hints()
+        hint_paragraph = ' '.join(hints) if renderer is None else renderer.render_hints(hints)
+        return {'error_count': error_count,
+                'hint_paragraph': hint_paragraph,
+                'missing_sentences': missing_sentences}
+
+    def write_sentence_hints(self, stream: TextIO, renderer: Renderer) -> dict:
+        """
+
+        :return: compare_by_sentences() without 'hint_paragraph', which is written to stream instead
+        """
+        hints, error_count, missing_sentences = self._sentence_hints()
+        renderer.write_hints(stream, hints)
+        return {'error_count': error_count, 'missing_sentences': missing_sentences}
 
-    def compare_by_sentences(self):
-        hint_paragraph = []
+    def _sentence_hints(self) -> Tuple[List[str], int, int]:
+        hints = []
         error_count = 0
 
         submission_sentences = self._get_submission_sentences()
-        answer_sentences_exclamation = (str(sentence).replace('.', '!') for sentence in self.answer)
-        answer_sentences_period = (str(sentence).replace('!', '.') for sentence in self.answer)
-
-        zipped = zip_longest(answer_sentences_period, answer_sentences_exclamation, submission_sentences, fillvalue='')
-        for periods_answer, exclamations_answer, submission in zipped:
-            if (submission not in (periods_answer, exclamations_answer)) and submission:
-                submission = f'<bold>{submission}</bold>'
-                error_count += 1
-            hint_paragraph.append(submission)
+        expected_sentences = self._expected_sentences
+        if expected_sentences is None:
+            expected_sentences = get_expected_sentences(self.answer)
+
+        for expected, submission in zip_longest(expected_sentences, submission_sentences):
+            hint, errors = sentence_hint(expected, submission)
+            error_count += errors
+            hints.append(hint)
         missing_sentences = len(self.answer) - len(submission_sentences)
-
-        return {'error_count': error_count,
-                'hint_paragraph': ' '.join(hint_paragraph),
-                'missing_sentences': missing_sentences}
+        return hints, error_count, missing_sentences
 
     def _get_submission_sentences(self):
-        sentence_re = re.compile(r"[^.,!?]+[.,!?]?")
-        submission_sentences = sentence_re.findall(self.submission)
-        return [sentence.strip() for sentence in submission_sentences]
+        return get_submission_sentences(self.submission)
+
+    def compare_by_words(self, renderer: Renderer = None):
+        """
 
-    def compare_by_words(self):
+        :param renderer: writes 'hint_paragraph'. Without one, errors are in <bold></bold>.
+        """
+        return self.compare_by_words_with_missed(renderer)[0]
+
+    def compare_by_words_with_missed(self, renderer: Renderer = None) -> Tuple[dict, List[Tuple[int, int]]]:
+        """
+
+        :return: compare_by_words(), (sentence index, word index) of each word in the answer that was wrong, missing
+            or out of order
+        """
+        structured = self.compare_by_words_structured()
+        hints = structured['hints']
+        if renderer is None:
+            hint_paragraph = ' '.join([hint.hint_sentence for hint in hints])
+        else:
+            hint_paragraph = renderer.render_paragraph([hint.words for hint in hints])
+        missed = [(s_index, w_index) for s_index, hint in enumerate(hints) for w_index in hint.missed]
+        return {'error_count': structured['error_count'],
+                'hint_paragraph': hint_paragraph,
+                'missing_sentences': structured['missing_sentences']}, missed
+
+    def write_word_hints(self, stream: TextIO, renderer: Renderer) -> dict:
+        """
+
+        :return: compare_by_words() without 'hint_paragraph', which is written to stream instead
+        """
+        structured = self.compare_by_words_structured()
+        renderer.write_paragraph(stream, [hint.words for hint in structured['hints']])
+        return {'error_count': structured['error_count'], 'missing_sentences': structured['missing_sentences']}
+
+    def compare_by_words_structured(self) -> dict:
+        """
+        compare_by_words() without rendering any strings
+
+        :return: {'error_count': int, 'hints': [SentenceHint, ...], 'missing_sentences': int}. There is a hint for
+            each answer sentence and each extra submission sentence.
+        """
         submission_sentences = self._get_submission_sentences()
         missing_sentences = len(self.answer) - len(submission_sentences)
         if missing_sentences > 0:
             submission_sentences += [''] * missing_sentences
 
-        error_count = 0
-        hint_sentences = []
-        for sentence, submission_str in zip_longest(self.answer, submission_sentences, fillvalue=Sentence()):
-            answer = compare_sentences(sentence, submission_str)
-            error_count += answer['error_count']
-            hint_sentences.append(answer['hint_sentence'])
-
-        return {'error_count': error_count,
-                'hint_paragraph': ' '.join(hint_sentences),
+        zipped = zip_longest(self.answer, submission_sentences, fillvalue=Sentence())
+        hints = [sentence_word_hint(sentence, submission_str, self._matchers) for sentence, submission_str in zipped]
+        return {'error_count': sum(hint.error_count for hint in hints),
+                'hints': hints,
                 'missing_sentences': missing_sentences}
 
 
+def get_expected_sentences(answer_paragraph: Paragraph) -> List[Tuple[str, str]]:
+    """
+
+    :return: [(sentence ending in periods, sentence ending in exclamations), ...]
+    """
+    answer = []
+    for sentence in answer_paragraph:
+        sentence_str = str(sentence)
+        answer.append((sentence_str.replace('!', '.'), sentence_str.replace('.', '!')))
+    return answer
+
+
+def get_submission_sentences(submission_str: str) -> List[str]:
+    return [sentence.strip() for sentence in SENTENCE_RE.findall(submission_str)]
+
+
+def sentence_hint(expected: Optional[Tuple[str, str]], submission: Optional[str]) -> Tuple[str, int]:
+    """
+
+    :param expected: the answer sentence ending in periods and in exclamations. None if there is no answer sentence.
+    :param submission: the stripped submission sentence. None if it is missing.
+    :return: the hint for the sentence, the error count
+    """
+    if submission is None:
+        return '', 0
+    if submission and (expected is None or submission not in expected):
+        return f'<bold>{submission}</bold>', 1
+    return submission, 0
+
+
 WordObj = namedtuple('WordObj', ['index', 'location', 'word'])
 
 
-def compare_sentences(sentence: Sentence, submission_str: str) -> dict:
+def compare_sentences(sentence: Sentence, submission_str: str, matchers: Matchers = None,
+                      renderer: Renderer = None) -> dict:
+    return compare_sentence_words(sentence, submission_str, matchers, renderer)[0]
+
+
+def compare_sentence_words(sentence: Sentence, submission_str: str, matchers: Matchers = None,
+                           renderer: Renderer = None) -> Tuple[dict, List[int]]:
+    """
+
+    :param renderer: writes 'hint_sentence'. Without one, errors are in <bold></bold>.
+    :return: compare_sentences(sentence, submission_str), the sorted indices of the words in sentence that were wrong,
+        missing or out of order in submission_str
+    """
+    hint = sentence_word_hint(sentence, submission_str, matchers)
+    return {
+        'error_count': hint.error_count,
+        'hint_sentence': hint.hint_sentence if renderer is None else hint.render(renderer),
+    }, hint.missed
+
+
+def sentence_word_hint(sentence: Sentence, submission_str: str, matchers: Matchers = None) -> 'SentenceHint':
+    """compare_sentence_words(sentence, submission_str) as records. The hint string is only made if it is used."""
+    missed = set()
+    missing = set()
     new_sentence = []
     error_count = 0
     extra_locations = get_word_locations(submission_str)
@@ -75,10 +192,11 @@ def compare_sentences(sentence: Sentence, submission_str: str) -> dict:
         if isinstance(word, Punctuation):
             new_word, location = get_punctuation(current_search_str)
         else:
-            new_word, location = get_word(current_search_str, word)
+            new_word, location = get_word(current_search_str, word, matchers)
 
         if location is None:
             location = _get_missing_location(new_sentence)
+            missing.add(index)
         extra_locations = filter_locations(extra_locations, location)
 
         until, after = location
@@ -90,6 +208,7 @@ def compare_sentences(sentence: Sentence, submission_str: str) -> dict:
         if has_error:
             new_word = new_word.bold()
             error_count += 1
+            missed.add(index)
         word_obj = WordObj(index=index, location=location, word=new_word)
         new_sentence.append(word_obj)
 
@@ -100,13 +219,108 @@ def compare_sentences(sentence: Sentence, submission_str: str) -> dict:
         error_count += 1
 
     ordered_like_submission_str = sorted(new_sentence, key=lambda el: el.location)
-    final_word_list, extra_errors = _check_for_out_of_order_words(ordered_like_submission_str)
-    hint = str(Sentence(final_word_list))
-    error_count += extra_errors
-    return {
-        'error_count': error_count,
-        'hint_sentence': hint,
-    }
+    final_word_list, out_of_order = _check_for_out_of_order_words(ordered_like_submission_str)
+    error_count += len(out_of_order)
+    wrong = missed - missing
+    missed.update(out_of_order)
+    kinds = {index: MISSING for index in missing}
+    kinds.update((index, WRONG) for index in wrong)
+    kinds.update((index, OUT_OF_ORDER) for index in out_of_order)
+    return SentenceHint(Sentence(final_word_list), error_count, sorted(missed),
+                        (sentence, submission_str, ordered_like_submission_str, kinds))
+
+
+HintToken = namedtuple('HintToken', ['start', 'end', 'kind', 'expected', 'actual', 'index'])
+"""
+one answer word, or extra submission word, in the order of the submission.
+start, end: where it is in the submission sentence. A MISSING word is at the empty span where it was looked for.
+kind: CORRECT, or one of ERROR_KINDS.
+expected: the answer word's value, or None if it is EXTRA. actual: the submission's text, or None if it is MISSING.
+index: the word's index in the answer sentence, or None if it is EXTRA.
+"""
+
+CORRECT = 'correct'
+WRONG = 'wrong'
+MISSING = 'missing'
+EXTRA = 'extra'
+OUT_OF_ORDER = 'out_of_order'
+ERROR_KINDS = (WRONG, MISSING, EXTRA, OUT_OF_ORDER)
+
+
+class SentenceHint(object):
+    """made by sentence_word_hint. The tokens and the hint string are only made the first time they are asked for."""
+    __slots__ = ('_words', '_error_count', '_missed', '_token_source', '_tokens')
+
+    def __init__(self, words: Sentence, error_count: int, missed: List[int], token_source: tuple):
+        """
+
+        :param words: the hint, with errors in bold
+        :param token_source: (answer sentence, submission sentence, WordObjs in the order of the submission,
+            {answer word index: kind, for each word that is not CORRECT})
+        """
+        self._words = words
+        self._error_count = error_count
+        self._missed = missed
+        self._token_source = token_source
+        self._tokens = None  # type: Optional[Tuple[HintToken, ...]]
+
+    @property
+    def tokens(self) -> Tuple[HintToken, ...]:
+        if self._tokens is None:
+            self._tokens = tuple(self._make_tokens(errors_only=False))
+        return self._tokens
+
+    def errors(self) -> List[HintToken]:
+        """the tokens that are not CORRECT"""
+        if self._tokens is not None:
+            return [token for token in self._tokens if token.kind != CORRECT]
+        return self._make_tokens(errors_only=True)
+
+    def _make_tokens(self, errors_only: bool) -> List[HintToken]:
+        sentence, submission_str, word_objs, kinds = self._token_source
+        tokens = []
+        for word_obj in word_objs:
+            start, end = word_obj.location
+            if word_obj.index is None:
+                tokens.append(HintToken(start, end, EXTRA, None, submission_str[start:end], None))
+                continue
+            kind = kinds.get(word_obj.index, CORRECT)
+            if kind == CORRECT and errors_only:
+                continue
+            actual = None if kind == MISSING else submission_str[start:end]
+            tokens.append(HintToken(start, end, kind, sentence.get(word_obj.index).value, actual, word_obj.index))
+        return tokens
+
+    @property
+    def error_count(self) -> int:
+        return self._error_count
+
+    @property
+    def missed(self) -> List[int]:
+        """the sorted indices of the answer words that were wrong, missing or out of order"""
+        return self._missed[:]
+
+    @property
+    def words(self) -> Sentence:
+        return self._words
+
+    @property
+    def hint_sentence(self) -> str:
+        """the hint with errors in <bold></bold>"""
+        return str(self._words)
+
+    def render(self, renderer: Renderer) -> str:
+        return renderer.render_sentence(self._words)
+
+    def write(self, stream: TextIO, renderer: Renderer):
+        renderer.write_sentence(stream, self._words)
+
+    def to_dict(self) -> dict:
+        """:return: compare_sentences()"""
+        return {'error_count': self._error_count, 'hint_sentence': self.hint_sentence}
+
+    def __repr__(self):
+        return 'SentenceHint({!r}, {!r}, {!r})'.format(list(self.tokens), self._error_count, self._missed)
 
 
 def _get_missing_location(current_sentence):
@@ -136,9 +350,13 @@ def filter_locations(all_locations: List[Tuple[int, int]], to_remove: Tuple[int,
 
 
 def _check_for_out_of_order_words(obj_list: List[WordObj]):
+    """
+
+    :return: the word list with out of order words in bold, the indices of the words that were newly made bold
+    """
     word_list = []
     expected_index = 0
-    extra_errors = 0
+    out_of_order = []
     skipped_indices = 0
     for word_obj in obj_list:
 
@@ -150,17 +368,18 @@ def _check_for_out_of_order_words(obj_list: List[WordObj]):
             new_word = word_obj.word.bold()
             skipped_indices += 1
             if new_word != word_obj.word:
-                extra_errors += 1
+                out_of_order.append(word_obj.index)
         else:
             new_word = word_obj.word
             expected_index += 1 + skipped_indices
             skipped_indices = 0
         word_list.append(new_word)
-    return word_list, extra_errors
+    return word_list, out_of_order
 
 
-def get_word(submission_str: str, word: AbstractWord) -> Tuple[AbstractWord, Optional[Tuple[int, int]]]:
-    location = find_word_group(word, submission_str)
+def get_word(submission_str: str, word: AbstractWord,
+             matchers: Matchers = None) -> Tuple[AbstractWord, Optional[Tuple[int, int]]]:
+    location = find_word_group(word, submission_str, matchers)
     if location is None:
         return BasicWord('MISSING'), None
     sub_str = submission_str[slice(*location)]
@@ -183,18 +402,62 @@ def get_punctuation(submission_str: str) -> Tuple[Union[AbstractWord, Punctuatio
         return BasicWord("MISSING"), None
 
 
-def find_word_group(word, submission_str) -> Optional[Tuple[int, int]]:
+def find_word_group(word, submission_str, matchers: Matchers = None) -> Optional[Tuple[int, int]]:
+    if matchers is None:
+        answer = re.search(word_regex(word), submission_str)
+    else:
+        matcher = matchers.get(matcher_key(word))
+        if matcher is None:
+            matcher = word_matcher(word)
+        answer = matcher.search(submission_str)
+    return answer.span() if answer is not None else answer
+
+
+def find_noun_group(word: Noun, submission_str):
+    return _search(_noun_regex(word), submission_str)
+
+
+def find_verb_group(word: Verb, submission_str):
+    return _search(_verb_regex(word), submission_str)
+
+
+def find_pronoun(pronoun: AbstractPronoun, submission_str: str):
+    return _search(_pronoun_regex(pronoun), submission_str)
+
+
+def find_word(word: AbstractWord, submission_str):
+    return _search(_basic_word_regex(word), submission_str)
+
+
+def matcher_key(word) -> str:
+    """Words with the same key are found by the same regex."""
     if isinstance(word, Noun):
-        return find_noun_group(word, submission_str)
+        return 'n:' + word.base_noun + ':' + word.irregular_plural
     elif isinstance(word, Verb):
-        return find_verb_group(word, submission_str)
+        return 'v:' + word.infinitive + ':' + word.irregular_past
     elif isinstance(word, AbstractPronoun):
-        return find_pronoun(word, submission_str)
+        return 'p:' + word.subject().value.lower()
     else:
-        return find_word(word, submission_str)
+        return 'w:' + word.value
 
 
-def find_noun_group(word: Noun, submission_str):
+def word_matcher(word) -> Pattern:
+    """the compiled regex that find_word_group searches submissions with"""
+    return re.compile(word_regex(word))
+
+
+def word_regex(word) -> str:
+    if isinstance(word, Noun):
+        return _noun_regex(word)
+    elif isinstance(word, Verb):
+        return _verb_regex(word)
+    elif isinstance(word, AbstractPronoun):
+        return _pronoun_regex(word)
+    else:
+        return _basic_word_regex(word)
+
+
+def _noun_regex(word: Noun):
     prefixes = '(a|A|an|An|the|The)'
 
     base_word = word.to_basic_noun()
@@ -207,10 +470,10 @@ def find_noun_group(word: Noun, submission_str):
 
     word_regex = f'({base_regex}|{plural_regex})'
 
-    return _find_from_regex(prefixes, word_regex, submission_str)
+    return _prefixed_regex(prefixes, word_regex)
 
 
-def find_verb_group(word: Verb, submission_str):
+def _verb_regex(word: Verb):
     prefixes = ["don't", "doesn't", "didn't"]
     all_prefixes = prefixes + [word.capitalize() for word in prefixes]
     prefix_regex = '({})'.format('|'.join(all_prefixes))
@@ -227,26 +490,28 @@ def find_verb_group(word: Verb, submission_str):
 
     word_regex = f'({base_regex}|{plural_regex}|{past_regex})'
 
-    return _find_from_regex(prefix_regex, word_regex, submission_str)
+    return _prefixed_regex(prefix_regex, word_regex)
 
 
-def find_pronoun(pronoun: AbstractPronoun, submission_str: str):
+def _pronoun_regex(pronoun: AbstractPronoun):
     subject_lower = pronoun.subject().value.lower()
     object_lower = pronoun.object().value.lower()
     subject_upper = subject_lower.capitalize()
     object_upper = object_lower.capitalize()
     word_regex = f'({subject_lower}|{subject_upper}|{object_lower}|{object_upper})'
-    answer = re.search(r'\b{}\b'.format(word_regex), submission_str)
-    return answer.span() if answer is not None else answer
+    return r'\b{}\b'.format(word_regex)
 
 
-def find_word(word: AbstractWord, submission_str):
-    answer = re.search(r'\b{}\b'.format(word.value), submission_str)
-    return answer.span() if answer is not None else answer
+def _basic_word_regex(word: AbstractWord):
+    return r'\b{}\b'.format(word.value)
+
+
+def _prefixed_regex(prefixes, word_regex):
+    return r'({} )?{}\w*'.format(prefixes, word_regex)
 
 
-def _find_from_regex(prefixes, word_regex, submission_str):
-    answer = re.compile(r'({} )?{}\w*'.format(prefixes, word_regex)).search(submission_str)
+def _search(regex, submission_str):
+    answer = re.search(regex, submission_str)
     return answer.span() if answer is not None else answer
 
 
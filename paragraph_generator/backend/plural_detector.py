@@ -0,0 +1,94 @@
+"""
+Finds which of a fixed set of strings are in a text in one pass over the text (Aho-Corasick). It gives the same answer
+as checking `pattern in text` for each pattern, but does not scan the text once per pattern.
+
+`str.__contains__` runs in C, so checking each pattern is faster until there are about 150 patterns. Below
+MIN_PATTERNS_TO_SCAN, find checks each pattern and the automaton is never built.
+"""
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+MIN_PATTERNS_TO_SCAN = 160
+
+
+Automaton = Tuple[List[Dict[str, int]], List[int], List[Tuple[int, ...]]]
+"""(goto, fail, out) for each state. goto only has the trie's own edges."""
+
+
+class PluralDetector(object):
+    def __init__(self, patterns: Iterable[str]):
+        """
+
+        :param patterns: matched exactly, so lower case them and the text to ignore case
+        """
+        self._patterns = tuple(patterns)
+        self._automaton = None  # type: Optional[Automaton]
+
+    @property
+    def patterns(self) -> Tuple[str, ...]:
+        return self._patterns
+
+    def _get_automaton(self) -> Automaton:
+        """
+        built on first use. Detectors are shared between threads, so the automaton is only stored once it is
+        finished. Threads that both find it missing each build one, and either is right.
+        """
+        automaton = self._automaton
+        if automaton is None:
+            automaton = _build_automaton(self._patterns)
+            self._automaton = automaton
+        return automaton
+
+    def find(self, text: str) -> Tuple[int, ...]:
+        """
+
+        :return: the sorted indices of the patterns that are in text
+        """
+        if len(self._patterns) < MIN_PATTERNS_TO_SCAN:
+            return tuple(index for index, pattern in enumerate(self._patterns) if pattern in text)
+        return self.scan(text)
+
+    def scan(self, text: str) -> Tuple[int, ...]:
+        """find, always in one pass over text"""
+        goto, fail, out = self._get_automaton()
+        found = set(out[0])
+        state = 0
+        for char in text:
+            next_state = goto[state].get(char)
+            while next_state is None and state:
+                state = fail[state]
+                next_state = goto[state].get(char)
+            state = next_state or 0
+            if out[state]:
+                found.update(out[state])
+        return tuple(sorted(found))
+
+
+def _build_automaton(patterns: Sequence[str]) -> Automaton:
+    goto = [{}]  # type: List[Dict[str, int]]
+    fail = [0]
+    out = [()]  # type: List[Tuple[int, ...]]
+    for index, pattern in enumerate(patterns):
+        state = 0
+        for char in pattern:
+            next_state = goto[state].get(char)
+            if next_state is None:
+                next_state = len(goto)
+                goto[state][char] = next_state
+                goto.append({})
+                fail.append(0)
+                out.append(())
+            state = next_state
+        out[state] += (index,)
+
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for char, next_state in goto[state].items():
+            queue.append(next_state)
+            suffix = fail[state]
+            while char not in goto[suffix] and suffix:
+                suffix = fail[suffix]
+            fail[next_state] = goto[suffix].get(char, 0)
+            out[next_state] += out[fail[next_state]]
+    return goto, fail, out
@@ -1,13 +1,32 @@
 import random
 
+from paragraph_generator.backend.random_assignments.at_least import choose_at_least
 from paragraph_generator.tags.status_tag import StatusTag
 from paragraph_generator.word_groups.paragraph import Paragraph
 from paragraph_generator.words.verb import Verb
 
 
-def assign_random_negatives(paragraph: Paragraph, p_negative) -> Paragraph:
+def assign_random_negatives(paragraph: Paragraph, p_negative, rng: random.Random = None, minimum=0) -> Paragraph:
+    """
+
+    :param minimum: make at least this many verbs negative. The answer is distributed as if assigning negatives
+                    were retried until there were enough.
+    :raises ValueError: if the paragraph has fewer than minimum verbs
+    """
+    if rng is None:
+        rng = random
     out = paragraph
+    if minimum > 0:
+        verb_positions = [(s_index, w_index, word) for s_index, w_index, word in paragraph.indexed_all_words()
+                          if isinstance(word, Verb)]
+        if minimum > len(verb_positions):
+            raise ValueError('cannot make {} negatives. the paragraph has {} verbs'.format(
+                minimum, len(verb_positions)))
+        for s_index, w_index, word in choose_at_least(verb_positions, p_negative, minimum, rng):
+            out = out.set(s_index, w_index, word.negative())
+        return out.set_tags(paragraph.tags.add(StatusTag.HAS_NEGATIVES))
+
     for s_index, w_index, word in paragraph.indexed_all_words():
-        if isinstance(word, Verb) and random.random() < p_negative:
+        if isinstance(word, Verb) and rng.random() < p_negative:
             out = out.set(s_index, w_index, word.negative())
     return out.set_tags(paragraph.tags.add(StatusTag.HAS_NEGATIVES))
@@ -0,0 +1,46 @@
+"""
+Random choices that must meet a minimum, made in one go instead of retrying until the minimum is met.
+"""
+import random
+from math import exp, lgamma, log
+from typing import List, Sequence, TypeVar
+
+T = TypeVar('T')
+
+
+def choose_at_least(items: Sequence[T], p_choose, minimum: int, rng: random.Random = None) -> List[T]:
+    """
+    Chooses each item with probability p_choose, given that at least minimum items are chosen. This is the same
+    distribution as choosing each item independently and starting over until at least minimum are chosen. If
+    p_choose <= 0, exactly minimum items are chosen.
+
+    :return: the chosen items in their original order
+    :raises ValueError: if there are fewer than minimum items
+    """
+    if rng is None:
+        rng = random
+    if minimum > len(items):
+        raise ValueError('cannot choose {} from {} items'.format(minimum, len(items)))
+    if minimum <= 0:
+        return [item for item in items if rng.random() < p_choose]
+
+    total = draw_count(len(items), p_choose, minimum, rng)
+    chosen = set(rng.sample(range(len(items)), total))
+    return [item for index, item in enumerate(items) if index in chosen]
+
+
+def draw_count(size: int, p_choose, minimum: int, rng: random.Random = None) -> int:
+    """a Binomial(size, p_choose) count, given that it is at least minimum"""
+    if rng is None:
+        rng = random
+    if p_choose <= 0:
+        return minimum
+    if p_choose >= 1:
+        return size
+
+    counts = range(minimum, size + 1)
+    log_weights = [lgamma(size + 1) - lgamma(count + 1) - lgamma(size - count + 1) +
+                   count * log(p_choose) + (size - count) * log(1 - p_choose)
+                   for count in counts]
+    highest = max(log_weights)
+    return rng.choices(counts, [exp(weight - highest) for weight in log_weights])[0]
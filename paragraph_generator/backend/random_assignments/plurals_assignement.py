@@ -1,6 +1,7 @@
 import random
 from typing import List
 
+from paragraph_generator.backend.random_assignments.at_least import choose_at_least
 from paragraph_generator.tags.status_tag import StatusTag
 from paragraph_generator.tags.wordtag import WordTag
 from paragraph_generator.word_groups.paragraph import Paragraph
@@ -9,8 +10,9 @@ from paragraph_generator.words.wordtools.abstractword import AbstractWord
 
 
 class PluralsAssignment(object):
-    def __init__(self, raw_paragraph: Paragraph):
+    def __init__(self, raw_paragraph: Paragraph, rng: random.Random = None):
         self._raw = raw_paragraph
+        self._rng = random if rng is None else rng
         self._revert_countable_nouns_and_tags()
 
     def _revert_countable_nouns_and_tags(self):
@@ -30,9 +32,25 @@ class PluralsAssignment(object):
                 new_paragraph = new_paragraph.set(s_index, w_index, noun.plural())
         return new_paragraph.set_tags(self.raw.tags.add(StatusTag.HAS_PLURALS))
 
-    def assign_random_plurals(self, p_plural) -> Paragraph:
-        to_plural = [noun for noun in get_countable_nouns(self.raw) if random.random() < p_plural]
+    def assign_random_plurals(self, p_plural, minimum_irregular=0) -> Paragraph:
+        """
 
+        :param minimum_irregular: make at least this many nouns with irregular plurals plural. The answer is
+                                  distributed as if assigning plurals were retried until there were enough.
+        :raises ValueError: if the paragraph has fewer than minimum_irregular countable nouns with irregular plurals
+        """
+        countable_nouns = get_countable_nouns(self.raw)
+        if minimum_irregular <= 0:
+            to_plural = [noun for noun in countable_nouns if self._rng.random() < p_plural]
+            return self.assign_plural(to_plural)
+
+        irregular = [noun for noun in countable_nouns if noun.irregular_plural]
+        if minimum_irregular > len(irregular):
+            raise ValueError(
+                'cannot make {} irregular plurals. the paragraph has {} nouns with irregular plurals'.format(
+                    minimum_irregular, len(irregular)))
+        to_plural = choose_at_least(irregular, p_plural, minimum_irregular, self._rng)
+        to_plural += [noun for noun in countable_nouns if not noun.irregular_plural and self._rng.random() < p_plural]
         return self.assign_plural(to_plural)
 
 
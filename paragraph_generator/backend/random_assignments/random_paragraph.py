@@ -1,7 +1,9 @@
 import random
-from typing import List
+from typing import Dict, List
 
 from paragraph_generator.backend.random_assignments.random_sentences import RandomSentences
+from paragraph_generator.backend.random_assignments.sentence_templates import SentenceTemplates
+from paragraph_generator.instrumentation import record_retry
 from paragraph_generator.tags.status_tag import StatusTag
 from paragraph_generator.tags.tags import Tags
 from paragraph_generator.word_groups.paragraph import Paragraph
@@ -12,9 +14,12 @@ from paragraph_generator.words.wordtools.abstractword import AbstractWord
 
 
 class RandomParagraph(object):
-    def __init__(self, probability_pronoun, verb_list: List[VerbGroup], noun_list: List[Noun]):
+    def __init__(self, probability_pronoun, verb_list: List[VerbGroup], noun_list: List[Noun],
+                 rng: random.Random = None, templates: SentenceTemplates = None):
         self._p_pronoun = probability_pronoun
-        self._word_maker = RandomSentences(verb_list, noun_list)
+        self._rng = random if rng is None else rng
+        self._verbs = tuple(verb_list)
+        self._word_maker = RandomSentences(verb_list, noun_list, rng, templates)
         self._raw_tag = Tags([StatusTag.RAW])
 
     def get_subject_pool(self, size) -> List[AbstractWord]:
@@ -26,26 +31,49 @@ class RandomParagraph(object):
             if new_subj not in pool:
                 pool.append(new_subj)
             else:
+                record_retry('subject_pool')
                 safety_count += 1
                 if safety_count > safety_limit:
                     raise ValueError('pool size is too large for available nouns loaded from file')
         return pool
 
-    def create_pool_paragraph(self, pool_size: int, num_sentences: int) -> Paragraph:
+    def create_pool_paragraph(self, pool_size: int, num_sentences: int, min_distinct_verbs=0,
+                              required_subject: AbstractWord = None) -> Paragraph:
+        """
+
+        :param min_distinct_verbs: see distinct_verbs
+        :param required_subject: this is in the pool and is the subject of at least one sentence
+        """
         subjects = self.get_subject_pool(pool_size)
+        verb_groups = self.distinct_verbs(num_sentences, min_distinct_verbs)
+        required_index = None
+        if required_subject is not None:
+            if required_subject not in subjects:
+                subjects[self._rng.randrange(len(subjects))] = required_subject
+            required_index = self._rng.randrange(num_sentences)
 
         sentences = []
-        for _ in range(num_sentences):
-            subj = random.choice(subjects)
-            sentences.append(self._word_maker.sentence(subj, self._p_pronoun))
+        for index in range(num_sentences):
+            subj = required_subject if index == required_index else self._rng.choice(subjects)
+            sentences.append(self._word_maker.sentence(subj, self._p_pronoun, verb_groups.get(index)))
         return Paragraph(sentences, self._raw_tag)
 
-    def create_chain_paragraph(self, num_sentences: int) -> Paragraph:
+    def create_chain_paragraph(self, num_sentences: int, min_distinct_verbs=0,
+                               required_subject: AbstractWord = None) -> Paragraph:
+        """
+
+        :param min_distinct_verbs: see distinct_verbs
+        :param required_subject: the subject of the first sentence
+        """
         sentences = []
+        verb_groups = self.distinct_verbs(num_sentences, min_distinct_verbs)
 
-        new_subj = self._word_maker.subject(self._p_pronoun)
-        for _ in range(num_sentences):
-            sentence = self._word_maker.sentence(new_subj, self._p_pronoun)
+        if required_subject is None:
+            new_subj = self._word_maker.subject(self._p_pronoun)
+        else:
+            new_subj = required_subject
+        for index in range(num_sentences):
+            sentence = self._word_maker.sentence(new_subj, self._p_pronoun, verb_groups.get(index))
             sentences.append(sentence)
             subj_candidate = sentence.get(-2)
             if isinstance(subj_candidate, Pronoun):
@@ -56,3 +84,28 @@ class RandomParagraph(object):
                 new_subj = self._word_maker.subject(self._p_pronoun)
 
         return Paragraph(sentences, self._raw_tag)
+
+    def distinct_verbs(self, num_sentences: int, minimum: int) -> Dict[int, VerbGroup]:
+        """
+        picks minimum sentences at random and gives each one a different verb. the other sentences get random verbs
+        as usual, so the paragraph uses at least minimum distinct verbs.
+
+        this changes the distribution. it is not the same as drawing every verb at random and starting over until
+        minimum are distinct, so some verb assignments are more likely than retrying would make them. retrying is not
+        practical when minimum is close to num_sentences, as almost every draw would be thrown away.
+
+        :return: {sentence_index: VerbGroup}
+        :raises ValueError: if there are fewer sentences or distinct verbs than minimum
+        """
+        if minimum <= 0:
+            return {}
+        by_verb = {}  # type: Dict[str, List[VerbGroup]]
+        for verb_group in self._verbs:
+            by_verb.setdefault(verb_group.verb.value, []).append(verb_group)
+        if minimum > min(num_sentences, len(by_verb)):
+            raise ValueError('cannot use {} distinct verbs in {} sentences with {} distinct verbs available'.format(
+                minimum, num_sentences, len(by_verb)))
+
+        verbs = self._rng.sample(list(by_verb), minimum)
+        indices = self._rng.sample(range(num_sentences), minimum)
+        return {index: self._rng.choice(by_verb[verb]) for index, verb in zip(indices, verbs)}
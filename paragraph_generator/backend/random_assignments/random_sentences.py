@@ -1,7 +1,10 @@
 import random
-from typing import List
+from typing import List, Tuple
 
-from paragraph_generator.tags.wordtag import WordTag
+from paragraph_generator.backend.random_assignments.sentence_templates import (  # noqa: F401 - re-exported
+    SentenceTemplates, fill_template, assign_objects, does_preposition_precede_separable_particle
+)
+from paragraph_generator.instrumentation import record_retry
 from paragraph_generator.word_groups.sentence import Sentence
 from paragraph_generator.word_groups.verb_group import VerbGroup
 from paragraph_generator.words.noun import Noun
@@ -11,12 +14,22 @@ from paragraph_generator.words.wordtools.abstractword import AbstractWord
 
 
 class RandomSentences(object):
-    def __init__(self, verb_list: List[VerbGroup], noun_list: List[Noun]):
-        self._pronouns = list(Pronoun.__members__.values())
-        self._endings = [Punctuation.PERIOD, Punctuation.PERIOD, Punctuation.EXCLAMATION]
-
-        self._verbs = verb_list[:]  # type: List[VerbGroup]
-        self._nouns = noun_list[:]  # type: List[Noun]
+    def __init__(self, verb_list: List[VerbGroup], noun_list: List[Noun], rng: random.Random = None,
+                 templates: SentenceTemplates = None):
+        """
+
+        :param rng: source of randomness. Defaults to the module level functions of `random`.
+            Give each thread its own `random.Random` for reproducible, uncontended generation.
+        :param templates: word order templates for verb_list. Pass one in to reuse it across instances.
+        """
+        self._pronouns = tuple(Pronoun.__members__.values())
+        self._endings = (Punctuation.PERIOD, Punctuation.PERIOD, Punctuation.EXCLAMATION)
+
+        self._verbs = tuple(verb_list)  # type: Tuple[VerbGroup, ...]
+        self._nouns = tuple(noun_list)  # type: Tuple[Noun, ...]
+        self._rng = random if rng is None else rng
+        self._templates = templates
+        self._verb_templates = None
         self._check_empty_lists()
 
     def _check_empty_lists(self):
@@ -25,33 +38,49 @@ class RandomSentences(object):
         if not self._nouns:
             raise ValueError('There are no nouns in any of the nouns lists.')
 
-    def sentence(self, subject: AbstractWord, p_pronoun=0.2):
+    def sentence(self, subject: AbstractWord, p_pronoun=0.2, verb_group: VerbGroup = None):
+        """
+
+        :param verb_group: build the predicate around this instead of a random VerbGroup
+        """
         p_pronoun = min(max(p_pronoun, 0), 1)
         to_test = subject
         if isinstance(subject, Pronoun):
             to_test = subject.object()
 
         max_loops_until_repeats_allowed = 100
-        predicate = self.predicate(p_pronoun)  # linter issue
+        predicate = self.predicate(p_pronoun, verb_group)  # linter issue
         for _ in range(max_loops_until_repeats_allowed):
             if to_test not in predicate:
                 break
-            predicate = self.predicate(p_pronoun)
+            record_retry('sentence_predicate')
+            predicate = self.predicate(p_pronoun, verb_group)
         predicate.insert(0, subject)
         return Sentence(predicate)
 
-    def predicate(self, p_pronoun=0.2):
+    def predicate(self, p_pronoun=0.2, verb_group: VerbGroup = None):
         p_pronoun = min(max(p_pronoun, 0), 1)
 
-        verb_group = random.choice(self._verbs)
+        if verb_group is None:
+            verb_group, template_table = self._rng.choice(self._get_verb_templates())
+        else:
+            self._get_verb_templates()
+            template_table = self._templates.get(verb_group)
 
         objects = self._get_objects(verb_group.objects, p_pronoun)
 
-        predicate = assign_objects(verb_group, objects)
+        predicate = fill_template(template_table, verb_group, objects)
 
-        predicate.append(random.choice(self._endings))
+        predicate.append(self._rng.choice(self._endings))
         return predicate
 
+    def _get_verb_templates(self):
+        if self._verb_templates is None:
+            if self._templates is None:
+                self._templates = SentenceTemplates(self._verbs)
+            self._verb_templates = self._templates.pair_with(self._verbs)
+        return self._verb_templates
+
     def _get_objects(self, object_count, p_pronoun):
         objects = []
         loop_count = 0
@@ -64,49 +93,21 @@ class RandomSentences(object):
 
             if new_obj not in objects or loop_count > max_loops_until_repeats_allowed:
                 objects.append(new_obj)
+            else:
+                record_retry('sentence_objects')
 
             loop_count += 1
         return objects
 
     def subject(self, p_pronoun):
-        if random.random() < p_pronoun:
-            return random.choice(self._pronouns).subject()
+        if self._rng.random() < p_pronoun:
+            return self._rng.choice(self._pronouns).subject()
         else:
-            return random.choice(self._nouns)
+            return self._rng.choice(self._nouns)
 
     def object(self, p_pronoun):
-        if random.random() < p_pronoun:
-            return random.choice(self._pronouns).object()
+        if self._rng.random() < p_pronoun:
+            return self._rng.choice(self._pronouns).object()
         else:
-            return random.choice(self._nouns)
-
+            return self._rng.choice(self._nouns)
 
-def assign_objects(verb_group: VerbGroup, objects: List[AbstractWord]):
-    preposition = [verb_group.preposition]
-    separable_particle = [verb_group.particle]
-    predicate = [verb_group.verb]  # type: List[AbstractWord]
-
-    while objects:
-        obj = objects.pop()
-        if len(preposition) < 2:
-            preposition.append(obj)
-        elif isinstance(obj, Pronoun):
-            separable_particle.insert(0, obj)
-        else:
-            separable_particle.append(obj)
-    if does_preposition_precede_separable_particle(preposition, separable_particle):
-        answer = predicate + preposition + separable_particle
-    else:
-        answer = predicate + separable_particle + preposition
-
-    return [word for word in answer if word is not None]
-
-
-def does_preposition_precede_separable_particle(preposition, separable_particle):
-    lacks_preposition = None in preposition
-    only_separable_particle = (
-            None not in separable_particle and
-            all(word.has_tags(WordTag.SEPARABLE_PARTICLE) for word in separable_particle)
-    )
-    preposition_with_pronoun = any(isinstance(word, Pronoun) for word in preposition)
-    return lacks_preposition and only_separable_particle and preposition_with_pronoun
@@ -0,0 +1,140 @@
+"""
+assign_objects decides the word order of a predicate from the shape of its VerbGroup (is there a preposition, is
+there a separable particle, how many objects) and from which of the objects are pronouns. There are only a handful
+of those cases, so SentenceTemplates works out the order for each one ahead of time and building a predicate
+becomes slot-filling.
+
+A template is a tuple of slots. Non-negative slots index the objects. Negative slots index the end of
+[*objects, particle, preposition, verb].
+"""
+from itertools import product
+from typing import Dict, List, Optional, Tuple
+
+from paragraph_generator.tags.tags import Tags
+from paragraph_generator.tags.wordtag import WordTag
+from paragraph_generator.word_groups.verb_group import VerbGroup
+from paragraph_generator.words.basicword import BasicWord
+from paragraph_generator.words.noun import Noun
+from paragraph_generator.words.pronoun import Pronoun
+from paragraph_generator.words.verb import Verb
+from paragraph_generator.words.wordtools.abstractword import AbstractWord
+
+VERB = -1
+PREPOSITION = -2
+PARTICLE = -3
+
+Shape = Tuple[bool, Optional[bool], int]
+Kinds = Tuple[bool, ...]
+Template = Tuple[int, ...]
+TemplateTable = Dict[Kinds, Template]
+
+_PRONOUN_PLACEHOLDERS = tuple(Pronoun.__members__.values())
+
+
+class SentenceTemplates(object):
+    def __init__(self, verb_list: List[VerbGroup]):
+        """
+        Builds a template table for every VerbGroup in verb_list. Build it once per vocabulary.
+        """
+        self._tables = {}  # type: Dict[Shape, TemplateTable]
+        self._verb_groups = tuple(verb_list)
+        self._entries = tuple((verb_group, self.get(verb_group)) for verb_group in self._verb_groups)
+
+    def __len__(self):
+        return len(self._verb_groups)
+
+    def get(self, verb_group: VerbGroup) -> TemplateTable:
+        shape = get_shape(verb_group)
+        table = self._tables.get(shape)
+        if table is None:
+            table = build_template_table(shape)
+            self._tables[shape] = table
+        return table
+
+    def pair_with(self, verb_list) -> Tuple[Tuple[VerbGroup, TemplateTable], ...]:
+        """
+
+        :return: ((verb_group, template_table), ...) in the order of verb_list
+        """
+        if len(verb_list) == len(self._verb_groups) and all(
+                new is old for new, old in zip(verb_list, self._verb_groups)):
+            return self._entries
+        return tuple((verb_group, self.get(verb_group)) for verb_group in verb_list)
+
+
+def assign_objects(verb_group: VerbGroup, objects: List[AbstractWord]):
+    preposition = [verb_group.preposition]
+    separable_particle = [verb_group.particle]
+    predicate = [verb_group.verb]  # type: List[AbstractWord]
+
+    while objects:
+        obj = objects.pop()
+        if len(preposition) < 2:
+            preposition.append(obj)
+        elif isinstance(obj, Pronoun):
+            separable_particle.insert(0, obj)
+        else:
+            separable_particle.append(obj)
+    if does_preposition_precede_separable_particle(preposition, separable_particle):
+        answer = predicate + preposition + separable_particle
+    else:
+        answer = predicate + separable_particle + preposition
+
+    return [word for word in answer if word is not None]
+
+
+def does_preposition_precede_separable_particle(preposition, separable_particle):
+    lacks_preposition = None in preposition
+    only_separable_particle = (
+            None not in separable_particle and
+            all(word.has_tags(WordTag.SEPARABLE_PARTICLE) for word in separable_particle)
+    )
+    preposition_with_pronoun = any(isinstance(word, Pronoun) for word in preposition)
+    return lacks_preposition and only_separable_particle and preposition_with_pronoun
+
+
+def get_shape(verb_group: VerbGroup) -> Shape:
+    particle = verb_group.particle
+    particle_state = None if particle is None else particle.has_tags(WordTag.SEPARABLE_PARTICLE)
+    return verb_group.preposition is not None, particle_state, verb_group.objects
+
+
+def build_template_table(shape: Shape) -> TemplateTable:
+    object_count = shape[2]
+    return {kinds: build_template(shape, kinds) for kinds in product((False, True), repeat=object_count)}
+
+
+def build_template(shape: Shape, kinds: Kinds) -> Optional[Template]:
+    """
+    runs assign_objects on placeholder words and records where each one landed.
+
+    :param kinds: for each object, is it a Pronoun
+    :return: None if there are more pronoun objects than placeholders to tell them apart
+    """
+    has_preposition, particle_state, _ = shape
+    if sum(kinds) > len(_PRONOUN_PLACEHOLDERS):
+        return None
+
+    verb = Verb('')
+    preposition = BasicWord.preposition('') if has_preposition else None
+    particle = None
+    if particle_state is not None:
+        particle = BasicWord('', Tags([WordTag.SEPARABLE_PARTICLE] if particle_state else []))
+
+    pronouns = iter(_PRONOUN_PLACEHOLDERS)
+    objects = [next(pronouns) if is_pronoun else Noun('') for is_pronoun in kinds]
+
+    slots = {id(obj): index for index, obj in enumerate(objects)}
+    slots.update({id(verb): VERB, id(preposition): PREPOSITION, id(particle): PARTICLE})
+
+    predicate = assign_objects(VerbGroup(verb, preposition, particle, shape[2]), objects)
+    return tuple(slots[id(word)] for word in predicate)
+
+
+def fill_template(table: TemplateTable, verb_group: VerbGroup, objects: List[AbstractWord]) -> List[AbstractWord]:
+    """same answer as assign_objects(verb_group, objects)"""
+    template = table.get(tuple([isinstance(obj, Pronoun) for obj in objects]))
+    if template is None:
+        return assign_objects(verb_group, objects)
+    words = objects + [verb_group.particle, verb_group.preposition, verb_group.verb]
+    return [words[slot] for slot in template]
@@ -0,0 +1,146 @@
+"""
+Everything an AnswerChecker works out from the original paragraph that does not depend on the submission.
+
+compile_checker(original) finds the countable nouns and their plurals and a regex matcher for each word. Grading a
+submission then only has to see which plurals it uses. The answer paragraph for that choice of plurals, and its
+expected sentence strings, are made the first time they are needed and kept. A CompiledChecker can be saved with
+to_json and graded from after from_json, so it can be stored next to the worksheet.
+"""
+import json
+import re
+from typing import Dict, List, Pattern, Tuple
+
+from paragraph_generator.backend.create_answer_paragraph import grammarize_like, revert_verbs
+from paragraph_generator.backend.paragraph_comparison import (
+    ParagraphComparison, get_expected_sentences, matcher_key, word_matcher
+)
+from paragraph_generator.backend.plural_detector import PluralDetector
+from paragraph_generator.backend.random_assignments.plurals_assignement import get_countable_nouns, PluralsAssignment
+from paragraph_generator.instrumentation import record_cache
+from paragraph_generator.serializer import Serializer
+from paragraph_generator.word_groups.paragraph import Paragraph
+from paragraph_generator.words.noun import Noun
+from paragraph_generator.words.punctuation import Punctuation
+
+COMPILED_CHECKER_VERSION = 1
+
+PluralIndices = Tuple[int, ...]
+Variant = Tuple[Paragraph, List[Tuple[str, str]]]
+
+
+def compile_checker(original: Paragraph) -> 'CompiledChecker':
+    return CompiledChecker(original)
+
+
+class CompiledChecker(object):
+    def __init__(self, original: Paragraph):
+        countable_nouns = get_countable_nouns(original)
+        plurals = [noun.plural().value.lower() for noun in countable_nouns]
+        matchers = {}
+        for word in original.all_words():
+            if not isinstance(word, Punctuation):
+                key = matcher_key(word)
+                if key not in matchers:
+                    matchers[key] = word_matcher(word)
+        self._init(original, countable_nouns, plurals, matchers, {})
+
+    def _init(self, original: Paragraph, countable_nouns: List[Noun], plurals: List[str],
+              matchers: Dict[str, Pattern], variants: Dict[PluralIndices, Variant]):
+        self._original = original
+        self._countable_nouns = tuple(countable_nouns)
+        self._plurals = tuple(plurals)
+        self._detector = PluralDetector(self._plurals)
+        self._matchers = matchers
+        self._variants = variants
+        self._assignment = PluralsAssignment(revert_verbs(original))
+
+    @property
+    def original(self) -> Paragraph:
+        return self._original
+
+    @property
+    def countable_nouns(self) -> Tuple[Noun, ...]:
+        return self._countable_nouns
+
+    @property
+    def plurals(self) -> Tuple[str, ...]:
+        """the lower case plural of each countable noun"""
+        return self._plurals
+
+    def plural_indices(self, submission: str) -> PluralIndices:
+        """the indices in countable_nouns of the nouns whose plural is in submission"""
+        return self._detector.find(submission.lower())
+
+    def answer_paragraph(self, submission: str) -> Paragraph:
+        """the same as create_answer_paragraph(submission, original)"""
+        return self._get_variant(self.plural_indices(submission))[0]
+
+    @property
+    def matchers(self) -> Dict[str, Pattern]:
+        """{matcher_key(word): word_matcher(word)} for the words in original"""
+        return self._matchers
+
+    def answer_and_expected_sentences(self, submission: str) -> Variant:
+        """
+
+        :return: answer_paragraph(submission), get_expected_sentences(answer_paragraph(submission))
+        """
+        return self._get_variant(self.plural_indices(submission))
+
+    def comparison(self, submission: str) -> ParagraphComparison:
+        answer, expected_sentences = self._get_variant(self.plural_indices(submission))
+        return ParagraphComparison(answer, submission, expected_sentences, self._matchers)
+
+    def _get_variant(self, plural_indices: PluralIndices) -> Variant:
+        variant = self._variants.get(plural_indices)
+        record_cache('answer_variants', variant is not None)
+        if variant is None:
+            to_plural = [self._countable_nouns[index] for index in plural_indices]
+            answer = grammarize_like(self._assignment.assign_plural(to_plural), self._original)
+            variant = answer, get_expected_sentences(answer)
+            self._variants[plural_indices] = variant
+        return variant
+
+    def to_dict(self) -> dict:
+        """Answer paragraphs that have already been made are saved too."""
+        variants = [{'plurals': list(indices), 'answer': Serializer.to_dict(answer),
+                     'expected_sentences': [list(pair) for pair in expected_sentences]}
+                    for indices, (answer, expected_sentences) in self._variants.items()]
+        return {
+            'class': 'CompiledChecker',
+            'version': COMPILED_CHECKER_VERSION,
+            'original': Serializer.to_dict(self._original),
+            'countable_nouns': [Serializer.to_dict(noun) for noun in self._countable_nouns],
+            'plurals': list(self._plurals),
+            'matchers': {key: matcher.pattern for key, matcher in self._matchers.items()},
+            'variants': variants,
+        }
+
+    @classmethod
+    def from_dict(cls, python_dict: dict) -> 'CompiledChecker':
+        """
+
+        :raises ValueError: if python_dict is not a CompiledChecker of this version
+        """
+        if python_dict.get('class') != 'CompiledChecker' or python_dict.get('version') != COMPILED_CHECKER_VERSION:
+            raise ValueError('not a version {} CompiledChecker: class={!r}, version={!r}'.format(
+                COMPILED_CHECKER_VERSION, python_dict.get('class'), python_dict.get('version')))
+        countable_nouns = [Serializer.to_obj(noun) for noun in python_dict['countable_nouns']]
+        if len(countable_nouns) != len(python_dict['plurals']):
+            raise ValueError('CompiledChecker has {} countable nouns and {} plurals'.format(
+                len(countable_nouns), len(python_dict['plurals'])))
+        matchers = {key: re.compile(pattern) for key, pattern in python_dict['matchers'].items()}
+        variants = {tuple(variant['plurals']): (Serializer.to_obj(variant['answer']),
+                                                [tuple(pair) for pair in variant['expected_sentences']])
+                    for variant in python_dict['variants']}
+        answer = cls.__new__(cls)
+        answer._init(Serializer.to_obj(python_dict['original']), countable_nouns, python_dict['plurals'],
+                     matchers, variants)
+        return answer
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> 'CompiledChecker':
+        return cls.from_dict(json.loads(json_str))
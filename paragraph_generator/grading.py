@@ -0,0 +1,253 @@
+"""
+Grading that reuses work between submissions.
+
+GradingSession follows one submission as it is typed. Each update finds the part of the text that changed, splits
+only that part into sentences again, and only compares the sentences whose text, or whose answer sentence, changed.
+Its hints are the same as AnswerChecker's for the same submission.
+
+grade_many grades a class set of submissions against one original. The original is compiled once and shared by worker
+processes, and the results come with class totals such as the most missed words.
+"""
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from paragraph_generator.backend.paragraph_comparison import (SENTENCE_RE, SentenceHint, sentence_hint,
+                                                             sentence_word_hint)
+from paragraph_generator.compiled_checker import CompiledChecker, compile_checker
+from paragraph_generator.word_groups.paragraph import Paragraph
+from paragraph_generator.word_groups.sentence import Sentence
+
+Span = Tuple[int, int]
+
+MIN_SUBMISSIONS_PER_PROCESS = 8
+
+_worker_checker = None  # type: Optional[CompiledChecker]
+
+
+class GradingSession(object):
+    def __init__(self, original: Union[Paragraph, CompiledChecker], submission: str = ''):
+        if not isinstance(original, CompiledChecker):
+            original = compile_checker(original)
+        self._checker = original
+        self._submission = ''
+        self._spans = []  # type: List[Span]
+        self._sentences = []  # type: List[str]
+        self._answer = Paragraph([])
+        self._expected = []  # type: List[Tuple[str, str]]
+        self._word_results = []  # type: List[Optional[Tuple[tuple, SentenceHint]]]
+        self.update(submission)
+
+    @property
+    def checker(self) -> CompiledChecker:
+        return self._checker
+
+    @property
+    def original(self) -> Paragraph:
+        return self._checker.original
+
+    @property
+    def submission(self) -> str:
+        return self._submission
+
+    @property
+    def submission_sentences(self) -> List[str]:
+        return self._sentences[:]
+
+    def update(self, submission: str):
+        """regrades against the whole new submission. Only the part that differs from the last one is split again."""
+        old = self._submission
+        start = _common_prefix_length(old, submission)
+        max_suffix = min(len(old), len(submission)) - start
+        suffix = _common_prefix_length(old[::-1][:max_suffix], submission[::-1][:max_suffix])
+        self.edit(start, len(old) - suffix, submission[start: len(submission) - suffix])
+
+    def edit(self, start: int, end: int, replacement: str):
+        """
+        regrades after submission[start:end] is replaced with replacement. An insert has start == end. A delete has
+        replacement == ''.
+
+        :raises ValueError: if not 0 <= start <= end <= len(submission)
+        """
+        if not 0 <= start <= end <= len(self._submission):
+            raise ValueError('edit [{}:{}] is outside the submission of length {}'.format(
+                start, end, len(self._submission)))
+        new_submission = self._submission[:start] + replacement + self._submission[end:]
+        self._resplit(new_submission, start, end, start + len(replacement))
+        self._submission = new_submission
+        self._answer, self._expected = self._checker.answer_and_expected_sentences(new_submission)
+
+    def _resplit(self, text: str, start: int, old_end: int, new_end: int):
+        """
+        Old matches that end before start are unchanged. Matching starts again from the end of the last of those,
+        and stops as soon as a new match ends where an old match ended, at or after the edit. From there on the
+        text, and so every match, is the same as before, only shifted.
+        """
+        spans = self._spans
+        shift = new_end - old_end
+        first = 0
+        while first < len(spans) and spans[first][1] < start:
+            first += 1
+        scan_from = spans[first - 1][1] if first else 0
+
+        new_spans = []
+        last = len(spans)
+        old_index = first
+        for match in SENTENCE_RE.finditer(text, scan_from):
+            new_spans.append(match.span())
+            if match.end() < new_end:
+                continue
+            old_match_end = match.end() - shift
+            while old_index < len(spans) and spans[old_index][1] < old_match_end:
+                old_index += 1
+            if old_index < len(spans) and spans[old_index][1] == old_match_end:
+                last = old_index + 1
+                break
+
+        shifted = [(low + shift, high + shift) for low, high in spans[last:]]
+        self._spans = spans[:first] + new_spans + shifted
+        self._sentences[first:last] = [text[low:high].strip() for low, high in new_spans]
+
+    def get_sentence_hints(self):
+        """
+
+        :return: {'error_count': int, 'hint_paragraph': str, 'missing_sentences': int}
+        """
+        hints = []
+        error_count = 0
+        for index in range(max(len(self._expected), len(self._sentences))):
+            expected = self._expected[index] if index < len(self._expected) else None
+            submission = self._sentences[index] if index < len(self._sentences) else None
+            hint, errors = sentence_hint(expected, submission)
+            error_count += errors
+            hints.append(hint)
+        return {'error_count': error_count,
+                'hint_paragraph': ' '.join(hints),
+                'missing_sentences': len(self._expected) - len(self._sentences)}
+
+    def get_word_hints(self):
+        """
+
+        :return: {'error_count': int, 'hint_paragraph': str, 'missing_sentences': int}
+        """
+        structured = self.get_structured_word_hints()
+        return {'error_count': structured['error_count'],
+                'hint_paragraph': ' '.join([hint.hint_sentence for hint in structured['hints']]),
+                'missing_sentences': structured['missing_sentences']}
+
+    def get_structured_word_hints(self):
+        """
+
+        :return: {'error_count': int, 'hints': [SentenceHint, ...], 'missing_sentences': int}, as
+            AnswerChecker.get_structured_word_hints
+        """
+        total = max(len(self._expected), len(self._sentences))
+        del self._word_results[total:]
+        self._word_results += [None] * (total - len(self._word_results))
+
+        hints = [self._get_word_result(index) for index in range(total)]
+        return {'error_count': sum(hint.error_count for hint in hints),
+                'hints': hints,
+                'missing_sentences': len(self._expected) - len(self._sentences)}
+
+    def _get_word_result(self, index) -> SentenceHint:
+        expected = self._expected[index] if index < len(self._expected) else None
+        submission = self._sentences[index] if index < len(self._sentences) else ''
+        key = (expected, submission)
+        cached = self._word_results[index]
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        sentence = self._answer.get_sentence(index) if expected is not None else Sentence()
+        result = sentence_word_hint(sentence, submission, self._checker.matchers)
+        self._word_results[index] = (key, result)
+        return result
+
+    def is_submission_correct(self) -> bool:
+        return self.count_sentence_errors() == 0
+
+    def count_sentence_errors(self) -> int:
+        return self.get_sentence_hints()['error_count']
+
+    def count_word_errors(self) -> int:
+        return self.get_word_hints()['error_count']
+
+
+def _common_prefix_length(first: str, second: str) -> int:
+    low, high = 0, min(len(first), len(second))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if first[:middle] == second[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def grade(checker: CompiledChecker, submission: str) -> dict:
+    """
+
+    :return: {'sentence_hints': dict, 'word_hints': dict, 'missed_words': [[sentence index, word index], ...]}. The
+        hints are the same as AnswerChecker's. missed_words are the answer words that were wrong, missing or out of
+        order.
+    """
+    comparison = checker.comparison(submission)
+    word_hints, missed = comparison.compare_by_words_with_missed()
+    return {'sentence_hints': comparison.compare_by_sentences(),
+            'word_hints': word_hints,
+            'missed_words': [list(location) for location in missed]}
+
+
+def grade_many(original: Union[Paragraph, CompiledChecker], submissions: Sequence[str], processes: int = None,
+               most_missed: int = 10) -> dict:
+    """
+    Grades every submission against original. original is compiled once. With more than one process, each worker
+    process gets the compiled checker once, when it starts.
+
+    :param processes: the number of worker processes. Defaults to os.cpu_count(). Fewer are used for small classes,
+        and with 1 everything runs in this process.
+    :param most_missed: how many of the most missed words to return
+    :return: {'results': [grade(checker, submission), ...] in the order of submissions,
+              'correct_count': int, 'mean_sentence_errors': float, 'mean_word_errors': float,
+              'most_missed_words': [{'sentence_index': int, 'word_index': int, 'word': str, 'count': int}, ...]}
+    """
+    checker = original if isinstance(original, CompiledChecker) else compile_checker(original)
+    submissions = list(submissions)
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = max(1, min(processes, len(submissions) // MIN_SUBMISSIONS_PER_PROCESS))
+
+    if processes == 1:
+        results = [grade(checker, submission) for submission in submissions]
+    else:
+        chunksize = max(1, len(submissions) // (processes * 4))
+        with ProcessPoolExecutor(processes, initializer=_start_worker, initargs=(checker.to_dict(),)) as executor:
+            results = list(executor.map(_grade_in_worker, submissions, chunksize=chunksize))
+    return _add_class_totals(checker.original, results, most_missed)
+
+
+def _start_worker(checker_dict: dict):
+    global _worker_checker
+    _worker_checker = CompiledChecker.from_dict(checker_dict)
+
+
+def _grade_in_worker(submission: str) -> dict:
+    return grade(_worker_checker, submission)
+
+
+def _add_class_totals(original: Paragraph, results: List[dict], most_missed: int) -> dict:
+    count = max(len(results), 1)
+    misses = Counter()  # type: Dict[Tuple[int, int], int]
+    for result in results:
+        misses.update(tuple(location) for location in result['missed_words'])
+    ordered = sorted(misses.items(), key=lambda item: (-item[1], item[0]))[:most_missed]
+    most_missed_words = [{'sentence_index': s_index, 'word_index': w_index,
+                          'word': str(original.get_sentence(s_index).get(w_index).value), 'count': misses_count}
+                         for (s_index, w_index), misses_count in ordered]
+    return {
+        'results': results,
+        'correct_count': sum(1 for result in results if result['sentence_hints']['error_count'] == 0),
+        'mean_sentence_errors': sum(result['sentence_hints']['error_count'] for result in results) / count,
+        'mean_word_errors': sum(result['word_hints']['error_count'] for result in results) / count,
+        'most_missed_words': most_missed_words,
+    }
@@ -0,0 +1,198 @@
+"""
+Optional timings and counters for paragraph generation and answer checking.
+
+Pass an Instrumentation to ParagraphsGenerator or AnswerChecker. It records:
+  - stages: calls, wall time and the net change in allocated memory blocks (sys.getallocatedblocks) per stage
+  - retries: how often the retry loops in RandomSentences and RandomParagraph.get_subject_pool had to try again
+  - caches: hits and misses of the error variant, plural detector and compiled answer caches
+
+snapshot() returns everything recorded so far and flush() hands it to each sink. LoggingSink logs it and
+PrometheusTextSink writes it to a file in the Prometheus text format, for a node exporter's textfile collector.
+
+Without an Instrumentation, each stage costs one check for None, and each retry or cache lookup one ContextVar lookup.
+"""
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Dict, Iterable, Optional
+
+_CURRENT = ContextVar('paragraph_generator_instrumentation', default=None)
+
+_NOT_INSTRUMENTED = nullcontext()
+
+current = _CURRENT.get
+"""the Instrumentation active in this thread or task, or None"""
+
+
+def activate(instrumentation: Optional['Instrumentation']):
+    """instrumentation.activate(), or a context manager that does nothing if instrumentation is None"""
+    if instrumentation is None:
+        return _NOT_INSTRUMENTED
+    return instrumentation.activate()
+
+
+def stage(instrumentation: Optional['Instrumentation'], name: str):
+    """instrumentation.stage(name), or a context manager that does nothing if instrumentation is None"""
+    if instrumentation is None:
+        return _NOT_INSTRUMENTED
+    return instrumentation.stage(name)
+
+
+def record_retry(loop: str):
+    instrumentation = current()
+    if instrumentation is not None:
+        instrumentation.retry(loop)
+
+
+def record_cache(cache: str, hit: bool):
+    instrumentation = current()
+    if instrumentation is not None:
+        instrumentation.cache(cache, hit)
+
+
+class Instrumentation(object):
+    def __init__(self, sinks: Iterable = (), track_allocations: bool = True):
+        """
+
+        :param sinks: objects with an emit(snapshot: dict) method
+        :param track_allocations: also record the change in allocated memory blocks for each stage
+        """
+        self._sinks = list(sinks)
+        self._track_allocations = track_allocations
+        self._lock = threading.Lock()
+        self._stage_calls = Counter()  # type: Dict[str, int]
+        self._stage_seconds = Counter()  # type: Dict[str, float]
+        self._stage_blocks = Counter()  # type: Dict[str, int]
+        self._retries = Counter()  # type: Dict[str, int]
+        self._hits = Counter()  # type: Dict[str, int]
+        self._misses = Counter()  # type: Dict[str, int]
+
+    @contextmanager
+    def activate(self):
+        """makes this the Instrumentation that record_retry and record_cache report to, in this thread or task"""
+        token = _CURRENT.set(self)
+        try:
+            yield self
+        finally:
+            _CURRENT.reset(token)
+
+    @contextmanager
+    def stage(self, name: str):
+        blocks = sys.getallocatedblocks() if self._track_allocations else 0
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            blocks = sys.getallocatedblocks() - blocks if self._track_allocations else 0
+            with self._lock:
+                self._stage_calls[name] += 1
+                self._stage_seconds[name] += seconds
+                self._stage_blocks[name] += blocks
+
+    def retry(self, loop: str):
+        with self._lock:
+            self._retries[loop] += 1
+
+    def cache(self, cache: str, hit: bool):
+        with self._lock:
+            if hit:
+                self._hits[cache] += 1
+            else:
+                self._misses[cache] += 1
+
+    def snapshot(self) -> dict:
+        """
+
+        :return: {'stages': {name: {'calls': int, 'seconds': float, 'allocated_blocks': int}},
+                  'retries': {loop: int},
+                  'caches': {cache: {'hits': int, 'misses': int, 'hit_rate': float}}}
+        """
+        with self._lock:
+            stages = {name: {'calls': calls, 'seconds': self._stage_seconds[name],
+                             'allocated_blocks': self._stage_blocks[name]}
+                      for name, calls in self._stage_calls.items()}
+            caches = {}
+            for cache in set(self._hits) | set(self._misses):
+                hits, misses = self._hits[cache], self._misses[cache]
+                caches[cache] = {'hits': hits, 'misses': misses, 'hit_rate': hits / (hits + misses)}
+            return {'stages': stages, 'retries': dict(self._retries), 'caches': caches}
+
+    def reset(self):
+        with self._lock:
+            for counter in (self._stage_calls, self._stage_seconds, self._stage_blocks, self._retries, self._hits,
+                            self._misses):
+                counter.clear()
+
+    def flush(self):
+        snapshot = self.snapshot()
+        for sink in self._sinks:
+            sink.emit(snapshot)
+
+
+class LoggingSink(object):
+    def __init__(self, logger: logging.Logger = None, level=logging.INFO):
+        self._logger = logging.getLogger('paragraph_generator') if logger is None else logger
+        self._level = level
+
+    def emit(self, snapshot: dict):
+        for name, stage in sorted(snapshot['stages'].items()):
+            self._logger.log(self._level, 'stage %s: %d calls, %.6f s, %d allocated blocks',
+                             name, stage['calls'], stage['seconds'], stage['allocated_blocks'])
+        for loop, count in sorted(snapshot['retries'].items()):
+            self._logger.log(self._level, 'retries %s: %d', loop, count)
+        for name, cache in sorted(snapshot['caches'].items()):
+            self._logger.log(self._level, 'cache %s: %d hits, %d misses, %.3f hit rate',
+                             name, cache['hits'], cache['misses'], cache['hit_rate'])
+
+
+class PrometheusTextSink(object):
+    def __init__(self, path: str, prefix: str = 'paragraph_generator'):
+        """Each emit replaces the file at path, so a reader never sees half of it."""
+        self._path = path
+        self._prefix = prefix
+
+    def emit(self, snapshot: dict):
+        directory = os.path.dirname(os.path.abspath(self._path))
+        file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'w') as f:
+                f.write(to_prometheus_text(snapshot, self._prefix))
+            os.replace(temp_path, self._path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+def to_prometheus_text(snapshot: dict, prefix: str = 'paragraph_generator') -> str:
+    lines = []
+
+    def add(name, metric_type, label, values: Dict[str, Optional[float]]):
+        lines.append('# TYPE {}_{} {}'.format(prefix, name, metric_type))
+        for key, value in sorted(values.items()):
+            lines.append('{}_{}{{{}="{}"}} {}'.format(prefix, name, label, _escape(key), _number(value)))
+
+    stages, retries, caches = snapshot['stages'], snapshot['retries'], snapshot['caches']
+    add('stage_calls_total', 'counter', 'stage', {name: stage['calls'] for name, stage in stages.items()})
+    add('stage_seconds_total', 'counter', 'stage', {name: stage['seconds'] for name, stage in stages.items()})
+    add('stage_allocated_blocks_total', 'counter', 'stage',
+        {name: stage['allocated_blocks'] for name, stage in stages.items()})
+    add('retries_total', 'counter', 'loop', retries)
+    add('cache_hits_total', 'counter', 'cache', {name: cache['hits'] for name, cache in caches.items()})
+    add('cache_misses_total', 'counter', 'cache', {name: cache['misses'] for name, cache in caches.items()})
+    add('cache_hit_ratio', 'gauge', 'cache', {name: cache['hit_rate'] for name, cache in caches.items()})
+    return '\n'.join(lines) + '\n'
+
+
+def _escape(label_value: str) -> str:
+    return label_value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
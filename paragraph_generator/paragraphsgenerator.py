@@ -1,18 +1,28 @@
-from typing import List, Tuple
+import random
+from typing import List, Tuple, Union
 
-from paragraph_generator.backend.error_maker import ErrorMaker
+from paragraph_generator.backend.dedup import BloomFilter, FingerprintSet, paragraph_fingerprint
+from paragraph_generator.backend.error_maker import ErrorMaker, add_cached_error_choices, get_cached_error_choices
 from paragraph_generator.backend.grammarizer import Grammarizer
 from paragraph_generator.backend.random_assignments.assign_random_negatives import assign_random_negatives
-from paragraph_generator.backend.random_assignments.plurals_assignement import PluralsAssignment
+from paragraph_generator.backend.random_assignments.plurals_assignement import PluralsAssignment, is_countable_noun
 from paragraph_generator.backend.random_assignments.random_paragraph import RandomParagraph
+from paragraph_generator.backend.random_assignments.sentence_templates import SentenceTemplates
+from paragraph_generator.instrumentation import Instrumentation, activate, record_retry, stage
+from paragraph_generator.snapshot import read_snapshot, write_snapshot
+from paragraph_generator.tags.status_tag import StatusTag
 from paragraph_generator.word_groups.paragraph import Paragraph
 from paragraph_generator.word_groups.verb_group import VerbGroup
 from paragraph_generator.word_lists import AbstractWordLists
 from paragraph_generator.words.noun import Noun
 
+DedupIndex = Union[FingerprintSet, BloomFilter]
+
+SNAPSHOT_KIND = 'ParagraphsGenerator'
+
 
 class ParagraphsGenerator(object):
-    def __init__(self, config_state, word_lists_generator: AbstractWordLists):
+    def __init__(self, config_state, word_lists_generator: AbstractWordLists, instrumentation: Instrumentation = None):
         """
 
         config_state optional keys:
@@ -24,6 +34,9 @@ class ParagraphsGenerator(object):
         - 'is_do_errors': bool
         - 'preposition_transpose_errors': bool
         - 'punctuation_errors': bool
+        - 'single_pass_errors': bool - apply all the errors in one pass (ErrorMaker.composite_errors)
+        - 'error_count': None|int|[low, high] - make exactly this many errors (ErrorMaker.exact_errors) instead of
+                         using 'error_probability'
         -
         - 'tense': str - 'simple_past'|'simple_present'
         - 'probability_plural_noun': 0.0 <= float <= 1.0
@@ -33,6 +46,17 @@ class ParagraphsGenerator(object):
         - 'paragraph_type': str - 'chain'|'pool'
         - 'subject_pool': 0 < int
         - 'paragraph_size': 0 < int
+        -
+        - 'minimum_negative_verbs': 0 <= int - at least this many negative verbs
+        - 'minimum_distinct_verbs': 0 <= int - at least this many different verbs
+        - 'require_irregular_plural': bool - at least one plural noun with an irregular plural
+        -
+        - These constraints are built into the random choices, so every paragraph meets them. A constraint that cannot
+          be met raises ValueError. minimum_negative_verbs gives the same paragraphs as retrying until it is met
+          would. minimum_distinct_verbs and require_irregular_plural do not: they fix some verbs or the subject first,
+          which changes the distribution of everything else.
+
+        :param instrumentation: records stage times, retries and cache hits while generating
         """
         self._config = {
             'error_probability': 0.2,
@@ -42,6 +66,8 @@ class ParagraphsGenerator(object):
             'punctuation_errors': True,
             'is_do_errors': False,
             'preposition_transpose_errors': False,
+            'single_pass_errors': False,
+            'error_count': None,
 
             'tense': 'simple_present',
             'probability_plural_noun': 0.2,
@@ -51,10 +77,16 @@ class ParagraphsGenerator(object):
             'paragraph_type': 'chain',
             'subject_pool': 5,
             'paragraph_size': 15,
+
+            'minimum_negative_verbs': 0,
+            'minimum_distinct_verbs': 0,
+            'require_irregular_plural': False,
         }
 
         self._config.update(config_state)
         self._word_list_generator = word_lists_generator
+        self._sentence_templates = None
+        self._instrumentation = instrumentation
 
     def get(self, key):
         return self._config[key]
@@ -65,44 +97,186 @@ class ParagraphsGenerator(object):
     def get_verbs(self) -> List[VerbGroup]:
         return self._word_list_generator.verbs
 
-    def generate_paragraphs(self) -> Tuple[Paragraph, Paragraph]:
+    def get_sentence_templates(self) -> SentenceTemplates:
+        if self._sentence_templates is None:
+            self._sentence_templates = SentenceTemplates(self.get_verbs())
+        return self._sentence_templates
+
+    def prepare(self, warm_up: int = 0):
+        """
+        builds the verbs, nouns and sentence templates now instead of on first use. save_snapshot can then save
+        them. A snapshot only pays off when the word lists are expensive to build. For the bundled csv files, loading
+        one is no faster than building again.
+
+        :param warm_up: generate this many paragraphs, with a seeded rng, to fill the error choice caches
+        """
+        self.get_verbs()
+        self.get_nouns()
+        self.get_sentence_templates()
+        rng = random.Random(0)
+        for _ in range(warm_up):
+            self.generate_paragraphs(rng)
+
+    def save_snapshot(self, path: str):
+        """
+        writes the config, word lists, sentence templates and cached error choices to one file. Call prepare first
+        so that they are built. The word lists object is pickled, so it must be picklable. This only pays off when
+        the word lists are expensive to build (see prepare).
+        """
+        payload = {
+            'config': self._config,
+            'word_lists': self._word_list_generator,
+            'sentence_templates': self.get_sentence_templates(),
+            'error_choices': get_cached_error_choices(),
+        }
+        write_snapshot(path, SNAPSHOT_KIND, payload)
+
+    @classmethod
+    def load_snapshot(cls, path: str, instrumentation: Instrumentation = None,
+                      restore_error_caches: bool = False) -> 'ParagraphsGenerator':
+        """
+        a ParagraphsGenerator from save_snapshot, with nothing left to build.
+
+        :param restore_error_caches: add the snapshot's cached error choices to this process's caches. They are shared
+            by every ParagraphsGenerator in the process.
+        :raises ValueError: if path is not a ParagraphsGenerator snapshot, or it is stale (see snapshot.py)
+        """
+        payload = read_snapshot(path, SNAPSHOT_KIND)
+        if restore_error_caches:
+            add_cached_error_choices(payload['error_choices'])
+        answer = cls(payload['config'], payload['word_lists'], instrumentation)
+        answer._sentence_templates = payload['sentence_templates']
+        return answer
+
+    def generate_paragraphs(self, rng: random.Random = None) -> Tuple[Paragraph, Paragraph]:
         """
+        Safe to call from many threads on one ParagraphsGenerator. Each thread may pass its own rng
+        to get reproducible results without contending on the shared module level random state.
 
+        :param rng: source of randomness. Defaults to the module level functions of `random`.
         :return: answer, error
         """
+        with self._activate():
+            return self._finish_paragraphs(self._create_raw_paragraph(rng), rng)
+
+    def generate_batch(self, count: int, dedup_index: DedupIndex = None, rng: random.Random = None,
+                       max_attempts: int = None) -> List[Tuple[Paragraph, Paragraph]]:
+        """
+        Generates count (answer, error) pairs. If there is a dedup_index, a raw paragraph whose
+        paragraph_fingerprint is already in it is thrown away before plurals, negatives, grammar and errors are
+        assigned. Every paragraph that is kept is added to dedup_index.
+
+        :param dedup_index: a FingerprintSet or BloomFilter from paragraph_generator.backend.dedup. It may be shared
+            between calls and threads.
+        :param max_attempts: give up after this many raw paragraphs. Defaults to 100 * count.
+        :raises ValueError: if count unique paragraphs were not found in max_attempts
+        """
+        if max_attempts is None:
+            max_attempts = 100 * count
+        answer = []
+        with self._activate():
+            for _ in range(max_attempts):
+                if len(answer) == count:
+                    break
+                raw = self._create_raw_paragraph(rng)
+                if dedup_index is not None:
+                    with self._stage('dedup'):
+                        is_new = dedup_index.add(paragraph_fingerprint(raw))
+                    if not is_new:
+                        record_retry('dedup')
+                        continue
+                answer.append(self._finish_paragraphs(raw, rng))
+        if len(answer) < count:
+            raise ValueError('found {} of {} unique paragraphs in {} attempts'.format(len(answer), count, max_attempts))
+        return answer
+
+    def _activate(self):
+        return activate(self._instrumentation)
+
+    def _stage(self, name):
+        return stage(self._instrumentation, name)
+
+    def _create_raw_paragraph(self, rng=None) -> Paragraph:
+        with self._stage('sampling'):
+            return self._sample_raw_paragraph(rng)
+
+    def _sample_raw_paragraph(self, rng=None) -> Paragraph:
         paragraph_size = self.get('paragraph_size')
         probability_pronoun = self.get('probability_pronoun')
-        generator = RandomParagraph(probability_pronoun, self.get_verbs(), self.get_nouns())
+        generator = RandomParagraph(probability_pronoun, self.get_verbs(), self.get_nouns(), rng,
+                                    self.get_sentence_templates())
+        min_distinct_verbs = self.get('minimum_distinct_verbs')
+        required_subject = None
+        if self.get('require_irregular_plural'):
+            required_subject = self._choose_irregular_noun(rng)
+
         if self.get('paragraph_type') == 'chain':
-            raw = generator.create_chain_paragraph(paragraph_size)
-        else:
-            raw = generator.create_pool_paragraph(self.get('pool_size'), paragraph_size)
+            return generator.create_chain_paragraph(paragraph_size, min_distinct_verbs, required_subject)
+        return generator.create_pool_paragraph(self.get('pool_size'), paragraph_size, min_distinct_verbs,
+                                               required_subject)
 
+    def _finish_paragraphs(self, raw: Paragraph, rng=None) -> Tuple[Paragraph, Paragraph]:
+        """
+
+        :return: answer, error
+        """
+        minimum_irregular = 1 if self.get('require_irregular_plural') else 0
         probability_plural_noun = self.get('probability_plural_noun')
-        with_plurals = PluralsAssignment(raw).assign_random_plurals(probability_plural_noun)
+        with self._stage('plurals'):
+            with_plurals = PluralsAssignment(raw, rng).assign_random_plurals(probability_plural_noun,
+                                                                             minimum_irregular)
 
         probability_negative_verb = self.get('probability_negative_verb')
-        with_negatives = assign_random_negatives(with_plurals, probability_negative_verb)
+        with self._stage('negatives'):
+            with_negatives = assign_random_negatives(with_plurals, probability_negative_verb, rng,
+                                                     self.get('minimum_negative_verbs'))
 
-        grammarizer = Grammarizer(with_negatives)
-        if self.get('tense') == 'simple_present':
-            answer = grammarizer.grammarize_to_present_tense()
-        else:
-            answer = grammarizer.grammarize_to_past_tense()
+        with self._stage('grammarize'):
+            grammarizer = Grammarizer(with_negatives)
+            if self.get('tense') == 'simple_present':
+                answer = grammarizer.grammarize_to_present_tense()
+            else:
+                answer = grammarizer.grammarize_to_past_tense()
 
-        error_maker = self._create_errors(answer)
+        with self._stage('errors'):
+            error_maker = self._create_errors(answer, rng)
 
         return answer, error_maker.get_paragraph()
 
-    def _create_errors(self, answer):
+    def _choose_irregular_noun(self, rng=None) -> Noun:
+        irregular = [noun for noun in self.get_nouns() if is_countable_noun(noun) and noun.irregular_plural]
+        if not irregular:
+            raise ValueError('require_irregular_plural: there are no countable nouns with irregular plurals')
+        return (random if rng is None else rng).choice(irregular)
+
+    def _create_errors(self, answer, rng=None):
+        if self.get('error_count') is not None or self.get('single_pass_errors'):
+            return self._create_errors_in_one_pass(answer, rng)
+
         preposition_errors_config_to_method_name = {'preposition_transpose_errors': 'preposition_errors'}
         error_types = ['noun_errors', 'pronoun_errors', 'verb_errors', 'is_do_errors', 'punctuation_errors']
         config_name_to_method_name = {key: key for key in error_types}
         config_name_to_method_name.update(preposition_errors_config_to_method_name)
         methods = [value for key, value in config_name_to_method_name.items() if self.get(key)]
 
-        error_maker = ErrorMaker(answer)
+        error_maker = ErrorMaker(answer, rng)
         p_error = self.get('error_probability')
         for method in methods:
             error_maker = getattr(error_maker, method)(p_error)
         return error_maker
+
+    def _create_errors_in_one_pass(self, answer, rng=None):
+        config_name_to_error_tag = {
+            'noun_errors': StatusTag.NOUN_ERRORS,
+            'pronoun_errors': StatusTag.PRONOUN_ERRORS,
+            'verb_errors': StatusTag.VERB_ERRORS,
+            'is_do_errors': StatusTag.IS_DO_ERRORS,
+            'punctuation_errors': StatusTag.PUNCTUATION_ERRORS,
+            'preposition_transpose_errors': StatusTag.PREPOSITION_ERRORS,
+        }
+        error_types = [tag for key, tag in config_name_to_error_tag.items() if self.get(key)]
+        error_maker = ErrorMaker(answer, rng)
+        if self.get('error_count') is not None:
+            return error_maker.exact_errors(error_types, self.get('error_count'))
+        p_error = self.get('error_probability')
+        return error_maker.composite_errors({tag: p_error for tag in error_types})
@@ -0,0 +1,224 @@
+"""
+Profiles a batch of generations or gradings and sums the time by pipeline stage.
+
+    with profile() as result:
+        for _ in range(100):
+            generator.generate_paragraphs()
+    result.stage_seconds()  # {'error_maker': 0.05, 'grammarizer': 0.06, 'random_assignment': 0.09, ...}
+    with open('generate.folded', 'w') as f:
+        result.write_collapsed(f)  # for flamegraph.pl or speedscope
+
+profile() runs cProfile. profile(sampling=True) instead looks at the stack of the profiled thread every interval
+seconds, which slows the code much less, but needs enough samples to be accurate.
+
+Time is given to the stage of the innermost frame, on its call stack, that is in one of the STAGE_FILES. Word and
+word group methods count for the stage that called them, and the rest for 'other'. cProfile only records who called
+each function, not whole stacks, so its stacks are rebuilt from the call graph by splitting the time of each function
+between its callers. They can have frames in the wrong order when a function is called from more than one place.
+"""
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, TextIO, Tuple
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+STAGE_FILES = {
+    'backend/random_assignments/': 'random_assignment',
+    'backend/grammarizer.py': 'grammarizer',
+    'backend/batch_grammarizer.py': 'grammarizer',
+    'backend/error_maker.py': 'error_maker',
+    'backend/create_answer_paragraph.py': 'comparison',
+    'backend/paragraph_comparison.py': 'comparison',
+    'backend/plural_detector.py': 'comparison',
+    'compiled_checker.py': 'comparison',
+    'grading.py': 'comparison',
+}
+"""{path in paragraph_generator, or the directory it is in: stage}"""
+
+OTHER_STAGE = 'other'
+MIN_STACK_FRACTION = 1e-5
+"""cProfile stacks with less than this fraction of the total time are left out"""
+
+FrameKey = Tuple[str, int, str]
+"""(file name, line number, function name), as in pstats. Sampled frames have qualified names on Python 3.11+."""
+Stack = Tuple[FrameKey, ...]
+
+
+def get_stage(filename: str) -> Optional[str]:
+    """the stage of code in filename, or None if it is not in any of the STAGE_FILES"""
+    if not filename.startswith(PACKAGE_DIR):
+        return None
+    relative = os.path.relpath(filename, PACKAGE_DIR).replace(os.sep, '/')
+    for path, stage in STAGE_FILES.items():
+        if relative == path or (path.endswith('/') and relative.startswith(path)):
+            return stage
+    return None
+
+
+def profile(sampling: bool = False, interval: float = 0.001) -> 'Profile':
+    """
+    a context manager that profiles the code run in it, in this thread
+
+    :param sampling: sample the stack instead of running cProfile
+    :param interval: seconds between samples
+    """
+    return Profile(sampling, interval)
+
+
+class Profile(object):
+    def __init__(self, sampling: bool = False, interval: float = 0.001):
+        self._sampling = sampling
+        self._interval = interval
+        self._profiler = None  # type: Optional[cProfile.Profile]
+        self._sampler = None  # type: Optional[_Sampler]
+        self._stats = None  # type: Optional[pstats.Stats]
+        self._stacks = Counter()  # type: Dict[Stack, float]
+
+    def __enter__(self):
+        if self._sampling:
+            self._sampler = _Sampler(sys._getframe(1), self._interval)
+            self._sampler.start()
+        else:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._sampling:
+            self._stacks = self._sampler.stop()
+        else:
+            self._profiler.disable()
+            self._stats = pstats.Stats(self._profiler)
+            self._stacks = _stacks_from_stats(self._stats.stats)
+        return False
+
+    @property
+    def stats(self) -> Optional[pstats.Stats]:
+        """the cProfile results, or None when sampling"""
+        return self._stats
+
+    @property
+    def stacks(self) -> Dict[Stack, float]:
+        """{call stack, outermost frame first: seconds in its innermost frame}"""
+        return dict(self._stacks)
+
+    def stage_seconds(self) -> Dict[str, float]:
+        stages = Counter()  # type: Dict[str, float]
+        for stack, seconds in self._stacks.items():
+            stages[_stack_stage(stack)] += seconds
+        return dict(stages)
+
+    def collapsed_stacks(self) -> List[str]:
+        """one 'frame;frame;frame microseconds' line per stack, as read by flamegraph.pl and speedscope"""
+        lines = []
+        for stack, seconds in sorted(self._stacks.items()):
+            microseconds = round(seconds * 1e6)
+            if microseconds:
+                lines.append('{} {}'.format(';'.join(_label(frame) for frame in stack), microseconds))
+        return lines
+
+    def write_collapsed(self, file: TextIO):
+        for line in self.collapsed_stacks():
+            file.write(line + '\n')
+
+    def dump_stats(self, path: str):
+        """
+        writes the cProfile results for pstats, snakeviz and the like
+
+        :raises ValueError: when sampling
+        """
+        if self._stats is None:
+            raise ValueError('only a cProfile profile has stats to dump. this one was sampled.')
+        self._stats.dump_stats(path)
+
+
+class _Sampler(threading.Thread):
+    def __init__(self, root, interval: float):
+        """
+
+        :param root: the frame that the profiled code runs in. Frames outside it are left off the stacks.
+        """
+        super(_Sampler, self).__init__(daemon=True)
+        self._thread_id = threading.get_ident()
+        self._root_depth = len(_frame_stack(root)) - 1
+        self._interval = interval
+        self._done = threading.Event()
+        self._samples = Counter()  # type: Dict[Stack, int]
+        self._start = time.perf_counter()
+
+    def run(self):
+        while not self._done.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is not None:
+                self._samples[_frame_stack(frame)[self._root_depth:]] += 1
+
+    def stop(self) -> Dict[Stack, float]:
+        """:return: {stack: seconds}, where each sample is worth an equal share of the time spent"""
+        self._done.set()
+        self.join()
+        total = sum(self._samples.values())
+        seconds_per_sample = (time.perf_counter() - self._start) / total if total else 0.0
+        return Counter({stack: count * seconds_per_sample for stack, count in self._samples.items()})
+
+
+def _frame_stack(frame) -> Stack:
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append((code.co_filename, code.co_firstlineno, getattr(code, 'co_qualname', code.co_name)))
+        frame = frame.f_back
+    return tuple(reversed(stack))
+
+
+def _stacks_from_stats(stats: dict) -> Dict[Stack, float]:
+    """
+    Walks the call graph down from the functions that have no callers. Each function's self and total time are split
+    between its callers, in proportion to the time it spent when each of them called it.
+    """
+    callees = defaultdict(list)
+    for function, (_, _, _, _, callers) in stats.items():
+        for caller, (_, _, _, edge_total) in callers.items():
+            callees[caller].append((function, edge_total))
+    roots = [function for function, value in stats.items() if not value[4]]
+    min_seconds = sum(stats[root][3] for root in roots) * MIN_STACK_FRACTION
+
+    stacks = Counter()  # type: Dict[Stack, float]
+    to_visit = [((root,), stats[root][3]) for root in roots]
+    while to_visit:
+        stack, seconds = to_visit.pop()
+        function = stack[-1]
+        _, _, self_seconds, total_seconds, _ = stats[function]
+        share = seconds / total_seconds if total_seconds else 0.0
+        stacks[stack] += self_seconds * share
+        for callee, edge_total in callees[function]:
+            callee_seconds = edge_total * share
+            if callee not in stack and callee_seconds >= min_seconds:
+                to_visit.append((stack + (callee,), callee_seconds))
+    return stacks
+
+
+def _stack_stage(stack: Stack) -> str:
+    for filename, _, _ in reversed(stack):
+        stage = get_stage(filename)
+        if stage is not None:
+            return stage
+    return OTHER_STAGE
+
+
+def _label(frame: FrameKey) -> str:
+    filename, _, name = frame
+    if filename == '~' or filename.startswith('<'):
+        label = name
+    else:
+        if filename.startswith(PACKAGE_DIR):
+            relative = os.path.relpath(filename, os.path.dirname(PACKAGE_DIR))
+            module = os.path.splitext(relative)[0].replace(os.sep, '.')
+        else:
+            module = os.path.splitext(os.path.basename(filename))[0]
+        label = '{}:{}'.format(module, name)
+    return label.replace(';', ',')
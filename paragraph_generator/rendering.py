@@ -0,0 +1,142 @@
+"""
+Renderers write paragraphs, sentences and answer hints straight to a text stream, as plain text, HTML, ANSI or
+markdown.
+
+    HTML.write_paragraph(response, paragraph)
+    checker.write_word_hints(response, HTML)  # {'error_count': 2, 'missing_sentences': 0}
+    checker.get_sentence_hints(MARKDOWN)['hint_paragraph']  # 'He **go** home.'
+
+A word whose value was made by bold() is an error. It is written between the renderer's error_start and error_end,
+and everything else is escaped for the output format. MARKUP writes the same <bold></bold> strings as str(). To make
+a new format, subclass Renderer, or pass the marks and escape function to it.
+"""
+import html
+import io
+from typing import Callable, Dict, Iterable, TextIO
+
+from paragraph_generator.words.punctuation import Punctuation
+from paragraph_generator.words.wordtools.abstractword import AbstractWord
+from paragraph_generator.words.wordtools.common_functions import BOLD_END, BOLD_START, is_bold
+
+MARKDOWN_SPECIAL = '\\`*_[]<>'
+MAX_RENDERED_VALUES = 10000
+"""each renderer keeps this many rendered word values, then starts again"""
+
+
+class Renderer(object):
+    def __init__(self, error_start: str = '', error_end: str = '', escape: Callable[[str], str] = None):
+        self._error_start = error_start
+        self._error_end = error_end
+        if escape is not None:
+            self.escape = escape
+        self._rendered = {}  # type: Dict[str, str]
+
+    @property
+    def error_start(self) -> str:
+        return self._error_start
+
+    @property
+    def error_end(self) -> str:
+        return self._error_end
+
+    def escape(self, text: str) -> str:
+        return text
+
+    def render_value(self, value: str) -> str:
+        """a word's value or a sentence hint, escaped, and between error_start and error_end if it is bold"""
+        if is_bold(value):
+            return self._error_start + self.escape(value[len(BOLD_START): -len(BOLD_END)]) + self._error_end
+        return self.escape(value)
+
+    def _render_word_value(self, value: str) -> str:
+        """render_value(value), kept for the next time, as the same words come up again and again"""
+        text = self.render_value(value)
+        if len(self._rendered) >= MAX_RENDERED_VALUES:
+            self._rendered.clear()
+        self._rendered[value] = text
+        return text
+
+    def write_value(self, stream: TextIO, value: str):
+        stream.write(self.render_value(value))
+
+    def write_sentence(self, stream: TextIO, sentence: Iterable[AbstractWord]):
+        """spaced like str(sentence)"""
+        rendered = self._rendered
+        parts = []
+        for word in sentence:
+            value = word.value
+            text = rendered.get(value)
+            if text is None:
+                text = self._render_word_value(value)
+            if not parts or isinstance(word, Punctuation):
+                if value:
+                    parts.append(text)
+            else:
+                parts.append(' ')
+                parts.append(text)
+        stream.write(''.join(parts))
+
+    def write_paragraph(self, stream: TextIO, paragraph: Iterable[Iterable[AbstractWord]]):
+        """
+        :param paragraph: a Paragraph, or any sentences
+        """
+        for index, sentence in enumerate(paragraph):
+            if index:
+                stream.write(' ')
+            self.write_sentence(stream, sentence)
+
+    def write_hints(self, stream: TextIO, hints: Iterable[str]):
+        """writes the sentence hints of ParagraphComparison.compare_by_sentences, joined by spaces"""
+        for index, hint in enumerate(hints):
+            if index:
+                stream.write(' ')
+            self.write_value(stream, hint)
+
+    def render_sentence(self, sentence: Iterable[AbstractWord]) -> str:
+        stream = io.StringIO()
+        self.write_sentence(stream, sentence)
+        return stream.getvalue()
+
+    def render_paragraph(self, paragraph: Iterable[Iterable[AbstractWord]]) -> str:
+        stream = io.StringIO()
+        self.write_paragraph(stream, paragraph)
+        return stream.getvalue()
+
+    def render_hints(self, hints: Iterable[str]) -> str:
+        stream = io.StringIO()
+        self.write_hints(stream, hints)
+        return stream.getvalue()
+
+
+def escape_html(text: str) -> str:
+    return html.escape(text, quote=False)
+
+
+def escape_ansi(text: str) -> str:
+    """removes ESC, so that submitted text cannot add its own escape codes"""
+    return text.replace('\x1b', '')
+
+
+def escape_markdown(text: str) -> str:
+    if not any(character in text for character in MARKDOWN_SPECIAL):
+        return text
+    return ''.join('\\' + character if character in MARKDOWN_SPECIAL else character for character in text)
+
+
+PLAIN = Renderer()
+MARKUP = Renderer(BOLD_START, BOLD_END)
+HTML = Renderer('<strong>', '</strong>', escape_html)
+ANSI = Renderer('\x1b[1;31m', '\x1b[0m', escape_ansi)
+MARKDOWN = Renderer('**', '**', escape_markdown)
+
+RENDERERS = {'plain': PLAIN, 'markup': MARKUP, 'html': HTML, 'ansi': ANSI, 'markdown': MARKDOWN}
+
+
+def get_renderer(name: str) -> Renderer:
+    """
+    :raises ValueError: if name is not in RENDERERS
+    """
+    try:
+        return RENDERERS[name]
+    except KeyError:
+        raise ValueError('no renderer named {!r}. choose from: {}'.format(name, ', '.join(sorted(RENDERERS))))
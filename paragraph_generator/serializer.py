@@ -11,9 +11,12 @@ from paragraph_generator.words.noun import Noun
 from paragraph_generator.words.pronoun import AbstractPronoun, Pronoun, CapitalPronoun
 from paragraph_generator.words.punctuation import Punctuation
 from paragraph_generator.words.verb import Verb
+from paragraph_generator.words.wordtools.abstractword import AbstractWord
 
 
 class Serializer(object):
+    _word_classes = ('BasicWord', 'Noun', 'Verb', 'Pronoun', 'CapitalPronoun', 'Punctuation', 'BeVerb')
+
     @classmethod
     def to_json(cls, python_obj):
         return json.dumps(cls.to_dict(python_obj))
@@ -26,6 +29,8 @@ class Serializer(object):
     def to_dict(cls, python_obj):
         if isinstance(python_obj, Paragraph):
             return cls._paragraph_to_dict(python_obj)
+        if isinstance(python_obj, (AbstractWord, AbstractPronoun, Punctuation, BeVerb)):
+            return cls._word_to_dict(python_obj)
 
     @classmethod
     def _paragraph_to_dict(cls, python_obj):
@@ -64,6 +69,8 @@ class Serializer(object):
     def to_obj(cls, python_dict):
         if python_dict['class'] == 'Paragraph':
             return cls._to_paragraph(python_dict)
+        if python_dict['class'] in cls._word_classes:
+            return cls._to_word(python_dict)
 
     @classmethod
     def _to_paragraph(cls, python_dict):
@@ -0,0 +1,77 @@
+"""
+Snapshot files: a short header that says what wrote them, then a pickle of prepared objects.
+
+A snapshot is only read back by the same SNAPSHOT_VERSION and the same paragraph_generator source code. Pickled words
+and cached error choices made by other code could be wrong without anything failing, so any change to a .py file in
+the package makes older snapshots stale. Checking this reads the package's source once per process.
+
+Unpickling can run any code. Only load snapshots that you made.
+"""
+import hashlib
+import json
+import os
+import pickle
+from typing import Any, Optional
+
+SNAPSHOT_MAGIC = b'PGSNAPSH'
+SNAPSHOT_VERSION = 1
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_source_fingerprint = None  # type: Optional[str]
+
+
+def source_fingerprint() -> str:
+    """a hash of every .py file in paragraph_generator"""
+    global _source_fingerprint
+    if _source_fingerprint is None:
+        digest = hashlib.blake2b(digest_size=16)
+        for directory, sub_directories, files in os.walk(PACKAGE_DIR):
+            sub_directories.sort()
+            for name in sorted(files):
+                if name.endswith('.py'):
+                    path = os.path.join(directory, name)
+                    digest.update(os.path.relpath(path, PACKAGE_DIR).replace(os.sep, '/').encode())
+                    with open(path, 'rb') as f:
+                        digest.update(f.read())
+        _source_fingerprint = digest.hexdigest()
+    return _source_fingerprint
+
+
+def write_snapshot(path: str, kind: str, payload: Any):
+    header = json.dumps({'kind': kind, 'version': SNAPSHOT_VERSION, 'source': source_fingerprint()}).encode()
+    with open(path, 'wb') as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(len(header).to_bytes(4, 'little'))
+        f.write(header)
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def read_snapshot(path: str, kind: str) -> Any:
+    """
+    :raises ValueError: if path is not a snapshot of kind, or it was written by another SNAPSHOT_VERSION or other
+        source code
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    start = len(SNAPSHOT_MAGIC) + 4
+    if not data.startswith(SNAPSHOT_MAGIC) or len(data) < start:
+        raise ValueError('not a snapshot file: {}'.format(path))
+    header_end = start + int.from_bytes(data[len(SNAPSHOT_MAGIC): start], 'little')
+    try:
+        header = json.loads(data[start: header_end].decode())
+    except ValueError:
+        header = None
+    if not isinstance(header, dict):
+        raise ValueError('snapshot header is damaged: {}'.format(path))
+    if header.get('kind') != kind:
+        raise ValueError('snapshot is a {!r}, not a {!r}: {}'.format(header.get('kind'), kind, path))
+    if header.get('version') != SNAPSHOT_VERSION:
+        raise ValueError('stale snapshot: version {!r} is not {}: {}'.format(header.get('version'), SNAPSHOT_VERSION,
+                                                                             path))
+    if header.get('source') != source_fingerprint():
+        raise ValueError('stale snapshot: paragraph_generator has changed since it was made: {}'.format(path))
+    try:
+        return pickle.loads(data[header_end:])
+    except Exception as error:
+        raise ValueError('snapshot is damaged: {}: {!r}'.format(path, error))
@@ -1,4 +1,4 @@
-from typing import Optional, List, Union
+from typing import Iterable, Optional, Union
 
 from paragraph_generator.tags.status_tag import StatusTag
 from paragraph_generator.tags.wordtag import WordTag
@@ -7,34 +7,38 @@ Tag = Union[StatusTag, WordTag]
 
 
 class Tags(object):
-    def __init__(self, tag_list: List[Optional[Tag]] = None):
-        self._tags = set()
-        if tag_list:
-            self._tags = set(tag_list)
+    """An immutable set of tags. It is hashable and safe to share, so there is no need to copy it."""
+    __slots__ = ('_tags',)
+
+    def __init__(self, tag_list: Iterable[Optional[Tag]] = None):
+        self._tags = frozenset(tag_list) if tag_list else frozenset()
 
     def to_list(self):
         return sorted(self._tags)
 
     def add(self, new_tag: Tag):
-        new_val = self.to_list()
-        new_val.append(new_tag)
-        return Tags(new_val)
+        if new_tag in self._tags:
+            return self
+        return Tags(self._tags | {new_tag})
 
     def remove(self, candidate_tag: Tag):
-        new_val = set(self.to_list())
-        new_val.discard(candidate_tag)
-        return Tags(list(new_val))
+        if candidate_tag not in self._tags:
+            return self
+        return Tags(self._tags - {candidate_tag})
 
     def has(self, candidate_tag: Tag):
         return candidate_tag in self._tags
 
     def copy(self):
-        return Tags(self.to_list())
+        return Tags(self._tags)
 
     def __eq__(self, other):
         if not isinstance(other, Tags):
             return False
-        return self.to_list() == other.to_list()
+        return self._tags == other._tags
+
+    def __hash__(self):
+        return hash(self._tags)
 
     def __repr__(self):
         return 'Tags({})'.format(self.to_list())
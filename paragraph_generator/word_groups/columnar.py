@@ -0,0 +1,414 @@
+"""
+Columnar (struct-of-arrays) storage for words.
+
+A Vocabulary interns every distinct word to a small int id and keeps a bitmask of its kind and tags. Paragraphs
+are then stored as parallel compact arrays of word ids and sentence offsets instead of nested lists of objects.
+The arrays are plain `array.array`s, so they support the buffer protocol and can be wrapped without copying
+(e.g. `numpy.frombuffer`) by callers that have NumPy.
+
+A ColumnarParagraph uses about a tenth of the memory of a Paragraph. Reading its words back is slower, as each word
+is looked up in the vocabulary, and find() is about as fast, through an index of word ids.
+"""
+import threading
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from paragraph_generator.tags.tags import Tags
+from paragraph_generator.tags.wordtag import WordTag
+from paragraph_generator.word_groups.paragraph import Paragraph
+from paragraph_generator.word_groups.sentence import Sentence
+from paragraph_generator.words.be_verb import BeVerb
+from paragraph_generator.words.noun import Noun
+from paragraph_generator.words.pronoun import AbstractPronoun, Pronoun, CapitalPronoun
+from paragraph_generator.words.punctuation import Punctuation
+from paragraph_generator.words.verb import Verb
+from paragraph_generator.words.wordtools.abstractword import AbstractWord
+
+ID_TYPECODE = 'L'
+MASK_TYPECODE = 'L'
+OFFSET_TYPECODE = 'L'
+
+KIND_NOUN = 1 << 16
+KIND_VERB = 1 << 17
+KIND_BE_VERB = 1 << 18
+KIND_PRONOUN = 1 << 19
+KIND_FIRST_PERSON = 1 << 20
+KIND_PUNCTUATION = 1 << 21
+
+_FIRST_PERSON = (Pronoun.I, Pronoun.ME, CapitalPronoun.I, CapitalPronoun.ME)
+
+
+def tag_bit(tag: WordTag) -> int:
+    return 1 << tag.value
+
+
+def get_mask(word: AbstractWord) -> int:
+    mask = 0
+    for tag in WordTag:
+        if word.has_tags(tag):
+            mask |= tag_bit(tag)
+
+    if isinstance(word, Noun):
+        mask |= KIND_NOUN
+    elif isinstance(word, Verb):
+        mask |= KIND_VERB
+    elif isinstance(word, BeVerb):
+        mask |= KIND_BE_VERB
+    elif isinstance(word, AbstractPronoun):
+        mask |= KIND_PRONOUN
+        if word in _FIRST_PERSON:
+            mask |= KIND_FIRST_PERSON
+    elif isinstance(word, Punctuation):
+        mask |= KIND_PUNCTUATION
+    return mask
+
+
+class Vocabulary(object):
+    def __init__(self, words: Iterable[AbstractWord] = ()):
+        """
+        Interns words to ids. Ids never change, and a Vocabulary can be shared between threads.
+        """
+        self._words = []  # type: List[AbstractWord]
+        self._masks = array(MASK_TYPECODE)
+        self._ids = {}  # type: Dict[AbstractWord, int]
+        self._transforms = {}  # type: Dict[str, Dict[int, int]]
+        self._lock = threading.Lock()
+        for word in words:
+            self.intern(word)
+
+    def __len__(self):
+        return len(self._words)
+
+    def intern(self, word: AbstractWord) -> int:
+        try:
+            return self._ids[word]
+        except KeyError:
+            with self._lock:
+                if word not in self._ids:
+                    self._masks.append(get_mask(word))
+                    self._words.append(word)
+                    self._ids[word] = len(self._words) - 1
+                return self._ids[word]
+
+    def get_id(self, word: AbstractWord) -> int:
+        """
+
+        :return: -1 if word is not in the vocabulary
+        """
+        return self._ids.get(word, -1)
+
+    def word(self, word_id: int) -> AbstractWord:
+        return self._words[word_id]
+
+    def mask(self, word_id: int) -> int:
+        return self._masks[word_id]
+
+    @property
+    def words(self) -> List[AbstractWord]:
+        return self._words
+
+    @property
+    def masks(self) -> array:
+        return self._masks
+
+    def transform(self, word_id: int, method_name: str) -> int:
+        """
+
+        :return: the id of self.word(word_id).<method_name>(). Answers are memoized.
+        """
+        table = self._transforms.get(method_name)
+        if table is None:
+            table = self._transforms.setdefault(method_name, {})
+        try:
+            return table[word_id]
+        except KeyError:
+            new_id = self.intern(getattr(self._words[word_id], method_name)())
+            table[word_id] = new_id
+            return new_id
+
+
+class ParagraphBatch(object):
+    def __init__(self, vocabulary: Vocabulary, word_ids: array, sentence_offsets: array,
+                 paragraph_offsets: array, tags: Sequence[Tags]):
+        """
+        Many paragraphs in three flat arrays.
+
+        :param word_ids: every word of every paragraph
+        :param sentence_offsets: sentence n is word_ids[sentence_offsets[n]:sentence_offsets[n + 1]]
+        :param paragraph_offsets: paragraph n is sentences paragraph_offsets[n] to paragraph_offsets[n + 1]
+        :param tags: the Tags of each paragraph
+        """
+        self._vocabulary = vocabulary
+        self._word_ids = word_ids
+        self._sentence_offsets = sentence_offsets
+        self._paragraph_offsets = paragraph_offsets
+        self._tags = tuple(tags)
+
+    @classmethod
+    def from_paragraphs(cls, paragraphs: Iterable[Paragraph], vocabulary: Vocabulary = None) -> 'ParagraphBatch':
+        if vocabulary is None:
+            vocabulary = Vocabulary()
+        intern = vocabulary.intern
+        word_ids = array(ID_TYPECODE)
+        sentence_offsets = array(OFFSET_TYPECODE, [0])
+        paragraph_offsets = array(OFFSET_TYPECODE, [0])
+        tags = []
+        for paragraph in paragraphs:
+            for sentence in paragraph:
+                word_ids.extend([intern(word) for word in sentence])
+                sentence_offsets.append(len(word_ids))
+            paragraph_offsets.append(len(sentence_offsets) - 1)
+            tags.append(paragraph.tags)
+        return cls(vocabulary, word_ids, sentence_offsets, paragraph_offsets, tags)
+
+    def to_paragraphs(self) -> List[Paragraph]:
+        words = self._vocabulary.words
+        word_ids = self._word_ids
+        sentence_offsets = self._sentence_offsets
+        sentences = [Sentence([words[word_id] for word_id in word_ids[start:end]])
+                     for start, end in zip(sentence_offsets, sentence_offsets[1:])]
+        paragraph_offsets = self._paragraph_offsets
+        return [Paragraph(sentences[start:end], tags)
+                for start, end, tags in zip(paragraph_offsets, paragraph_offsets[1:], self._tags)]
+
+    def __len__(self):
+        return len(self._tags)
+
+    @property
+    def vocabulary(self) -> Vocabulary:
+        return self._vocabulary
+
+    @property
+    def word_ids(self) -> array:
+        return self._word_ids
+
+    @property
+    def sentence_offsets(self) -> array:
+        return self._sentence_offsets
+
+    @property
+    def paragraph_offsets(self) -> array:
+        return self._paragraph_offsets
+
+    @property
+    def tags(self) -> Tuple[Tags, ...]:
+        return self._tags
+
+    def masks(self) -> array:
+        """the kind and tag bitmask of every word in word_ids"""
+        vocabulary_masks = self._vocabulary.masks
+        return array(MASK_TYPECODE, [vocabulary_masks[word_id] for word_id in self._word_ids])
+
+    def paragraph(self, index: int) -> 'ColumnarParagraph':
+        first_sentence, last_sentence = self._paragraph_offsets[index], self._paragraph_offsets[index + 1]
+        start = self._sentence_offsets[first_sentence]
+        word_ids = self._word_ids[start:self._sentence_offsets[last_sentence]]
+        sentence_offsets = array(OFFSET_TYPECODE, [offset - start for offset in
+                                                   self._sentence_offsets[first_sentence:last_sentence + 1]])
+        return ColumnarParagraph(self._vocabulary, word_ids, sentence_offsets, self._tags[index])
+
+
+class ColumnarParagraph(Paragraph):
+    def __init__(self, vocabulary: Vocabulary, word_ids: array, sentence_offsets: array, tags: Tags = None):
+        """
+        A Paragraph stored as parallel arrays: a vocabulary id and a kind/tag bitmask for every word, and a sentence
+        offset table. It is a drop-in Paragraph, and its sentences are lightweight SentenceViews that are made when
+        they are asked for.
+
+        :param sentence_offsets: sentence n is word_ids[sentence_offsets[n]:sentence_offsets[n + 1]].
+            It starts at 0 and ends at len(word_ids).
+        """
+        super(ColumnarParagraph, self).__init__((), tags)
+        self._vocabulary = vocabulary
+        self._word_ids = word_ids
+        vocabulary_masks = vocabulary.masks
+        self._masks = array(MASK_TYPECODE, [vocabulary_masks[word_id] for word_id in word_ids])
+        self._sentence_offsets = sentence_offsets
+        self._sentences = _SentenceViews(vocabulary, word_ids, self._masks, sentence_offsets)
+        self._id_positions = None  # type: Optional[Dict[int, List[Tuple[int, int]]]]
+
+    @classmethod
+    def from_paragraph(cls, paragraph: Paragraph, vocabulary: Vocabulary = None) -> 'ColumnarParagraph':
+        if vocabulary is None:
+            vocabulary = Vocabulary()
+        word_ids, sentence_offsets = _encode_sentences(vocabulary, paragraph)
+        return cls(vocabulary, word_ids, sentence_offsets, paragraph.tags)
+
+    @classmethod
+    def from_word_lists(cls, word_lists: List[List[AbstractWord]], tags=None,
+                        vocabulary: Vocabulary = None) -> 'ColumnarParagraph':
+        if vocabulary is None:
+            vocabulary = Vocabulary()
+        word_ids, sentence_offsets = _encode_sentences(vocabulary, word_lists)
+        return cls(vocabulary, word_ids, sentence_offsets, tags)
+
+    def to_paragraph(self) -> Paragraph:
+        return Paragraph([sentence.to_sentence() for sentence in self], self._tags)
+
+    @property
+    def vocabulary(self) -> Vocabulary:
+        return self._vocabulary
+
+    @property
+    def word_ids(self) -> array:
+        return self._word_ids
+
+    @property
+    def masks(self) -> array:
+        return self._masks
+
+    @property
+    def sentence_offsets(self) -> array:
+        return self._sentence_offsets
+
+    def __repr__(self):
+        return 'ColumnarParagraph({!r}, {!r})'.format(self.sentence_list(), self.tags)
+
+    def all_words(self):
+        words = self._vocabulary.words
+        return (words[word_id] for word_id in self._word_ids)
+
+    def indexed_all_words(self):
+        """
+
+        :return: Generator[(s_index, w_index, word)]
+        """
+        words = self._vocabulary.words
+        word_ids = self._word_ids
+        offsets = self._sentence_offsets
+        return ((s_index, index - offsets[s_index], words[word_ids[index]])
+                for s_index in range(len(offsets) - 1)
+                for index in range(offsets[s_index], offsets[s_index + 1]))
+
+    def set_tags(self, tags: Tags) -> 'ColumnarParagraph':
+        return ColumnarParagraph(self._vocabulary, self._word_ids, self._sentence_offsets, tags)
+
+    def set_sentence(self, index, new_sentence) -> 'ColumnarParagraph':
+        sentences = self.sentence_list()
+        sentences[index] = new_sentence
+        word_ids, sentence_offsets = _encode_sentences(self._vocabulary, sentences)
+        return ColumnarParagraph(self._vocabulary, word_ids, sentence_offsets, self._tags)
+
+    def set(self, sentence_index, word_index, value: AbstractWord) -> 'ColumnarParagraph':
+        sentence = self.get_sentence(sentence_index)
+        word_ids = array(ID_TYPECODE, self._word_ids)
+        word_ids[sentence.absolute_index(word_index)] = self._vocabulary.intern(value)
+        return ColumnarParagraph(self._vocabulary, word_ids, self._sentence_offsets, self._tags)
+
+    def find(self, word: AbstractWord) -> List[Tuple[int, int]]:
+        try:
+            word_id = self._vocabulary.get_id(word)
+        except TypeError:
+            return self._find_by_scanning(word)
+        if word_id == -1:
+            return []
+        id_positions = self._id_positions
+        if id_positions is None:
+            id_positions = self._get_id_positions()
+        return id_positions.get(word_id, [])[:]
+
+    def _get_id_positions(self):
+        """like _get_word_positions, keyed by word id. built on first use."""
+        if self._id_positions is None:
+            id_positions = {}  # type: Dict[int, List[Tuple[int, int]]]
+            word_ids = self._word_ids
+            offsets = self._sentence_offsets
+            for s_index in range(len(offsets) - 1):
+                start = offsets[s_index]
+                for index in range(start, offsets[s_index + 1]):
+                    id_positions.setdefault(word_ids[index], []).append((s_index, index - start))
+            self._id_positions = id_positions
+        return self._id_positions
+
+
+class SentenceView(Sentence):
+    def __init__(self, paragraph: ColumnarParagraph, index: int):
+        """
+        A Sentence that points into a ColumnarParagraph's arrays instead of holding a list. Changes return a new
+        Sentence.
+
+        :param paragraph: anything with the vocabulary, word_ids, masks and sentence_offsets of a ColumnarParagraph
+        """
+        super(SentenceView, self).__init__()
+        offsets = paragraph.sentence_offsets
+        self._start = offsets[index]
+        self._end = offsets[index + 1]
+        self._masks = paragraph.masks
+        self._word_list = _WordSlice(paragraph.vocabulary.words, paragraph.word_ids, self._start, self._end)
+
+    def to_sentence(self) -> Sentence:
+        return Sentence(self._word_list)
+
+    def absolute_index(self, index: int) -> int:
+        """the position of word index in the paragraph's arrays"""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('list index out of range')
+        return self._start + index
+
+    def __repr__(self):
+        return 'SentenceView({!r})'.format(self.word_list())
+
+    def get_verb(self):
+        if self._verb_index is None:
+            self._verb_index = -1
+            masks = self._masks
+            for index in range(self._start, self._end):
+                if masks[index] & (KIND_VERB | KIND_BE_VERB):
+                    self._verb_index = index - self._start
+                    break
+        return self._verb_index
+
+
+class _SentenceViews(Sequence['SentenceView']):
+    """the sentences of a ColumnarParagraph, made as they are asked for"""
+    __slots__ = ('vocabulary', 'word_ids', 'masks', 'sentence_offsets')
+
+    def __init__(self, vocabulary: Vocabulary, word_ids: array, masks: array, sentence_offsets: array):
+        self.vocabulary = vocabulary
+        self.word_ids = word_ids
+        self.masks = masks
+        self.sentence_offsets = sentence_offsets
+
+    def __len__(self):
+        return len(self.sentence_offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(SentenceView(self, s_index) for s_index in range(len(self))[index])
+        return SentenceView(self, range(len(self))[index])
+
+
+class _WordSlice(Sequence[AbstractWord]):
+    """the words of a SentenceView, read from the paragraph's arrays"""
+    __slots__ = ('_words', '_word_ids', '_start', '_end')
+
+    def __init__(self, words: List[AbstractWord], word_ids: array, start: int, end: int):
+        self._words = words
+        self._word_ids = word_ids
+        self._start = start
+        self._end = end
+
+    def __len__(self):
+        return self._end - self._start
+
+    def __getitem__(self, index):
+        words = self._words
+        word_ids = self._word_ids
+        if isinstance(index, slice):
+            return tuple(words[word_ids[position]] for position in range(self._start, self._end)[index])
+        return words[word_ids[range(self._start, self._end)[index]]]
+
+    def __iter__(self):
+        return map(self._words.__getitem__, self._word_ids[self._start:self._end])
+
+
+def _encode_sentences(vocabulary: Vocabulary, sentences) -> Tuple[array, array]:
+    intern = vocabulary.intern
+    word_ids = array(ID_TYPECODE)
+    sentence_offsets = array(OFFSET_TYPECODE, [0])
+    for sentence in sentences:
+        word_ids.extend([intern(word) for word in sentence])
+        sentence_offsets.append(len(word_ids))
+    return word_ids, sentence_offsets
@@ -1,17 +1,22 @@
 from itertools import chain
-from typing import List
+from typing import Dict, List, Optional, TextIO, Tuple
 
 from paragraph_generator.tags.tags import Tags
 from paragraph_generator.word_groups.sentence import Sentence
 from paragraph_generator.words.wordtools.abstractword import AbstractWord
 
+_NO_INDEX = object()
+"""_word_positions after a word could not be hashed. find() scans instead of building the index again."""
+
 
 class Paragraph(object):
     def __init__(self, sentence_list: List[Sentence], tags: Tags = None):
         if tags is None:
             tags = Tags()
-        self._tags = tags.copy()
-        self._sentences = sentence_list[:]
+        self._tags = tags
+        self._sentences = tuple(sentence_list)
+        self._word_positions = None  # type: Optional[Dict[AbstractWord, List[Tuple[int, int]]]]
+        self._str = None  # type: Optional[str]
 
     @classmethod
     def from_word_lists(cls, word_lists: List[List[AbstractWord]], tags=None):
@@ -19,15 +24,16 @@ class Paragraph(object):
 
     @property
     def tags(self):
-        return self._tags.copy()
+        return self._tags
 
     def sentence_list(self):
-        return self._sentences[:]
+        return list(self._sentences)
 
     def __eq__(self, other):
         if not isinstance(other, Paragraph):
             return False
-        return (self.tags, self.sentence_list()) == (other.tags, other.sentence_list())
+        return (self.tags == other.tags and len(self) == len(other) and
+                all(sentence == other_sentence for sentence, other_sentence in zip(self, other)))
 
     def __len__(self):
         return len(self._sentences)
@@ -36,7 +42,19 @@ class Paragraph(object):
         return iter(self._sentences)
 
     def __str__(self):
-        return ' '.join((str(sentence) for sentence in self._sentences))
+        if self._str is None:
+            self._str = ' '.join([str(sentence) for sentence in self._sentences])
+        return self._str
+
+    def write(self, stream: TextIO):
+        """writes str(self) one sentence at a time, without joining the whole paragraph"""
+        if self._str is not None:
+            stream.write(self._str)
+            return
+        for index, sentence in enumerate(self._sentences):
+            if index:
+                stream.write(' ')
+            stream.write(str(sentence))
 
     def __repr__(self):
         """PURELY FOR TESTING CONVENIENCE"""
@@ -55,22 +73,49 @@ class Paragraph(object):
                 for w_index, word in enumerate(sentence))
 
     def set_tags(self, tags: Tags):
-        return Paragraph(self.sentence_list(), tags)
+        return Paragraph(self._sentences, tags)
 
     def get_sentence(self, index):
         return self._sentences[index]
 
     def set_sentence(self, index, new_sentence):
-        sentences = self.sentence_list()
+        sentences = list(self._sentences)
         sentences[index] = new_sentence
-        return Paragraph(sentences, self.tags)
+        return Paragraph(sentences, self._tags)
 
     def set(self, sentence_index, word_index, value: AbstractWord):
-        sentences = self.sentence_list()
+        sentences = list(self._sentences)
         sentences[sentence_index] = sentences[sentence_index].set(word_index, value)
-        return Paragraph(sentences, self.tags)
+        return Paragraph(sentences, self._tags)
 
     def find(self, word: AbstractWord):
+        word_positions = self._get_word_positions()
+        if word_positions is None:
+            return self._find_by_scanning(word)
+        try:
+            return word_positions.get(word, [])[:]
+        except TypeError:
+            return self._find_by_scanning(word)
+
+    def _get_word_positions(self):
+        """
+        built on first use. a Paragraph never changes, so the index never goes stale.
+
+        :return: None if a word in the paragraph cannot be hashed
+        """
+        if self._word_positions is None:
+            word_positions = {}
+            try:
+                for s_index, w_index, word in self.indexed_all_words():
+                    word_positions.setdefault(word, []).append((s_index, w_index))
+            except TypeError:
+                word_positions = _NO_INDEX
+            self._word_positions = word_positions
+        if self._word_positions is _NO_INDEX:
+            return None
+        return self._word_positions
+
+    def _find_by_scanning(self, word):
         answer = []
         for s_index, w_index, to_test in self.indexed_all_words():
             if word == to_test:
@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import List, Optional, TextIO, Union
 
 from paragraph_generator.words.be_verb import BeVerb
 from paragraph_generator.words.pronoun import AbstractPronoun
@@ -12,21 +12,22 @@ WordList = List[Union[AbstractWord, AbstractPronoun, Punctuation, BeVerb]]
 class Sentence(object):
     def __init__(self, word_list: WordList = None):
         if word_list is None:
-            word_list = []
-        self._word_list = word_list.copy()
+            word_list = ()
+        self._word_list = tuple(word_list)
+        self._verb_index = None  # type: Optional[int]
+        self._str = None  # type: Optional[str]
 
     def __repr__(self):
         """for testing convenience"""
         return 'Sentence({!r})'.format(self.word_list())
 
     def word_list(self):
-        return self._word_list[:]
+        return list(self._word_list)
 
     def get_verb(self):
-        for index, word in enumerate(self.word_list()):
-            if isinstance(word, (Verb, BeVerb)):
-                return index
-        return -1
+        if self._verb_index is None:
+            self._verb_index = _find_verb(self._word_list)
+        return self._verb_index
 
     def get_subject(self):
         return max(self.get_verb() - 1, -1)
@@ -34,10 +35,10 @@ class Sentence(object):
     def __eq__(self, other):
         if not isinstance(other, Sentence):
             return False
-        return self.word_list() == other.word_list()
+        return tuple(self) == tuple(other)
 
     def __iter__(self):
-        return iter(self.word_list())
+        return iter(self._word_list)
 
     def __len__(self):
         return len(self._word_list)
@@ -46,30 +47,50 @@ class Sentence(object):
         return self._word_list[index]
 
     def set(self, index, value):
-        new_list = self.word_list()
+        new_list = list(self._word_list)
         new_list[index] = value
         return Sentence(new_list)
 
     def delete(self, index):
-        new_list = self.word_list()
+        new_list = list(self._word_list)
         del new_list[index]
         return Sentence(new_list)
 
     def insert(self, index, new_word):
-        new_list = self.word_list()
+        new_list = list(self._word_list)
         new_list.insert(index, new_word)
         return Sentence(new_list)
 
     def insert_list(self, index, word_list):
-        old_list = self.word_list()
-        new_list = old_list[:index] + word_list[:] + old_list[index:]
+        old_list = self._word_list
+        new_list = old_list[:index] + tuple(word_list) + old_list[index:]
         return Sentence(new_list)
 
     def __str__(self):
-        answer = ''
-        for word in self.word_list():
-            if not answer or isinstance(word, Punctuation):
-                answer += word.value
-            else:
-                answer += ' {}'.format(word.value)
-        return answer
+        """built on first use. a Sentence never changes, so it is only joined once."""
+        if self._str is None:
+            self._str = _render(self._word_list)
+        return self._str
+
+    def write(self, stream: TextIO):
+        stream.write(str(self))
+
+
+def _render(word_list: WordList) -> str:
+    parts = []
+    for word in word_list:
+        value = word.value
+        if not parts or isinstance(word, Punctuation):
+            if value:
+                parts.append(value)
+        else:
+            parts.append(' ')
+            parts.append(value)
+    return ''.join(parts)
+
+
+def _find_verb(word_list: WordList) -> int:
+    for index, word in enumerate(word_list):
+        if isinstance(word, (Verb, BeVerb)):
+            return index
+    return -1
@@ -1,6 +1,11 @@
+import csv
+import sys
 from abc import ABC, abstractmethod
-from typing import List
+from array import array
+from typing import Dict, List, Sequence, TextIO, Tuple
 
+from paragraph_generator.tags.tags import Tags
+from paragraph_generator.tags.wordtag import WordTag
 from paragraph_generator.word_groups.verb_group import VerbGroup
 from paragraph_generator.words.basicword import BasicWord
 from paragraph_generator.words.noun import Noun
@@ -19,7 +24,43 @@ class AbstractWordLists(ABC):
         raise NotImplementedError
 
 
-class WordLists(AbstractWordLists):
+class _GeneratedWordLists(AbstractWordLists):
+    """verbs and nouns are made by the _generate_* methods the first time they are read, and then kept"""
+
+    def __init__(self):
+        self._verb_groups = None
+        self._nouns = None
+
+    @property
+    def verbs(self):
+        if self._verb_groups is None:
+            self._verb_groups = tuple(self._generate_verb_groups())
+        return list(self._verb_groups)
+
+    @property
+    def nouns(self):
+        if self._nouns is None:
+            self._nouns = tuple(self._generate_countable() + self._generate_uncountable() + self._generate_static())
+        return list(self._nouns)
+
+    @abstractmethod
+    def _generate_verb_groups(self) -> List[VerbGroup]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _generate_countable(self) -> List[Noun]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _generate_uncountable(self) -> List[Noun]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _generate_static(self) -> List[Noun]:
+        raise NotImplementedError
+
+
+class WordLists(_GeneratedWordLists):
     def __init__(self, verbs=None, countable=None, uncountable=None, static=None):
         """
 
@@ -28,18 +69,11 @@ class WordLists(AbstractWordLists):
         :param uncountable: {'noun': str, 'definite': bool}
         :param static: {'noun': str, 'is_plural': bool}
         """
-        self._verbs = verbs if verbs else []
-        self._countable = countable if countable else []
-        self._uncountable = uncountable if uncountable else []
-        self._static = static if static else []
-
-    @property
-    def verbs(self):
-        return self._generate_verb_groups()
-
-    @property
-    def nouns(self):
-        return self._generate_countable() + self._generate_uncountable() + self._generate_static()
+        super(WordLists, self).__init__()
+        self._verbs = _freeze(verbs)
+        self._countable = _freeze(countable)
+        self._uncountable = _freeze(uncountable)
+        self._static = _freeze(static)
 
     def _generate_verb_groups(self):
         return [_generate_verb_group(verb_json) for verb_json in self._verbs]
@@ -54,6 +88,190 @@ class WordLists(AbstractWordLists):
         return [Noun.proper_noun(el['noun'], el['is_plural']) for el in self._static]
 
 
+Columns = Dict[str, Sequence]
+
+VERB_COLUMNS = {'verb': None, 'irregular_past': '', 'preposition': '', 'particle': '', 'objects': 1}
+COUNTABLE_COLUMNS = {'noun': None, 'irregular_plural': ''}
+UNCOUNTABLE_COLUMNS = {'noun': None, 'definite': False}
+STATIC_COLUMNS = {'noun': None, 'is_plural': False}
+"""{column: default}. A column whose default is None must be given."""
+
+_TRUE_STRINGS = ('true', 't', 'yes', 'y', '1', 'p')
+_FALSE_STRINGS = ('false', 'f', 'no', 'n', '0', '')
+
+
+class ColumnarWordLists(_GeneratedWordLists):
+    def __init__(self, verbs: Columns = None, countable: Columns = None, uncountable: Columns = None,
+                 static: Columns = None):
+        """
+        The same words as WordLists, given as columns instead of one dict per word. Each argument maps a column name to
+        a sequence with one entry per word: a list, a tuple, an array or anything else that iter works on. Columns that
+        are left out get their default (see the *_COLUMNS dicts).
+
+        Every column is checked before any word is made. Strings are interned and numbers and bools are kept in
+        arrays, so a large vocabulary stays small until verbs or nouns is first read.
+
+        :param verbs: 'verb': str, 'irregular_past': str, 'preposition': str, 'particle': str, 'objects': int
+        :param countable: 'noun': str, 'irregular_plural': str
+        :param uncountable: 'noun': str, 'definite': bool
+        :param static: 'noun': str, 'is_plural': bool
+        :raises ValueError: for an unknown or missing column, columns of different lengths, an empty verb or noun, a
+            negative or non-integer objects, or a bool column entry that is not a bool or one of _TRUE_STRINGS or
+            _FALSE_STRINGS
+        """
+        super(ColumnarWordLists, self).__init__()
+        self._verbs = _check_columns('verbs', verbs, VERB_COLUMNS)
+        self._countable = _check_columns('countable', countable, COUNTABLE_COLUMNS)
+        self._uncountable = _check_columns('uncountable', uncountable, UNCOUNTABLE_COLUMNS)
+        self._static = _check_columns('static', static, STATIC_COLUMNS)
+
+    @classmethod
+    def from_csv(cls, verbs: TextIO = None, countable: TextIO = None, uncountable: TextIO = None,
+                 static: TextIO = None) -> 'ColumnarWordLists':
+        """
+        Reads each stream as csv, with a header row of column names, straight into columns.
+
+        :raises ValueError: as __init__, or for a row with the wrong number of fields
+        """
+        return cls(*(None if stream is None else read_csv_columns(stream) for stream in (verbs, countable,
+                                                                                          uncountable, static)))
+
+    def _generate_verb_groups(self):
+        columns = self._verbs
+        prepositions = _shared_words(columns['preposition'], BasicWord.preposition)
+        particles = _shared_words(columns['particle'], BasicWord.particle)
+        return [VerbGroup(Verb(verb, irregular_past), prepositions[preposition], particles[particle], objects)
+                for verb, irregular_past, preposition, particle, objects
+                in zip(columns['verb'], columns['irregular_past'], columns['preposition'], columns['particle'],
+                       columns['objects'])]
+
+    def _generate_countable(self):
+        return [Noun(noun, irregular_plural)
+                for noun, irregular_plural in zip(self._countable['noun'], self._countable['irregular_plural'])]
+
+    def _generate_uncountable(self):
+        tags = Tags([WordTag.UNCOUNTABLE])
+        nouns = []
+        for noun, definite in zip(self._uncountable['noun'], self._uncountable['definite']):
+            new_noun = Noun(noun, '', '', tags)
+            nouns.append(new_noun.definite() if definite else new_noun)
+        return nouns
+
+    def _generate_static(self):
+        singular = Tags([WordTag.PROPER])
+        plural = singular.add(WordTag.PLURAL)
+        return [Noun(noun, '', '', plural if is_plural else singular)
+                for noun, is_plural in zip(self._static['noun'], self._static['is_plural'])]
+
+
+def read_csv_columns(stream: TextIO) -> Dict[str, list]:
+    """
+    :return: {column name in the header row: [the field in that column of each row]}
+    :raises ValueError: if a row does not have one field per column
+    """
+    reader = csv.reader(stream, skipinitialspace=True)
+    names = [name.strip() for name in next(reader, [])]
+    columns = [[] for _ in names]
+    appends = [column.append for column in columns]
+    for row in reader:
+        if not row:
+            continue
+        if len(row) != len(names):
+            raise ValueError('csv line {} has {} fields, not {}: {!r}'.format(reader.line_num, len(row), len(names),
+                                                                              row))
+        for append, field in zip(appends, row):
+            append(field)
+    return dict(zip(names, columns))
+
+
+def _check_columns(name: str, columns: Columns, defaults: dict) -> Dict[str, Sequence]:
+    """:return: {column: interned strings in a tuple, or numbers in an array} with every column in defaults"""
+    columns = {} if columns is None else columns
+    unknown = set(columns) - set(defaults)
+    if unknown:
+        raise ValueError('{}: unknown columns {}. the columns are {}'.format(name, sorted(unknown), list(defaults)))
+    length = None
+    checked = {}
+    for column, default in defaults.items():
+        if column not in columns:
+            if default is None and columns:
+                raise ValueError('{}: the {!r} column is required'.format(name, column))
+            continue
+        values = columns[column]
+        if isinstance(default, bool):
+            checked[column] = _bool_array(name, column, values)
+        elif isinstance(default, int):
+            checked[column] = _count_array(name, column, values)
+        else:
+            checked[column] = _interned(name, column, values, required=default is None)
+        if length is None:
+            length = len(checked[column])
+        elif len(checked[column]) != length:
+            raise ValueError('{}: the {!r} column has {} entries, not {}'.format(name, column, len(checked[column]),
+                                                                                 length))
+    length = length or 0
+    for column, default in defaults.items():
+        if column not in checked:
+            checked[column] = _default_column(default, length)
+    return checked
+
+
+def _default_column(default, length: int) -> Sequence:
+    if isinstance(default, bool):
+        return array('B', [default]) * length
+    if isinstance(default, int):
+        return array('L', [default]) * length
+    return (sys.intern(default or ''),) * length
+
+
+def _interned(name, column, values, required: bool) -> Tuple[str, ...]:
+    intern = sys.intern
+    try:
+        answer = tuple(intern(value.strip()) for value in values)
+    except (AttributeError, TypeError):
+        raise ValueError('{}: the {!r} column must be strings'.format(name, column))
+    if required and not all(answer):
+        raise ValueError('{}: {!r} is empty at index {}'.format(name, column, answer.index('')))
+    return answer
+
+
+def _count_array(name, column, values) -> array:
+    counts = array('L')
+    for index, value in enumerate(values):
+        try:
+            counts.append(int(value) if isinstance(value, (int, str)) else value.__index__())
+        except (AttributeError, OverflowError, TypeError, ValueError):
+            raise ValueError('{}: {!r} at index {} is not a whole number of at least 0: {!r}'.format(
+                name, column, index, value))
+    return counts
+
+
+def _bool_array(name, column, values) -> array:
+    flags = array('B')
+    for index, value in enumerate(values):
+        if isinstance(value, str):
+            lowered = value.strip().lower()
+            if lowered not in _TRUE_STRINGS and lowered not in _FALSE_STRINGS:
+                raise ValueError('{}: {!r} at index {} is not a bool: {!r}'.format(name, column, index, value))
+            value = lowered in _TRUE_STRINGS
+        elif value not in (True, False):
+            raise ValueError('{}: {!r} at index {} is not a bool: {!r}'.format(name, column, index, value))
+        flags.append(bool(value))
+    return flags
+
+
+def _shared_words(values: Sequence[str], make_word) -> dict:
+    """{value: one word for every use of value, or None for ''}"""
+    return {value: make_word(value) if value else None for value in set(values)}
+
+
+def _freeze(json_list):
+    """copies the caller's data so that later changes to it cannot race with readers of a shared WordLists"""
+    if not json_list:
+        return ()
+    return tuple(dict(json_dict) for json_dict in json_list)
+
+
 def _generate_verb_group(verb_json):
     """
     :param verb_json: keys='verb', 'irregular_past', 'objects', 'preposition', 'particle'
@@ -5,6 +5,8 @@ from paragraph_generator.words.wordtools.common_functions import bold
 
 
 class BasicWord(AbstractWord):
+    __slots__ = ('_value', '_tags')
+
     def __init__(self, value, tags=None):
         self._value = value
         if tags is None:
@@ -25,7 +27,7 @@ class BasicWord(AbstractWord):
 
     @property
     def tags(self):
-        return self._tags.copy()
+        return self._tags
 
     def capitalize(self):
         new_value = self.value[0].upper() + self.value[1:]
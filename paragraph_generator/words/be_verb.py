@@ -27,17 +27,10 @@ class BeVerb(Enum):
 
     @property
     def tags(self) -> Tags:
-        tag_list = []
-        if 'IS' in self.name:
-            tag_list.append(WordTag.THIRD_PERSON)
-        if 'NOT' in self.name:
-            tag_list.append(WordTag.NEGATIVE)
-        if 'WAS' in self.name or 'WERE' in self.name:
-            tag_list.append(WordTag.PAST)
-        return Tags(tag_list)
+        return _TAGS[self]
 
     def has_tags(self, *tags: WordTag) -> bool:
-        return all(self.tags.has(tag) for tag in tags)
+        return _TAG_SETS[self].issuperset(tags)
 
     def capitalize(self) -> AbstractWord:
         return BasicWord(self.value.capitalize())
@@ -49,18 +42,40 @@ class BeVerb(Enum):
         return BasicWord(bold(self.value))
 
     def negative(self):
-        if self.has_tags(WordTag.NEGATIVE) or self == BeVerb.BE:
-            return self
-        return getattr(self, '{}_NOT'.format(self.name))
+        return _NEGATIVES[self]
 
     def past_tense(self):
-        if self.has_tags(WordTag.PAST):
-            return self
-        new_name = self.name
-        pairs = {'AM': 'WAS', 'IS': 'WAS', 'ARE': 'WERE'}
-        for present, past in pairs.items():
-            new_name = new_name.replace(present, past)
-        return getattr(self, new_name)
+        return _PAST_TENSES[self]
 
 
 ABCMeta.register(AbstractWord, BeVerb)
+
+
+def _tags_from_name(name: str) -> Tags:
+    tag_list = []
+    if 'IS' in name:
+        tag_list.append(WordTag.THIRD_PERSON)
+    if 'NOT' in name:
+        tag_list.append(WordTag.NEGATIVE)
+    if 'WAS' in name or 'WERE' in name:
+        tag_list.append(WordTag.PAST)
+    return Tags(tag_list)
+
+
+def _negative_name(name: str) -> str:
+    if 'NOT' in name or name == 'BE':
+        return name
+    return '{}_NOT'.format(name)
+
+
+def _past_tense_name(name: str) -> str:
+    for present, past in (('AM', 'WAS'), ('IS', 'WAS'), ('ARE', 'WERE')):
+        name = name.replace(present, past)
+    return name
+
+
+# every BeVerb's tags and transitions, worked out from the member names once
+_TAGS = {be_verb: _tags_from_name(be_verb.name) for be_verb in BeVerb}
+_TAG_SETS = {be_verb: frozenset(tags.to_list()) for be_verb, tags in _TAGS.items()}
+_NEGATIVES = {be_verb: BeVerb[_negative_name(be_verb.name)] for be_verb in BeVerb}
+_PAST_TENSES = {be_verb: BeVerb[_past_tense_name(be_verb.name)] for be_verb in BeVerb}
@@ -5,6 +5,8 @@ from paragraph_generator.words.wordtools.common_functions import add_s, bold
 
 
 class Noun(AbstractWord):
+    __slots__ = ('_value', '_irregular', '_base', '_tags')
+
     def __init__(self, value, irregular_plural='', base='', tags=None):
         self._value = value
         self._irregular = irregular_plural
@@ -14,7 +16,7 @@ class Noun(AbstractWord):
 
         if not tags:
             tags = Tags()
-        self._tags = tags.copy()
+        self._tags = tags
 
     @classmethod
     def uncountable_noun(cls, value):
@@ -41,7 +43,7 @@ class Noun(AbstractWord):
 
     @property
     def tags(self):
-        return self._tags.copy()
+        return self._tags
 
     def __eq__(self, other):
         if not isinstance(other, Noun):
@@ -1,5 +1,6 @@
 from abc import ABCMeta
 from enum import Enum
+from typing import Dict, Tuple
 
 from paragraph_generator.tags.wordtag import WordTag
 from paragraph_generator.words.basicword import BasicWord
@@ -17,24 +18,10 @@ class AbstractPronoun(Enum):
         return BasicWord(self.value).bold()
 
     def object(self):
-        changes = {self.I: self.ME,
-                   self.HE: self.HIM,
-                   self.SHE: self.HER,
-                   self.WE: self.US,
-                   self.THEY: self.THEM}
-        if self in changes:
-            return changes[self]
-        return self
+        return _get_transitions(self)[0]
 
     def subject(self):
-        changes = {self.ME: self.I,
-                   self.HIM: self.HE,
-                   self.HER: self.SHE,
-                   self.US: self.WE,
-                   self.THEM: self.THEY}
-        if self in changes:
-            return changes[self]
-        return self
+        return _get_transitions(self)[1]
 
     def is_pair(self, other):
         if not isinstance(other, AbstractPronoun):
@@ -42,9 +29,7 @@ class AbstractPronoun(Enum):
         return self.subject() == other.subject()
 
     def has_tags(self, *tags):
-        if tags == (WordTag.PLURAL,) and self in (self.YOU, self.WE, self.US, self.THEY, self.THEM):
-            return True
-        return False
+        return tags == (WordTag.PLURAL,) and _get_transitions(self)[2]
 
 
 ABCMeta.register(AbstractWord, AbstractPronoun)
@@ -71,7 +56,7 @@ class Pronoun(AbstractPronoun):
     THEM = 'them'
 
     def capitalize(self):
-        return getattr(CapitalPronoun, self.name)
+        return _CAPITALIZED[self]
 
     def de_capitalize(self):
         return self
@@ -101,4 +86,37 @@ class CapitalPronoun(AbstractPronoun):
         return self
 
     def de_capitalize(self):
-        return getattr(Pronoun, self.name)
+        return _DE_CAPITALIZED[self]
+
+
+_SUBJECT_OBJECT_NAMES = (('I', 'ME'), ('HE', 'HIM'), ('SHE', 'HER'), ('WE', 'US'), ('THEY', 'THEM'))
+_PLURAL_NAMES = frozenset(['YOU', 'WE', 'US', 'THEY', 'THEM'])
+
+# {pronoun: (pronoun.object(), pronoun.subject(), pronoun.has_tags(WordTag.PLURAL))}
+_TRANSITIONS = {}  # type: Dict[AbstractPronoun, Tuple[AbstractPronoun, AbstractPronoun, bool]]
+
+
+def _get_transitions(pronoun: AbstractPronoun) -> Tuple[AbstractPronoun, AbstractPronoun, bool]:
+    try:
+        return _TRANSITIONS[pronoun]
+    except KeyError:
+        _add_transitions(type(pronoun))
+        return _TRANSITIONS[pronoun]
+
+
+def _add_transitions(pronoun_class):
+    """Pronoun and CapitalPronoun are added at import. Other subclasses of AbstractPronoun are added on first use."""
+    members = pronoun_class.__members__
+    objects = {members[subject]: members[object_] for subject, object_ in _SUBJECT_OBJECT_NAMES}
+    subjects = {object_: subject for subject, object_ in objects.items()}
+    for pronoun in pronoun_class:
+        _TRANSITIONS[pronoun] = (objects.get(pronoun, pronoun), subjects.get(pronoun, pronoun),
+                                 pronoun.name in _PLURAL_NAMES)
+
+
+_add_transitions(Pronoun)
+_add_transitions(CapitalPronoun)
+_CAPITALIZED = {pronoun: CapitalPronoun[pronoun.name] for pronoun in Pronoun}
+_DE_CAPITALIZED = {pronoun: Pronoun[pronoun.name] for pronoun in CapitalPronoun}
+
+FIRST_PERSON_SINGULAR = frozenset([Pronoun.I, Pronoun.ME, CapitalPronoun.I, CapitalPronoun.ME])
@@ -5,6 +5,8 @@ from paragraph_generator.words.wordtools.common_functions import add_s, add_ed,
 
 
 class Verb(AbstractWord):
+    __slots__ = ('_value', '_irregular_past', '_inf', '_tags')
+
     def __init__(self, value, irregular_past='', infinitive='', tags=None):
         self._value = value
         self._irregular_past = irregular_past
@@ -14,7 +16,7 @@ class Verb(AbstractWord):
 
         if tags is None:
             tags = Tags()
-        self._tags = tags.copy()
+        self._tags = tags
 
     @property
     def value(self):
@@ -30,7 +32,7 @@ class Verb(AbstractWord):
 
     @property
     def tags(self):
-        return self._tags.copy()
+        return self._tags
 
     def __eq__(self, other):
         if not isinstance(other, Verb):
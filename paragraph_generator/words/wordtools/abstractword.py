@@ -5,6 +5,7 @@ from paragraph_generator.tags.wordtag import WordTag
 
 
 class AbstractWord(ABC):
+    __slots__ = ()
 
     @property
     @abstractmethod
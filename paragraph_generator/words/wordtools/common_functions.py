@@ -1,7 +1,22 @@
+BOLD_START = '<bold>'
+BOLD_END = '</bold>'
+
+
 def bold(word_value) -> str:
-    if word_value.endswith('</bold>') and word_value.startswith('<bold>'):
+    if is_bold(word_value):
         return word_value
-    return '<bold>{}</bold>'.format(word_value)
+    return '{}{}{}'.format(BOLD_START, word_value, BOLD_END)
+
+
+def is_bold(word_value) -> bool:
+    return word_value.endswith(BOLD_END) and word_value.startswith(BOLD_START)
+
+
+def un_bold(word_value) -> str:
+    """the inside of a bold() value. other values are returned unchanged."""
+    if is_bold(word_value):
+        return word_value[len(BOLD_START): -len(BOLD_END)]
+    return word_value
 
 
 def add_s(word_value):
@@ -21,10 +21,10 @@ setup(name='paragraph_generator',
           'Development Status :: 4 - Beta',
           'Intended Audience :: Developers',
           'Programming Language :: Python',
-          'Programming Language :: Python :: 3.6',
           'Programming Language :: Python :: 3.7',
       ],
-      packages=find_packages(exclude=['tests']),
+      python_requires='>=3.7',
+      packages=find_packages(exclude=['tests', 'tests.*', 'benchmarks']),
       package_data={
           '': ['data/*.csv']
       },
@@ -1,6 +1,8 @@
+import io
 import unittest
 
 from paragraph_generator.answer_checker import AnswerChecker
+from paragraph_generator.rendering import HTML, MARKUP
 from paragraph_generator.word_groups.paragraph import Paragraph
 from paragraph_generator.word_groups.sentence import Sentence
 from paragraph_generator.words.noun import Noun
@@ -103,6 +105,37 @@ class TestAnswerChecker(unittest.TestCase):
         }
         self.assertEqual(checker.get_word_hints(), expected)
 
+    def test_get_structured_word_hints(self):
+        submission = 'Me liked squirrels! The squirrels like me.'
+        checker = AnswerChecker(submission, self.test_paragraph)
+        structured = checker.get_structured_word_hints()
+        self.assertEqual(structured['error_count'], 2)
+        self.assertEqual(structured['missing_sentences'], 0)
+        self.assertEqual([(token.kind, token.expected, token.actual) for token in structured['hints'][0].errors()],
+                         [('wrong', 'I', 'Me'), ('wrong', 'like', 'liked')])
+        self.assertEqual(' '.join(hint.hint_sentence for hint in structured['hints']),
+                         checker.get_word_hints()['hint_paragraph'])
+
+    def test_hints_with_renderer(self):
+        submission = 'Me liked squirrels! The squirrels like me.'
+        checker = AnswerChecker(submission, self.test_paragraph)
+        self.assertEqual(checker.get_word_hints(MARKUP), checker.get_word_hints())
+        self.assertEqual(checker.get_word_hints(HTML)['hint_paragraph'],
+                         '<strong>Me</strong> <strong>liked</strong> squirrels! The squirrels like me.')
+        self.assertEqual(checker.get_sentence_hints(HTML)['hint_paragraph'],
+                         '<strong>Me liked squirrels!</strong> The squirrels like me.')
+
+    def test_write_hints(self):
+        submission = 'Me liked squirrels! The squirrels like me.'
+        checker = AnswerChecker(submission, self.test_paragraph)
+        for write, get in ((checker.write_word_hints, checker.get_word_hints),
+                           (checker.write_sentence_hints, checker.get_sentence_hints)):
+            stream = io.StringIO()
+            expected = get(HTML)
+            self.assertEqual(write(stream, HTML), {'error_count': expected['error_count'],
+                                                   'missing_sentences': expected['missing_sentences']})
+            self.assertEqual(stream.getvalue(), expected['hint_paragraph'])
+
     def test_all_functions_switching_periods_and_exclamation_points(self):
         submission = 'I like squirrels. The squirrels like me.'
         checker = AnswerChecker(submission, self.test_paragraph)
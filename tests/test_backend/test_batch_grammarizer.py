@@ -0,0 +1,110 @@
+import random
+import unittest
+
+from paragraph_generator.backend.batch_grammarizer import BatchGrammarizer
+from paragraph_generator.backend.grammarizer import Grammarizer
+from paragraph_generator.backend.random_assignments.assign_random_negatives import assign_random_negatives
+from paragraph_generator.backend.random_assignments.plurals_assignement import PluralsAssignment
+from paragraph_generator.backend.random_assignments.random_paragraph import RandomParagraph
+from paragraph_generator.tags.status_tag import StatusTag
+from paragraph_generator.tags.tags import Tags
+from paragraph_generator.word_groups.columnar import ParagraphBatch, Vocabulary
+from paragraph_generator.word_groups.paragraph import Paragraph
+from paragraph_generator.word_groups.sentence import Sentence
+from paragraph_generator.word_groups.verb_group import VerbGroup
+from paragraph_generator.words.basicword import BasicWord
+from paragraph_generator.words.noun import Noun
+from paragraph_generator.words.pronoun import Pronoun, CapitalPronoun
+from paragraph_generator.words.punctuation import Punctuation
+from paragraph_generator.words.verb import Verb
+
+
+def grammarize_each(paragraphs, tense):
+    method = 'grammarize_to_{}_tense'.format(tense)
+    return [getattr(Grammarizer(paragraph), method)() for paragraph in paragraphs]
+
+
+def grammarize_batch(paragraphs, tense):
+    method = 'grammarize_to_{}_tense'.format(tense)
+    return getattr(BatchGrammarizer.from_paragraphs(paragraphs), method)().to_paragraphs()
+
+
+class TestBatchGrammarizer(unittest.TestCase):
+    def setUp(self):
+        self.verbs = [
+            VerbGroup(Verb('take'), None, BasicWord.particle('away'), 1),
+            VerbGroup(Verb('give'), BasicWord.preposition('to'), None, 2),
+            VerbGroup(Verb('have'), None, None, 1),
+            VerbGroup(Verb('play'), BasicWord.preposition('with'), None, 1),
+        ]
+        self.nouns = [Noun('dog'), Noun('child', 'children'), Noun.uncountable_noun('water'),
+                      Noun.uncountable_noun('air').definite(), Noun.proper_noun('Joe'),
+                      Noun.proper_noun('the Joneses', plural=True)]
+
+    def random_raw_paragraphs(self, count):
+        rng = random.Random(2345)
+        paragraphs = []
+        for index in range(count):
+            generator = RandomParagraph(0.3, self.verbs, self.nouns, rng)
+            raw = generator.create_chain_paragraph(1 + index % 7)
+            with_plurals = PluralsAssignment(raw, rng).assign_random_plurals(0.4)
+            paragraphs.append(assign_random_negatives(with_plurals, 0.3, rng))
+        return paragraphs
+
+    def test_init(self):
+        batch = ParagraphBatch.from_paragraphs([Paragraph([Sentence([Noun('x')])])])
+        self.assertIs(BatchGrammarizer(batch).raw, batch)
+
+    def test_changes_tags(self):
+        tags = Tags([StatusTag.RAW, StatusTag.HAS_PLURALS])
+        paragraphs = [Paragraph([Sentence([Noun('x')])], tags), Paragraph([], Tags([StatusTag.RAW]))]
+        grammarizer = BatchGrammarizer.from_paragraphs(paragraphs)
+        self.assertEqual(grammarizer.grammarize_to_present_tense().tags,
+                         (Tags([StatusTag.HAS_PLURALS, StatusTag.SIMPLE_PRESENT]), Tags([StatusTag.SIMPLE_PRESENT])))
+        self.assertEqual(grammarizer.grammarize_to_past_tense().tags,
+                         (Tags([StatusTag.HAS_PLURALS, StatusTag.SIMPLE_PAST]), Tags([StatusTag.SIMPLE_PAST])))
+
+    def test_articles_are_tracked_per_paragraph(self):
+        sentence = Sentence([Noun('dog'), Verb('like'), Noun('dog'), Punctuation.PERIOD])
+        paragraphs = [Paragraph([sentence, sentence]), Paragraph([sentence])]
+        answer = grammarize_batch(paragraphs, 'present')
+        self.assertEqual(answer, grammarize_each(paragraphs, 'present'))
+        self.assertEqual(str(answer[1]), 'A dog likes the dog.')
+
+    def test_third_person_rules(self):
+        paragraphs = [Paragraph([
+            Sentence([Pronoun.I, Verb('go'), Punctuation.PERIOD]),
+            Sentence([CapitalPronoun.HE, Verb('go'), Punctuation.PERIOD]),
+            Sentence([Noun('dog').plural(), Verb('go').negative(), Punctuation.PERIOD]),
+            Sentence([Noun.uncountable_noun('water'), Verb('have'), Punctuation.PERIOD]),
+            Sentence([Verb('go'), Punctuation.PERIOD]),
+            Sentence([BasicWord('x'), Verb('go')]),
+            Sentence([BasicWord('x')]),
+        ])]
+        answer = grammarize_batch(paragraphs, 'present')
+        self.assertEqual(answer, grammarize_each(paragraphs, 'present'))
+        self.assertEqual(str(answer[0]), 'I go. He goes. Dogs don\'t go. Water has. Go. X go X')
+
+    def test_past_tense(self):
+        paragraphs = [Paragraph([Sentence([Pronoun.I, Verb('go', 'went'), Punctuation.PERIOD]),
+                                 Sentence([BasicWord('x')])])]
+        answer = grammarize_batch(paragraphs, 'past')
+        self.assertEqual(answer, grammarize_each(paragraphs, 'past'))
+        self.assertEqual(str(answer[0]), 'I went. X')
+
+    def test_empty_sentence_raises_index_error_like_grammarizer(self):
+        paragraphs = [Paragraph([Sentence([])])]
+        self.assertRaises(IndexError, grammarize_each, paragraphs, 'present')
+        self.assertRaises(IndexError, grammarize_batch, paragraphs, 'present')
+
+    def test_identical_to_grammarizer_on_random_paragraphs(self):
+        paragraphs = self.random_raw_paragraphs(200)
+        for tense in ('present', 'past'):
+            self.assertEqual(grammarize_batch(paragraphs, tense), grammarize_each(paragraphs, tense))
+
+    def test_shared_vocabulary_across_batches(self):
+        vocabulary = Vocabulary()
+        paragraphs = self.random_raw_paragraphs(20)
+        first = BatchGrammarizer.from_paragraphs(paragraphs[:10], vocabulary).grammarize_to_present_tense()
+        second = BatchGrammarizer.from_paragraphs(paragraphs[10:], vocabulary).grammarize_to_present_tense()
+        self.assertEqual(first.to_paragraphs() + second.to_paragraphs(), grammarize_each(paragraphs, 'present'))
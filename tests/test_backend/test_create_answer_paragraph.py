@@ -1,6 +1,7 @@
 import unittest
 
-from paragraph_generator.backend.create_answer_paragraph import create_answer_paragraph
+from paragraph_generator.backend import create_answer_paragraph as create_answer_module
+from paragraph_generator.backend.create_answer_paragraph import create_answer_paragraph, get_plural_detector
 from paragraph_generator.backend.grammarizer import Grammarizer
 from paragraph_generator.backend.random_assignments.assign_random_negatives import assign_random_negatives
 from paragraph_generator.backend.random_assignments.plurals_assignement import PluralsAssignment
@@ -130,3 +131,28 @@ class TestCreateAnswerParagraph(unittest.TestCase):
 
         self.assertEqual(answer, expected)
         self.assertEqual(str(answer), "A dog didn't like a cat.")
+
+    def test_get_plural_detector(self):
+        paragraph = Paragraph([Sentence([Noun('dog'), Verb('like'), Noun('child', 'children').definite(),
+                                         Noun.uncountable_noun('water'), Noun('dog'), Punctuation.PERIOD])])
+        countable_nouns, detector = get_plural_detector(paragraph)
+        self.assertEqual(countable_nouns, [Noun('dog'), Noun('child', 'children')])
+        self.assertEqual(detector.patterns, ('dogs', 'children'))
+
+    def test_get_plural_detector_is_cached_per_paragraph(self):
+        sentences = [Sentence([Noun('dog'), Verb('like'), Noun('cat'), Punctuation.PERIOD])]
+        paragraph = Paragraph(sentences)
+        detector = get_plural_detector(paragraph)[1]
+        self.assertIs(get_plural_detector(paragraph)[1], detector)
+        self.assertIsNot(get_plural_detector(Paragraph(sentences))[1], detector)
+
+    def test_get_plural_detector_cache_is_cleared_when_full(self):
+        old_max = create_answer_module.MAX_CACHED_PLURAL_DETECTORS
+        create_answer_module.MAX_CACHED_PLURAL_DETECTORS = 2
+        try:
+            paragraphs = [Paragraph([Sentence([Noun('dog')])]) for _ in range(3)]
+            for paragraph in paragraphs:
+                get_plural_detector(paragraph)
+            self.assertEqual(len(create_answer_module._PLURAL_DETECTORS), 1)
+        finally:
+            create_answer_module.MAX_CACHED_PLURAL_DETECTORS = old_max
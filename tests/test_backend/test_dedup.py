@@ -0,0 +1,152 @@
+import os
+import random
+import tempfile
+import unittest
+from hashlib import blake2b
+
+from paragraph_generator.backend.dedup import (
+    BloomFilter, FingerprintSet, paragraph_fingerprint, sentence_fingerprint, word_skeleton
+)
+from paragraph_generator.word_groups.paragraph import Paragraph
+from paragraph_generator.word_groups.sentence import Sentence
+from paragraph_generator.words.basicword import BasicWord
+from paragraph_generator.words.be_verb import BeVerb
+from paragraph_generator.words.noun import Noun
+from paragraph_generator.words.pronoun import CapitalPronoun, Pronoun
+from paragraph_generator.words.punctuation import Punctuation
+from paragraph_generator.words.verb import Verb
+
+
+def fingerprints(count, seed=0):
+    rng = random.Random(seed)
+    return [rng.getrandbits(64).to_bytes(8, 'little') for _ in range(count)]
+
+
+class TestFingerprints(unittest.TestCase):
+    def setUp(self):
+        self.dog_plays = Sentence([Noun('dog'), Verb('play'), Punctuation.PERIOD])
+        self.cat_jumps = Sentence([Noun('cat'), Verb('jump'), BasicWord.preposition('on'), Pronoun.ME,
+                                   Punctuation.PERIOD])
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'index')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_word_skeleton(self):
+        self.assertEqual(word_skeleton(Noun('dog').definite().plural().capitalize()), 'n:dog')
+        self.assertEqual(word_skeleton(Verb('play').negative().past_tense()), 'v:play')
+        self.assertEqual(word_skeleton(BeVerb.WERE), 'v:be')
+        self.assertEqual(word_skeleton(CapitalPronoun.ME), 'p:i')
+        self.assertEqual(word_skeleton(Pronoun.THEM), 'p:they')
+        self.assertEqual(word_skeleton(BasicWord.preposition('With')), 'w:with')
+        self.assertEqual(word_skeleton(Punctuation.EXCLAMATION), '')
+
+    def test_sentence_fingerprint_is_stable(self):
+        fingerprint = sentence_fingerprint(self.dog_plays)
+        self.assertEqual(len(fingerprint), 8)
+        self.assertEqual(fingerprint, sentence_fingerprint(Sentence(list(self.dog_plays))))
+        self.assertEqual(fingerprint, blake2b(b'n:dog v:play', digest_size=8).digest())
+
+    def test_sentence_fingerprint_ignores_inflection_and_punctuation(self):
+        inflected = Sentence([Noun('dog').plural().definite().capitalize(), Verb('play').negative().past_tense(),
+                              Punctuation.EXCLAMATION])
+        self.assertEqual(sentence_fingerprint(self.dog_plays), sentence_fingerprint(inflected))
+
+    def test_sentence_fingerprint_differs_on_words(self):
+        other = Sentence([Noun('cat'), Verb('play'), Punctuation.PERIOD])
+        self.assertNotEqual(sentence_fingerprint(self.dog_plays), sentence_fingerprint(other))
+        swapped = Sentence([Verb('play'), Noun('dog'), Punctuation.PERIOD])
+        self.assertNotEqual(sentence_fingerprint(self.dog_plays), sentence_fingerprint(swapped))
+
+    def test_paragraph_fingerprint_ignores_sentence_order(self):
+        forward = Paragraph([self.dog_plays, self.cat_jumps])
+        backward = Paragraph([self.cat_jumps, self.dog_plays])
+        self.assertEqual(paragraph_fingerprint(forward), paragraph_fingerprint(backward))
+        self.assertNotEqual(paragraph_fingerprint(forward), paragraph_fingerprint(Paragraph([self.dog_plays])))
+
+    def test_fingerprint_set_add_contains_len(self):
+        index = FingerprintSet()
+        first, second = fingerprints(2)
+        self.assertTrue(index.add(first))
+        self.assertFalse(index.add(first))
+        self.assertIn(first, index)
+        self.assertNotIn(second, index)
+        self.assertEqual(len(index), 1)
+
+    def test_fingerprint_set_init_with_fingerprints(self):
+        index = FingerprintSet(fingerprints(10))
+        self.assertEqual(len(index), 10)
+        self.assertFalse(index.add(fingerprints(10)[3]))
+
+    def test_fingerprint_set_save_and_load(self):
+        index = FingerprintSet(fingerprints(100))
+        index.save(self.path)
+        loaded = FingerprintSet.load(self.path)
+        self.assertEqual(len(loaded), 100)
+        for fingerprint in fingerprints(100):
+            self.assertIn(fingerprint, loaded)
+
+    def test_fingerprint_set_load_bad_file(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'PGFPSET1' + b'123')
+        self.assertRaises(ValueError, FingerprintSet.load, self.path)
+        BloomFilter(10).save(self.path)
+        self.assertRaises(ValueError, FingerprintSet.load, self.path)
+
+    def test_bloom_filter_bad_values(self):
+        self.assertRaises(ValueError, BloomFilter, 0)
+        self.assertRaises(ValueError, BloomFilter, 10, 0)
+        self.assertRaises(ValueError, BloomFilter, 10, 1)
+
+    def test_bloom_filter_size(self):
+        index = BloomFilter(1000, 0.01)
+        self.assertEqual(index.num_bits, 9586)
+        self.assertEqual(index.num_hashes, 7)
+
+    def test_bloom_filter_add_contains_len(self):
+        index = BloomFilter(100)
+        first, second = fingerprints(2)
+        self.assertTrue(index.add(first))
+        self.assertFalse(index.add(first))
+        self.assertIn(first, index)
+        self.assertNotIn(second, index)
+        self.assertEqual(len(index), 1)
+
+    def test_bloom_filter_never_misses_what_was_added(self):
+        index = BloomFilter(1000)
+        to_add = fingerprints(1000)
+        for fingerprint in to_add:
+            index.add(fingerprint)
+        for fingerprint in to_add:
+            self.assertIn(fingerprint, index)
+
+    def test_bloom_filter_false_positive_rate_at_capacity(self):
+        index = BloomFilter(5000, 0.01)
+        for fingerprint in fingerprints(5000, seed=1):
+            index.add(fingerprint)
+        false_positives = sum(fingerprint in index for fingerprint in fingerprints(20000, seed=2))
+        self.assertLess(false_positives / 20000, 0.02)
+
+    def test_bloom_filter_save_and_load(self):
+        index = BloomFilter(100)
+        for fingerprint in fingerprints(50):
+            index.add(fingerprint)
+        index.save(self.path)
+        loaded = BloomFilter.load(self.path)
+        self.assertEqual((loaded.num_bits, loaded.num_hashes, len(loaded)),
+                         (index.num_bits, index.num_hashes, len(index)))
+        for fingerprint in fingerprints(50):
+            self.assertIn(fingerprint, loaded)
+        self.assertTrue(loaded.add(fingerprints(51)[-1]))
+
+    def test_bloom_filter_load_bad_file(self):
+        FingerprintSet(fingerprints(3)).save(self.path)
+        self.assertRaises(ValueError, BloomFilter.load, self.path)
+
+        BloomFilter(100).save(self.path)
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        with open(self.path, 'wb') as f:
+            f.write(data[:-1])
+        self.assertRaises(ValueError, BloomFilter.load, self.path)
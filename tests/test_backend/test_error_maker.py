@@ -1,7 +1,11 @@
 import random
 import unittest
+from collections import Counter
 
-from paragraph_generator.backend.error_maker import make_verb_error, make_noun_error, ErrorMaker, get_be_verb
+from paragraph_generator.backend import error_maker as error_maker_module
+from paragraph_generator.backend.error_maker import (make_verb_error, make_noun_error, ErrorMaker, get_be_verb,
+                                                     ERROR_ORDER, get_noun_error_choices, get_verb_error_choices,
+                                                     add_cached_error_choices, get_cached_error_choices)
 from paragraph_generator.tags.status_tag import StatusTag
 from paragraph_generator.tags.tags import Tags
 from paragraph_generator.tags.wordtag import WordTag
@@ -105,6 +109,45 @@ class TestErrorMaker(unittest.TestCase):
             else:
                 self.assertEqual(Verb("don't play", '', 'play', tags=self.negative), to_test)
 
+    def test_get_noun_error_choices_are_cached(self):
+        choices = get_noun_error_choices(Noun('dog').definite())
+        self.assertIs(get_noun_error_choices(Noun('dog').definite()), choices)
+        self.assertEqual(choices, (Noun('dog'),) * 3 + (Noun('dog').indefinite(), Noun('dog').plural(),
+                                                         Noun('dog').plural().indefinite()))
+        self.assertIsNot(get_noun_error_choices(Noun('dog').indefinite()), choices)
+        self.assertIsNot(get_noun_error_choices(Noun('dog').definite().capitalize()), choices)
+
+    def test_get_verb_error_choices_are_cached(self):
+        choices = get_verb_error_choices(Verb('go', 'went').past_tense())
+        self.assertIs(get_verb_error_choices(Verb('go', 'went').past_tense()), choices)
+        self.assertEqual(choices, (Verb('go', 'went'), Verb('go', 'went').third_person()))
+        self.assertIsNot(get_verb_error_choices(Verb('go', 'went').past_tense().negative()), choices)
+
+    def test_error_choices_cache_starts_over_when_full(self):
+        old_max = error_maker_module.MAX_CACHED_ERROR_CHOICES
+        error_maker_module.MAX_CACHED_ERROR_CHOICES = 2
+        try:
+            nouns = [Noun('a'), Noun('b'), Noun('c')]
+            first = get_noun_error_choices(nouns[0])
+            for noun in nouns:
+                get_noun_error_choices(noun)
+            self.assertLessEqual(len(error_maker_module._NOUN_ERROR_CHOICES), 2)
+            self.assertIsNot(get_noun_error_choices(nouns[0]), first)
+            self.assertEqual(get_noun_error_choices(nouns[0]), first)
+        finally:
+            error_maker_module.MAX_CACHED_ERROR_CHOICES = old_max
+
+    def test_get_cached_error_choices_and_add_cached_error_choices(self):
+        noun_choices = get_noun_error_choices(Noun('elk').plural())
+        verb_choices = get_verb_error_choices(Verb('hum').third_person())
+        cached = get_cached_error_choices()
+        error_maker_module._NOUN_ERROR_CHOICES.clear()
+        error_maker_module._VERB_ERROR_CHOICES.clear()
+        add_cached_error_choices(cached)
+        self.assertIs(get_noun_error_choices(Noun('elk').plural()), noun_choices)
+        self.assertIs(get_verb_error_choices(Verb('hum').third_person()), verb_choices)
+        self.assertEqual(get_cached_error_choices(), cached)
+
     def test_make_noun_error_proper_no_article(self):
         random.seed(191)
         noun = Noun.proper_noun('Joe')
@@ -813,3 +856,172 @@ class TestErrorMaker(unittest.TestCase):
 
         self.assertEqual(str(verb_error.get_paragraph()), expected_verb_error)
         self.assertEqual(str(verb_is_do_error.get_paragraph()), expected_verb_is_do_error)
+
+    def composite_paragraph(self):
+        sentences = [
+            Sentence([CapitalPronoun.I, Verb('play'), BasicWord.preposition('with'), Noun('dog').definite(),
+                      Punctuation.PERIOD]),
+            Sentence([Noun('cat').definite().capitalize(), Verb('like').third_person(), Pronoun.HIM,
+                      Punctuation.EXCLAMATION]),
+            Sentence([CapitalPronoun.HE, Verb('go', 'went').past_tense(), Punctuation.PERIOD]),
+        ]
+        return Paragraph(sentences, Tags([StatusTag.SIMPLE_PRESENT]))
+
+    def chained(self, paragraph, p_errors, rng=None):
+        method_names = {
+            StatusTag.NOUN_ERRORS: 'noun_errors',
+            StatusTag.PRONOUN_ERRORS: 'pronoun_errors',
+            StatusTag.VERB_ERRORS: 'verb_errors',
+            StatusTag.IS_DO_ERRORS: 'is_do_errors',
+            StatusTag.PUNCTUATION_ERRORS: 'punctuation_errors',
+            StatusTag.PREPOSITION_ERRORS: 'preposition_errors',
+        }
+        error_maker = ErrorMaker(paragraph, rng)
+        for tag in ERROR_ORDER:
+            if tag in p_errors:
+                error_maker = getattr(error_maker, method_names[tag])(p_errors[tag])
+        return error_maker.get_paragraph()
+
+    def test_composite_errors_no_errors(self):
+        paragraph = self.composite_paragraph()
+        self.assertEqual(ErrorMaker(paragraph).composite_errors({}).get_paragraph(), paragraph)
+
+    def test_composite_errors_p_error_zero_only_sets_tags(self):
+        paragraph = self.composite_paragraph()
+        p_errors = {tag: 0.0 for tag in ERROR_ORDER}
+        answer = ErrorMaker(paragraph).composite_errors(p_errors).get_paragraph()
+        self.assertEqual(answer.sentence_list(), paragraph.sentence_list())
+        self.assertEqual(answer.tags, Tags([StatusTag.SIMPLE_PRESENT] + list(ERROR_ORDER)))
+
+    def test_composite_errors_unknown_error_type(self):
+        error_maker = ErrorMaker(self.composite_paragraph())
+        self.assertRaises(ValueError, error_maker.composite_errors, {StatusTag.RAW: 1.0})
+
+    def test_composite_errors_same_as_chained_when_every_error_is_made(self):
+        class LastChoice(random.Random):
+            def random(self):
+                return 0.0
+
+            def choice(self, seq):
+                return seq[-1]
+
+        paragraph = self.composite_paragraph()
+        for length in range(len(ERROR_ORDER) + 1):
+            p_errors = {tag: 1.0 for tag in ERROR_ORDER[:length]}
+            composite = ErrorMaker(paragraph, LastChoice()).composite_errors(p_errors).get_paragraph()
+            self.assertEqual(composite, self.chained(paragraph, p_errors, LastChoice()))
+
+    def test_composite_errors_punctuation_errors_decapitalize_next_sentence(self):
+        p_errors = {StatusTag.PUNCTUATION_ERRORS: 1.0, StatusTag.PRONOUN_ERRORS: 1.0}
+        answer = ErrorMaker(self.composite_paragraph()).composite_errors(p_errors).get_paragraph()
+        self.assertEqual(str(answer), 'Me play with the dog, the cat likes he, him went,')
+
+    def test_composite_errors_same_distribution_as_chained(self):
+        paragraph = self.composite_paragraph()
+        p_errors = {tag: 0.5 for tag in ERROR_ORDER}
+        runs = 2000
+        rng = random.Random(2468)
+        composite = Counter(str(ErrorMaker(paragraph, rng).composite_errors(p_errors).get_paragraph())
+                            for _ in range(runs))
+        chained = Counter(str(self.chained(paragraph, p_errors, rng)) for _ in range(runs))
+
+        for position in range(len(paragraph)):
+            composite_sentences = Counter()
+            chained_sentences = Counter()
+            for counter, sentences in ((composite, composite_sentences), (chained, chained_sentences)):
+                for text, count in counter.items():
+                    sentences[_split_sentences(text)[position]] += count
+            for text in set(composite_sentences) | set(chained_sentences):
+                self.assertAlmostEqual(composite_sentences[text] / runs, chained_sentences[text] / runs, delta=0.05)
+
+    def exact_paragraph(self):
+        sentences = [
+            Sentence([Noun('dog').definite().capitalize(), Verb('play').third_person(), BasicWord.preposition('with'),
+                      Noun('cat').indefinite(), Punctuation.PERIOD]),
+            Sentence([CapitalPronoun.HE, BeVerb.IS, Noun('dog').indefinite(), Punctuation.EXCLAMATION]),
+            Sentence([Noun('cat').plural().capitalize(), Verb('like'), Pronoun.HIM, Punctuation.PERIOD]),
+        ]
+        return Paragraph(sentences, Tags([StatusTag.SIMPLE_PRESENT]))
+
+    def count_changed_words(self, paragraph, error_paragraph):
+        changed = 0
+        for sentence, error_sentence in zip(paragraph, error_paragraph):
+            for word, error_word in zip(sentence, error_sentence):
+                if word.value.lower() != error_word.value.lower():
+                    changed += 1
+        return changed
+
+    def test_exact_errors_makes_exactly_count_errors(self):
+        paragraph = self.exact_paragraph()
+        error_types = [StatusTag.NOUN_ERRORS, StatusTag.PRONOUN_ERRORS, StatusTag.VERB_ERRORS,
+                       StatusTag.PUNCTUATION_ERRORS]
+        places = 5 + 1 + 2 + 3
+        rng = random.Random(8)
+        for count in range(places + 1):
+            for _ in range(10):
+                error_paragraph = ErrorMaker(paragraph, rng).exact_errors(error_types, count).get_paragraph()
+                self.assertEqual(self.count_changed_words(paragraph, error_paragraph), count)
+
+    def test_exact_errors_sets_tags_for_every_error_type(self):
+        paragraph = self.exact_paragraph()
+        error_types = [StatusTag.NOUN_ERRORS, StatusTag.IS_DO_ERRORS]
+        answer = ErrorMaker(paragraph).exact_errors(error_types, 0).get_paragraph()
+        self.assertEqual(answer.sentence_list(), paragraph.sentence_list())
+        self.assertEqual(answer.tags, Tags([StatusTag.SIMPLE_PRESENT, StatusTag.NOUN_ERRORS, StatusTag.IS_DO_ERRORS]))
+
+    def test_exact_errors_all_places(self):
+        paragraph = self.exact_paragraph()
+        error_maker = ErrorMaker(paragraph)
+
+        answer = error_maker.exact_errors([StatusTag.IS_DO_ERRORS, StatusTag.PREPOSITION_ERRORS], 3).get_paragraph()
+        expected = 'The dog with a cat is play. He is a dog! Cats are like him.'
+        self.assertEqual(str(answer), expected)
+
+        answer = error_maker.exact_errors([StatusTag.PUNCTUATION_ERRORS], 3).get_paragraph()
+        self.assertEqual(str(answer), 'The dog plays with a cat, he is a dog, cats like him,')
+
+    def test_exact_errors_too_many(self):
+        error_maker = ErrorMaker(self.exact_paragraph())
+        self.assertRaises(ValueError, error_maker.exact_errors, [StatusTag.IS_DO_ERRORS], 3)
+        self.assertRaises(ValueError, error_maker.exact_errors, [StatusTag.IS_DO_ERRORS], (3, 5))
+        self.assertRaises(ValueError, error_maker.exact_errors, [StatusTag.PREPOSITION_ERRORS], 2)
+
+    def test_exact_errors_bad_count(self):
+        error_maker = ErrorMaker(self.exact_paragraph())
+        self.assertRaises(ValueError, error_maker.exact_errors, [StatusTag.NOUN_ERRORS], -1)
+        self.assertRaises(ValueError, error_maker.exact_errors, [StatusTag.NOUN_ERRORS], (3, 2))
+        self.assertRaises(ValueError, error_maker.exact_errors, [StatusTag.RAW], 1)
+
+    def test_exact_errors_range(self):
+        paragraph = self.exact_paragraph()
+        rng = random.Random(3)
+        counts = set()
+        for _ in range(100):
+            error_paragraph = ErrorMaker(paragraph, rng).exact_errors([StatusTag.NOUN_ERRORS], (2, 10)).get_paragraph()
+            counts.add(self.count_changed_words(paragraph, error_paragraph))
+        self.assertEqual(counts, {2, 3, 4})
+
+    def test_exact_errors_every_place_equally_likely(self):
+        paragraph = self.exact_paragraph()
+        rng = random.Random(5)
+        runs = 900
+        chosen = Counter()
+        for _ in range(runs):
+            error_paragraph = ErrorMaker(paragraph, rng).exact_errors([StatusTag.VERB_ERRORS, StatusTag.PRONOUN_ERRORS],
+                                                                     1).get_paragraph()
+            for s_index, sentence in enumerate(error_paragraph):
+                for w_index, word in enumerate(sentence):
+                    if word != paragraph.get_sentence(s_index).get(w_index):
+                        chosen[(s_index, w_index)] += 1
+        self.assertEqual(set(chosen), {(0, 1), (1, 0), (2, 1), (2, 2)})
+        for count in chosen.values():
+            self.assertAlmostEqual(count / runs, 0.25, delta=0.05)
+
+
+def _split_sentences(text):
+    answer = ['']
+    for char in text:
+        answer[-1] += char
+        if char in '.!,':
+            answer.append('')
+    return [sentence.strip() for sentence in answer[:-1]]
@@ -1,9 +1,12 @@
+import io
 import unittest
 
 from paragraph_generator.backend.paragraph_comparison import (
     ParagraphComparison, find_noun_group, find_verb_group, find_word,
-    find_word_group, compare_sentences,
+    find_word_group, compare_sentences, sentence_word_hint, HintToken, CORRECT, WRONG, MISSING, EXTRA, OUT_OF_ORDER,
+    ERROR_KINDS,
     get_word_locations, filter_locations, get_word, get_punctuation, find_pronoun)
+from paragraph_generator.rendering import MARKDOWN, MARKUP, PLAIN
 from paragraph_generator.word_groups.paragraph import Paragraph
 from paragraph_generator.word_groups.sentence import Sentence
 from paragraph_generator.words.basicword import BasicWord
@@ -168,6 +171,51 @@ class TestParagraphComparison(unittest.TestCase):
         }
         self.assertEqual(hints, expected)
 
+    def test_compare_by_words_renderer(self):
+        answer = Paragraph([Sentence([Noun('dog').definite(), Punctuation.PERIOD]),
+                            Sentence([Noun('cat').plural(), Punctuation.PERIOD])])
+        comparitor = ParagraphComparison(answer, 'a dog. The cats. Extra')
+        self.assertEqual(comparitor.compare_by_words(MARKUP), comparitor.compare_by_words())
+        self.assertEqual(comparitor.compare_by_words(PLAIN)['hint_paragraph'], 'a dog. The cats. Extra')
+        self.assertEqual(comparitor.compare_by_words(MARKDOWN)['hint_paragraph'],
+                         '**a dog**. **The cats**. **Extra**')
+        self.assertEqual(comparitor.compare_by_words_with_missed(PLAIN)[1],
+                         comparitor.compare_by_words_with_missed()[1])
+
+    def test_compare_by_sentences_renderer(self):
+        answer = Paragraph([Sentence([BasicWord('a'), Punctuation.PERIOD]),
+                            Sentence([BasicWord('b'), Punctuation.PERIOD])])
+        comparitor = ParagraphComparison(answer, 'a. c.')
+        self.assertEqual(comparitor.compare_by_sentences(MARKUP), comparitor.compare_by_sentences())
+        self.assertEqual(comparitor.compare_by_sentences(MARKDOWN)['hint_paragraph'], 'a. **c.**')
+
+    def test_compare_by_words_structured(self):
+        answer = Paragraph([Sentence([Noun('dog').definite(), Punctuation.PERIOD]),
+                            Sentence([Noun('cat').plural(), Punctuation.PERIOD])])
+        comparitor = ParagraphComparison(answer, 'a dog. The cats. Extra')
+        structured = comparitor.compare_by_words_structured()
+        hints, missed = comparitor.compare_by_words_with_missed()
+        self.assertEqual(structured['error_count'], hints['error_count'])
+        self.assertEqual(structured['missing_sentences'], -1)
+        self.assertEqual(len(structured['hints']), 3)
+        self.assertEqual(' '.join(hint.hint_sentence for hint in structured['hints']), hints['hint_paragraph'])
+        self.assertEqual([(s_index, w_index) for s_index, hint in enumerate(structured['hints'])
+                          for w_index in hint.missed], missed)
+        self.assertEqual([token.kind for hint in structured['hints'] for token in hint.tokens],
+                         [WRONG, CORRECT, WRONG, CORRECT, EXTRA])
+
+    def test_write_hints(self):
+        answer = Paragraph([Sentence([Noun('dog').definite(), Punctuation.PERIOD]),
+                            Sentence([Noun('cat').plural(), Punctuation.PERIOD])])
+        comparitor = ParagraphComparison(answer, 'a dog.')
+        stream = io.StringIO()
+        self.assertEqual(comparitor.write_word_hints(stream, MARKUP), {'error_count': 3, 'missing_sentences': 1})
+        self.assertEqual(stream.getvalue(), comparitor.compare_by_words()['hint_paragraph'])
+
+        stream = io.StringIO()
+        self.assertEqual(comparitor.write_sentence_hints(stream, MARKUP), {'error_count': 1, 'missing_sentences': 1})
+        self.assertEqual(stream.getvalue(), comparitor.compare_by_sentences()['hint_paragraph'])
+
     def test_compare_by_words_noun_errors(self):
         answer = Paragraph([Sentence([Noun('dog').definite(), Punctuation.PERIOD]),
                             Sentence([Noun('cat').plural(), Punctuation.PERIOD])])
@@ -835,3 +883,53 @@ class TestParagraphComparisonHelperFunctions(unittest.TestCase):
             'error_count': 2
         }
         self.assertEqual(answer, expected)
+
+    def test_sentence_word_hint(self):
+        sentence = Sentence([Noun('dog').definite(), Verb('go'), Punctuation.PERIOD])
+        hint = sentence_word_hint(sentence, 'go the dog.')
+        self.assertEqual(hint.words, Sentence([BasicWord('go').bold(), BasicWord('the dog'), Punctuation.PERIOD]))
+        self.assertEqual(hint.error_count, 1)
+        self.assertEqual(hint.missed, [1])
+        self.assertEqual(hint.tokens, (HintToken(0, 2, OUT_OF_ORDER, 'go', 'go', 1),
+                                       HintToken(3, 10, CORRECT, 'the dog', 'the dog', 0),
+                                       HintToken(10, 11, CORRECT, '.', '.', 2)))
+        self.assertEqual(hint.hint_sentence, '<bold>go</bold> the dog.')
+        self.assertEqual(hint.to_dict(), compare_sentences(sentence, 'go the dog.'))
+
+    def test_sentence_word_hint_error_kinds(self):
+        sentence = Sentence([Noun('dog').definite().capitalize(), Verb('play').past_tense(), Noun('bone').indefinite(),
+                             Punctuation.PERIOD])
+        submission = 'The dog plays big a bone?'
+        hint = sentence_word_hint(sentence, submission)
+        self.assertEqual(hint.tokens, (HintToken(0, 7, CORRECT, 'The dog', 'The dog', 0),
+                                       HintToken(8, 13, WRONG, 'played', 'plays', 1),
+                                       HintToken(14, 17, EXTRA, None, 'big', None),
+                                       HintToken(18, 24, CORRECT, 'a bone', 'a bone', 2),
+                                       HintToken(24, 25, WRONG, '.', '?', 3)))
+        self.assertEqual(hint.errors(), [token for token in hint.tokens if token.kind in ERROR_KINDS])
+        self.assertEqual(hint.error_count, len(hint.errors()))
+        self.assertEqual(hint.missed, [1, 3])
+        for token in hint.tokens:
+            self.assertEqual(submission[token.start: token.end], token.actual)
+
+    def test_sentence_word_hint_missing(self):
+        sentence = Sentence([Noun('dog').definite().capitalize(), Verb('play').past_tense(), Punctuation.PERIOD])
+        hint = sentence_word_hint(sentence, 'The dog')
+        self.assertEqual(hint.errors(), [HintToken(7, 7, MISSING, 'played', None, 1),
+                                         HintToken(7, 7, MISSING, '.', None, 2)])
+        self.assertIsNone(hint._tokens)
+        self.assertEqual(hint.tokens, (HintToken(0, 7, CORRECT, 'The dog', 'The dog', 0),
+                                       HintToken(7, 7, MISSING, 'played', None, 1),
+                                       HintToken(7, 7, MISSING, '.', None, 2)))
+        self.assertEqual(hint.hint_sentence, 'The dog <bold>MISSING</bold> <bold>MISSING</bold>')
+        self.assertEqual(hint.render(MARKDOWN), 'The dog **MISSING** **MISSING**')
+
+    def test_sentence_hint_makes_tokens_and_string_once_when_asked(self):
+        hint = sentence_word_hint(Sentence([BasicWord('a'), Punctuation.PERIOD]), 'b.')
+        self.assertIsNone(hint._tokens)
+        self.assertIsNone(hint.words._str)
+        self.assertIs(hint.hint_sentence, hint.hint_sentence)
+        self.assertIs(hint.tokens, hint.tokens)
+        stream = io.StringIO()
+        hint.write(stream, PLAIN)
+        self.assertEqual(stream.getvalue(), 'MISSING b.')
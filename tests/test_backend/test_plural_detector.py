@@ -0,0 +1,82 @@
+import random
+import threading
+import unittest
+
+from paragraph_generator.backend import plural_detector
+from paragraph_generator.backend.plural_detector import PluralDetector
+
+
+class TestPluralDetector(unittest.TestCase):
+    def assert_same_as_in(self, patterns, text):
+        expected = tuple(index for index, pattern in enumerate(patterns) if pattern in text)
+        detector = PluralDetector(patterns)
+        self.assertEqual(detector.find(text), expected)
+        self.assertEqual(detector.scan(text), expected)
+
+    def test_patterns(self):
+        self.assertEqual(PluralDetector(iter(['dogs', 'cats'])).patterns, ('dogs', 'cats'))
+
+    def test_no_patterns(self):
+        self.assertEqual(PluralDetector([]).scan('dogs'), ())
+
+    def test_find(self):
+        detector = PluralDetector(['dogs', 'cats', 'children'])
+        self.assertEqual(detector.find('the children like cats.'), (1, 2))
+        self.assertEqual(detector.scan('the children like cats.'), (1, 2))
+        self.assertEqual(detector.scan('a dog likes a cat.'), ())
+
+    def test_overlapping_and_nested_patterns(self):
+        patterns = ['mice', 'dormice', 'ice', 'ices', 'sheep', 'he', 'hers']
+        for text in ('dormice', 'ushers', 'sheepdormices', 'she', 'icicle'):
+            self.assert_same_as_in(patterns, text)
+
+    def test_repeated_and_empty_patterns(self):
+        self.assert_same_as_in(['dogs', 'dogs', ''], 'hotdogs')
+        self.assert_same_as_in(['', 'a'], '')
+
+    def test_same_as_in_for_random_patterns(self):
+        rng = random.Random(3)
+        for _ in range(500):
+            patterns = [''.join(rng.choice('abc') for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(0, 8))]
+            text = ''.join(rng.choice('abcd') for _ in range(rng.randint(0, 30)))
+            self.assert_same_as_in(patterns, text)
+
+    def test_find_scans_when_there_are_enough_patterns(self):
+        old_min = plural_detector.MIN_PATTERNS_TO_SCAN
+        try:
+            plural_detector.MIN_PATTERNS_TO_SCAN = 3
+            few = PluralDetector(['ab', 'b'])
+            self.assertEqual(few.find('abc'), (0, 1))
+            self.assertIsNone(few._automaton)
+
+            enough = PluralDetector(['ab', 'b', 'ca'])
+            self.assertEqual(enough.find('abc'), (0, 1))
+            self.assertIsNotNone(enough._automaton)
+        finally:
+            plural_detector.MIN_PATTERNS_TO_SCAN = old_min
+
+    def test_goto_only_has_trie_edges(self):
+        patterns = ['he', 'she', 'his', 'hers']
+        goto, _, _ = PluralDetector(patterns)._get_automaton()
+        self.assertEqual(sum(len(edges) for edges in goto), len(goto) - 1)
+
+    def test_threads_scanning_a_new_detector(self):
+        rng = random.Random(5)
+        patterns = [''.join(rng.choice('abcdef') for _ in range(rng.randint(2, 8))) for _ in range(3000)]
+        texts = [''.join(rng.choice('abcdefg ') for _ in range(200)) for _ in range(4)]
+        expected = [tuple(index for index, pattern in enumerate(patterns) if pattern in text) for text in texts]
+        for _ in range(5):
+            detector = PluralDetector(patterns)
+            barrier = threading.Barrier(len(texts))
+            results = [None] * len(texts)
+
+            def work(index):
+                barrier.wait()
+                results[index] = detector.scan(texts[index])
+
+            threads = [threading.Thread(target=work, args=(index,)) for index in range(len(texts))]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(results, expected)
@@ -51,3 +51,20 @@ class TestAssignRandomNegatives(unittest.TestCase):
                 indices = self.paragraph.find(verb)[0]
                 expected = expected.set(*indices, verb.negative())
             self.assertEqual(to_test.sentence_list(), expected.sentence_list())
+
+    def test_minimum_with_p_negative_zero(self):
+        rng = random.Random(5)
+        for _ in range(10):
+            to_test = assign_random_negatives(self.paragraph, 0.0, rng, minimum=1)
+            negatives = [word for word in to_test.all_words() if word in (Verb('b').negative(), Verb('e').negative())]
+            self.assertEqual(len(negatives), 1)
+            self.assertEqual(to_test.tags, self.tags.add(StatusTag.HAS_NEGATIVES))
+
+    def test_minimum_all_verbs(self):
+        expected_list = [Sentence([BasicWord('a'), Verb('b').negative(), BasicWord('c')]),
+                         Sentence([BasicWord('d'), Verb('e').negative()])]
+        to_test = assign_random_negatives(self.paragraph, 0.1, minimum=2)
+        self.assertEqual(to_test.sentence_list(), expected_list)
+
+    def test_minimum_more_than_verbs(self):
+        self.assertRaises(ValueError, assign_random_negatives, self.paragraph, 0.5, None, 3)
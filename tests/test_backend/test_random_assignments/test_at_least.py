@@ -0,0 +1,53 @@
+import random
+import unittest
+from collections import Counter
+from math import comb
+
+from paragraph_generator.backend.random_assignments.at_least import choose_at_least, draw_count
+
+
+class TestAtLeast(unittest.TestCase):
+    def test_choose_at_least_zero_is_independent_choices(self):
+        items = list(range(20))
+        random.seed(4)
+        expected = [item for item in items if random.random() < 0.4]
+        random.seed(4)
+        self.assertEqual(choose_at_least(items, 0.4, 0), expected)
+
+    def test_choose_at_least_too_few_items(self):
+        self.assertRaises(ValueError, choose_at_least, [1, 2], 0.5, 3)
+
+    def test_choose_at_least_p_lte_zero(self):
+        rng = random.Random(1)
+        for _ in range(20):
+            self.assertEqual(len(choose_at_least(list(range(5)), 0.0, 2, rng)), 2)
+            self.assertEqual(len(choose_at_least(list(range(5)), -1, 2, rng)), 2)
+
+    def test_choose_at_least_p_gte_one(self):
+        self.assertEqual(choose_at_least([3, 1, 2], 1.0, 1), [3, 1, 2])
+
+    def test_choose_at_least_keeps_order(self):
+        rng = random.Random(2)
+        items = ['e', 'd', 'c', 'b', 'a']
+        for _ in range(20):
+            chosen = choose_at_least(items, 0.5, 2, rng)
+            self.assertEqual(chosen, [item for item in items if item in chosen])
+            self.assertGreaterEqual(len(chosen), 2)
+
+    def test_draw_count_is_conditional_binomial(self):
+        size, p_choose, minimum = 6, 0.3, 2
+        weights = {count: comb(size, count) * p_choose ** count * (1 - p_choose) ** (size - count)
+                   for count in range(minimum, size + 1)}
+        total = sum(weights.values())
+
+        runs = 5000
+        rng = random.Random(3)
+        counts = Counter(draw_count(size, p_choose, minimum, rng) for _ in range(runs))
+        self.assertTrue(set(counts).issubset(weights))
+        for count, weight in weights.items():
+            self.assertAlmostEqual(counts[count] / runs, weight / total, delta=0.02)
+
+    def test_draw_count_large_size(self):
+        count = draw_count(5000, 0.001, 100, random.Random(4))
+        self.assertGreaterEqual(count, 100)
+        self.assertLess(count, 200)
@@ -5,6 +5,7 @@ from paragraph_generator.backend.random_assignments.plurals_assignement import (
                                                                                 is_countable_noun)
 from paragraph_generator.tags.status_tag import StatusTag
 from paragraph_generator.tags.tags import Tags
+from paragraph_generator.tags.wordtag import WordTag
 from paragraph_generator.word_groups.paragraph import Paragraph
 from paragraph_generator.word_groups.sentence import Sentence
 from paragraph_generator.words.basicword import BasicWord
@@ -132,3 +133,21 @@ class TestPluralsAssignment(unittest.TestCase):
         paragraph = Paragraph([], Tags([StatusTag.RAW]))
         answer = PluralsAssignment(paragraph).assign_random_plurals(0.5)
         self.assertEqual(answer.tags, Tags([StatusTag.RAW, StatusTag.HAS_PLURALS]))
+
+    def test_assign_random_plurals_minimum_irregular(self):
+        paragraph = Paragraph([Sentence([Noun('child', 'children'), Noun('dog')]),
+                               Sentence([Noun('mouse', 'mice'), Noun('child', 'children').definite()])])
+        pa = PluralsAssignment(paragraph, random.Random(6))
+        irregular_plurals = (Noun('child', 'children').plural(), Noun('mouse', 'mice').plural())
+        for _ in range(10):
+            new_paragraph = pa.assign_random_plurals(0.0, minimum_irregular=1)
+            plurals = {word for word in new_paragraph.all_words() if word.has_tags(WordTag.PLURAL)}
+            self.assertEqual(len(plurals), 1)
+            self.assertIn(plurals.pop(), irregular_plurals)
+
+        new_paragraph = pa.assign_random_plurals(0.0, minimum_irregular=2)
+        self.assertEqual(new_paragraph, pa.assign_plural([Noun('child', 'children'), Noun('mouse', 'mice')]))
+
+    def test_assign_random_plurals_minimum_irregular_too_few(self):
+        pa = PluralsAssignment(Paragraph([Sentence([Noun('child', 'children'), Noun('dog')])]))
+        self.assertRaises(ValueError, pa.assign_random_plurals, 0.5, 2)
@@ -165,3 +165,43 @@ class TestRandomParagraph(unittest.TestCase):
         ]
         expected = Paragraph(sentences, self.raw_tags)
         self.assertEqual(answer, expected)
+
+    def test_distinct_verbs(self):
+        rp = RandomParagraph(0.2, self.verbs, self.countable, random.Random(7))
+        for _ in range(10):
+            answer = rp.distinct_verbs(5, 3)
+            self.assertEqual(len(answer), 3)
+            self.assertTrue(set(answer).issubset(range(5)))
+            self.assertEqual(len({verb_group.verb for verb_group in answer.values()}), 3)
+        self.assertEqual(rp.distinct_verbs(5, 0), {})
+
+    def test_distinct_verbs_too_many(self):
+        self.assertRaises(ValueError, self.rp.distinct_verbs, 5, 4)
+        self.assertRaises(ValueError, self.rp.distinct_verbs, 2, 3)
+
+    def test_create_chain_paragraph_min_distinct_verbs(self):
+        rp = RandomParagraph(0.2, self.verbs, self.countable, random.Random(8))
+        for _ in range(10):
+            paragraph = rp.create_chain_paragraph(3, min_distinct_verbs=3)
+            verbs = {sentence.get(sentence.get_verb()) for sentence in paragraph}
+            self.assertEqual(verbs, {Verb('eat'), Verb('give'), Verb('jump')})
+
+    def test_create_pool_paragraph_min_distinct_verbs(self):
+        rp = RandomParagraph(0.2, self.verbs, self.countable, random.Random(9))
+        for _ in range(10):
+            paragraph = rp.create_pool_paragraph(2, 3, min_distinct_verbs=3)
+            verbs = {sentence.get(sentence.get_verb()) for sentence in paragraph}
+            self.assertEqual(verbs, {Verb('eat'), Verb('give'), Verb('jump')})
+
+    def test_create_chain_paragraph_required_subject(self):
+        rp = RandomParagraph(0.2, self.verbs, self.countable, random.Random(10))
+        paragraph = rp.create_chain_paragraph(3, required_subject=Noun('mouse', 'mice'))
+        self.assertEqual(paragraph.get_sentence(0).get(0), Noun('mouse', 'mice'))
+
+    def test_create_pool_paragraph_required_subject(self):
+        rp = RandomParagraph(0.2, self.verbs, self.countable, random.Random(11))
+        for _ in range(10):
+            paragraph = rp.create_pool_paragraph(3, 4, required_subject=Noun('mouse', 'mice'))
+            subjects = [sentence.get(0) for sentence in paragraph]
+            self.assertIn(Noun('mouse', 'mice'), subjects)
+            self.assertLessEqual(len(set(subjects)), 3)
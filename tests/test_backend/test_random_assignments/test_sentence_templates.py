@@ -0,0 +1,95 @@
+import random
+import unittest
+from itertools import product
+
+from paragraph_generator.backend.random_assignments.random_sentences import RandomSentences
+from paragraph_generator.backend.random_assignments.sentence_templates import (
+    SentenceTemplates, assign_objects, build_template, fill_template, get_shape, PARTICLE, PREPOSITION, VERB
+)
+from paragraph_generator.word_groups.verb_group import VerbGroup
+from paragraph_generator.word_lists import WordLists
+from paragraph_generator.words.basicword import BasicWord
+from paragraph_generator.words.noun import Noun
+from paragraph_generator.words.pronoun import Pronoun
+from paragraph_generator.words.verb import Verb
+
+
+class TestSentenceTemplates(unittest.TestCase):
+    def setUp(self):
+        self.prepositions = [None, BasicWord.preposition('with')]
+        self.particles = [None, BasicWord.particle('away'), BasicWord('odd')]
+        self.nouns = [Noun('dog'), Noun('cat'), Noun('pig')]
+        self.pronouns = [Pronoun.HIM, Pronoun.US, Pronoun.IT]
+
+    def all_verb_groups(self):
+        return [VerbGroup(Verb('take'), preposition, particle, objects)
+                for preposition, particle, objects in product(self.prepositions, self.particles, range(4))]
+
+    def test_get_shape(self):
+        verb_group = VerbGroup(Verb('take'), BasicWord.preposition('to'), BasicWord.particle('away'), 2)
+        self.assertEqual(get_shape(verb_group), (True, True, 2))
+
+        verb_group = VerbGroup(Verb('take'), None, BasicWord('away'), 1)
+        self.assertEqual(get_shape(verb_group), (False, False, 1))
+
+        verb_group = VerbGroup(Verb('take'), None, None, 0)
+        self.assertEqual(get_shape(verb_group), (False, None, 0))
+
+    def test_build_template_no_objects(self):
+        self.assertEqual(build_template((False, None, 0), ()), (VERB,))
+        self.assertEqual(build_template((True, True, 0), ()), (VERB, PARTICLE, PREPOSITION))
+
+    def test_build_template_pronoun_before_particle(self):
+        self.assertEqual(build_template((False, True, 1), (True,)), (VERB, 0, PARTICLE))
+        self.assertEqual(build_template((False, True, 1), (False,)), (VERB, PARTICLE, 0))
+
+    def test_build_template_two_objects_with_preposition(self):
+        self.assertEqual(build_template((True, None, 2), (False, False)), (VERB, 0, PREPOSITION, 1))
+
+    def test_fill_template_matches_assign_objects_for_every_shape_and_kind_of_object(self):
+        templates = SentenceTemplates(self.all_verb_groups())
+        for verb_group in self.all_verb_groups():
+            for kinds in product((False, True), repeat=verb_group.objects):
+                objects = [self.pronouns[index] if is_pronoun else self.nouns[index]
+                           for index, is_pronoun in enumerate(kinds)]
+                expected = assign_objects(verb_group, objects[:])
+                answer = fill_template(templates.get(verb_group), verb_group, objects)
+                self.assertEqual(answer, expected)
+
+    def test_fill_template_falls_back_to_assign_objects_without_a_template(self):
+        verb_group = VerbGroup(Verb('take'), None, None, 1)
+        self.assertEqual(fill_template({}, verb_group, [Noun('dog')]), [Verb('take'), Noun('dog')])
+
+    def test_tables_are_shared_between_verb_groups_of_the_same_shape(self):
+        first = VerbGroup(Verb('take'), None, BasicWord.particle('away'), 1)
+        second = VerbGroup(Verb('put'), None, BasicWord.particle('down'), 1)
+        templates = SentenceTemplates([first, second])
+        self.assertIs(templates.get(first), templates.get(second))
+        self.assertEqual(len(templates), 2)
+
+    def test_pair_with_reuses_entries_for_the_same_verb_groups(self):
+        verb_groups = self.all_verb_groups()
+        templates = SentenceTemplates(verb_groups)
+        self.assertIs(templates.pair_with(verb_groups[:]), templates.pair_with(verb_groups))
+
+        other = [VerbGroup(Verb('eat'), None, None, 1)]
+        self.assertEqual(templates.pair_with(other), ((other[0], templates.get(other[0])),))
+
+    def test_random_sentences_with_shared_templates_matches_without(self):
+        verb_groups = self.all_verb_groups()
+        templates = SentenceTemplates(verb_groups)
+        nouns = self.nouns
+
+        random.seed(4578)
+        expected = [RandomSentences(verb_groups, nouns).predicate(0.5) for _ in range(50)]
+        random.seed(4578)
+        answer = [RandomSentences(verb_groups, nouns, templates=templates).predicate(0.5) for _ in range(50)]
+        self.assertEqual(answer, expected)
+
+    def test_word_lists_materializes_words_once(self):
+        word_lists = WordLists(verbs=[{'verb': 'eat', 'irregular_past': 'ate', 'preposition': '', 'particle': '',
+                                       'objects': 1}],
+                               countable=[{'noun': 'dog', 'irregular_plural': ''}])
+        self.assertIs(word_lists.verbs[0], word_lists.verbs[0])
+        self.assertIs(word_lists.nouns[0], word_lists.nouns[0])
+        self.assertIsNot(word_lists.verbs, word_lists.verbs)
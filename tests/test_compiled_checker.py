@@ -0,0 +1,121 @@
+import json
+import random
+import unittest
+
+from paragraph_generator.answer_checker import AnswerChecker
+from paragraph_generator.backend.create_answer_paragraph import create_answer_paragraph
+from paragraph_generator.compiled_checker import COMPILED_CHECKER_VERSION, CompiledChecker, compile_checker
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+from paragraph_generator.word_groups.paragraph import Paragraph
+from paragraph_generator.word_groups.sentence import Sentence
+from paragraph_generator.word_lists import WordLists
+from paragraph_generator.words.noun import Noun
+from paragraph_generator.words.pronoun import CapitalPronoun, Pronoun
+from paragraph_generator.words.punctuation import Punctuation
+from paragraph_generator.words.verb import Verb
+
+
+def all_hints(checker: AnswerChecker):
+    return checker.get_sentence_hints(), checker.get_word_hints()
+
+
+class TestCompiledChecker(unittest.TestCase):
+    def setUp(self):
+        self.test_paragraph = Paragraph(
+            [
+                Sentence([
+                    CapitalPronoun.I, Verb('like'), Noun('squirrel').plural(), Punctuation.EXCLAMATION
+                ]),
+                Sentence([
+                    Noun('child', 'children').definite().capitalize(), Verb('like'), Pronoun.ME, Punctuation.PERIOD
+                ])
+            ]
+        )
+        self.submissions = [
+            'I like squirrels! The child likes me.',
+            'I like a squirrel. The children like me!',
+            'i like squirrels? The CHILDREN liked me.',
+            'a. b. c.',
+            '',
+        ]
+
+    def test_compile_checker(self):
+        compiled = compile_checker(self.test_paragraph)
+        self.assertIsInstance(compiled, CompiledChecker)
+        self.assertEqual(compiled.original, self.test_paragraph)
+        self.assertEqual(compiled.countable_nouns, (Noun('squirrel'), Noun('child', 'children')))
+        self.assertEqual(compiled.plurals, ('squirrels', 'children'))
+
+    def test_plural_indices(self):
+        compiled = compile_checker(self.test_paragraph)
+        self.assertEqual(compiled.plural_indices('I like a squirrel.'), ())
+        self.assertEqual(compiled.plural_indices('SQUIRRELS and a child'), (0,))
+        self.assertEqual(compiled.plural_indices('squirrels and Children'), (0, 1))
+
+    def test_answer_paragraph_is_create_answer_paragraph(self):
+        compiled = compile_checker(self.test_paragraph)
+        for submission in self.submissions:
+            self.assertEqual(compiled.answer_paragraph(submission),
+                             create_answer_paragraph(submission, self.test_paragraph))
+
+    def test_answer_paragraph_is_made_once_per_choice_of_plurals(self):
+        compiled = compile_checker(self.test_paragraph)
+        first = compiled.answer_paragraph('I like squirrels! The child likes me.')
+        second = compiled.answer_paragraph('squirrels squirrels')
+        self.assertIs(first, second)
+        self.assertIsNot(first, compiled.answer_paragraph('children'))
+
+    def test_answer_checker_with_compiled_checker_same_as_with_paragraph(self):
+        compiled = compile_checker(self.test_paragraph)
+        for submission in self.submissions:
+            checker = AnswerChecker(submission, compiled)
+            self.assertEqual(checker.original, self.test_paragraph)
+            self.assertEqual(all_hints(checker), all_hints(AnswerChecker(submission, self.test_paragraph)))
+
+    def test_answer_checker_with_compiled_checker_on_generated_paragraphs(self):
+        rng = random.Random(5)
+        word_lists = WordLists(
+            verbs=[{'verb': 'take', 'irregular_past': 'took', 'preposition': 'from', 'particle': '', 'objects': 2},
+                   {'verb': 'play', 'irregular_past': '', 'preposition': 'with', 'particle': '', 'objects': 1},
+                   {'verb': 'jump', 'irregular_past': '', 'preposition': '', 'particle': 'up', 'objects': 0}],
+            countable=[{'noun': 'child', 'irregular_plural': 'children'}, {'noun': 'dog', 'irregular_plural': ''},
+                       {'noun': 'knife', 'irregular_plural': ''}],
+            uncountable=[{'noun': 'water', 'definite': False}],
+            static=[{'noun': 'Joe', 'is_plural': False}])
+        generator = ParagraphsGenerator({'paragraph_size': 6, 'tense': 'simple_past', 'probability_plural_noun': 0.5},
+                                        word_lists)
+        for _ in range(10):
+            answer, error = generator.generate_paragraphs(rng)
+            compiled = compile_checker(answer)
+            for submission in (str(answer), str(error), str(error)[:40]):
+                self.assertEqual(all_hints(AnswerChecker(submission, compiled)),
+                                 all_hints(AnswerChecker(submission, answer)))
+
+    def test_to_json_and_back(self):
+        compiled = compile_checker(self.test_paragraph)
+        compiled.answer_paragraph('children')
+        loaded = CompiledChecker.from_json(compiled.to_json())
+        self.assertEqual(loaded.to_dict(), compiled.to_dict())
+        self.assertEqual(loaded.original, self.test_paragraph)
+        self.assertEqual(loaded.countable_nouns, compiled.countable_nouns)
+        for submission in self.submissions:
+            self.assertEqual(all_hints(AnswerChecker(submission, loaded)),
+                             all_hints(AnswerChecker(submission, self.test_paragraph)))
+
+    def test_to_dict_keeps_answer_paragraphs_already_made(self):
+        compiled = compile_checker(self.test_paragraph)
+        self.assertEqual(compiled.to_dict()['variants'], [])
+        compiled.answer_paragraph('children')
+        variants = compiled.to_dict()['variants']
+        self.assertEqual(len(variants), 1)
+        self.assertEqual(variants[0]['plurals'], [1])
+        self.assertEqual(variants[0]['expected_sentences'],
+                         [['I like a squirrel.', 'I like a squirrel!'],
+                          ['Children like me.', 'Children like me!']])
+        json.dumps(compiled.to_dict())
+
+    def test_from_dict_raises_value_error(self):
+        as_dict = compile_checker(self.test_paragraph).to_dict()
+        self.assertRaises(ValueError, CompiledChecker.from_dict, dict(as_dict, version=COMPILED_CHECKER_VERSION + 1))
+        self.assertRaises(ValueError, CompiledChecker.from_dict, dict(as_dict, **{'class': 'Paragraph'}))
+        self.assertRaises(ValueError, CompiledChecker.from_dict, dict(as_dict, plurals=['squirrels']))
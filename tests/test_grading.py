@@ -0,0 +1,198 @@
+import random
+import unittest
+
+from paragraph_generator import grading
+from paragraph_generator.answer_checker import AnswerChecker
+from paragraph_generator.backend.paragraph_comparison import get_submission_sentences
+from paragraph_generator.compiled_checker import compile_checker
+from paragraph_generator.grading import GradingSession, grade, grade_many
+from paragraph_generator.word_groups.paragraph import Paragraph
+from paragraph_generator.word_groups.sentence import Sentence
+from paragraph_generator.words.noun import Noun
+from paragraph_generator.words.pronoun import CapitalPronoun, Pronoun
+from paragraph_generator.words.punctuation import Punctuation
+from paragraph_generator.words.verb import Verb
+
+
+class TestGradingSession(unittest.TestCase):
+    def setUp(self):
+        self.test_paragraph = Paragraph(
+            [
+                Sentence([CapitalPronoun.I, Verb('like'), Noun('squirrel').plural(), Punctuation.EXCLAMATION]),
+                Sentence([Noun('child', 'children').indefinite().capitalize(), Verb('like'), Pronoun.ME,
+                          Punctuation.PERIOD]),
+                Sentence([CapitalPronoun.HE, Verb('play'), Punctuation.PERIOD]),
+            ]
+        )
+        self.correct = 'I like squirrels! A child likes me. He plays.'
+        self.compared = []
+        self.old_sentence_word_hint = grading.sentence_word_hint
+
+        def counting_sentence_word_hint(sentence, submission_str, matchers=None):
+            self.compared.append(submission_str)
+            return self.old_sentence_word_hint(sentence, submission_str, matchers)
+
+        grading.sentence_word_hint = counting_sentence_word_hint
+
+    def tearDown(self):
+        grading.sentence_word_hint = self.old_sentence_word_hint
+
+    def assert_same_as_answer_checker(self, session):
+        checker = AnswerChecker(session.submission, self.test_paragraph)
+        self.assertEqual(session.get_sentence_hints(), checker.get_sentence_hints())
+        self.assertEqual(session.get_word_hints(), checker.get_word_hints())
+        structured = session.get_structured_word_hints()
+        expected = checker.get_structured_word_hints()
+        self.assertEqual([hint.tokens for hint in structured['hints']], [hint.tokens for hint in expected['hints']])
+        self.assertEqual((structured['error_count'], structured['missing_sentences']),
+                         (expected['error_count'], expected['missing_sentences']))
+        self.assertEqual(session.submission_sentences, get_submission_sentences(session.submission))
+
+    def test_init(self):
+        session = GradingSession(self.test_paragraph, self.correct)
+        self.assertEqual(session.original, self.test_paragraph)
+        self.assertEqual(session.submission, self.correct)
+        self.assertTrue(session.is_submission_correct())
+        self.assertEqual(session.count_word_errors(), 0)
+        self.assert_same_as_answer_checker(session)
+
+    def test_init_with_compiled_checker(self):
+        compiled = compile_checker(self.test_paragraph)
+        session = GradingSession(compiled)
+        self.assertIs(session.checker, compiled)
+        self.assertEqual(session.submission, '')
+        self.assert_same_as_answer_checker(session)
+
+    def test_update(self):
+        session = GradingSession(self.test_paragraph)
+        for submission in ('I like', 'I like squirrels!', 'I like squirrels! Children liked me.', self.correct,
+                           'I like squirrels? A child likes me. He plays.', '', 'a. b. c. d.'):
+            session.update(submission)
+            self.assertEqual(session.submission, submission)
+            self.assert_same_as_answer_checker(session)
+
+    def test_edit(self):
+        session = GradingSession(self.test_paragraph, self.correct)
+        session.edit(0, 0, 'Oh, ')
+        self.assertEqual(session.submission, 'Oh, ' + self.correct)
+        self.assert_same_as_answer_checker(session)
+
+        session.edit(0, 4, '')
+        self.assertEqual(session.submission, self.correct)
+        self.assert_same_as_answer_checker(session)
+
+        session.edit(16, 17, '?')
+        self.assertEqual(session.submission, 'I like squirrels? A child likes me. He plays.')
+        self.assertEqual(session.count_sentence_errors(), 1)
+        self.assert_same_as_answer_checker(session)
+
+    def test_edit_out_of_range(self):
+        session = GradingSession(self.test_paragraph, 'abc')
+        self.assertRaises(ValueError, session.edit, -1, 0, 'x')
+        self.assertRaises(ValueError, session.edit, 2, 1, 'x')
+        self.assertRaises(ValueError, session.edit, 0, 4, 'x')
+
+    def test_typing_one_character_at_a_time(self):
+        session = GradingSession(self.test_paragraph)
+        for index, char in enumerate(self.correct):
+            session.edit(index, index, char)
+            self.assert_same_as_answer_checker(session)
+
+    def test_only_changed_sentences_are_compared_again(self):
+        session = GradingSession(self.test_paragraph, self.correct)
+        session.get_word_hints()
+        self.assertEqual(len(self.compared), 3)
+
+        del self.compared[:]
+        session.edit(len(self.correct) - 1, len(self.correct), '!')
+        session.get_word_hints()
+        self.assertEqual(self.compared, ['He plays!'])
+
+        del self.compared[:]
+        session.get_word_hints()
+        self.assertEqual(self.compared, [])
+
+    def test_sentences_with_a_new_answer_sentence_are_compared_again(self):
+        session = GradingSession(self.test_paragraph, self.correct)
+        session.get_word_hints()
+
+        del self.compared[:]
+        session.update('I like squirrels! Children like me. He plays.')
+        session.get_word_hints()
+        self.assertEqual(self.compared, ['Children like me.'])
+        self.assertEqual(session.count_word_errors(), 0)
+
+    def test_random_edits_same_as_answer_checker(self):
+        rng = random.Random(7)
+        pool = self.correct + ' The children liked squirrels, he played!.?'
+        session = GradingSession(self.test_paragraph)
+        for _ in range(300):
+            text = session.submission
+            start = rng.randint(0, len(text))
+            end = rng.randint(start, min(len(text), start + rng.choice([0, 1, 5, 20])))
+            replacement_start = rng.randint(0, len(pool))
+            replacement = pool[replacement_start: replacement_start + rng.choice([0, 1, 3, 30])]
+            session.edit(start, end, replacement)
+            self.assertEqual(session.submission, text[:start] + replacement + text[end:])
+            self.assert_same_as_answer_checker(session)
+
+
+class TestGradeMany(unittest.TestCase):
+    def setUp(self):
+        self.test_paragraph = Paragraph(
+            [
+                Sentence([CapitalPronoun.I, Verb('like'), Noun('squirrel').plural(), Punctuation.EXCLAMATION]),
+                Sentence([CapitalPronoun.HE, Verb('play'), Punctuation.PERIOD]),
+            ]
+        )
+        self.submissions = [
+            'I like squirrels! He plays.',
+            'I liked squirrels! He played.',
+            'I like a squirrel. He played!',
+            'I like squirrels!',
+            'squirrels like I! He plays.',
+        ]
+
+    def test_grade(self):
+        result = grade(compile_checker(self.test_paragraph), 'I liked squirrels! He played.')
+        checker = AnswerChecker('I liked squirrels! He played.', self.test_paragraph)
+        self.assertEqual(result, {'sentence_hints': checker.get_sentence_hints(),
+                                  'word_hints': checker.get_word_hints(),
+                                  'missed_words': [[0, 1], [1, 1]]})
+
+    def test_grade_missing_and_out_of_order_words(self):
+        checker = compile_checker(self.test_paragraph)
+        self.assertEqual(grade(checker, 'I like squirrels!')['missed_words'], [[1, 0], [1, 1], [1, 2]])
+        self.assertEqual(grade(checker, 'squirrels like I! He plays.')['missed_words'], [[0, 1], [0, 2]])
+
+    def test_grade_many_results_are_the_same_as_answer_checker(self):
+        graded = grade_many(self.test_paragraph, self.submissions, processes=1)
+        self.assertEqual(len(graded['results']), len(self.submissions))
+        for submission, result in zip(self.submissions, graded['results']):
+            checker = AnswerChecker(submission, self.test_paragraph)
+            self.assertEqual(result['sentence_hints'], checker.get_sentence_hints())
+            self.assertEqual(result['word_hints'], checker.get_word_hints())
+
+    def test_grade_many_class_totals(self):
+        graded = grade_many(compile_checker(self.test_paragraph), self.submissions, processes=1, most_missed=3)
+        self.assertEqual(graded['correct_count'], 2)
+        sentence_errors = [result['sentence_hints']['error_count'] for result in graded['results']]
+        word_errors = [result['word_hints']['error_count'] for result in graded['results']]
+        self.assertEqual(graded['mean_sentence_errors'], sum(sentence_errors) / 5)
+        self.assertEqual(graded['mean_word_errors'], sum(word_errors) / 5)
+        self.assertEqual(graded['most_missed_words'], [
+            {'sentence_index': 1, 'word_index': 1, 'word': 'play', 'count': 3},
+            {'sentence_index': 0, 'word_index': 1, 'word': 'like', 'count': 2},
+            {'sentence_index': 0, 'word_index': 2, 'word': 'squirrels', 'count': 1},
+        ])
+
+    def test_grade_many_no_submissions(self):
+        graded = grade_many(self.test_paragraph, [])
+        self.assertEqual(graded, {'results': [], 'correct_count': 0, 'mean_sentence_errors': 0.0,
+                                  'mean_word_errors': 0.0, 'most_missed_words': []})
+
+    def test_grade_many_in_processes_is_the_same_as_in_one_process(self):
+        submissions = self.submissions * 4
+        one_process = grade_many(self.test_paragraph, submissions, processes=1)
+        two_processes = grade_many(self.test_paragraph, submissions, processes=2)
+        self.assertEqual(one_process, two_processes)
@@ -0,0 +1,254 @@
+import logging
+import os
+import random
+import tempfile
+import unittest
+
+from paragraph_generator.answer_checker import AnswerChecker
+from paragraph_generator.compiled_checker import compile_checker
+from paragraph_generator.instrumentation import (
+    Instrumentation, LoggingSink, PrometheusTextSink, current, record_cache, record_retry, to_prometheus_text
+)
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+from paragraph_generator.word_groups.paragraph import Paragraph
+from paragraph_generator.word_groups.sentence import Sentence
+from paragraph_generator.word_groups.verb_group import VerbGroup
+from paragraph_generator.word_lists import AbstractWordLists
+from paragraph_generator.words.noun import Noun
+from paragraph_generator.words.pronoun import CapitalPronoun, Pronoun
+from paragraph_generator.words.punctuation import Punctuation
+from paragraph_generator.words.verb import Verb
+
+
+class DummyWordLists(AbstractWordLists):
+    def __init__(self, nouns, verbs):
+        self._nouns = nouns
+        self._verbs = verbs
+
+    @property
+    def nouns(self):
+        return self._nouns[:]
+
+    @property
+    def verbs(self):
+        return self._verbs[:]
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.word_lists = DummyWordLists([Noun('dog'), Noun('cat')], [VerbGroup(Verb('like'), None, None, 1)])
+        self.config = {'error_probability': 0.5, 'noun_errors': True, 'verb_errors': True, 'paragraph_size': 3}
+        self.paragraph = Paragraph([
+            Sentence([CapitalPronoun.I, Verb('like'), Noun('squirrel').plural(), Punctuation.EXCLAMATION]),
+            Sentence([Noun('squirrel').plural().definite().capitalize(), Verb('like'), Pronoun.ME,
+                      Punctuation.PERIOD])
+        ])
+
+    def test_empty_snapshot(self):
+        self.assertEqual(Instrumentation().snapshot(), {'stages': {}, 'retries': {}, 'caches': {}})
+
+    def test_record_retry_and_record_cache_do_nothing_when_not_active(self):
+        instrumentation = Instrumentation()
+        record_retry('loop')
+        record_cache('cache', True)
+        self.assertIsNone(current())
+        self.assertEqual(instrumentation.snapshot(), {'stages': {}, 'retries': {}, 'caches': {}})
+
+    def test_activate_reports_to_instrumentation_until_exit(self):
+        instrumentation = Instrumentation()
+        with instrumentation.activate():
+            self.assertIs(current(), instrumentation)
+            record_retry('loop')
+            record_retry('loop')
+            record_cache('cache', True)
+            record_cache('cache', True)
+            record_cache('cache', True)
+            record_cache('cache', False)
+        self.assertIsNone(current())
+        record_retry('loop')
+        snapshot = instrumentation.snapshot()
+        self.assertEqual(snapshot['retries'], {'loop': 2})
+        self.assertEqual(snapshot['caches'], {'cache': {'hits': 3, 'misses': 1, 'hit_rate': 0.75}})
+
+    def test_activate_nested(self):
+        outer = Instrumentation()
+        inner = Instrumentation()
+        with outer.activate():
+            with inner.activate():
+                record_retry('loop')
+            record_retry('loop')
+        self.assertEqual(outer.snapshot()['retries'], {'loop': 1})
+        self.assertEqual(inner.snapshot()['retries'], {'loop': 1})
+
+    def test_stage_counts_calls_and_time(self):
+        instrumentation = Instrumentation()
+        for _ in range(3):
+            with instrumentation.stage('stage'):
+                pass
+        stage = instrumentation.snapshot()['stages']['stage']
+        self.assertEqual(stage['calls'], 3)
+        self.assertGreaterEqual(stage['seconds'], 0.0)
+
+    def test_stage_counts_allocated_blocks(self):
+        instrumentation = Instrumentation()
+        with instrumentation.stage('stage'):
+            kept = [object() for _ in range(1000)]
+        self.assertGreaterEqual(instrumentation.snapshot()['stages']['stage']['allocated_blocks'], 900)
+        self.assertEqual(len(kept), 1000)
+
+    def test_stage_without_track_allocations(self):
+        instrumentation = Instrumentation(track_allocations=False)
+        with instrumentation.stage('stage'):
+            kept = [object() for _ in range(1000)]
+        self.assertEqual(instrumentation.snapshot()['stages']['stage']['allocated_blocks'], 0)
+        self.assertEqual(len(kept), 1000)
+
+    def test_stage_records_when_an_error_is_raised(self):
+        instrumentation = Instrumentation()
+        with self.assertRaises(KeyError):
+            with instrumentation.stage('stage'):
+                raise KeyError()
+        self.assertEqual(instrumentation.snapshot()['stages']['stage']['calls'], 1)
+
+    def test_reset(self):
+        instrumentation = Instrumentation()
+        with instrumentation.activate(), instrumentation.stage('stage'):
+            record_retry('loop')
+            record_cache('cache', False)
+        instrumentation.reset()
+        self.assertEqual(instrumentation.snapshot(), {'stages': {}, 'retries': {}, 'caches': {}})
+
+    def test_paragraphs_generator_stages(self):
+        instrumentation = Instrumentation()
+        generator = ParagraphsGenerator(self.config, self.word_lists, instrumentation)
+        for _ in range(4):
+            generator.generate_paragraphs(random.Random(5))
+        stages = instrumentation.snapshot()['stages']
+        self.assertEqual(sorted(stages), ['errors', 'grammarize', 'negatives', 'plurals', 'sampling'])
+        for stage in stages.values():
+            self.assertEqual(stage['calls'], 4)
+        self.assertIsNone(current())
+
+    def test_paragraphs_generator_error_cache_hits(self):
+        instrumentation = Instrumentation()
+        generator = ParagraphsGenerator(self.config, self.word_lists, instrumentation)
+        for seed in range(10):
+            generator.generate_paragraphs(random.Random(seed))
+        caches = instrumentation.snapshot()['caches']
+        self.assertGreater(caches['noun_error_choices']['hits'], 0)
+        self.assertGreater(caches['verb_error_choices']['hit_rate'], 0.5)
+
+    def test_paragraphs_generator_subject_pool_retries(self):
+        instrumentation = Instrumentation()
+        config = {'paragraph_type': 'pool', 'pool_size': 2, 'probability_pronoun': 0.0, 'paragraph_size': 2}
+        generator = ParagraphsGenerator(config, self.word_lists, instrumentation)
+        for seed in range(10):
+            generator.generate_paragraphs(random.Random(seed))
+        self.assertGreater(instrumentation.snapshot()['retries']['subject_pool'], 0)
+
+    def test_paragraphs_generator_same_paragraphs_with_and_without_instrumentation(self):
+        plain = ParagraphsGenerator(self.config, self.word_lists)
+        instrumented = ParagraphsGenerator(self.config, self.word_lists, Instrumentation())
+        for seed in range(5):
+            expected = plain.generate_paragraphs(random.Random(seed))
+            self.assertEqual(instrumented.generate_paragraphs(random.Random(seed)), expected)
+
+    def test_generate_batch_dedup_stage(self):
+        instrumentation = Instrumentation()
+        generator = ParagraphsGenerator(self.config, self.word_lists, instrumentation)
+        generator.generate_batch(3, rng=random.Random(1))
+        self.assertEqual(instrumentation.snapshot()['stages']['sampling']['calls'], 3)
+        self.assertNotIn('dedup', instrumentation.snapshot()['stages'])
+
+    def test_answer_checker_stages(self):
+        instrumentation = Instrumentation()
+        checker = AnswerChecker('I like squirrels! The squirrel like me.', self.paragraph, instrumentation)
+        checker.get_sentence_hints()
+        checker.get_word_hints()
+        stages = instrumentation.snapshot()['stages']
+        self.assertEqual(stages['answer_paragraph']['calls'], 2)
+        self.assertEqual(stages['compare_by_sentences']['calls'], 1)
+        self.assertEqual(stages['compare_by_words']['calls'], 1)
+
+    def test_answer_checker_compiled_cache_hits(self):
+        instrumentation = Instrumentation()
+        compiled = compile_checker(self.paragraph)
+        for submission in ('I like squirrels!', 'I like squirrels.', 'I like a squirrel.'):
+            AnswerChecker(submission, compiled, instrumentation).get_sentence_hints()
+        self.assertEqual(instrumentation.snapshot()['caches']['answer_variants'],
+                         {'hits': 1, 'misses': 2, 'hit_rate': 1 / 3})
+
+    def test_flush_sends_snapshot_to_every_sink(self):
+        class ListSink(object):
+            def __init__(self):
+                self.snapshots = []
+
+            def emit(self, snapshot):
+                self.snapshots.append(snapshot)
+
+        sinks = [ListSink(), ListSink()]
+        instrumentation = Instrumentation(sinks)
+        with instrumentation.activate():
+            record_retry('loop')
+        instrumentation.flush()
+        for sink in sinks:
+            self.assertEqual(sink.snapshots, [{'stages': {}, 'retries': {'loop': 1}, 'caches': {}}])
+
+    def test_logging_sink(self):
+        logger = logging.getLogger('test_instrumentation')
+        instrumentation = Instrumentation([LoggingSink(logger)], track_allocations=False)
+        with instrumentation.activate():
+            record_retry('loop')
+            record_cache('cache', True)
+        with instrumentation.stage('stage'):
+            pass
+        with self.assertLogs(logger, logging.INFO) as logs:
+            instrumentation.flush()
+        self.assertEqual(len(logs.output), 3)
+        self.assertTrue(logs.output[0].startswith('INFO:test_instrumentation:stage stage: 1 calls, '))
+        self.assertTrue(logs.output[0].endswith(' s, 0 allocated blocks'))
+        self.assertEqual(logs.output[1:], ['INFO:test_instrumentation:retries loop: 1',
+                                           'INFO:test_instrumentation:cache cache: 1 hits, 0 misses, 1.000 hit rate'])
+
+    def test_to_prometheus_text(self):
+        snapshot = {'stages': {'sampling': {'calls': 2, 'seconds': 0.5, 'allocated_blocks': 10}},
+                    'retries': {'subject_pool': 3},
+                    'caches': {'plural_detectors': {'hits': 3, 'misses': 1, 'hit_rate': 0.75}}}
+        expected = [
+            '# TYPE pg_stage_calls_total counter',
+            'pg_stage_calls_total{stage="sampling"} 2',
+            '# TYPE pg_stage_seconds_total counter',
+            'pg_stage_seconds_total{stage="sampling"} 0.5',
+            '# TYPE pg_stage_allocated_blocks_total counter',
+            'pg_stage_allocated_blocks_total{stage="sampling"} 10',
+            '# TYPE pg_retries_total counter',
+            'pg_retries_total{loop="subject_pool"} 3',
+            '# TYPE pg_cache_hits_total counter',
+            'pg_cache_hits_total{cache="plural_detectors"} 3',
+            '# TYPE pg_cache_misses_total counter',
+            'pg_cache_misses_total{cache="plural_detectors"} 1',
+            '# TYPE pg_cache_hit_ratio gauge',
+            'pg_cache_hit_ratio{cache="plural_detectors"} 0.75',
+        ]
+        self.assertEqual(to_prometheus_text(snapshot, 'pg'), '\n'.join(expected) + '\n')
+
+    def test_to_prometheus_text_escapes_label_values(self):
+        snapshot = {'stages': {}, 'retries': {'a"b\\c\nd': 1}, 'caches': {}}
+        self.assertIn('paragraph_generator_retries_total{loop="a\\"b\\\\c\\nd"} 1', to_prometheus_text(snapshot))
+
+    def test_prometheus_text_sink_replaces_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'paragraph_generator.prom')
+            instrumentation = Instrumentation([PrometheusTextSink(path)])
+            with instrumentation.activate():
+                record_retry('loop')
+            instrumentation.flush()
+            record_retry('not active')
+            with instrumentation.activate():
+                record_retry('loop')
+            instrumentation.flush()
+            with open(path) as f:
+                text = f.read()
+            self.assertEqual(text, to_prometheus_text(instrumentation.snapshot()))
+            self.assertIn('paragraph_generator_retries_total{loop="loop"} 2\n', text)
+            self.assertEqual(os.listdir(directory), ['paragraph_generator.prom'])
@@ -0,0 +1,40 @@
+import importlib
+import subprocess
+import sys
+import unittest
+
+import paragraph_generator
+
+
+def modules_loaded_by(statement):
+    code = 'import sys; {}; print(" ".join(sorted(sys.modules)))'.format(statement)
+    output = subprocess.run([sys.executable, '-c', code], check=True, stdout=subprocess.PIPE, universal_newlines=True)
+    return {name for name in output.stdout.split() if name.startswith('paragraph_generator')}
+
+
+class TestPackageImports(unittest.TestCase):
+    def test_import_loads_no_submodules(self):
+        self.assertEqual(modules_loaded_by('import paragraph_generator'), {'paragraph_generator'})
+
+    def test_name_loads_only_its_module(self):
+        loaded = modules_loaded_by('from paragraph_generator import Noun')
+        self.assertIn('paragraph_generator.words.noun', loaded)
+        self.assertNotIn('paragraph_generator.backend.paragraph_comparison', loaded)
+        self.assertNotIn('paragraph_generator.paragraphsgenerator', loaded)
+
+    def test_names_are_the_module_objects(self):
+        for name, module_name in paragraph_generator._LAZY_NAMES.items():
+            self.assertIs(getattr(paragraph_generator, name), getattr(importlib.import_module(module_name), name))
+
+    def test_all(self):
+        self.assertEqual(sorted(paragraph_generator.__all__), sorted(paragraph_generator._LAZY_NAMES))
+        namespace = {}
+        exec('from paragraph_generator import *', namespace)
+        self.assertIs(namespace['ParagraphsGenerator'], paragraph_generator.ParagraphsGenerator)
+
+    def test_dir(self):
+        self.assertTrue(set(paragraph_generator.__all__).issubset(dir(paragraph_generator)))
+
+    def test_unknown_name_raises_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            paragraph_generator.NotAName
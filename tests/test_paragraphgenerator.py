@@ -1,12 +1,18 @@
+import os
 import random
+import tempfile
 import unittest
 
-from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+from paragraph_generator import snapshot
+from paragraph_generator.backend import error_maker
+from paragraph_generator.backend.dedup import BloomFilter, FingerprintSet, paragraph_fingerprint
+from paragraph_generator.backend.error_maker import get_cached_error_choices
+from paragraph_generator.paragraphsgenerator import SNAPSHOT_KIND, ParagraphsGenerator
 from paragraph_generator.tags.status_tag import StatusTag
 from paragraph_generator.tags.wordtag import WordTag
 from paragraph_generator.word_groups.sentence import Sentence
 from paragraph_generator.word_groups.verb_group import VerbGroup
-from paragraph_generator.word_lists import AbstractWordLists
+from paragraph_generator.word_lists import AbstractWordLists, WordLists
 from paragraph_generator.words.basicword import BasicWord
 from paragraph_generator.words.noun import Noun
 from paragraph_generator.words.pronoun import AbstractPronoun
@@ -85,6 +91,8 @@ class TestParagraphsGenerator(unittest.TestCase):
             'punctuation_errors': True,
             'is_do_errors': False,
             'preposition_transpose_errors': False,
+            'single_pass_errors': False,
+            'error_count': None,
 
             'tense': 'simple_present',
             'probability_plural_noun': 0.2,
@@ -94,6 +102,10 @@ class TestParagraphsGenerator(unittest.TestCase):
             'paragraph_type': 'chain',
             'subject_pool': 5,
             'paragraph_size': 15,
+
+            'minimum_negative_verbs': 0,
+            'minimum_distinct_verbs': 0,
+            'require_irregular_plural': False,
         }
         to_test = ParagraphsGenerator({}, self.word_lists)
         for key, value in default.items():
@@ -323,6 +335,105 @@ class TestParagraphsGenerator(unittest.TestCase):
         answer, error = ParagraphsGenerator(config, self.word_lists).generate_paragraphs()
         self.assert_only_error_has_one_error_tag(answer, error, StatusTag.PUNCTUATION_ERRORS)
 
+    def test_single_pass_errors_sets_the_same_tags(self):
+        errors_keys = ['noun_errors', 'pronoun_errors', 'verb_errors', 'is_do_errors', 'preposition_transpose_errors',
+                       'punctuation_errors']
+        config = {key: False for key in errors_keys}
+        config.update({'error_probability': 1.0, 'paragraph_size': 1, 'verb_errors': True, 'single_pass_errors': True})
+
+        answer, error = ParagraphsGenerator(config, self.word_lists).generate_paragraphs()
+        self.assert_only_error_has_one_error_tag(answer, error, StatusTag.VERB_ERRORS)
+        self.assertNotEqual(answer.sentence_list(), error.sentence_list())
+
+    def test_single_pass_errors_error_probability_zero(self):
+        config = {'error_probability': 0.0, 'is_do_errors': True, 'preposition_transpose_errors': True,
+                  'single_pass_errors': True, 'paragraph_size': 5}
+        answer, error = ParagraphsGenerator(config, self.word_lists).generate_paragraphs()
+        self.assertEqual(answer.sentence_list(), error.sentence_list())
+
+    def test_error_count_makes_exactly_that_many_errors(self):
+        errors_keys = ['noun_errors', 'pronoun_errors', 'verb_errors', 'is_do_errors', 'preposition_transpose_errors',
+                       'punctuation_errors']
+        config = {key: False for key in errors_keys}
+        config.update({'verb_errors': True, 'paragraph_size': 4, 'error_count': 2, 'error_probability': 0.0})
+        generator = ParagraphsGenerator(config, self.word_lists)
+        for _ in range(10):
+            answer, error = generator.generate_paragraphs()
+            error_count = 0
+            for error_sentence, sentence in zip(error, answer):
+                if error_sentence.get(error_sentence.get_verb()) != sentence.get(sentence.get_verb()):
+                    error_count += 1
+            self.assertEqual(error_count, 2)
+            self.assert_only_error_has_one_error_tag(answer, error, StatusTag.VERB_ERRORS)
+
+    def test_error_count_range(self):
+        config = {'verb_errors': True, 'paragraph_size': 4, 'error_count': [0, 1]}
+        answer, error = ParagraphsGenerator(config, self.word_lists).generate_paragraphs()
+        self.assertTrue(error.tags.has(StatusTag.VERB_ERRORS))
+
+    def test_constraints_are_met_on_every_paragraph(self):
+        verbs = self.verbs + [VerbGroup(Verb('like'), None, None, 1), VerbGroup(Verb('see', 'saw'), None, None, 1)]
+        nouns = self.countable_nouns + [Noun('child', 'children'), Noun('mouse', 'mice')]
+        config = {'paragraph_size': 5, 'probability_negative_verb': 0.1, 'probability_plural_noun': 0.1,
+                  'error_probability': 0.0, 'minimum_negative_verbs': 3, 'minimum_distinct_verbs': 4,
+                  'require_irregular_plural': True}
+        generator = ParagraphsGenerator(config, DummyWordLists(nouns=nouns, verbs=verbs))
+        irregular_plurals = ('children', 'mice')
+        rng = random.Random(12)
+        for _ in range(20):
+            answer, _ = generator.generate_paragraphs(rng)
+            verbs_used = [sentence.get(sentence.get_verb()) for sentence in answer]
+            self.assertGreaterEqual(sum(verb.has_tags(WordTag.NEGATIVE) for verb in verbs_used), 3)
+            self.assertGreaterEqual(len({verb.infinitive for verb in verbs_used}), 4)
+            self.assertTrue(any(word.value.lower() in irregular_plurals for word in answer.all_words()))
+
+    def test_constraints_that_cannot_be_met(self):
+        config = {'paragraph_size': 2, 'minimum_negative_verbs': 3}
+        self.assertRaises(ValueError, ParagraphsGenerator(config, self.word_lists).generate_paragraphs)
+
+        config = {'paragraph_size': 5, 'minimum_distinct_verbs': 3}
+        self.assertRaises(ValueError, ParagraphsGenerator(config, self.word_lists).generate_paragraphs)
+
+        config = {'require_irregular_plural': True}
+        self.assertRaises(ValueError, ParagraphsGenerator(config, self.word_lists).generate_paragraphs)
+
+    def test_generate_batch_without_dedup_index(self):
+        random.seed(4)
+        batch = ParagraphsGenerator(self.config_state, self.word_lists).generate_batch(3)
+        self.assertEqual(len(batch), 3)
+        for answer, error in batch:
+            self.assertEqual(len(answer), 1)
+            self.assertEqual(len(error), 1)
+
+    def test_generate_batch_skips_duplicates(self):
+        config = {'probability_pronoun': 0.0, 'paragraph_size': 1}
+        generator = ParagraphsGenerator(config, self.word_lists)
+        index = FingerprintSet()
+        batch = generator.generate_batch(4, index, random.Random(10))
+        fingerprints = {paragraph_fingerprint(answer) for answer, _ in batch}
+        self.assertEqual(len(fingerprints), 4)
+        self.assertEqual(len(index), 4)
+
+    def test_generate_batch_raises_value_error_when_out_of_unique_paragraphs(self):
+        config = {'probability_pronoun': 0.0, 'paragraph_size': 1}
+        generator = ParagraphsGenerator(config, self.word_lists)
+        index = FingerprintSet()
+        generator.generate_batch(4, index, random.Random(10))
+        self.assertRaises(ValueError, generator.generate_batch, 1, index, random.Random(10), 50)
+
+    def test_generate_batch_only_finishes_unique_paragraphs(self):
+        generator = ParagraphsGenerator({'probability_pronoun': 0.0, 'paragraph_size': 1}, self.word_lists)
+        finished = []
+        original = generator._finish_paragraphs
+
+        def finish(raw, rng=None):
+            finished.append(raw)
+            return original(raw, rng)
+
+        generator._finish_paragraphs = finish
+        generator.generate_batch(4, BloomFilter(100), random.Random(3))
+        self.assertEqual(len(finished), 4)
+
     def test_retains_definite_assigned_to_uncountable_nouns(self):
         random.seed(33784)
         config = {'error_probability': 0.0, 'probability_pronoun': 0.0, 'paragraph_size': 1}
@@ -348,3 +459,61 @@ class TestParagraphsGenerator(unittest.TestCase):
                       Noun.uncountable_noun('water'), Punctuation.PERIOD])
         ]
         self.assertEqual(expected_sentences, answer.sentence_list())
+
+    def test_prepare_builds_sentence_templates(self):
+        generator = ParagraphsGenerator({}, self.word_lists)
+        generator.prepare()
+        self.assertIsNotNone(generator._sentence_templates)
+
+    def test_snapshot_round_trip(self):
+        config = {'error_probability': 0.5, 'paragraph_size': 4, 'tense': 'simple_past'}
+        generator = ParagraphsGenerator(config, WordLists(
+            verbs=[{'verb': 'go', 'irregular_past': 'went', 'preposition': 'with', 'particle': 'away', 'objects': 1},
+                   {'verb': 'eat', 'irregular_past': 'ate', 'preposition': '', 'particle': '', 'objects': 1}],
+            countable=[{'noun': 'dog', 'irregular_plural': ''}, {'noun': 'child', 'irregular_plural': 'children'}]
+        ))
+        generator.prepare(warm_up=3)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'generator.snapshot')
+            generator.save_snapshot(path)
+            loaded = ParagraphsGenerator.load_snapshot(path)
+        self.assertEqual(loaded.get('tense'), 'simple_past')
+        self.assertEqual(loaded.get_verbs(), generator.get_verbs())
+        self.assertEqual(loaded.get_nouns(), generator.get_nouns())
+        self.assertIsNotNone(loaded._sentence_templates)
+        for seed in range(5):
+            self.assertEqual(loaded.generate_paragraphs(random.Random(seed)),
+                             generator.generate_paragraphs(random.Random(seed)))
+
+    def test_load_snapshot_restores_error_caches_only_when_asked(self):
+        key = ('test_load_snapshot_restores_error_caches_only_when_asked',)
+        payload = {'config': {}, 'word_lists': self.word_lists, 'sentence_templates': None,
+                   'error_choices': {'nouns': {key: (Noun('dog'),)}, 'verbs': {}}}
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'generator.snapshot')
+            snapshot.write_snapshot(path, SNAPSHOT_KIND, payload)
+            ParagraphsGenerator.load_snapshot(path)
+            self.assertNotIn(key, get_cached_error_choices()['nouns'])
+            ParagraphsGenerator.load_snapshot(path, restore_error_caches=True)
+        try:
+            self.assertEqual(get_cached_error_choices()['nouns'][key], (Noun('dog'),))
+        finally:
+            error_maker._NOUN_ERROR_CHOICES.pop(key, None)
+
+    def test_load_snapshot_rejects_stale_snapshot(self):
+        generator = ParagraphsGenerator({}, self.word_lists)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'generator.snapshot')
+            generator.save_snapshot(path)
+            old_fingerprint = snapshot._source_fingerprint
+            snapshot._source_fingerprint = '0' * 32
+            try:
+                self.assertRaises(ValueError, ParagraphsGenerator.load_snapshot, path)
+            finally:
+                snapshot._source_fingerprint = old_fingerprint
+
+    def test_load_snapshot_rejects_other_snapshots(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'other.snapshot')
+            snapshot.write_snapshot(path, 'CompiledChecker', {})
+            self.assertRaises(ValueError, ParagraphsGenerator.load_snapshot, path)
@@ -0,0 +1,131 @@
+import io
+import os
+import pstats
+import random
+import re
+import tempfile
+import time
+import unittest
+
+from paragraph_generator.grading import grade_many
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+from paragraph_generator.profiling import PACKAGE_DIR, OTHER_STAGE, get_stage, profile
+from paragraph_generator.word_groups.verb_group import VerbGroup
+from paragraph_generator.word_lists import AbstractWordLists
+from paragraph_generator.words.basicword import BasicWord
+from paragraph_generator.words.noun import Noun
+from paragraph_generator.words.verb import Verb
+
+STAGES = {'random_assignment', 'grammarizer', 'error_maker', 'comparison', OTHER_STAGE}
+COLLAPSED_LINE = re.compile(r'^[^;\n]+(;[^;\n]+)* [1-9]\d*$')
+
+
+class DummyWordLists(AbstractWordLists):
+    @property
+    def nouns(self):
+        return [Noun('dog'), Noun('cat'), Noun('child', 'children'), Noun.uncountable_noun('water')]
+
+    @property
+    def verbs(self):
+        return [VerbGroup(Verb('go'), BasicWord.preposition('with'), BasicWord.particle('away'), 1),
+                VerbGroup(Verb('eat'), None, None, 1)]
+
+
+def package_file(*path):
+    return os.path.join(PACKAGE_DIR, *path)
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        config = {'error_probability': 0.5, 'noun_errors': True, 'verb_errors': True, 'paragraph_size': 5}
+        self.generator = ParagraphsGenerator(config, DummyWordLists())
+
+    def generate(self, count=20):
+        rng = random.Random(3)
+        for _ in range(count):
+            self.generator.generate_paragraphs(rng)
+
+    def test_get_stage(self):
+        self.assertEqual(get_stage(package_file('backend', 'random_assignments', 'random_sentences.py')),
+                         'random_assignment')
+        self.assertEqual(get_stage(package_file('backend', 'grammarizer.py')), 'grammarizer')
+        self.assertEqual(get_stage(package_file('backend', 'batch_grammarizer.py')), 'grammarizer')
+        self.assertEqual(get_stage(package_file('backend', 'error_maker.py')), 'error_maker')
+        self.assertEqual(get_stage(package_file('backend', 'paragraph_comparison.py')), 'comparison')
+        self.assertEqual(get_stage(package_file('grading.py')), 'comparison')
+
+    def test_get_stage_none(self):
+        self.assertIsNone(get_stage(package_file('words', 'noun.py')))
+        self.assertIsNone(get_stage(package_file('paragraphsgenerator.py')))
+        self.assertIsNone(get_stage(random.__file__))
+        self.assertIsNone(get_stage('~'))
+
+    def test_cprofile_stage_seconds(self):
+        with profile() as result:
+            self.generate()
+        stages = result.stage_seconds()
+        self.assertTrue({'random_assignment', 'grammarizer', 'error_maker'}.issubset(stages))
+        self.assertTrue(set(stages).issubset(STAGES))
+        self.assertNotIn('comparison', stages)
+        total = sum(row[2] for row in result.stats.stats.values())
+        self.assertAlmostEqual(sum(stages.values()), total, delta=total * 0.01)
+
+    def test_cprofile_stacks_start_in_profiled_code(self):
+        with profile() as result:
+            self.generate()
+        roots = {stack[0][2] for stack in result.stacks}
+        self.assertIn('generate', roots)
+        self.assertNotIn('test_cprofile_stacks_start_in_profiled_code', roots)
+        called_from_generate = {stack[1][::2] for stack in result.stacks
+                                if len(stack) > 1 and stack[0][2] == 'generate'}
+        self.assertIn((package_file('paragraphsgenerator.py'), 'generate_paragraphs'), called_from_generate)
+
+    def test_collapsed_stacks(self):
+        with profile() as result:
+            self.generate()
+        lines = result.collapsed_stacks()
+        self.assertTrue(lines)
+        for line in lines:
+            self.assertRegex(line, COLLAPSED_LINE)
+        self.assertTrue(any('paragraph_generator.backend.grammarizer:' in line for line in lines))
+
+    def test_write_collapsed(self):
+        with profile() as result:
+            self.generate(5)
+        file = io.StringIO()
+        result.write_collapsed(file)
+        self.assertEqual(file.getvalue(), ''.join(line + '\n' for line in result.collapsed_stacks()))
+
+    def test_grading_is_comparison(self):
+        answer, error = self.generator.generate_paragraphs(random.Random(4))
+        with profile() as result:
+            grade_many(answer, [str(error)] * 5, processes=1)
+        stages = result.stage_seconds()
+        self.assertEqual(max(stages, key=stages.get), 'comparison')
+
+    def test_dump_stats(self):
+        with profile() as result:
+            self.generate(5)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'generate.prof')
+            result.dump_stats(path)
+            self.assertEqual(pstats.Stats(path).total_calls, result.stats.total_calls)
+
+    def test_sampling(self):
+        with profile(sampling=True, interval=0.0005) as result:
+            start = time.perf_counter()
+            while time.perf_counter() - start < 0.1:
+                self.generator.generate_paragraphs()
+        self.assertIsNone(result.stats)
+        self.assertTrue(result.stacks)
+        for stack in result.stacks:
+            self.assertIn(stack[0][2], ('test_sampling', 'TestProfiling.test_sampling'))
+        self.assertTrue(set(result.stage_seconds()).issubset(STAGES))
+        for line in result.collapsed_stacks():
+            self.assertRegex(line, COLLAPSED_LINE)
+
+    def test_sampling_cannot_dump_stats(self):
+        with profile(sampling=True) as result:
+            pass
+        self.assertEqual(result.stage_seconds(), {})
+        self.assertRaises(ValueError, result.dump_stats, 'not_written.prof')
@@ -0,0 +1,100 @@
+import io
+import random
+import unittest
+
+from paragraph_generator.backend.error_maker import ERROR_ORDER, ErrorMaker
+from paragraph_generator.rendering import (ANSI, HTML, MARKDOWN, MARKUP, PLAIN, RENDERERS, Renderer, escape_markdown,
+                                           get_renderer)
+from paragraph_generator.word_groups.columnar import ColumnarParagraph
+from paragraph_generator.word_groups.paragraph import Paragraph
+from paragraph_generator.word_groups.sentence import Sentence
+from paragraph_generator.words.basicword import BasicWord
+from paragraph_generator.words.noun import Noun
+from paragraph_generator.words.pronoun import CapitalPronoun, Pronoun
+from paragraph_generator.words.punctuation import Punctuation
+from paragraph_generator.words.verb import Verb
+
+
+class TestRenderer(unittest.TestCase):
+    def setUp(self):
+        self.sentence = Sentence([CapitalPronoun.I, Verb('like').bold(), Noun('cat').plural(), Punctuation.COMMA.bold(),
+                                  BasicWord('<b>&').bold(), Punctuation.PERIOD])
+        self.paragraph = Paragraph([self.sentence, Sentence([Pronoun.HE, Verb('go'), Punctuation.EXCLAMATION])])
+
+    def test_write_sentence(self):
+        expected = {
+            PLAIN: 'I like cats, <b>&.',
+            MARKUP: str(self.sentence),
+            HTML: 'I <strong>like</strong> cats<strong>,</strong> <strong>&lt;b&gt;&amp;</strong>.',
+            ANSI: 'I \x1b[1;31mlike\x1b[0m cats\x1b[1;31m,\x1b[0m \x1b[1;31m<b>&\x1b[0m.',
+            MARKDOWN: 'I **like** cats**,** **\\<b\\>&**.',
+        }
+        for renderer, text in expected.items():
+            stream = io.StringIO()
+            renderer.write_sentence(stream, self.sentence)
+            self.assertEqual(stream.getvalue(), text)
+            self.assertEqual(renderer.render_sentence(self.sentence), text)
+
+    def test_write_sentence_spaces_like_str(self):
+        for word_list in ([], [BasicWord('')], [BasicWord(''), BasicWord('a'), BasicWord(''), Punctuation.PERIOD],
+                          [Punctuation.PERIOD, BasicWord('a')]):
+            sentence = Sentence(word_list)
+            self.assertEqual(MARKUP.render_sentence(sentence), str(sentence))
+            self.assertEqual(PLAIN.render_sentence(sentence), str(sentence))
+
+    def test_write_paragraph(self):
+        self.assertEqual(MARKUP.render_paragraph(self.paragraph), str(self.paragraph))
+        self.assertEqual(PLAIN.render_paragraph(self.paragraph), 'I like cats, <b>&. he go!')
+        self.assertEqual(PLAIN.render_paragraph(Paragraph([])), '')
+        stream = io.StringIO()
+        HTML.write_paragraph(stream, self.paragraph)
+        self.assertEqual(stream.getvalue(), HTML.render_sentence(self.sentence) + ' he go!')
+
+    def test_write_paragraph_any_sentences(self):
+        columnar = ColumnarParagraph.from_paragraph(self.paragraph)
+        self.assertEqual(MARKDOWN.render_paragraph(columnar), MARKDOWN.render_paragraph(self.paragraph))
+        self.assertEqual(MARKDOWN.render_paragraph(list(self.paragraph)), MARKDOWN.render_paragraph(self.paragraph))
+
+    def test_markup_matches_str_of_error_paragraphs(self):
+        paragraph = Paragraph([Sentence([Noun('dog').definite().capitalize(), Verb('eat').past_tense(),
+                                         Noun('bone').indefinite(), Punctuation.PERIOD])] * 4)
+        rng = random.Random(5)
+        for _ in range(20):
+            error_paragraph = ErrorMaker(paragraph, rng).composite_errors({tag: 0.5 for tag in ERROR_ORDER})
+            error_paragraph = error_paragraph.get_paragraph()
+            bold_paragraph = Paragraph([Sentence([word.bold() if rng.random() < 0.3 else word for word in sentence])
+                                        for sentence in error_paragraph])
+            self.assertEqual(MARKUP.render_paragraph(bold_paragraph), str(bold_paragraph))
+
+    def test_write_hints(self):
+        hints = ['a.', '<bold>b c.</bold>', '', '<bold>*</bold>']
+        self.assertEqual(MARKUP.render_hints(hints), ' '.join(hints))
+        self.assertEqual(MARKDOWN.render_hints(hints), 'a. **b c.**  **\\***')
+        self.assertEqual(HTML.render_hints([]), '')
+
+    def test_custom_renderer(self):
+        renderer = Renderer('[', ']', str.upper)
+        self.assertEqual(renderer.render_sentence(self.sentence), 'I [LIKE] CATS[,] [<B>&].')
+
+    def test_subclass(self):
+        class SpanRenderer(Renderer):
+            def __init__(self):
+                super(SpanRenderer, self).__init__('<span class="error">', '</span>')
+
+            def escape(self, text):
+                return text.replace('<', '')
+
+        self.assertEqual(SpanRenderer().render_sentence(Sentence([BasicWord('<a').bold(), BasicWord('b')])),
+                         '<span class="error">a</span> b')
+
+    def test_escape_markdown(self):
+        self.assertEqual(escape_markdown("don't"), "don't")
+        self.assertEqual(escape_markdown('a_b*c\\'), 'a\\_b\\*c\\\\')
+
+    def test_ansi_removes_escape(self):
+        self.assertEqual(ANSI.render_hints(['a\x1b[2Jb']), 'a[2Jb')
+
+    def test_get_renderer(self):
+        for name, renderer in RENDERERS.items():
+            self.assertIs(get_renderer(name), renderer)
+        self.assertRaises(ValueError, get_renderer, 'pdf')
@@ -269,6 +269,16 @@ class TestSerializer(unittest.TestCase):
         as_obj = Serializer.to_obj(as_dict)
         self.assertEqual(as_obj, paragraph)
 
+    def test_word_to_dict_and_back(self):
+        words = [
+            BasicWord.preposition('a'), Noun('child', 'children').plural().definite(), Verb('go', 'went').negative(),
+            Pronoun.I, CapitalPronoun.ME, BeVerb.AM, Punctuation.COMMA
+        ]
+        for word in words:
+            as_dict = Serializer.to_dict(word)
+            self.assertEqual(as_dict, Serializer._word_to_dict(word))
+            self.assertEqual(Serializer.to_obj(as_dict), word)
+
     def test_to_json(self):
         paragraph = Paragraph(
             [
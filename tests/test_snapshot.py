@@ -0,0 +1,74 @@
+import json
+import os
+import tempfile
+import unittest
+
+from paragraph_generator import snapshot
+from paragraph_generator.snapshot import (SNAPSHOT_MAGIC, SNAPSHOT_VERSION, read_snapshot, source_fingerprint,
+                                          write_snapshot)
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'test.snapshot')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_header(self, header: dict, payload=b''):
+        header_bytes = json.dumps(header).encode()
+        with open(self.path, 'wb') as f:
+            f.write(SNAPSHOT_MAGIC + len(header_bytes).to_bytes(4, 'little') + header_bytes + payload)
+
+    def test_source_fingerprint(self):
+        self.assertEqual(len(source_fingerprint()), 32)
+        self.assertEqual(source_fingerprint(), source_fingerprint())
+
+    def test_round_trip(self):
+        payload = {'words': ['a', 'b'], 'count': 3, 'pair': (1, 2)}
+        write_snapshot(self.path, 'test', payload)
+        self.assertEqual(read_snapshot(self.path, 'test'), payload)
+
+    def test_read_snapshot_not_a_snapshot(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'not a snapshot at all')
+        self.assertRaises(ValueError, read_snapshot, self.path, 'test')
+
+    def test_read_snapshot_wrong_kind(self):
+        write_snapshot(self.path, 'test', 1)
+        with self.assertRaisesRegex(ValueError, "snapshot is a 'test', not a 'other'"):
+            read_snapshot(self.path, 'other')
+
+    def test_read_snapshot_old_version(self):
+        self.write_header({'kind': 'test', 'version': SNAPSHOT_VERSION - 1, 'source': source_fingerprint()})
+        with self.assertRaisesRegex(ValueError, 'stale snapshot: version'):
+            read_snapshot(self.path, 'test')
+
+    def test_read_snapshot_other_source(self):
+        write_snapshot(self.path, 'test', 1)
+        old_fingerprint = snapshot._source_fingerprint
+        snapshot._source_fingerprint = '0' * 32
+        try:
+            with self.assertRaisesRegex(ValueError, 'stale snapshot: paragraph_generator has changed'):
+                read_snapshot(self.path, 'test')
+        finally:
+            snapshot._source_fingerprint = old_fingerprint
+
+    def test_read_snapshot_damaged_header(self):
+        with open(self.path, 'wb') as f:
+            f.write(SNAPSHOT_MAGIC + (5).to_bytes(4, 'little') + b'{not json')
+        with self.assertRaisesRegex(ValueError, 'header is damaged'):
+            read_snapshot(self.path, 'test')
+        self.write_header(['kind', 'test'])
+        with self.assertRaisesRegex(ValueError, 'header is damaged'):
+            read_snapshot(self.path, 'test')
+
+    def test_read_snapshot_truncated_payload(self):
+        write_snapshot(self.path, 'test', list(range(100)))
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        with open(self.path, 'wb') as f:
+            f.write(data[:-20])
+        with self.assertRaisesRegex(ValueError, 'snapshot is damaged'):
+            read_snapshot(self.path, 'test')
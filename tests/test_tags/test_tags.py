@@ -93,6 +93,19 @@ class TestTags(unittest.TestCase):
         self.assertIsNot(tags, new_tags)
         self.assertEqual(tags, new_tags)
 
+    def test_add_and_remove_return_self_when_nothing_changes(self):
+        tags = Tags([WordTag.THIRD_PERSON, WordTag.PAST])
+        self.assertIs(tags.add(WordTag.PAST), tags)
+        self.assertIs(tags.remove(WordTag.DEFINITE), tags)
+        self.assertEqual(tags.add(WordTag.DEFINITE), Tags([WordTag.THIRD_PERSON, WordTag.PAST, WordTag.DEFINITE]))
+        self.assertEqual(tags, Tags([WordTag.THIRD_PERSON, WordTag.PAST]))
+
+    def test_hash(self):
+        tags = Tags([WordTag.THIRD_PERSON, WordTag.DEFINITE])
+        equal_tags = Tags([WordTag.DEFINITE, WordTag.THIRD_PERSON])
+        self.assertEqual(hash(tags), hash(equal_tags))
+        self.assertEqual(len({tags, equal_tags, Tags()}), 2)
+
     def test_equality(self):
         tags = Tags([WordTag.THIRD_PERSON, WordTag.DEFINITE])
         equal_tags = Tags([WordTag.DEFINITE, WordTag.THIRD_PERSON, WordTag.THIRD_PERSON])
@@ -0,0 +1,120 @@
+import random
+import threading
+import unittest
+
+from paragraph_generator.backend.error_maker import ErrorMaker
+from paragraph_generator.backend.random_assignments.random_paragraph import RandomParagraph
+from paragraph_generator.paragraphsgenerator import ParagraphsGenerator
+from paragraph_generator.word_lists import WordLists
+
+THREADS = 8
+REPEATS = 10
+
+
+def run_in_threads(target, thread_count=THREADS):
+    """runs target(thread_index) in thread_count threads released at the same moment. re-raises any error."""
+    barrier = threading.Barrier(thread_count)
+    results = [None] * thread_count
+    errors = []
+
+    def work(index):
+        try:
+            barrier.wait()
+            results[index] = target(index)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(index,)) for index in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return results
+
+
+class TestThreadSafety(unittest.TestCase):
+    def setUp(self):
+        self.config = {'error_probability': 0.5, 'is_do_errors': True, 'preposition_transpose_errors': True,
+                       'paragraph_size': 10}
+        self.verbs = [
+            {'verb': 'take', 'irregular_past': 'took', 'preposition': '', 'particle': 'away', 'objects': 1},
+            {'verb': 'give', 'irregular_past': 'gave', 'preposition': 'to', 'particle': '', 'objects': 2},
+            {'verb': 'play', 'irregular_past': '', 'preposition': 'with', 'particle': '', 'objects': 1},
+            {'verb': 'eat', 'irregular_past': 'ate', 'preposition': '', 'particle': '', 'objects': 1},
+        ]
+        self.countable = [{'noun': 'dog', 'irregular_plural': ''}, {'noun': 'child', 'irregular_plural': 'children'}]
+        self.uncountable = [{'noun': 'water', 'definite': False}, {'noun': 'air', 'definite': True}]
+        self.static = [{'noun': 'Joe', 'is_plural': False}]
+        self.word_lists = WordLists(self.verbs, self.countable, self.uncountable, self.static)
+
+    def generate_all(self, generator, seed):
+        rng = random.Random(seed)
+        return [generator.generate_paragraphs(rng) for _ in range(REPEATS)]
+
+    def test_shared_generator_with_per_thread_rng_matches_single_threaded_results(self):
+        generator = ParagraphsGenerator(self.config, self.word_lists)
+        expected = [self.generate_all(generator, seed) for seed in range(THREADS)]
+
+        answer = run_in_threads(lambda seed: self.generate_all(generator, seed))
+        self.assertEqual(answer, expected)
+
+    def test_shared_generator_with_default_rng_produces_valid_paragraphs(self):
+        generator = ParagraphsGenerator(self.config, self.word_lists)
+
+        def generate(_):
+            return [generator.generate_paragraphs() for _ in range(REPEATS)]
+
+        for results in run_in_threads(generate):
+            for answer, error in results:
+                self.assertEqual(len(answer), 10)
+                self.assertEqual(len(error), 10)
+
+    def test_per_thread_rng_does_not_touch_module_random_state(self):
+        generator = ParagraphsGenerator(self.config, self.word_lists)
+        random.seed(1234)
+        expected = random.random()
+
+        random.seed(1234)
+        run_in_threads(lambda seed: self.generate_all(generator, seed))
+        self.assertEqual(random.random(), expected)
+
+    def test_random_paragraph_rng(self):
+        first = RandomParagraph(0.5, self.word_lists.verbs, self.word_lists.nouns, random.Random(3))
+        second = RandomParagraph(0.5, self.word_lists.verbs, self.word_lists.nouns, random.Random(3))
+        self.assertEqual(first.create_pool_paragraph(2, 5), second.create_pool_paragraph(2, 5))
+        self.assertEqual(first.create_chain_paragraph(5), second.create_chain_paragraph(5))
+
+    def test_error_maker_rng_is_passed_to_chained_error_makers(self):
+        generator = ParagraphsGenerator(self.config, self.word_lists)
+        answer, _ = generator.generate_paragraphs(random.Random(5))
+
+        def make_errors(seed):
+            error_maker = ErrorMaker(answer, random.Random(seed))
+            return error_maker.noun_errors(0.5).verb_errors(0.5).punctuation_errors(0.5).get_paragraph()
+
+        expected = [make_errors(seed) for seed in range(THREADS)]
+        self.assertEqual(run_in_threads(make_errors), expected)
+
+    def test_word_lists_is_not_affected_by_changes_to_input_lists(self):
+        expected_verbs = self.word_lists.verbs
+        expected_nouns = self.word_lists.nouns
+
+        self.verbs[0]['verb'] = 'oops'
+        self.verbs.append(self.verbs[1])
+        self.countable.clear()
+        self.uncountable[0]['noun'] = 'oops'
+
+        self.assertEqual(self.word_lists.verbs, expected_verbs)
+        self.assertEqual(self.word_lists.nouns, expected_nouns)
+
+    def test_shared_word_lists_materialize_equal_words_in_every_thread(self):
+        expected = (self.word_lists.verbs, self.word_lists.nouns)
+
+        def materialize(_):
+            return [(self.word_lists.verbs, self.word_lists.nouns) for _ in range(REPEATS)]
+
+        for results in run_in_threads(materialize):
+            for result in results:
+                self.assertEqual(result, expected)
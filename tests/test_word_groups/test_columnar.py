@@ -0,0 +1,234 @@
+import io
+import unittest
+from array import array
+
+from paragraph_generator.tags.status_tag import StatusTag
+from paragraph_generator.tags.tags import Tags
+from paragraph_generator.tags.wordtag import WordTag
+from paragraph_generator.word_groups.columnar import (Vocabulary, ParagraphBatch, ColumnarParagraph, get_mask, tag_bit,
+                                                      KIND_NOUN, KIND_VERB, KIND_BE_VERB, KIND_PRONOUN,
+                                                      KIND_FIRST_PERSON, KIND_PUNCTUATION)
+from paragraph_generator.word_groups.paragraph import Paragraph
+from paragraph_generator.word_groups.sentence import Sentence
+from paragraph_generator.words.basicword import BasicWord
+from paragraph_generator.words.be_verb import BeVerb
+from paragraph_generator.words.noun import Noun
+from paragraph_generator.words.pronoun import Pronoun, CapitalPronoun
+from paragraph_generator.words.punctuation import Punctuation
+from paragraph_generator.words.verb import Verb
+
+
+class TestVocabulary(unittest.TestCase):
+    def test_get_mask_kinds(self):
+        self.assertEqual(get_mask(Noun('dog')), KIND_NOUN)
+        self.assertEqual(get_mask(Verb('go')), KIND_VERB)
+        self.assertEqual(get_mask(BeVerb.BE), KIND_BE_VERB)
+        self.assertEqual(get_mask(Pronoun.HIM), KIND_PRONOUN)
+        self.assertEqual(get_mask(Punctuation.PERIOD), KIND_PUNCTUATION)
+        self.assertEqual(get_mask(BasicWord('x')), 0)
+
+    def test_get_mask_tags(self):
+        self.assertEqual(get_mask(Noun('dog').plural().definite()),
+                         KIND_NOUN | tag_bit(WordTag.PLURAL) | tag_bit(WordTag.DEFINITE))
+        self.assertEqual(get_mask(BeVerb.WERE_NOT),
+                         KIND_BE_VERB | tag_bit(WordTag.PAST) | tag_bit(WordTag.NEGATIVE))
+        self.assertEqual(get_mask(BasicWord.preposition('to')), tag_bit(WordTag.PREPOSITION))
+
+    def test_get_mask_pronouns(self):
+        self.assertEqual(get_mask(CapitalPronoun.ME), KIND_PRONOUN | KIND_FIRST_PERSON)
+        self.assertEqual(get_mask(Pronoun.THEY), KIND_PRONOUN | tag_bit(WordTag.PLURAL))
+
+    def test_intern_gives_equal_words_the_same_id(self):
+        vocabulary = Vocabulary()
+        self.assertEqual(vocabulary.intern(Noun('dog')), 0)
+        self.assertEqual(vocabulary.intern(Verb('dog')), 1)
+        self.assertEqual(vocabulary.intern(Noun('dog')), 0)
+        self.assertEqual(vocabulary.intern(Pronoun.I), 2)
+        self.assertEqual(vocabulary.intern(CapitalPronoun.I), 3)
+        self.assertEqual(len(vocabulary), 4)
+
+    def test_word_mask_and_get_id(self):
+        vocabulary = Vocabulary([Noun('dog'), Verb('go')])
+        self.assertEqual(vocabulary.word(1), Verb('go'))
+        self.assertEqual(vocabulary.mask(1), KIND_VERB)
+        self.assertEqual(vocabulary.get_id(Verb('go')), 1)
+        self.assertEqual(vocabulary.get_id(Verb('went')), -1)
+        self.assertEqual(len(vocabulary), 2)
+
+    def test_transform(self):
+        vocabulary = Vocabulary([Noun('dog')])
+        plural_id = vocabulary.transform(0, 'plural')
+        self.assertEqual(vocabulary.word(plural_id), Noun('dog').plural())
+        self.assertEqual(vocabulary.transform(0, 'plural'), plural_id)
+        self.assertEqual(vocabulary.transform(plural_id, 'plural'), plural_id)
+        self.assertEqual(len(vocabulary), 2)
+
+
+class TestParagraphBatch(unittest.TestCase):
+    def setUp(self):
+        self.paragraphs = [
+            Paragraph([Sentence([Noun('dog'), Verb('go'), Punctuation.PERIOD]),
+                       Sentence([Pronoun.I, Verb('go'), Noun('dog'), Punctuation.EXCLAMATION])],
+                      Tags([StatusTag.RAW])),
+            Paragraph([], Tags([StatusTag.HAS_PLURALS])),
+            Paragraph([Sentence([]), Sentence([BeVerb.IS])]),
+        ]
+
+    def test_from_paragraphs(self):
+        batch = ParagraphBatch.from_paragraphs(self.paragraphs)
+        self.assertEqual(batch.word_ids, array('L', [0, 1, 2, 3, 1, 0, 4, 5]))
+        self.assertEqual(batch.sentence_offsets, array('L', [0, 3, 7, 7, 8]))
+        self.assertEqual(batch.paragraph_offsets, array('L', [0, 2, 2, 4]))
+        self.assertEqual(batch.tags, (Tags([StatusTag.RAW]), Tags([StatusTag.HAS_PLURALS]), Tags()))
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(len(batch.vocabulary), 6)
+
+    def test_masks(self):
+        batch = ParagraphBatch.from_paragraphs(self.paragraphs[2:])
+        self.assertEqual(batch.masks(), array('L', [KIND_BE_VERB | tag_bit(WordTag.THIRD_PERSON)]))
+
+    def test_round_trip(self):
+        batch = ParagraphBatch.from_paragraphs(self.paragraphs)
+        self.assertEqual(batch.to_paragraphs(), self.paragraphs)
+
+    def test_shared_vocabulary(self):
+        vocabulary = Vocabulary([Punctuation.PERIOD])
+        batch = ParagraphBatch.from_paragraphs(self.paragraphs[:1], vocabulary)
+        self.assertIs(batch.vocabulary, vocabulary)
+        self.assertEqual(batch.word_ids[:3], array('L', [1, 2, 0]))
+        self.assertEqual(batch.to_paragraphs(), self.paragraphs[:1])
+
+
+class TestColumnarParagraph(unittest.TestCase):
+    def setUp(self):
+        self.sentences = [Sentence([Noun('dog'), Verb('eat'), Noun('cat'), Punctuation.PERIOD]),
+                          Sentence([Pronoun.HE, BeVerb.IS, Noun('dog'), Punctuation.EXCLAMATION]),
+                          Sentence([BasicWord('x')])]
+        self.tags = Tags([StatusTag.RAW])
+        self.paragraph = Paragraph(self.sentences, self.tags)
+        self.columnar = ColumnarParagraph.from_paragraph(self.paragraph)
+
+    def test_from_paragraph(self):
+        self.assertEqual(self.columnar.word_ids, array('L', [0, 1, 2, 3, 4, 5, 0, 6, 7]))
+        self.assertEqual(self.columnar.sentence_offsets, array('L', [0, 4, 8, 9]))
+        self.assertEqual(self.columnar.masks[:2], array('L', [KIND_NOUN, KIND_VERB]))
+        self.assertEqual(self.columnar.tags, self.tags)
+
+    def test_round_trip(self):
+        answer = self.columnar.to_paragraph()
+        self.assertIs(type(answer), Paragraph)
+        self.assertIs(type(answer.get_sentence(0)), Sentence)
+        self.assertEqual(answer, self.paragraph)
+
+    def test_is_a_paragraph_and_compares_equal_both_ways(self):
+        self.assertIsInstance(self.columnar, Paragraph)
+        self.assertEqual(self.columnar, self.paragraph)
+        self.assertEqual(self.paragraph, self.columnar)
+        self.assertNotEqual(self.columnar, self.paragraph.set_tags(Tags()))
+
+    def test_paragraph_read_api(self):
+        self.assertEqual(len(self.columnar), 3)
+        self.assertEqual(list(self.columnar), self.sentences)
+        self.assertEqual(self.columnar.sentence_list(), self.sentences)
+        self.assertEqual(str(self.columnar), str(self.paragraph))
+        stream = io.StringIO()
+        self.columnar.write(stream)
+        self.assertEqual(stream.getvalue(), str(self.paragraph))
+        self.assertEqual(list(self.columnar.all_words()), list(self.paragraph.all_words()))
+        self.assertEqual(list(self.columnar.indexed_all_words()), list(self.paragraph.indexed_all_words()))
+        self.assertEqual(self.columnar.get_sentence(-1), self.sentences[-1])
+        self.assertRaises(IndexError, self.columnar.get_sentence, 3)
+
+    def test_from_word_lists(self):
+        vocabulary = Vocabulary()
+        columnar = ColumnarParagraph.from_word_lists([sentence.word_list() for sentence in self.sentences], self.tags,
+                                                     vocabulary)
+        self.assertIsInstance(columnar, ColumnarParagraph)
+        self.assertIs(columnar.vocabulary, vocabulary)
+        self.assertEqual(columnar, self.paragraph)
+        self.assertEqual(ColumnarParagraph.from_word_lists([[BasicWord('x')]]).tags, Tags())
+
+    def test_paragraph_methods_that_are_not_overridden(self):
+        self.assertEqual(self.columnar._get_word_positions(), self.paragraph._get_word_positions())
+        self.assertEqual(self.columnar._find_by_scanning(Noun('dog')), [(0, 0), (1, 2)])
+        self.assertEqual(Paragraph.set_sentence(self.columnar, 2, Sentence()),
+                         self.paragraph.set_sentence(2, Sentence()))
+        self.assertEqual(Paragraph.set_tags(self.columnar, Tags()), self.paragraph.set_tags(Tags()))
+
+    def test_find(self):
+        self.assertEqual(self.columnar.find(Noun('dog')), [(0, 0), (1, 2)])
+        self.assertEqual(self.columnar.find(Punctuation.EXCLAMATION), [(1, 3)])
+        self.assertEqual(self.columnar.find(Noun('pig')), [])
+        self.assertEqual(self.columnar.find(Noun('dog')), self.paragraph.find(Noun('dog')))
+
+    def test_find_keeps_an_index_of_word_ids(self):
+        answer = self.columnar.find(Noun('dog'))
+        answer.append((5, 5))
+        self.assertEqual(self.columnar.find(Noun('dog')), [(0, 0), (1, 2)])
+        self.assertEqual(self.columnar._id_positions[0], [(0, 0), (1, 2)])
+        self.assertEqual(self.columnar.find(BasicWord('x')), [(2, 0)])
+        self.assertEqual(self.columnar.set(2, 0, Noun('dog')).find(Noun('dog')), [(0, 0), (1, 2), (2, 0)])
+
+    def test_find_unhashable_word(self):
+        class Unhashable(BasicWord):
+            __hash__ = None
+
+        self.assertEqual(self.columnar.find(Unhashable('x')), [(2, 0)])
+
+    def test_set_and_set_tags_return_new_columnar_paragraphs(self):
+        new = self.columnar.set(1, -1, Punctuation.PERIOD)
+        self.assertIsInstance(new, ColumnarParagraph)
+        self.assertEqual(new, self.paragraph.set(1, -1, Punctuation.PERIOD))
+        self.assertEqual(self.columnar, self.paragraph)
+
+        new = self.columnar.set_tags(Tags([StatusTag.HAS_PLURALS]))
+        self.assertEqual(new, self.paragraph.set_tags(Tags([StatusTag.HAS_PLURALS])))
+
+    def test_set_sentence(self):
+        new_sentence = Sentence([BasicWord('a'), BasicWord('b')])
+        new = self.columnar.set_sentence(0, new_sentence)
+        self.assertEqual(new, self.paragraph.set_sentence(0, new_sentence))
+        self.assertEqual(new.sentence_offsets, array('L', [0, 2, 6, 7]))
+
+    def test_sentence_view_read_api(self):
+        view = self.columnar.get_sentence(1)
+        sentence = self.sentences[1]
+        self.assertIsInstance(view, Sentence)
+        self.assertEqual(view, sentence)
+        self.assertEqual(sentence, view)
+        self.assertEqual(view.word_list(), sentence.word_list())
+        self.assertEqual(list(view), list(sentence))
+        self.assertEqual(len(view), 4)
+        self.assertEqual(view.get(-1), Punctuation.EXCLAMATION)
+        self.assertRaises(IndexError, view.get, 4)
+        self.assertEqual(str(view), 'he is dog!')
+        self.assertEqual(repr(view), 'SentenceView({!r})'.format(sentence.word_list()))
+
+    def test_sentence_view_get_verb_and_subject(self):
+        for view, sentence in zip(self.columnar, self.sentences):
+            self.assertEqual(view.get_verb(), sentence.get_verb())
+            self.assertEqual(view.get_subject(), sentence.get_subject())
+
+    def test_sentence_view_changes_return_sentences(self):
+        view = self.columnar.get_sentence(0)
+        sentence = self.sentences[0]
+        for method, args in (('set', (0, BasicWord('z'))), ('delete', (1,)), ('insert', (1, BasicWord('z'))),
+                             ('insert_list', (1, [BasicWord('y'), BasicWord('z')]))):
+            answer = getattr(view, method)(*args)
+            self.assertIs(type(answer), Sentence)
+            self.assertEqual(answer, getattr(sentence, method)(*args))
+
+    def test_sentence_view_is_set_up_like_a_sentence(self):
+        view = self.columnar.get_sentence(1)
+        self.assertEqual(view.word_list(), self.sentences[1].word_list())
+        self.assertEqual(view.get_verb(), 1)
+        self.assertEqual(Sentence.get_verb(view), 1)
+        self.assertEqual(Sentence.__str__(view), 'he is dog!')
+        self.assertEqual(self.columnar.get_sentence(2).get_verb(), -1)
+
+    def test_batch_paragraph(self):
+        paragraphs = [self.paragraph, Paragraph([]), self.paragraph.set_tags(Tags())]
+        batch = ParagraphBatch.from_paragraphs(paragraphs)
+        for index, expected in enumerate(paragraphs):
+            self.assertEqual(batch.paragraph(index), expected)
+        self.assertIs(batch.paragraph(2).vocabulary, batch.vocabulary)
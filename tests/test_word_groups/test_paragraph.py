@@ -1,3 +1,4 @@
+import io
 import unittest
 
 from paragraph_generator.tags.status_tag import StatusTag
@@ -21,7 +22,7 @@ class TestParagraph(unittest.TestCase):
         paragraph = Paragraph(sentence_list, tags)
         self.assertEqual(paragraph.tags, tags)
         self.assertEqual(paragraph.sentence_list(), sentence_list)
-        self.assertIsNot(paragraph.tags, tags)
+        self.assertIs(paragraph.tags, tags)
         self.assertIsNot(paragraph.sentence_list(), sentence_list)
 
         old_sentence_list = paragraph.sentence_list()
@@ -57,6 +58,11 @@ class TestParagraph(unittest.TestCase):
         self.assertNotEqual(Paragraph([Sentence([BasicWord('a')])], tags),
                             Paragraph([Sentence([BasicWord('b')])], tags))
 
+    def test__eq__false_by_sentence_count(self):
+        sentence_list = [Sentence([BasicWord('hi')]), Sentence([BasicWord('ho')])]
+        self.assertNotEqual(Paragraph(sentence_list), Paragraph(sentence_list[:1]))
+        self.assertNotEqual(Paragraph(sentence_list[:1]), Paragraph(sentence_list))
+
     def test__eq__false_by_type(self):
         self.assertNotEqual(Paragraph([]), [[]])
 
@@ -83,6 +89,23 @@ class TestParagraph(unittest.TestCase):
         paragraph = Paragraph(sentence_list, tags)
         self.assertEqual(str(paragraph), 'hi there. ho there!')
 
+    def test_str_is_made_once(self):
+        paragraph = Paragraph([Sentence([BasicWord('hi'), Punctuation.PERIOD])])
+        self.assertIs(str(paragraph), str(paragraph))
+        new_paragraph = paragraph.set_sentence(0, Sentence([BasicWord('ho'), Punctuation.PERIOD]))
+        self.assertEqual(str(new_paragraph), 'ho.')
+        self.assertEqual(str(paragraph), 'hi.')
+
+    def test_write(self):
+        sentence_list = [Sentence([BasicWord('hi'), BasicWord('there'), Punctuation.PERIOD]),
+                         Sentence([BasicWord('ho'), BasicWord('there'), Punctuation.EXCLAMATION])]
+        for paragraph in (Paragraph(sentence_list), Paragraph([]), Paragraph(sentence_list[:1])):
+            stream = io.StringIO()
+            paragraph.write(stream)
+            self.assertEqual(stream.getvalue(), str(paragraph))
+            paragraph.write(stream)
+            self.assertEqual(stream.getvalue(), str(paragraph) * 2)
+
     def test_repr_used_only_for_testing(self):
         sentences = [Sentence([BasicWord('x')])]
         paragraph = Paragraph(sentences)
@@ -161,6 +184,48 @@ class TestParagraph(unittest.TestCase):
         ])
         self.assertEqual(paragraph.find(BasicWord('x')), [(0, 0), (1, 2)])
 
+    def test_find_repeated_calls_and_changing_the_answer_is_safe(self):
+        paragraph = Paragraph.from_word_lists([[BasicWord('x'), BasicWord('y')], [BasicWord('x')]])
+        answer = paragraph.find(BasicWord('x'))
+        answer.append((5, 5))
+        self.assertEqual(paragraph.find(BasicWord('x')), [(0, 0), (1, 0)])
+        self.assertEqual(paragraph.find(BasicWord('y')), [(0, 1)])
+        self.assertEqual(paragraph.find(BasicWord('z')), [])
+        self.assertEqual(paragraph.find(Punctuation.COMMA), [])
+
+    def test_find_on_new_paragraph_from_set_is_up_to_date(self):
+        paragraph = Paragraph.from_word_lists([[BasicWord('x'), BasicWord('y')], [BasicWord('x')]])
+        self.assertEqual(paragraph.find(BasicWord('x')), [(0, 0), (1, 0)])
+        new_paragraph = paragraph.set(0, 0, BasicWord('y'))
+        self.assertEqual(new_paragraph.find(BasicWord('x')), [(1, 0)])
+        self.assertEqual(new_paragraph.find(BasicWord('y')), [(0, 0), (0, 1)])
+        self.assertEqual(paragraph.find(BasicWord('x')), [(0, 0), (1, 0)])
+
+    def test_find_unhashable_word(self):
+        class Unhashable(BasicWord):
+            __hash__ = None
+
+        paragraph = Paragraph.from_word_lists([[BasicWord('x'), Unhashable('x')]])
+        self.assertEqual(paragraph.find(Unhashable('x')), [(0, 0), (0, 1)])
+
+    def test_find_does_not_build_the_index_again_after_an_unhashable_word(self):
+        class Unhashable(BasicWord):
+            __hash__ = None
+
+        class CountingParagraph(Paragraph):
+            calls = 0
+
+            def indexed_all_words(self):
+                CountingParagraph.calls += 1
+                return super(CountingParagraph, self).indexed_all_words()
+
+        paragraph = CountingParagraph([Sentence([BasicWord('x'), Unhashable('x')]), Sentence([BasicWord('y')])])
+        self.assertIsNone(paragraph._get_word_positions())
+        self.assertEqual(paragraph.find(BasicWord('y')), [(1, 0)])
+        self.assertEqual(paragraph.find(BasicWord('x')), [(0, 0), (0, 1)])
+        self.assertIsNone(paragraph._get_word_positions())
+        self.assertEqual(CountingParagraph.calls, 3)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,3 +1,4 @@
+import io
 import unittest
 
 from paragraph_generator.word_groups.sentence import Sentence
@@ -19,6 +20,21 @@ class TestSentence(unittest.TestCase):
         self.assertEqual(actual, input_list)
         self.assertIsNot(actual, input_list)
 
+    def test_init_copies_any_iterable(self):
+        input_list = [BasicWord('Hello'), BasicWord('world')]
+        from_tuple = Sentence(tuple(input_list))
+        from_generator = Sentence(word for word in input_list)
+        self.assertEqual(from_tuple, Sentence(input_list))
+        self.assertEqual(from_generator, Sentence(input_list))
+
+    def test_changing_word_list_does_not_change_sentence(self):
+        input_list = [BasicWord('Hello'), BasicWord('world')]
+        sentence = Sentence(input_list)
+        input_list[0] = BasicWord('Goodbye')
+        answer = sentence.word_list()
+        answer[1] = BasicWord('moon')
+        self.assertEqual(list(sentence), [BasicWord('Hello'), BasicWord('world')])
+
     def test_eq_true(self):
         input_list = [BasicWord('Hello'), BasicWord('world')]
         sentence = Sentence(input_list)
@@ -55,6 +71,24 @@ class TestSentence(unittest.TestCase):
         ])
         self.assertEqual(str(sentence), "He doesn't go home, but she goes home.")
 
+    def test_sentence_str_empty_first_word_has_no_space_after_it(self):
+        sentence = Sentence([BasicWord(''), BasicWord('hi'), BasicWord(''), Punctuation.PERIOD])
+        self.assertEqual(str(sentence), 'hi .')
+
+    def test_sentence_str_is_made_once(self):
+        sentence = Sentence([BasicWord('I'), Verb('go'), Punctuation.PERIOD])
+        self.assertIs(str(sentence), str(sentence))
+        self.assertEqual(str(sentence.insert(2, BasicWord('home'))), 'I go home.')
+        self.assertEqual(str(sentence), 'I go.')
+
+    def test_sentence_write(self):
+        sentence = Sentence([BasicWord('I'), Verb('go'), Punctuation.PERIOD])
+        stream = io.StringIO()
+        sentence.write(stream)
+        Sentence().write(stream)
+        sentence.write(stream)
+        self.assertEqual(stream.getvalue(), 'I go.I go.')
+
     def test_sentence_get_verb_no_verb(self):
         sentence = Sentence([BasicWord('Hello'), BasicWord('world')])
         self.assertEqual(sentence.get_verb(), -1)
@@ -165,3 +199,14 @@ class TestSentence(unittest.TestCase):
     def test_sentence_get_subject_no_subject(self):
         sentence = Sentence([Verb('do'), BasicWord('it')])
         self.assertEqual(sentence.get_subject(), -1)
+
+    def test_sentence_get_verb_and_subject_are_stable_across_calls_and_new_sentences(self):
+        sentence = Sentence([BasicWord('Bob'), Verb('go'), BasicWord('home')])
+        self.assertEqual(sentence.get_verb(), 1)
+        self.assertEqual(sentence.get_verb(), 1)
+        self.assertEqual(sentence.get_subject(), 0)
+
+        new_sentence = sentence.insert(0, BasicWord('big'))
+        self.assertEqual(new_sentence.get_verb(), 2)
+        self.assertEqual(new_sentence.get_subject(), 1)
+        self.assertEqual(sentence.get_verb(), 1)
@@ -1,7 +1,10 @@
+import io
 import unittest
+from array import array
 
 from paragraph_generator.word_groups.verb_group import VerbGroup
-from paragraph_generator.word_lists import WordLists, AbstractWordLists
+from paragraph_generator.word_lists import (ColumnarWordLists, WordLists, AbstractWordLists, read_csv_columns,
+                                           _GeneratedWordLists)
 from paragraph_generator.words.basicword import BasicWord
 from paragraph_generator.words.noun import Noun
 from paragraph_generator.words.verb import Verb
@@ -23,6 +26,38 @@ class TestAbstractWordLists(unittest.TestCase):
         self.assertRaises(NotImplementedError, getattr, test, 'verbs')
 
 
+class TestGeneratedWordLists(unittest.TestCase):
+    def test_words_are_generated_once_and_copied(self):
+        class TestClass(_GeneratedWordLists):
+            calls = 0
+
+            def _generate_verb_groups(self):
+                TestClass.calls += 1
+                return [VerbGroup(Verb('go'), None, None, 0)]
+
+            def _generate_countable(self):
+                TestClass.calls += 1
+                return [Noun('dog')]
+
+            def _generate_uncountable(self):
+                return [Noun.uncountable_noun('air')]
+
+            def _generate_static(self):
+                return [Noun.proper_noun('Joe')]
+
+        test = TestClass()
+        verbs = test.verbs
+        verbs.append(None)
+        self.assertEqual(test.verbs, [VerbGroup(Verb('go'), None, None, 0)])
+        self.assertEqual(test.nouns, [Noun('dog'), Noun.uncountable_noun('air'), Noun.proper_noun('Joe')])
+        self.assertEqual(test.nouns, [Noun('dog'), Noun.uncountable_noun('air'), Noun.proper_noun('Joe')])
+        self.assertEqual(TestClass.calls, 2)
+
+    def test_word_lists_share_it(self):
+        self.assertIsInstance(WordLists(), _GeneratedWordLists)
+        self.assertIsInstance(ColumnarWordLists(), _GeneratedWordLists)
+
+
 class TestWordLists(unittest.TestCase):
     def assert_unordered_lists(self, first, second):
         for el in first:
@@ -90,3 +125,108 @@ class TestWordLists(unittest.TestCase):
         expected_nouns = [Noun('dog'), Noun.uncountable_noun('water'), Noun.proper_noun('Joe')]
         self.assert_unordered_lists(lists.verbs, expected_verbs)
         self.assert_unordered_lists(lists.nouns, expected_nouns)
+
+
+class TestColumnarWordLists(unittest.TestCase):
+    def setUp(self):
+        self.verbs = {'verb': ['take', 'play'], 'irregular_past': ['took', ''], 'preposition': ['with', ''],
+                      'particle': ['away', ''], 'objects': [2, 1]}
+        self.countable = {'noun': ['dog', 'child'], 'irregular_plural': ['', 'children']}
+        self.uncountable = {'noun': ['water', 'air'], 'definite': [True, False]}
+        self.static = {'noun': ['the Dude', 'the Joneses'], 'is_plural': [False, True]}
+
+    def test_isinstance_AbstractWordList(self):
+        self.assertIsInstance(ColumnarWordLists(), AbstractWordLists)
+
+    def test_init_empty(self):
+        lists = ColumnarWordLists()
+        self.assertEqual(lists.verbs, [])
+        self.assertEqual(lists.nouns, [])
+
+    def test_same_words_as_word_lists(self):
+        def rows(columns):
+            return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+        lists = ColumnarWordLists(self.verbs, self.countable, self.uncountable, self.static)
+        expected = WordLists(rows(self.verbs), rows(self.countable), rows(self.uncountable), rows(self.static))
+        self.assertEqual(lists.verbs, expected.verbs)
+        self.assertEqual(lists.nouns, expected.nouns)
+
+    def test_default_columns(self):
+        lists = ColumnarWordLists(verbs={'verb': ['play']}, countable={'noun': ['dog']}, uncountable={'noun': ['air']},
+                                  static={'noun': ['Joe']})
+        self.assertEqual(lists.verbs, [VerbGroup(Verb('play'), None, None, 1)])
+        self.assertEqual(lists.nouns, [Noun('dog'), Noun.uncountable_noun('air'), Noun.proper_noun('Joe')])
+
+    def test_columns_can_be_any_sequence(self):
+        lists = ColumnarWordLists(verbs={'verb': ('go', 'eat'), 'objects': array('b', [0, 2])},
+                                  static={'noun': iter_list(['Joe']), 'is_plural': array('B', [1])})
+        self.assertEqual(lists.verbs, [VerbGroup(Verb('go'), None, None, 0), VerbGroup(Verb('eat'), None, None, 2)])
+        self.assertEqual(lists.nouns, [Noun.proper_noun('Joe', plural=True)])
+
+    def test_strings_are_interned(self):
+        lists = ColumnarWordLists(verbs={'verb': ['go', 'eat'], 'preposition': ['with', ''.join(['wi', 'th'])]})
+        first, second = lists.verbs
+        self.assertIs(first.preposition, second.preposition)
+        self.assertIs(lists._verbs['preposition'][0], lists._verbs['preposition'][1])
+
+    def test_bool_strings(self):
+        lists = ColumnarWordLists(uncountable={'noun': ['water', 'air', 'rice'], 'definite': ['True', ' no ', '']},
+                                  static={'noun': ['the Joneses', 'Joe'], 'is_plural': ['p', 'false']})
+        self.assertEqual(lists.nouns, [Noun.uncountable_noun('water').definite(), Noun.uncountable_noun('air'),
+                                       Noun.uncountable_noun('rice'), Noun.proper_noun('the Joneses', plural=True),
+                                       Noun.proper_noun('Joe')])
+
+    def test_verbs_and_nouns_are_cached_copies(self):
+        lists = ColumnarWordLists(self.verbs, self.countable)
+        self.assertEqual(lists.nouns, lists.nouns)
+        self.assertIsNot(lists.nouns, lists.nouns)
+        self.assertIs(lists.nouns[0], lists.nouns[0])
+
+    def test_unknown_column_raises_value_error(self):
+        self.assertRaises(ValueError, ColumnarWordLists, countable={'noun': ['dog'], 'plural': ['dogs']})
+
+    def test_missing_required_column_raises_value_error(self):
+        self.assertRaises(ValueError, ColumnarWordLists, verbs={'irregular_past': ['went']})
+
+    def test_columns_of_different_lengths_raise_value_error(self):
+        self.assertRaises(ValueError, ColumnarWordLists, verbs={'verb': ['go', 'eat'], 'objects': [1]})
+
+    def test_empty_word_raises_value_error(self):
+        with self.assertRaisesRegex(ValueError, "'noun' is empty at index 1"):
+            ColumnarWordLists(countable={'noun': ['dog', ' ']})
+
+    def test_bad_objects_raise_value_error(self):
+        for bad in (-1, 1.5, 'one', None):
+            self.assertRaises(ValueError, ColumnarWordLists, verbs={'verb': ['go'], 'objects': [bad]})
+
+    def test_bad_bool_raises_value_error(self):
+        for bad in ('maybe', 2, None):
+            self.assertRaises(ValueError, ColumnarWordLists, static={'noun': ['Joe'], 'is_plural': [bad]})
+
+    def test_non_string_raises_value_error(self):
+        self.assertRaises(ValueError, ColumnarWordLists, countable={'noun': [1]})
+
+    def test_read_csv_columns(self):
+        stream = io.StringIO('noun, irregular_plural\ndog,\n\nchild, children\n')
+        self.assertEqual(read_csv_columns(stream), {'noun': ['dog', 'child'], 'irregular_plural': ['', 'children']})
+
+    def test_read_csv_columns_empty(self):
+        self.assertEqual(read_csv_columns(io.StringIO('')), {})
+
+    def test_read_csv_columns_wrong_field_count_raises_value_error(self):
+        stream = io.StringIO('noun, irregular_plural\ndog\n')
+        self.assertRaisesRegex(ValueError, 'csv line 2 has 1 fields, not 2', read_csv_columns, stream)
+
+    def test_from_csv(self):
+        verbs = io.StringIO('verb,irregular_past,preposition,particle,objects\ntake,took,with,away,2\nplay,,,,1\n')
+        static = io.StringIO('noun,is_plural\nthe Joneses,p\n')
+        lists = ColumnarWordLists.from_csv(verbs=verbs, static=static)
+        self.assertEqual(lists.verbs, [VerbGroup(Verb('take', 'took'), BasicWord.preposition('with'),
+                                                 BasicWord.particle('away'), 2),
+                                       VerbGroup(Verb('play'), None, None, 1)])
+        self.assertEqual(lists.nouns, [Noun.proper_noun('the Joneses', plural=True)])
+
+
+def iter_list(values):
+    return (value for value in values)
@@ -98,3 +98,30 @@ class TestBeVerb(unittest.TestCase):
 
     def test_be_has_no_past_tense(self):
         self.assertEqual(BeVerb.BE.past_tense(), BeVerb.BE)
+
+    def test_tables_match_the_name_based_rules(self):
+        for be_verb in BeVerb:
+            name = be_verb.name
+
+            expected_tags = []
+            if 'IS' in name:
+                expected_tags.append(WordTag.THIRD_PERSON)
+            if 'NOT' in name:
+                expected_tags.append(WordTag.NEGATIVE)
+            if 'WAS' in name or 'WERE' in name:
+                expected_tags.append(WordTag.PAST)
+            self.assertEqual(be_verb.tags, Tags(expected_tags))
+            for tag in WordTag:
+                self.assertEqual(be_verb.has_tags(tag), tag in expected_tags)
+            self.assertTrue(be_verb.has_tags(*expected_tags))
+
+            if WordTag.NEGATIVE in expected_tags or be_verb == BeVerb.BE:
+                self.assertIs(be_verb.negative(), be_verb)
+            else:
+                self.assertIs(be_verb.negative(), BeVerb[name + '_NOT'])
+
+            if WordTag.PAST in expected_tags:
+                self.assertIs(be_verb.past_tense(), be_verb)
+            else:
+                past_name = name.replace('AM', 'WAS').replace('IS', 'WAS').replace('ARE', 'WERE')
+                self.assertIs(be_verb.past_tense(), BeVerb[past_name])
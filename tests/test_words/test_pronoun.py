@@ -2,7 +2,7 @@ import unittest
 
 from paragraph_generator.tags.wordtag import WordTag
 from paragraph_generator.words.basicword import BasicWord
-from paragraph_generator.words.pronoun import Pronoun, CapitalPronoun, AbstractPronoun
+from paragraph_generator.words.pronoun import Pronoun, CapitalPronoun, AbstractPronoun, _TRANSITIONS
 from paragraph_generator.words.wordtools.abstractword import AbstractWord
 
 
@@ -33,6 +33,69 @@ class DummyPronoun(AbstractPronoun):
         return self
 
 
+def old_object(pronoun):
+    """object() as it was before the transition table"""
+    changes = {pronoun.I: pronoun.ME, pronoun.HE: pronoun.HIM, pronoun.SHE: pronoun.HER, pronoun.WE: pronoun.US,
+               pronoun.THEY: pronoun.THEM}
+    return changes.get(pronoun, pronoun)
+
+
+def old_subject(pronoun):
+    """subject() as it was before the transition table"""
+    changes = {pronoun.ME: pronoun.I, pronoun.HIM: pronoun.HE, pronoun.HER: pronoun.SHE, pronoun.US: pronoun.WE,
+               pronoun.THEM: pronoun.THEY}
+    return changes.get(pronoun, pronoun)
+
+
+def old_is_plural(pronoun):
+    """has_tags(WordTag.PLURAL) as it was before the transition table"""
+    return pronoun in (pronoun.YOU, pronoun.WE, pronoun.US, pronoun.THEY, pronoun.THEM)
+
+
+class TestTransitionTable(unittest.TestCase):
+    def assert_matches_old_rules(self, pronoun_class):
+        for pronoun in pronoun_class:
+            self.assertIs(pronoun.object(), old_object(pronoun))
+            self.assertIs(pronoun.subject(), old_subject(pronoun))
+            self.assertEqual(pronoun.has_tags(WordTag.PLURAL), old_is_plural(pronoun))
+            self.assertFalse(pronoun.has_tags(WordTag.PLURAL, WordTag.PLURAL))
+            self.assertFalse(pronoun.has_tags())
+
+    def test_pronoun_and_capital_pronoun(self):
+        self.assert_matches_old_rules(Pronoun)
+        self.assert_matches_old_rules(CapitalPronoun)
+
+    def test_other_subclasses_are_added_on_first_use(self):
+        class NewPronoun(AbstractPronoun):
+            I = 'i'
+            ME = 'me'
+            YOU = 'you'
+            HE = 'he'
+            HIM = 'him'
+            SHE = 'she'
+            HER = 'her'
+            IT = 'it'
+            WE = 'we'
+            US = 'us'
+            THEY = 'they'
+            THEM = 'them'
+
+            def capitalize(self):
+                return self
+
+            def de_capitalize(self):
+                return self
+
+        self.assertNotIn(NewPronoun.HE, _TRANSITIONS)
+        self.assertIs(NewPronoun.HE.object(), NewPronoun.HIM)
+        self.assertIn(NewPronoun.THEM, _TRANSITIONS)
+        self.assertIs(NewPronoun.THEM.subject(), NewPronoun.THEY)
+        self.assertTrue(NewPronoun.US.has_tags(WordTag.PLURAL))
+        self.assertFalse(NewPronoun.IT.has_tags(WordTag.PLURAL))
+        self.assert_matches_old_rules(NewPronoun)
+        self.assert_matches_old_rules(DummyPronoun)
+
+
 class TestAbstractPronoun(unittest.TestCase):
 
     @classmethod
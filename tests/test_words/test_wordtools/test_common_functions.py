@@ -1,6 +1,6 @@
 import unittest
 
-from paragraph_generator.words.wordtools.common_functions import (bold, add_s, add_ed, needs_es,
+from paragraph_generator.words.wordtools.common_functions import (bold, is_bold, un_bold, add_s, add_ed, needs_es,
                                                                   is_y_as_long_vowel_sound,
                                                                   ends_with_short_vowel_and_consonant)
 
@@ -98,6 +98,18 @@ class TestCommonFunctions(unittest.TestCase):
     def test_bold_full_tag(self):
         self.assertEqual(bold('<bold>x</bold>'), '<bold>x</bold>')
 
+    def test_is_bold(self):
+        self.assertTrue(is_bold('<bold>x</bold>'))
+        self.assertTrue(is_bold(bold('')))
+        for value in ('x', '<bold>x', 'x</bold>', '<bold>'):
+            self.assertFalse(is_bold(value))
+
+    def test_un_bold(self):
+        self.assertEqual(un_bold(bold('x y')), 'x y')
+        self.assertEqual(un_bold(bold('')), '')
+        self.assertEqual(un_bold('<bold>x'), '<bold>x')
+        self.assertEqual(un_bold('x'), 'x')
+
     def test_add_s_needs_es(self):
         es_words = ('buzz', 'fitch', 'fess', 'ax', 'dish', 'bobo')
         for word in es_words: